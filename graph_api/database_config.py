@@ -8,6 +8,7 @@ database = {
     "address": "http://{}:{}".format(db_host, db_port),
     "name": "neo4j",
     "commit_path": "/db/{database_name}/tx/commit",
+    "transaction_path": "/db/{database_name}/tx",
     "user": "neo4j",
     "passwd": "grisera",
 }
@@ -11,12 +11,18 @@ class DatabaseService:
 
     Attributes:
         database_url (str): Database URL 
+        transaction_url (str): URL of database transactions left open between requests
         database_auth (HTTPBasicAuth): Database connection credentials
         _instance (DatabaseService): Instance of the singleton object
     """
     database_url = (database["address"] + database["commit_path"]) \
         .replace("{database_name}", database["name"])
+    transaction_url = (database["address"] + database["transaction_path"]) \
+        .replace("{database_name}", database["name"])
     database_auth = HTTPBasicAuth(database["user"], database["passwd"])
+    timestamp_index_created = False
+    signal_value_index_created = False
+    signal_chunk_index_created = False
 
     _instance = None
 
@@ -28,38 +34,79 @@ class DatabaseService:
             cls._instance = super(DatabaseService, cls).__new__(cls)
         return cls._instance
 
-    def post_statement(self, statement):
+    def post_statement(self, statement, parameters=None, url=None):
         """
         Wrap statement with body and send it to database by its API
 
         Args:
             statement (string): Statement to be sent
+            parameters (Optional[dict]): Parameters of statement
+            url (Optional[str]): Commit URL of open transaction, statement is committed alone if not given
 
         Returns:
             Result of request      
         """
+        statement_body = {"statement": statement}
+        if parameters is not None:
+            statement_body["parameters"] = parameters
         commit_body = {
-            "statements": [{"statement": statement}]
+            "statements": [statement_body]
         }
-        response = self.post(commit_body)
+        response = self.post(commit_body, url)
         return response
 
-    def post(self, commit_body):
+    def post(self, commit_body, url=None):
         """
         Send request to database by its API
 
         Args:
             statement (string): Statement to be sent
+            url (Optional[str]): URL of request, statements are committed alone if not given
 
         Returns:
             Result of request      
         """
 
-        response = requests.post(url=self.database_url,
+        response = requests.post(url=url or self.database_url,
                                  json=commit_body,
                                  auth=self.database_auth).json()
         return response
 
+    def begin_transaction(self, commit_body):
+        """
+        Send statements to database in a new transaction, which is left open until it is committed by request
+        to its commit URL or until it times out. Commit URL is built from transaction URL of API, as URL returned
+        by database may use address of database unknown to API.
+
+        Args:
+            commit_body (dict): Statements to be sent
+
+        Returns:
+            Result of request with commit URL of transaction
+        """
+        response = self.post(commit_body, self.transaction_url)
+        if response.get("commit") is not None:
+            transaction_id = response["commit"].rstrip("/").split("/")[-2]
+            response["commit"] = "{}/{}/commit".format(self.transaction_url, transaction_id)
+        return response
+
+    @staticmethod
+    def lock_statement(node_parameter, variable=False):
+        """
+        Create statement taking write lock of node with id given by parameter, which is held until the end
+        of transaction, so transactions locking the same node are serialized
+
+        Args:
+            node_parameter (str): Parameter holding id of node
+            variable (bool): Whether id of node is held by variable bound earlier in statement instead of parameter
+
+        Returns:
+            Statement
+        """
+        return "MATCH (locked) WHERE id(locked)={}{} " \
+               "SET locked.timestamp_lock=true REMOVE locked.timestamp_lock".format("" if variable else "$",
+                                                                                     node_parameter)
+
     def node_exists(self, node_id):
         """
         Check wheather node with given id exists
@@ -128,7 +175,9 @@ class DatabaseService:
         operators = {
             "equals": "=",
             "less": "<=",
-            "greater": ">="
+            "greater": ">=",
+            "less_than": "<",
+            "greater_than": ">"
         }
         return_list = []
         where_list = []
@@ -169,6 +218,12 @@ class DatabaseService:
             get_statement += f" WHERE {' AND '.join(where_list)}"
         if len(return_list) > 0:
             get_statement += f" RETURN {','.join([f'{label},LABELS({label})' for label in return_list])}"
+        if query.order_by is not None:
+            get_statement += f" ORDER BY toInteger(n_{str(query.order_by.node_index)}.{query.order_by.key})"
+            if query.order_by.descending:
+                get_statement += " DESC"
+        if query.limit is not None:
+            get_statement += f" LIMIT {str(query.limit)}"
         return self.post_statement(get_statement)
 
     def delete_node(self, node_id):
@@ -210,7 +265,7 @@ class DatabaseService:
             Result of request
         """
         get_statement = "MATCH ()-[r]->() where id(r)={} " \
-                        "return id(startNode(r)), id(endNode(r)), type(r), id(r)".format(relationship_id)
+                        "return id(startNode(r)), id(endNode(r)), type(r), id(r), properties(r)".format(relationship_id)
         return self.post_statement(get_statement)
 
     def delete_relationship(self, relationship_id):
@@ -237,7 +292,7 @@ class DatabaseService:
             Result of request
         """
         get_statement = "MATCH (n)-[r]->(m) where id(n)={} or id(m)={} " \
-                        "return id(startNode(r)), id(endNode(r)), type(r), id(r)".format(
+                        "return id(startNode(r)), id(endNode(r)), type(r), id(r), properties(r)".format(
                          node_id, node_id)
         return self.post_statement(get_statement)
 
@@ -322,3 +377,445 @@ class DatabaseService:
             "statements": [{"statement": delete_statement}]
         }
         return self.post(commit_body)
+
+    def create_timestamp_index(self):
+        """
+        Send to the database requests to create index of timestamp nodes by experiment and timestamp, if it was
+        not created yet, and to index timestamp lists of experiments created before it. Timestamps of indexed
+        nodes are stored as integers.
+
+        Returns:
+            Result of the last request, None if index was already created
+        """
+        if DatabaseService.timestamp_index_created:
+            return None
+        index_statement = "CREATE INDEX timestamp_experiment IF NOT EXISTS " \
+                          "FOR (t:Timestamp) ON (t.experiment_id, t.timestamp)"
+        response = self.post_statement(index_statement)
+        if len(response["errors"]) > 0:
+            return response
+        migrate_statement = "MATCH (e)-[:takes]->(first:Timestamp) WHERE first.experiment_id IS NULL " \
+                            "MATCH (first)-[:next*0..]->(t:Timestamp) " \
+                            "SET t.experiment_id=id(e), t.timestamp=toInteger(t.timestamp)"
+        response = self.post_statement(migrate_statement)
+        if len(response["errors"]) == 0:
+            DatabaseService.timestamp_index_created = True
+        return response
+
+    def create_signal_value_index(self):
+        """
+        Send to the database requests to create index of signal value nodes by time series, (start) timestamp and
+        sequence number in list of signal values of time series, if it was not created yet, and to index signal
+        values created before it
+
+        Returns:
+            Result of the last request, None if index was already created
+        """
+        if DatabaseService.signal_value_index_created:
+            return None
+        index_statement = "CREATE INDEX signal_value_time_series IF NOT EXISTS " \
+                          "FOR (s:`Signal Value`) ON (s.time_series_id, s.timestamp, s.sequence)"
+        response = self.post_statement(index_statement)
+        if len(response["errors"]) > 0:
+            return response
+        response = self.index_signal_values()
+        if len(response["errors"]) == 0:
+            DatabaseService.signal_value_index_created = True
+        return response
+
+    def index_signal_values(self, time_series_id=None):
+        """
+        Send to the database request to store id of time series, integer (start) timestamp and sequence number in
+        signal value nodes of time series, numbered along their list from 0
+
+        Args:
+            time_series_id (Optional[int]): Id of time series, lists of signal values not indexed yet are indexed
+                if not given
+
+        Returns:
+            Result of request with count of indexed signal values
+        """
+        first_condition = "first.sequence IS NULL" if time_series_id is None else "id(ts)=$time_series_id"
+        index_statement = "MATCH (ts)-[:hasSignal]->(first:`Signal Value`) WHERE " + first_condition + " " \
+                          "MATCH path=(first)-[:next*0..]->(s:`Signal Value`) " \
+                          "MATCH (t:Timestamp)-[:inSec|startInSec]->(s) " \
+                          "SET s.time_series_id=id(ts), s.sequence=length(path), " \
+                          "s.timestamp=toInteger(t.timestamp) RETURN count(s)"
+        return self.post_statement(index_statement, {"time_series_id": time_series_id})
+
+    def get_signal_values(self, time_series_id, start_timestamp=None, end_timestamp=None, signal_min_value=None,
+                          signal_max_value=None, after_timestamp=None, after_sequence=None, limit=None,
+                          descending=False):
+        """
+        Send to the database request to get page of signal values of time series with their timestamps, found and
+        ordered by (start) timestamp and sequence number with index of signal values
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            signal_min_value (Optional[int]): Filter signal values by min value
+            signal_max_value (Optional[int]): Filter signal values by max value
+            after_timestamp (Optional[int]): (Start) timestamp of the last signal value of previous page
+            after_sequence (Optional[int]): Sequence number of the last signal value of previous page
+            limit (Optional[int]): Maximal number of signal values
+            descending (bool): Whether signal values are read from the last one
+
+        Returns:
+            Result of request with rows of signal value, (start) timestamp and end timestamp nodes, each followed
+            by its labels
+        """
+        order = " DESC" if descending else ""
+        where_list = ["s.time_series_id=$time_series_id"]
+        if start_timestamp is not None:
+            where_list.append("s.timestamp>=$start_timestamp")
+        if end_timestamp is not None:
+            where_list.append("s.timestamp<$end_timestamp")
+        if after_timestamp is not None:
+            operator = "<" if descending else ">"
+            where_list.append(f"(s.timestamp{operator}$after_timestamp OR "
+                              f"s.timestamp=$after_timestamp AND s.sequence{operator}$after_sequence)")
+        if signal_min_value is not None:
+            where_list.append("toInteger(s.value)>=$signal_min_value")
+        if signal_max_value is not None:
+            where_list.append("toInteger(s.value)<=$signal_max_value")
+        get_statement = f"MATCH (s:`Signal Value`) WHERE {' AND '.join(where_list)} " \
+                        f"WITH s ORDER BY s.timestamp{order}, s.sequence{order}"
+        if limit is not None:
+            get_statement += " LIMIT $limit"
+        get_statement += " MATCH (t:Timestamp)-[:inSec|startInSec]->(s) " \
+                         "OPTIONAL MATCH (e:Timestamp)-[:endInSec]->(s) " \
+                         "RETURN s, labels(s), t, labels(t), e, labels(e) " \
+                         f"ORDER BY s.timestamp{order}, s.sequence{order}"
+        parameters = {"time_series_id": time_series_id, "start_timestamp": start_timestamp,
+                      "end_timestamp": end_timestamp, "signal_min_value": signal_min_value,
+                      "signal_max_value": signal_max_value, "after_timestamp": after_timestamp,
+                      "after_sequence": after_sequence, "limit": limit}
+        return self.post_statement(get_statement, parameters)
+
+    def replace_signal_value_properties(self, time_series_id, signal_values):
+        """
+        Send to the database request to replace properties of signal value nodes of time series in a single
+        statement, keeping their index properties
+
+        Args:
+            time_series_id (int): Id of time series
+            signal_values (List[dict]): Signal values with id and new properties of signal value node
+
+        Returns:
+            Result of request with rows of id, previous properties and labels of signal value nodes
+        """
+        replace_statement = "UNWIND $signal_values AS signal_value " \
+                            "MATCH (s:`Signal Value`) WHERE id(s)=signal_value.id " \
+                            "AND s.time_series_id=$time_series_id " \
+                            "WITH s, signal_value, properties(s) AS previous " \
+                            "SET s = signal_value.properties, s.time_series_id=previous.time_series_id, " \
+                            "s.timestamp=previous.timestamp, s.sequence=previous.sequence " \
+                            "RETURN id(s), previous, labels(s)"
+        return self.post_statement(replace_statement, {"time_series_id": time_series_id,
+                                                       "signal_values": signal_values})
+
+    def get_timestamp_list(self, timestamp_id, experiment_id, first_timestamp, last_timestamp):
+        """
+        Send to the database request to get ordered timestamp nodes from the last one earlier than first timestamp
+        up to last timestamp, and relationship of experiment with its first timestamp. Timestamps of experiment
+        are found by index, timestamps without experiment are read from given timestamp node along the list.
+        Statements are run in a transaction left open, which first locks experiment (or the given timestamp
+        node), so timestamp list cannot change until new timestamps are spliced into it and transaction is
+        committed.
+
+        Args:
+            timestamp_id (Optional[int]): Id of timestamp node from which list is read without experiment
+            experiment_id (Optional[int]): Id of experiment of timestamps
+            first_timestamp (int): Value of the first timestamp to find
+            last_timestamp (int): Value of the last timestamp to read
+
+        Returns:
+            Result of request with commit URL of transaction, with rows of timestamp id, its value, id of its next
+            relationship and of the next timestamp in the second statement and with row of id of takes
+            relationship of experiment and of its first timestamp in the third one
+        """
+        if experiment_id is not None:
+            list_statement = "CALL { MATCH (t:Timestamp) WHERE t.experiment_id=$experiment_id " \
+                             "AND t.timestamp<$first_timestamp RETURN t ORDER BY t.timestamp DESC LIMIT 1 " \
+                             "UNION MATCH (t:Timestamp) WHERE t.experiment_id=$experiment_id " \
+                             "AND t.timestamp>=$first_timestamp AND t.timestamp<=$last_timestamp RETURN t } " \
+                             "OPTIONAL MATCH (t)-[r:next]->(n) " \
+                             "RETURN id(t), toInteger(t.timestamp), id(r), id(n) ORDER BY t.timestamp"
+        else:
+            list_statement = "MATCH (first:Timestamp) WHERE id(first)=$timestamp_id " \
+                             "MATCH path=(first)-[:next*0..]->(t:Timestamp) " \
+                             "WHERE toInteger(t.timestamp)<=$last_timestamp " \
+                             "OPTIONAL MATCH (t)-[r:next]->(n) " \
+                             "RETURN id(t), toInteger(t.timestamp), id(r), id(n) ORDER BY length(path)"
+        experiment_statement = "MATCH (e) WHERE id(e)=$experiment_id " \
+                               "OPTIONAL MATCH (e)-[r:takes]->(first:Timestamp) RETURN id(r), id(first)"
+        parameters = {"timestamp_id": timestamp_id, "experiment_id": experiment_id,
+                      "first_timestamp": first_timestamp, "last_timestamp": last_timestamp}
+        lock_parameter = "experiment_id" if experiment_id is not None else "timestamp_id"
+        commit_body = {
+            "statements": [{"statement": self.lock_statement(lock_parameter), "parameters": parameters},
+                           {"statement": list_statement, "parameters": parameters},
+                           {"statement": experiment_statement, "parameters": parameters}]
+        }
+        return self.begin_transaction(commit_body)
+
+    def merge_timestamp(self, experiment_id, timestamp):
+        """
+        Send to the database request to get timestamp node of experiment or to create it, spliced into timestamp
+        list between the nearest earlier and later timestamps found by index. Experiment is locked first, as index
+        of timestamps is not unique, so concurrent requests would create the same timestamp twice.
+
+        Args:
+            experiment_id (int): Id of experiment
+            timestamp (int): Value of timestamp
+
+        Returns:
+            Result of request with row of id and properties of timestamp node
+        """
+        merge_statement = self.lock_statement("experiment_id") + " " \
+                          "MERGE (t:Timestamp {experiment_id: $experiment_id, timestamp: $timestamp}) " \
+                          "WITH t CALL { WITH t WITH t WHERE NOT ()-[:next|takes]->(t) " \
+                          "MATCH (e) WHERE id(e)=$experiment_id " \
+                          "CALL { OPTIONAL MATCH (p:Timestamp) WHERE p.experiment_id=$experiment_id " \
+                          "AND p.timestamp<$timestamp RETURN p ORDER BY p.timestamp DESC LIMIT 1 } " \
+                          "CALL { OPTIONAL MATCH (n:Timestamp) WHERE n.experiment_id=$experiment_id " \
+                          "AND n.timestamp>$timestamp RETURN n ORDER BY n.timestamp LIMIT 1 } " \
+                          "OPTIONAL MATCH (p)-[previous_next:next]->(n) " \
+                          "OPTIONAL MATCH (e)-[previous_takes:takes]->(n) WHERE p IS NULL " \
+                          "DELETE previous_next, previous_takes " \
+                          "FOREACH (_ IN CASE WHEN p IS NULL THEN [1] ELSE [] END | CREATE (e)-[:takes]->(t)) " \
+                          "FOREACH (previous IN CASE WHEN p IS NULL THEN [] ELSE [p] END | " \
+                          "CREATE (previous)-[:next]->(t)) " \
+                          "FOREACH (next IN CASE WHEN n IS NULL THEN [] ELSE [n] END | CREATE (t)-[:next]->(next)) " \
+                          "RETURN count(*) AS spliced } " \
+                          "RETURN id(t), properties(t)"
+        return self.post_statement(merge_statement, {"experiment_id": experiment_id, "timestamp": timestamp})
+
+    def create_signal_values(self, timestamps, signal_values, relationships, deleted_relationships,
+                             experiment_id=None, previous_signal_value_id=None, commit_url=None):
+        """
+        Send to the database request to create timestamp and signal value nodes with their relationships
+        in a single transaction
+
+        Args:
+            timestamps (List[str]): Values of timestamp nodes to create
+            signal_values (List[dict]): Properties of signal value nodes to create
+            relationships (List[dict]): Relationships to create, with name and with start and end given as id of
+                existing node (start_id, end_id) or as index of created timestamp (start_timestamp, end_timestamp)
+                or signal value (start_signal_value, end_signal_value)
+            deleted_relationships (List[int]): Ids of relationships to delete
+            experiment_id (Optional[int]): Id of experiment of created timestamps
+            previous_signal_value_id (Optional[int]): Id of signal value after which signal values are linked,
+                sequence numbers of created signal values follow its sequence number
+            commit_url (Optional[str]): Commit URL of transaction in which timestamp list was read
+
+        Returns:
+            Result of request with row of lists of ids of created timestamp and signal value nodes
+        """
+        create_relationship_parts = "".join(
+            "FOREACH (_ IN CASE WHEN relationship.name='{name}' THEN [1] ELSE [] END | "
+            "CREATE (n)-[:{name}]->(m)) ".format(name=name)
+            for name in ["next", "takes", "hasSignal", "inSec", "startInSec", "endInSec"])
+        create_statement = "CALL { UNWIND $deleted_relationships AS relationship_id " \
+                           "MATCH ()-[r]->() WHERE id(r)=relationship_id DELETE r RETURN count(r) AS deleted } " \
+                           "CALL { UNWIND $timestamps AS timestamp " \
+                           "CREATE (t:Timestamp {timestamp: timestamp, experiment_id: $experiment_id}) " \
+                           "RETURN collect(t) AS timestamps } " \
+                           "CALL { OPTIONAL MATCH (previous:`Signal Value`) " \
+                           "WHERE id(previous)=$previous_signal_value_id " \
+                           "UNWIND range(0, size($signal_values) - 1) AS index CREATE (s:`Signal Value`) " \
+                           "SET s = $signal_values[index], s.sequence=coalesce(previous.sequence, -1) + 1 + index " \
+                           "RETURN collect(s) AS signal_values } " \
+                           "CALL { WITH timestamps, signal_values UNWIND $relationships AS relationship " \
+                           "OPTIONAL MATCH (start_node) WHERE id(start_node)=relationship.start_id " \
+                           "OPTIONAL MATCH (end_node) WHERE id(end_node)=relationship.end_id " \
+                           "WITH relationship, coalesce(start_node, timestamps[relationship.start_timestamp], " \
+                           "signal_values[relationship.start_signal_value]) AS n, " \
+                           "coalesce(end_node, timestamps[relationship.end_timestamp], " \
+                           "signal_values[relationship.end_signal_value]) AS m " + \
+                           create_relationship_parts + \
+                           "RETURN count(*) AS created } " \
+                           "RETURN [t IN timestamps | id(t)], [s IN signal_values | id(s)]"
+        parameters = {"timestamps": timestamps, "signal_values": signal_values, "relationships": relationships,
+                      "deleted_relationships": deleted_relationships, "experiment_id": experiment_id,
+                      "previous_signal_value_id": previous_signal_value_id}
+        return self.post_statement(create_statement, parameters, commit_url)
+
+    def delete_signal_values(self, time_series_id, start_timestamp=None):
+        """
+        Send to the database request to delete signal values of time series and timestamps not used by other
+        signal values in a single transaction. Signal values and timestamps left in their lists are linked with
+        the nearest ones before and after deleted ones. Experiments of timestamps are locked first, the same way
+        as when signal values are saved, so timestamp lists are not changed concurrently.
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only signal values with (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request with counts of deleted signal values and timestamps in the last two statements
+        """
+        lock_experiments_statement = \
+            "MATCH (ts)-[:hasSignal]->(first:`Signal Value`) WHERE id(ts)=$time_series_id " \
+            "MATCH (first)-[:next*0..]->(:`Signal Value`)<-[:inSec|startInSec|endInSec]-(t:Timestamp) " \
+            "WHERE $start_timestamp IS NULL OR toInteger(t.timestamp)>=$start_timestamp " \
+            "WITH DISTINCT t.experiment_id AS experiment_id " + self.lock_statement("experiment_id", variable=True)
+        mark_signal_values_statement = \
+            "MATCH (ts)-[:hasSignal]->(first:`Signal Value`) WHERE id(ts)=$time_series_id " \
+            "MATCH (first)-[:next*0..]->(s:`Signal Value`) WHERE $start_timestamp IS NULL OR EXISTS { " \
+            "MATCH (t:Timestamp)-[:inSec|startInSec]->(s) WHERE toInteger(t.timestamp)>=$start_timestamp } " \
+            "SET s:DeletedSignalValue"
+        mark_timestamps_statement = \
+            "MATCH (t:Timestamp)-[:inSec|startInSec|endInSec]->(:DeletedSignalValue) WITH DISTINCT t " \
+            "WHERE NOT EXISTS { MATCH (t)-[:inSec|startInSec|endInSec]->(s) WHERE NOT s:DeletedSignalValue } " \
+            "SET t:DeletedTimestamp"
+        parameters = {"time_series_id": time_series_id, "start_timestamp": start_timestamp}
+        statements = [lock_experiments_statement,
+                      mark_signal_values_statement,
+                      self.relink_statement("DeletedSignalValue", ["next", "hasSignal"]),
+                      mark_timestamps_statement,
+                      self.relink_statement("DeletedTimestamp", ["next", "takes"]),
+                      "MATCH (s:DeletedSignalValue) DETACH DELETE s RETURN count(s)",
+                      "MATCH (t:DeletedTimestamp) DETACH DELETE t RETURN count(t)"]
+        commit_body = {
+            "statements": [{"statement": statement, "parameters": parameters} for statement in statements]
+        }
+        return self.post(commit_body)
+
+    @staticmethod
+    def relink_statement(label, names):
+        """
+        Create statement linking node before each run of nodes with given label in list of next relationships
+        with node after the run, using the same relationship name as relationship leading to the run
+
+        Args:
+            label (str): Label of nodes to be removed from list
+            names (List[str]): Names of relationships leading to the first node of run
+
+        Returns:
+            Statement
+        """
+        create_parts = "".join("FOREACH (_ IN CASE WHEN name='{name}' THEN [1] ELSE [] END | "
+                               "CREATE (previous)-[:{name}]->(following)) ".format(name=name) for name in names)
+        return "MATCH (start:{label}) WHERE NOT EXISTS {{ MATCH (:{label})-[:next]->(start) }} " \
+               "MATCH path=(start)-[:next*0..]->(end:{label}) WHERE all(node IN nodes(path) WHERE node:{label}) " \
+               "AND NOT EXISTS {{ MATCH (end)-[:next]->(:{label}) }} " \
+               "MATCH (previous)-[r:{names}]->(start) MATCH (end)-[:next]->(following) " \
+               "WITH previous, type(r) AS name, following ".format(label=label, names="|".join(names)) + \
+               create_parts
+
+    def create_signal_chunk_index(self):
+        """
+        Send to the database request to create index of signal chunk nodes by time series and sequence number in
+        list of chunks of time series, if it was not created yet
+
+        Returns:
+            Result of request, None if index was already created
+        """
+        if DatabaseService.signal_chunk_index_created:
+            return None
+        index_statement = "CREATE INDEX signal_chunk_time_series IF NOT EXISTS " \
+                          "FOR (c:`Signal Chunk`) ON (c.time_series_id, c.sequence)"
+        response = self.post_statement(index_statement)
+        if len(response["errors"]) == 0:
+            DatabaseService.signal_chunk_index_created = True
+        return response
+
+    def save_signal_chunks(self, time_series_id, updated_signal_chunks, created_signal_chunks,
+                           deleted_signal_chunk_ids):
+        """
+        Send to the database request to delete, overwrite and create signal chunk nodes of time series in a single
+        transaction. Created chunks are numbered and linked after the last remaining chunk of time series, or to
+        time series if it has no chunks.
+
+        Args:
+            time_series_id (int): Id of time series
+            updated_signal_chunks (List[dict]): Chunks to overwrite, with id and properties of chunk node
+            created_signal_chunks (List[dict]): Properties of chunk nodes to create, in order
+            deleted_signal_chunk_ids (List[int]): Ids of chunk nodes to delete
+
+        Returns:
+            Result of request with row of ids of overwritten and created chunk nodes
+        """
+        save_statement = "MATCH (ts) WHERE id(ts)=$time_series_id " \
+                         "CALL { UNWIND $deleted_signal_chunk_ids AS chunk_id " \
+                         "MATCH (c:`Signal Chunk`) WHERE id(c)=chunk_id DETACH DELETE c RETURN count(c) AS deleted } " \
+                         "CALL { UNWIND $updated_signal_chunks AS chunk " \
+                         "MATCH (c:`Signal Chunk`) WHERE id(c)=chunk.id SET c += chunk.properties " \
+                         "RETURN collect(id(c)) AS updated } " \
+                         "CALL { OPTIONAL MATCH (c:`Signal Chunk`) WHERE c.time_series_id=$time_series_id " \
+                         "RETURN c AS last ORDER BY c.sequence DESC LIMIT 1 } " \
+                         "CALL { WITH last UNWIND range(0, size($created_signal_chunks) - 1) AS index " \
+                         "CREATE (c:`Signal Chunk`) SET c = $created_signal_chunks[index], " \
+                         "c.time_series_id=$time_series_id, c.sequence=coalesce(last.sequence, -1) + 1 + index " \
+                         "RETURN collect(c) AS created } " \
+                         "FOREACH (index IN range(0, size(created) - 2) | FOREACH (c IN [created[index]] | " \
+                         "FOREACH (n IN [created[index + 1]] | CREATE (c)-[:next]->(n)))) " \
+                         "FOREACH (first IN created[0..1] | " \
+                         "FOREACH (previous IN CASE WHEN last IS NULL THEN [] ELSE [last] END | " \
+                         "CREATE (previous)-[:next]->(first)) " \
+                         "FOREACH (_ IN CASE WHEN last IS NULL THEN [1] ELSE [] END | " \
+                         "CREATE (ts)-[:hasSignalChunk]->(first))) " \
+                         "RETURN updated + [c IN created | id(c)]"
+        parameters = {"time_series_id": time_series_id, "updated_signal_chunks": updated_signal_chunks,
+                      "created_signal_chunks": created_signal_chunks,
+                      "deleted_signal_chunk_ids": deleted_signal_chunk_ids}
+        return self.post_statement(save_statement, parameters)
+
+    def get_signal_chunks(self, time_series_id, start_timestamp=None, end_timestamp=None, signal_min_value=None,
+                          signal_max_value=None, after_sequence=None, limit=None, descending=False):
+        """
+        Send to the database request to get page of signal chunks of time series in order of their list. Chunks
+        without signals in range of (start) timestamps or of values are pruned by their first and last timestamps
+        and minimal and maximal values.
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter chunks by last (start) timestamp not lower than given one
+            end_timestamp (Optional[int]): Filter chunks by first (start) timestamp lower than given one
+            signal_min_value (Optional[float]): Filter chunks by max value not lower than given one
+            signal_max_value (Optional[float]): Filter chunks by min value not greater than given one
+            after_sequence (Optional[int]): Sequence number of the last chunk of previous page
+            limit (Optional[int]): Maximal number of chunks
+            descending (bool): Whether chunks are read from the last one
+
+        Returns:
+            Result of request with rows of id and properties of chunk node
+        """
+        where_list = ["c.time_series_id=$time_series_id"]
+        if start_timestamp is not None:
+            where_list.append("c.last_timestamp>=$start_timestamp")
+        if end_timestamp is not None:
+            where_list.append("c.first_timestamp<$end_timestamp")
+        if signal_min_value is not None:
+            where_list.append("c.max_value>=$signal_min_value")
+        if signal_max_value is not None:
+            where_list.append("c.min_value<=$signal_max_value")
+        if after_sequence is not None:
+            where_list.append("c.sequence<$after_sequence" if descending else "c.sequence>$after_sequence")
+        get_statement = f"MATCH (c:`Signal Chunk`) WHERE {' AND '.join(where_list)} " \
+                        f"RETURN id(c), properties(c) ORDER BY c.sequence{' DESC' if descending else ''}"
+        if limit is not None:
+            get_statement += " LIMIT $limit"
+        parameters = {"time_series_id": time_series_id, "start_timestamp": start_timestamp,
+                      "end_timestamp": end_timestamp, "signal_min_value": signal_min_value,
+                      "signal_max_value": signal_max_value, "after_sequence": after_sequence, "limit": limit}
+        return self.post_statement(get_statement, parameters)
+
+    def delete_signal_chunks(self, time_series_id, start_timestamp=None):
+        """
+        Send to the database request to delete signal chunks of time series
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only chunks with the first (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request with count of deleted chunks
+        """
+        delete_statement = "MATCH (c:`Signal Chunk`) WHERE c.time_series_id=$time_series_id " \
+                           "AND ($start_timestamp IS NULL OR c.first_timestamp>=$start_timestamp) " \
+                           "DETACH DELETE c RETURN count(c)"
+        return self.post_statement(delete_statement, {"time_series_id": time_series_id,
+                                                      "start_timestamp": start_timestamp})
@@ -95,15 +95,32 @@ class RelationQueryIn(BaseModel):
     label: Optional[str]
 
 
+class OrderByQueryIn(BaseModel):
+    """
+    Model of rows order in query to acquire from client
+    Attributes:
+        node_index (int): index of node in query, which property is used to sort rows
+        key (str): name of numeric property used to sort rows
+        descending (bool): whether rows are sorted in descending order
+    """
+    node_index: int
+    key: str
+    descending: bool = False
+
+
 class NodeRowsQueryIn(BaseModel):
     """
     Model of node row query to acquire from client
     Attributes:
         nodes (Optional[List[NodeQueryIn]]): List of nodes in graph DB
         relations (Optional[List[RelationQueryIn]]): List of relations in graph DB
+        order_by (Optional[OrderByQueryIn]): Order of returned rows
+        limit (Optional[int]): Maximal number of returned rows
     """
     nodes: Optional[List[NodeQueryIn]] = []
     relations: Optional[List[RelationQueryIn]] = []
+    order_by: Optional[OrderByQueryIn]
+    limit: Optional[int]
 
 
 class NodeRowsOut(BaseModel):
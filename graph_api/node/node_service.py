@@ -137,7 +137,11 @@ class NodeService:
         else:
             response_data = response["results"][0]["data"]
             relationships = [BasicRelationshipOut(start_node=relation["row"][0], end_node=relation["row"][1],
-                                                  id=relation["row"][3], name=relation["row"][2]) for relation in response_data]
+                                                  id=relation["row"][3], name=relation["row"][2],
+                                                  properties=[PropertyIn(key=key, value=value)
+                                                              for key, value in relation["row"][4].items()]
+                                                  if len(relation["row"]) > 4 else None)
+                             for relation in response_data]
             result = RelationshipsOut(relationships=relationships)
 
         return result
@@ -0,0 +1,102 @@
+from typing import Optional, Any, List, Union
+
+from pydantic import BaseModel, StrictInt, StrictFloat, StrictStr
+
+
+class SignalChunkIn(BaseModel):
+    """
+    Model of signal chunk to acquire from client
+
+    Attributes:
+        id (Optional[int]): Id of stored signal chunk node to overwrite, a new chunk is created if not given
+        timestamps (List[int]): Ordered (start) timestamps of signals
+        end_timestamps (Optional[List[int]]): End timestamps of signals of type Epoch
+        values (List[Union[StrictInt, StrictFloat, StrictStr]]): Values of signals, stored as numbers if all
+            of them are numbers, strings are never converted to numbers
+    """
+    id: Optional[int] = None
+    timestamps: List[int]
+    end_timestamps: Optional[List[int]] = None
+    values: List[Union[StrictInt, StrictFloat, StrictStr]]
+
+
+class SignalChunksIn(BaseModel):
+    """
+    Model of signal chunks of time series to acquire from client
+
+    Attributes:
+        time_series_id (int): Id of time series node
+        signal_chunks (List[SignalChunkIn]): Chunks to overwrite and to append after the last chunk, in order
+        deleted_signal_chunk_ids (List[int]): Ids of signal chunk nodes to delete
+    """
+    time_series_id: int
+    signal_chunks: List[SignalChunkIn] = []
+    deleted_signal_chunk_ids: List[int] = []
+
+
+class SignalChunkOut(BaseModel):
+    """
+    Model of signal chunk to send to client as a result of request
+
+    Attributes:
+        id (int): Id of signal chunk node
+        sequence (int): Number of chunk in list of chunks of time series
+        timestamps (List[int]): Ordered (start) timestamps of signals
+        end_timestamps (Optional[List[int]]): End timestamps of signals of type Epoch
+        values (list): Values of signals
+        first_timestamp (int): (Start) timestamp of the first signal
+        last_timestamp (int): (Start) timestamp of the last signal
+        min_value (Optional[float]): Minimal value of signals, None if values are not numeric
+        max_value (Optional[float]): Maximal value of signals, None if values are not numeric
+    """
+    id: int
+    sequence: int
+    timestamps: List[int] = []
+    end_timestamps: Optional[List[int]] = None
+    values: list = []
+    first_timestamp: int
+    last_timestamp: int
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+
+class SignalChunksOut(BaseModel):
+    """
+    Model of signal chunks to send to client as a result of request
+
+    Attributes:
+        signal_chunks (List[SignalChunkOut]): Signal chunks in order of their list
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_chunks: List[SignalChunkOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class SignalChunksSavedOut(BaseModel):
+    """
+    Model of saved signal chunks to send to client as a result of request
+
+    Attributes:
+        signal_chunk_ids (List[int]): Ids of overwritten and created signal chunk nodes in order of signal chunks
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_chunk_ids: List[int] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class SignalChunksDeletedOut(BaseModel):
+    """
+    Model of deleted signal chunks to send to client as a result of request
+
+    Attributes:
+        signal_chunks_count (int): Number of deleted signal chunk nodes
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_chunks_count: int = 0
+    errors: Optional[Any] = None
+    links: Optional[list] = None
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from fastapi import Response
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+
+from hateoas import get_links
+from signal_chunk.signal_chunk_model import SignalChunksIn, SignalChunksOut, SignalChunksSavedOut, \
+    SignalChunksDeletedOut
+from signal_chunk.signal_chunk_service import SignalChunkService
+
+router = InferringRouter()
+
+
+@cbv(router)
+class SignalChunkRouter:
+    """
+    Class for routing signal chunks based requests
+
+    Attributes:
+        signal_chunk_service (SignalChunkService): Service instance for signal chunks
+    """
+    signal_chunk_service = SignalChunkService()
+
+    @router.post("/signal_chunks", tags=["signal chunks"], response_model=SignalChunksSavedOut)
+    async def save_signal_chunks(self, signal_chunks: SignalChunksIn, response: Response):
+        """
+        Delete, overwrite and append signal chunks of time series in a single transaction
+        """
+        save_response = self.signal_chunk_service.save_signal_chunks(signal_chunks)
+        if save_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        save_response.links = get_links(router)
+
+        return save_response
+
+    @router.get("/signal_chunks", tags=["signal chunks"], response_model=SignalChunksOut)
+    async def get_signal_chunks(self, time_series_id: int, response: Response,
+                                start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                                signal_min_value: Optional[float] = None, signal_max_value: Optional[float] = None,
+                                after_sequence: Optional[int] = None, limit: Optional[int] = None,
+                                descending: bool = False):
+        """
+        Get page of signal chunks of time series, which may contain signals in given ranges
+        """
+        get_response = self.signal_chunk_service.get_signal_chunks(time_series_id, start_timestamp, end_timestamp,
+                                                                   signal_min_value, signal_max_value,
+                                                                   after_sequence, limit, descending)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
+    @router.delete("/signal_chunks", tags=["signal chunks"], response_model=SignalChunksDeletedOut)
+    async def delete_signal_chunks(self, time_series_id: int, response: Response,
+                                   start_timestamp: Optional[int] = None):
+        """
+        Delete signal chunks of time series, optionally only chunks starting from given (start) timestamp
+        """
+        delete_response = self.signal_chunk_service.delete_signal_chunks(time_series_id, start_timestamp)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
@@ -0,0 +1,123 @@
+from typing import Optional
+
+from database_service import DatabaseService
+from signal_chunk.signal_chunk_model import SignalChunkIn, SignalChunksIn, SignalChunkOut, SignalChunksOut, \
+    SignalChunksSavedOut, SignalChunksDeletedOut
+
+
+def signal_chunk_properties(signal_chunk: SignalChunkIn):
+    """
+    Create properties of signal chunk node with typed arrays of signals and summary used to prune chunks. Values
+    are stored as array of integers if all of them are integers, as array of floats if all of them are numbers,
+    otherwise as array of strings without min and max.
+    """
+    values = signal_chunk.values
+    numeric = all(isinstance(value, (int, float)) for value in values)
+    if numeric and not all(isinstance(value, int) for value in values):
+        values = [float(value) for value in values]
+    elif not numeric:
+        values = [str(value) for value in values]
+    properties = {"timestamps": signal_chunk.timestamps, "values": values,
+                  "first_timestamp": signal_chunk.timestamps[0], "last_timestamp": signal_chunk.timestamps[-1],
+                  "min_value": min(values) if numeric else None, "max_value": max(values) if numeric else None}
+    if signal_chunk.end_timestamps is not None:
+        properties["end_timestamps"] = signal_chunk.end_timestamps
+    return properties
+
+
+class SignalChunkService:
+    """
+    Object to handle logic of signal chunks requests
+
+    Attributes:
+        db (DatabaseService): Handles communication with Neo4j database
+    """
+    db: DatabaseService = DatabaseService()
+
+    def save_signal_chunks(self, signal_chunks: SignalChunksIn):
+        """
+        Send request to database by its API to delete, overwrite and append signal chunks of time series in
+        a single transaction
+
+        Args:
+            signal_chunks (SignalChunksIn): Signal chunks to be saved in database
+
+        Returns:
+            Result of request as ids of overwritten and then of created signal chunks
+        """
+        if not self.db.node_exists(signal_chunks.time_series_id):
+            return SignalChunksSavedOut(errors={"errors": "not matching node id"})
+        for signal_chunk in signal_chunks.signal_chunks:
+            if len(signal_chunk.timestamps) == 0 or len(signal_chunk.timestamps) != len(signal_chunk.values) or \
+                    (signal_chunk.end_timestamps is not None and
+                     len(signal_chunk.end_timestamps) != len(signal_chunk.values)):
+                return SignalChunksSavedOut(errors="Signal chunk should have equal number of timestamps and values.")
+            if any(previous > timestamp for previous, timestamp in
+                   zip(signal_chunk.timestamps, signal_chunk.timestamps[1:])):
+                return SignalChunksSavedOut(errors="Timestamps of signal chunk should be ordered.")
+        index_response = self.db.create_signal_chunk_index()
+        if index_response is not None and len(index_response["errors"]) > 0:
+            return SignalChunksSavedOut(errors=index_response["errors"])
+
+        updated_signal_chunks = [{"id": signal_chunk.id, "properties": signal_chunk_properties(signal_chunk)}
+                                 for signal_chunk in signal_chunks.signal_chunks if signal_chunk.id is not None]
+        created_signal_chunks = [signal_chunk_properties(signal_chunk)
+                                 for signal_chunk in signal_chunks.signal_chunks if signal_chunk.id is None]
+        response = self.db.save_signal_chunks(signal_chunks.time_series_id, updated_signal_chunks,
+                                              created_signal_chunks, signal_chunks.deleted_signal_chunk_ids)
+        if len(response["errors"]) > 0:
+            return SignalChunksSavedOut(errors=response["errors"])
+
+        return SignalChunksSavedOut(signal_chunk_ids=response["results"][0]["data"][0]["row"][0])
+
+    def get_signal_chunks(self, time_series_id: int, start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None, signal_min_value: Optional[float] = None,
+                          signal_max_value: Optional[float] = None, after_sequence: Optional[int] = None,
+                          limit: Optional[int] = None, descending: bool = False):
+        """
+        Send request to database by its API to get page of signal chunks of time series, which may contain signals
+        in given ranges of (start) timestamps and values
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter chunks by last (start) timestamp not lower than given one
+            end_timestamp (Optional[int]): Filter chunks by first (start) timestamp lower than given one
+            signal_min_value (Optional[float]): Filter chunks by max value not lower than given one
+            signal_max_value (Optional[float]): Filter chunks by min value not greater than given one
+            after_sequence (Optional[int]): Sequence number of the last chunk of previous page
+            limit (Optional[int]): Maximal number of chunks
+            descending (bool): Whether chunks are read from the last one
+
+        Returns:
+            Result of request as list of signal chunks
+        """
+        if not self.db.node_exists(time_series_id):
+            return SignalChunksOut(errors={"errors": "not matching node id"})
+
+        response = self.db.get_signal_chunks(time_series_id, start_timestamp, end_timestamp, signal_min_value,
+                                             signal_max_value, after_sequence, limit, descending)
+        if len(response["errors"]) > 0:
+            return SignalChunksOut(errors=response["errors"])
+
+        return SignalChunksOut(signal_chunks=[SignalChunkOut(id=row["row"][0], **row["row"][1])
+                                              for row in response["results"][0]["data"]])
+
+    def delete_signal_chunks(self, time_series_id: int, start_timestamp: Optional[int] = None):
+        """
+        Send request to database by its API to delete signal chunks of time series
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only chunks with the first (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request as number of deleted signal chunks
+        """
+        if not self.db.node_exists(time_series_id):
+            return SignalChunksDeletedOut(errors={"errors": "not matching node id"})
+
+        response = self.db.delete_signal_chunks(time_series_id, start_timestamp)
+        if len(response["errors"]) > 0:
+            return SignalChunksDeletedOut(errors=response["errors"])
+
+        return SignalChunksDeletedOut(signal_chunks_count=response["results"][0]["data"][0]["row"][0])
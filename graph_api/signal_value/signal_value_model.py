@@ -0,0 +1,150 @@
+from typing import Optional, Any, List
+
+from pydantic import BaseModel
+
+from node.node_model import NodeRowsOut, BasicNodeOut
+from property.property_model import PropertyIn
+
+
+class SignalValueIn(BaseModel):
+    """
+    Model of signal value to acquire from client
+
+    Attributes:
+        timestamp (Optional[int]): Timestamp of signal of type Timestamp, linked with inSec relationship
+        start_timestamp (Optional[int]): Start timestamp of signal of type Epoch, linked with startInSec relationship
+        end_timestamp (Optional[int]): End timestamp of signal of type Epoch, linked with endInSec relationship
+        properties (List[PropertyIn]): Properties of signal value node
+    """
+    timestamp: Optional[int] = None
+    start_timestamp: Optional[int] = None
+    end_timestamp: Optional[int] = None
+    properties: List[PropertyIn] = []
+
+
+class SignalValuesIn(BaseModel):
+    """
+    Model of signal values of time series to acquire from client
+
+    Attributes:
+        time_series_id (int): Id of time series node
+        experiment_id (Optional[int]): Id of experiment node, which takes list of timestamp nodes
+        previous_signal_value_id (Optional[int]): Id of signal value node after which signal values are linked,
+            signal values are linked to time series if not given
+        timestamp_id (Optional[int]): Id of timestamp node from which timestamp list is searched when experiment
+            is not given, a new timestamp list is started if it is not given or if it is later than any of signals
+        signal_values (List[SignalValueIn]): Signal values in order of the list of signal values
+    """
+    time_series_id: int
+    experiment_id: Optional[int] = None
+    previous_signal_value_id: Optional[int] = None
+    timestamp_id: Optional[int] = None
+    signal_values: List[SignalValueIn] = []
+
+
+class SignalValuesOut(BaseModel):
+    """
+    Model of created signal values to send to client as a result of request
+
+    Attributes:
+        signal_value_ids (List[int]): Ids of created signal value nodes in order of signal values
+        timestamp_ids (List[int]): Ids of (start) timestamp nodes of signal values
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_value_ids: List[int] = []
+    timestamp_ids: List[int] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class SignalValueRowsOut(NodeRowsOut):
+    """
+    Model of page of signal values with their timestamps to send to client as a result of request
+
+    Attributes:
+        last_timestamp (Optional[int]): (Start) timestamp of the last signal value of page
+        last_sequence (Optional[int]): Sequence number of the last signal value of page
+    """
+    last_timestamp: Optional[int] = None
+    last_sequence: Optional[int] = None
+
+
+class SignalValuePropertiesIn(BaseModel):
+    """
+    Model of new properties of stored signal value to acquire from client
+
+    Attributes:
+        id (int): Id of signal value node
+        properties (List[PropertyIn]): Properties replacing the ones of signal value node
+    """
+    id: int
+    properties: List[PropertyIn] = []
+
+
+class SignalValuesPropertiesIn(BaseModel):
+    """
+    Model of new properties of stored signal values of time series to acquire from client
+
+    Attributes:
+        time_series_id (int): Id of time series node
+        signal_values (List[SignalValuePropertiesIn]): Signal values with their new properties
+    """
+    time_series_id: int
+    signal_values: List[SignalValuePropertiesIn] = []
+
+
+class SignalValuesPropertiesOut(BaseModel):
+    """
+    Model of signal values with replaced properties to send to client as a result of request
+
+    Attributes:
+        signal_values (List[BasicNodeOut]): Signal value nodes with their previous properties
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_values: List[BasicNodeOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class TimestampIn(BaseModel):
+    """
+    Model of timestamp of experiment to acquire from client
+
+    Attributes:
+        experiment_id (int): Id of experiment node, which takes list of timestamp nodes
+        timestamp (int): Value of timestamp
+    """
+    experiment_id: int
+    timestamp: int
+
+
+class SignalValuesDeletedOut(BaseModel):
+    """
+    Model of deleted signal values to send to client as a result of request
+
+    Attributes:
+        signal_values_count (int): Number of deleted signal value nodes
+        timestamps_count (int): Number of deleted timestamp nodes
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_values_count: int = 0
+    timestamps_count: int = 0
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class SignalValuesIndexedOut(BaseModel):
+    """
+    Model of indexed signal values to send to client as a result of request
+
+    Attributes:
+        signal_values_count (int): Number of indexed signal value nodes
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list]): Hateoas implementation
+    """
+    signal_values_count: int = 0
+    errors: Optional[Any] = None
+    links: Optional[list] = None
@@ -0,0 +1,117 @@
+from typing import Optional
+
+from fastapi import Response
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+
+from hateoas import get_links
+from node.node_model import NodeOut
+from signal_value.signal_value_model import SignalValuesIn, SignalValuesOut, TimestampIn, SignalValuesDeletedOut, \
+    SignalValuesIndexedOut, SignalValueRowsOut, SignalValuesPropertiesIn, SignalValuesPropertiesOut
+from signal_value.signal_value_service import SignalValueService
+
+router = InferringRouter()
+
+
+@cbv(router)
+class SignalValueRouter:
+    """
+    Class for routing signal values based requests
+
+    Attributes:
+        signal_value_service (SignalValueService): Service instance for signal values
+    """
+    signal_value_service = SignalValueService()
+
+    @router.post("/signal_values", tags=["signal values"], response_model=SignalValuesOut)
+    async def create_signal_values(self, signal_values: SignalValuesIn, response: Response):
+        """
+        Create signal values of time series with their timestamps in a single transaction
+        """
+        create_response = self.signal_value_service.save_signal_values(signal_values)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.get("/signal_values", tags=["signal values"], response_model=SignalValueRowsOut)
+    async def get_signal_values(self, time_series_id: int, response: Response,
+                                start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                                signal_min_value: Optional[int] = None, signal_max_value: Optional[int] = None,
+                                after_timestamp: Optional[int] = None, after_sequence: Optional[int] = None,
+                                limit: Optional[int] = None, descending: bool = False):
+        """
+        Get page of signal values of time series with their timestamps, ordered by (start) timestamp
+        """
+        get_response = self.signal_value_service.get_signal_values(time_series_id, start_timestamp, end_timestamp,
+                                                                   signal_min_value, signal_max_value,
+                                                                   after_timestamp, after_sequence, limit,
+                                                                   descending)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
+    @router.post("/signal_values/properties", tags=["signal values"], response_model=SignalValuesPropertiesOut)
+    async def replace_signal_value_properties(self, signal_values: SignalValuesPropertiesIn, response: Response):
+        """
+        Replace properties of stored signal values of time series, keeping them indexed
+        """
+        replace_response = self.signal_value_service.replace_signal_value_properties(signal_values)
+        if replace_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        replace_response.links = get_links(router)
+
+        return replace_response
+
+    @router.post("/signal_values/index", tags=["signal values"], response_model=SignalValuesIndexedOut)
+    async def index_signal_values(self, time_series_id: int, response: Response):
+        """
+        Number signal values of time series along their list and index them
+        """
+        index_response = self.signal_value_service.index_signal_values(time_series_id)
+        if index_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        index_response.links = get_links(router)
+
+        return index_response
+
+    @router.delete("/signal_values", tags=["signal values"], response_model=SignalValuesDeletedOut)
+    async def delete_signal_values(self, time_series_id: int, response: Response,
+                                   start_timestamp: Optional[int] = None):
+        """
+        Delete signal values of time series, optionally only from given (start) timestamp, with timestamps
+        not used by other signal values
+        """
+        delete_response = self.signal_value_service.delete_signal_values(time_series_id, start_timestamp)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
+
+    @router.post("/timestamps", tags=["signal values"], response_model=NodeOut)
+    async def create_timestamp(self, timestamp: TimestampIn, response: Response):
+        """
+        Get timestamp of experiment or create it in its place in timestamp list of experiment
+        """
+        create_response = self.signal_value_service.save_timestamp(timestamp)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
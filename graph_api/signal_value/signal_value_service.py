@@ -0,0 +1,331 @@
+from typing import Optional
+
+from database_service import DatabaseService
+from node.node_model import NodeOut, BasicNodeOut
+from property.property_model import PropertyIn
+from signal_value.signal_value_model import SignalValuesIn, SignalValuesOut, TimestampIn, SignalValuesDeletedOut, \
+    SignalValuesIndexedOut, SignalValueRowsOut, SignalValuesPropertiesIn, SignalValuesPropertiesOut
+
+# properties by which signal values and timestamps are indexed, not returned to clients
+index_properties = {"Signal Value": {"time_series_id", "timestamp", "sequence"}, "Timestamp": {"experiment_id"}}
+
+
+def relationship_request(name: str, start: dict, end: dict):
+    """
+    Create description of relationship between existing ({"id": id}) or created ({"timestamp": index} or
+    {"signal_value": index}) nodes
+    """
+    relationship = {"name": name}
+    relationship.update({"start_" + key: value for key, value in start.items()})
+    relationship.update({"end_" + key: value for key, value in end.items()})
+    return relationship
+
+
+class SignalValueService:
+    """
+    Object to handle logic of signal values requests
+
+    Attributes:
+        db (DatabaseService): Handles communication with Neo4j database
+    """
+    db: DatabaseService = DatabaseService()
+
+    def save_signal_values(self, signal_values: SignalValuesIn):
+        """
+        Send request to database by its API to create signal value nodes of time series, linked after previous
+        signal value, with missing timestamp nodes spliced into timestamp list of experiment. Timestamp list is
+        read and all nodes and relationships are then created in a single transaction, which locks experiment
+        (or timestamp node from which the list is read), so concurrent requests do not splice the same list.
+
+        Args:
+            signal_values (SignalValuesIn): Signal values to be added to database
+
+        Returns:
+            Result of request as ids of created signal values and of their (start) timestamps
+        """
+        if not self.db.node_exists(signal_values.time_series_id):
+            return SignalValuesOut(errors={"errors": "not matching node id"})
+        if len(signal_values.signal_values) == 0:
+            return SignalValuesOut()
+        for index_response in [self.db.create_timestamp_index(), self.db.create_signal_value_index()]:
+            if index_response is not None and len(index_response["errors"]) > 0:
+                return SignalValuesOut(errors=index_response["errors"])
+
+        start_timestamps = [signal_value.timestamp if signal_value.timestamp is not None
+                            else signal_value.start_timestamp for signal_value in signal_values.signal_values]
+        if None in start_timestamps:
+            return SignalValuesOut(errors="Timestamp value is None. Please check time series type.")
+        timestamp_values = sorted(set(start_timestamps).union(
+            signal_value.end_timestamp for signal_value in signal_values.signal_values
+            if signal_value.timestamp is None and signal_value.end_timestamp is not None))
+
+        timestamp_list, commit_url, errors = self.get_timestamp_list(signal_values, timestamp_values[0],
+                                                                     timestamp_values[-1])
+        if errors is not None:
+            return SignalValuesOut(errors=errors)
+        timestamps, timestamp_nodes, relationships, deleted_relationships = self.splice_timestamps(
+            timestamp_values, timestamp_list, signal_values.experiment_id)
+
+        signal_value_properties = []
+        for index, signal_value in enumerate(signal_values.signal_values):
+            properties = {signal_value_property.key: str(signal_value_property.value)
+                          for signal_value_property in signal_value.properties}
+            # indexed properties, sequence number is set by database after the previous signal value
+            properties.update({"time_series_id": signal_values.time_series_id, "timestamp": start_timestamps[index]})
+            signal_value_properties.append(properties)
+            signal_value_node = {"signal_value": index}
+            if index > 0:
+                relationships.append(relationship_request("next", {"signal_value": index - 1}, signal_value_node))
+            elif signal_values.previous_signal_value_id is not None:
+                relationships.append(relationship_request("next", {"id": signal_values.previous_signal_value_id},
+                                                          signal_value_node))
+            else:
+                relationships.append(relationship_request("hasSignal", {"id": signal_values.time_series_id},
+                                                          signal_value_node))
+            if signal_value.timestamp is not None:
+                relationships.append(relationship_request("inSec", timestamp_nodes[signal_value.timestamp],
+                                                          signal_value_node))
+                continue
+            relationships.append(relationship_request("startInSec", timestamp_nodes[signal_value.start_timestamp],
+                                                      signal_value_node))
+            if signal_value.end_timestamp is not None:
+                relationships.append(relationship_request("endInSec", timestamp_nodes[signal_value.end_timestamp],
+                                                          signal_value_node))
+
+        response = self.db.create_signal_values(timestamps, signal_value_properties, relationships,
+                                                deleted_relationships, signal_values.experiment_id,
+                                                signal_values.previous_signal_value_id, commit_url)
+        if len(response["errors"]) > 0:
+            return SignalValuesOut(errors=response["errors"])
+
+        timestamp_ids, signal_value_ids = response["results"][0]["data"][0]["row"]
+        return SignalValuesOut(signal_value_ids=signal_value_ids,
+                               timestamp_ids=[timestamp_nodes[timestamp]["id"]
+                                              if "id" in timestamp_nodes[timestamp]
+                                              else timestamp_ids[timestamp_nodes[timestamp]["timestamp"]]
+                                              for timestamp in start_timestamps])
+
+    def get_signal_values(self, time_series_id: int, start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None, signal_min_value: Optional[int] = None,
+                          signal_max_value: Optional[int] = None, after_timestamp: Optional[int] = None,
+                          after_sequence: Optional[int] = None, limit: Optional[int] = None,
+                          descending: bool = False):
+        """
+        Send request to database by its API to get page of signal values of time series ordered by (start)
+        timestamp and by their order in list of signal values. Signal values are found with index, following
+        pages start after (start) timestamp and sequence number of the last signal value of previous page.
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            signal_min_value (Optional[int]): Filter signal values by min value
+            signal_max_value (Optional[int]): Filter signal values by max value
+            after_timestamp (Optional[int]): (Start) timestamp of the last signal value of previous page
+            after_sequence (Optional[int]): Sequence number of the last signal value of previous page
+            limit (Optional[int]): Maximal number of signal values
+            descending (bool): Whether signal values are read from the last one
+
+        Returns:
+            Result of request as rows of signal value node, (start) timestamp node and, for signals of type
+            Epoch, end timestamp node, without their index properties, with (start) timestamp and sequence number
+            of the last signal value
+        """
+        if not self.db.node_exists(time_series_id):
+            return SignalValueRowsOut(errors={"errors": "not matching node id"})
+        if after_timestamp is not None and after_sequence is None:
+            return SignalValueRowsOut(errors="Sequence number of the last signal value of previous page is required.")
+        index_response = self.db.create_signal_value_index()
+        if index_response is not None and len(index_response["errors"]) > 0:
+            return SignalValueRowsOut(errors=index_response["errors"])
+
+        response = self.db.get_signal_values(time_series_id, start_timestamp, end_timestamp, signal_min_value,
+                                             signal_max_value, after_timestamp, after_sequence, limit, descending)
+        if len(response["errors"]) > 0:
+            return SignalValueRowsOut(errors=response["errors"])
+
+        data = response["results"][0]["data"]
+        result = SignalValueRowsOut(rows=[])
+        for nodes in data:
+            result.rows.append([BasicNodeOut(labels=nodes["row"][index + 1], id=nodes["meta"][index]["id"],
+                                             properties=[PropertyIn(key=key, value=value)
+                                                         for key, value in nodes["row"][index].items()
+                                                         if not any(key in index_properties.get(label, ())
+                                                                    for label in nodes["row"][index + 1])])
+                                for index in range(0, len(nodes["row"]), 2) if nodes["row"][index] is not None])
+        if len(data) > 0:
+            result.last_timestamp = data[-1]["row"][0].get("timestamp")
+            result.last_sequence = data[-1]["row"][0].get("sequence")
+        return result
+
+    def replace_signal_value_properties(self, signal_values: SignalValuesPropertiesIn):
+        """
+        Send request to database by its API to replace properties of signal values of time series in a single
+        statement. Index properties of signal values are kept, so they do not need to be indexed again.
+
+        Args:
+            signal_values (SignalValuesPropertiesIn): Signal values with their new properties
+
+        Returns:
+            Result of request as signal value nodes with their previous properties
+        """
+        if not self.db.node_exists(signal_values.time_series_id):
+            return SignalValuesPropertiesOut(errors={"errors": "not matching node id"})
+        if len(signal_values.signal_values) == 0:
+            return SignalValuesPropertiesOut()
+
+        response = self.db.replace_signal_value_properties(
+            signal_values.time_series_id,
+            [{"id": signal_value.id, "properties": {signal_value_property.key: str(signal_value_property.value)
+                                                    for signal_value_property in signal_value.properties}}
+             for signal_value in signal_values.signal_values])
+        if len(response["errors"]) > 0:
+            return SignalValuesPropertiesOut(errors=response["errors"])
+
+        return SignalValuesPropertiesOut(signal_values=[
+            BasicNodeOut(id=signal_value_id, labels=labels,
+                         properties=[PropertyIn(key=key, value=value) for key, value in properties.items()
+                                     if key not in index_properties["Signal Value"]])
+            for signal_value_id, properties, labels in (row["row"] for row in response["results"][0]["data"])])
+
+    def index_signal_values(self, time_series_id: int):
+        """
+        Send request to database by its API to number signal values of time series along their list and to
+        index them, needed after signal values were created or changed one by one
+
+        Args:
+            time_series_id (int): Id of time series
+
+        Returns:
+            Result of request as number of indexed signal values
+        """
+        if not self.db.node_exists(time_series_id):
+            return SignalValuesIndexedOut(errors={"errors": "not matching node id"})
+        index_response = self.db.create_signal_value_index()
+        if index_response is not None and len(index_response["errors"]) > 0:
+            return SignalValuesIndexedOut(errors=index_response["errors"])
+
+        response = self.db.index_signal_values(time_series_id)
+        if len(response["errors"]) > 0:
+            return SignalValuesIndexedOut(errors=response["errors"])
+
+        return SignalValuesIndexedOut(signal_values_count=response["results"][0]["data"][0]["row"][0])
+
+    def delete_signal_values(self, time_series_id: int, start_timestamp: Optional[int] = None):
+        """
+        Send request to database by its API to delete signal values of time series, with timestamps not used by
+        other signal values, in a single transaction
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only signal values with (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request as numbers of deleted signal values and timestamps
+        """
+        if not self.db.node_exists(time_series_id):
+            return SignalValuesDeletedOut(errors={"errors": "not matching node id"})
+
+        response = self.db.delete_signal_values(time_series_id, start_timestamp)
+        if len(response["errors"]) > 0:
+            return SignalValuesDeletedOut(errors=response["errors"])
+
+        return SignalValuesDeletedOut(signal_values_count=response["results"][-2]["data"][0]["row"][0],
+                                      timestamps_count=response["results"][-1]["data"][0]["row"][0])
+
+    def get_timestamp_list(self, signal_values: SignalValuesIn, first_timestamp: int, last_timestamp: int):
+        """
+        Read timestamp nodes from the last one earlier than first timestamp up to last timestamp. Timestamps of
+        experiment are found by index, timestamps without experiment are read from given timestamp node, which
+        must not be later than first timestamp. Timestamp list is read in a transaction left open.
+
+        Returns:
+            Tuple of rows of timestamp list (id, timestamp, id of next relationship, id of next timestamp) with row
+            of experiment (id of takes relationship, id of first timestamp), commit URL of transaction and errors
+        """
+        timestamp_id = signal_values.timestamp_id if signal_values.experiment_id is None else None
+        response = self.db.get_timestamp_list(timestamp_id, signal_values.experiment_id, first_timestamp,
+                                              last_timestamp)
+        if len(response["errors"]) > 0:
+            return None, None, response["errors"]
+        rows = [row["row"] for row in response["results"][1]["data"]]
+        if timestamp_id is not None and (len(rows) == 0 or rows[0][1] > first_timestamp):
+            # timestamps later than given one start a new list
+            rows = []
+        experiment_rows = response["results"][2]["data"]
+        experiment_row = experiment_rows[0]["row"] if len(experiment_rows) > 0 else [None, None]
+        return (rows, experiment_row), response.get("commit"), None
+
+    def save_timestamp(self, timestamp: TimestampIn):
+        """
+        Send request to database by its API to get timestamp node of experiment, found by index, or to create it
+        in its place in timestamp list of experiment
+
+        Args:
+            timestamp (TimestampIn): Timestamp to be found or added to database
+
+        Returns:
+            Result of request as node object
+        """
+        if not self.db.node_exists(timestamp.experiment_id):
+            return NodeOut(errors={"errors": "not matching node id"})
+        index_response = self.db.create_timestamp_index()
+        if index_response is not None and len(index_response["errors"]) > 0:
+            return NodeOut(errors=index_response["errors"])
+
+        response = self.db.merge_timestamp(timestamp.experiment_id, timestamp.timestamp)
+        if len(response["errors"]) > 0:
+            return NodeOut(errors=response["errors"])
+
+        timestamp_id, properties = response["results"][0]["data"][0]["row"]
+        return NodeOut(id=timestamp_id, labels={"Timestamp"},
+                       properties=[PropertyIn(key=key, value=value) for key, value in properties.items()])
+
+    @staticmethod
+    def splice_timestamps(timestamp_values: list, timestamp_list: tuple, experiment_id):
+        """
+        Find timestamp nodes of ordered timestamp values and plan creation of missing ones, linked between
+        their neighbours in timestamp list, or linked to experiment before its first timestamp
+
+        Returns:
+            Tuple of values of timestamps to create, dictionary of timestamp nodes by value, relationships to
+            create and ids of relationships to delete
+        """
+        rows, (takes_id, first_timestamp_id) = timestamp_list
+        timestamps = []
+        timestamp_nodes = {}
+        runs = []
+        position = 0
+        for timestamp in timestamp_values:
+            while position < len(rows) and rows[position][1] < timestamp:
+                position += 1
+            if position < len(rows) and rows[position][1] == timestamp:
+                timestamp_nodes[timestamp] = {"id": rows[position][0]}
+                continue
+            timestamp_nodes[timestamp] = {"timestamp": len(timestamps)}
+            if len(runs) > 0 and runs[-1][0] == position:
+                runs[-1][1].append(len(timestamps))
+            else:
+                runs.append((position, [len(timestamps)]))
+            timestamps.append(timestamp)
+
+        relationships = []
+        deleted_relationships = []
+        for position, indices in runs:
+            if position > 0:
+                previous_id, _, next_relationship_id, next_id = rows[position - 1]
+                if next_relationship_id is not None:
+                    deleted_relationships.append(next_relationship_id)
+                relationships.append(relationship_request("next", {"id": previous_id}, {"timestamp": indices[0]}))
+            else:
+                next_id = first_timestamp_id
+                if takes_id is not None:
+                    deleted_relationships.append(takes_id)
+                if experiment_id is not None:
+                    relationships.append(relationship_request("takes", {"id": experiment_id},
+                                                              {"timestamp": indices[0]}))
+            relationships.extend(relationship_request("next", {"timestamp": index}, {"timestamp": index + 1})
+                                 for index in indices[:-1])
+            if next_id is not None:
+                relationships.append(relationship_request("next", {"timestamp": indices[-1]}, {"id": next_id}))
+        return timestamps, timestamp_nodes, relationships, deleted_relationships
@@ -5,7 +5,8 @@ import unittest.mock as mock
 from requests import Response
 
 from database_service import DatabaseService
-from node.node_model import NodeIn, NodeRowsQueryIn, NodeQueryIn, RelationQueryIn, NodeParameterQueryIn
+from node.node_model import NodeIn, NodeRowsQueryIn, NodeQueryIn, RelationQueryIn, NodeParameterQueryIn, \
+    OrderByQueryIn
 from property.property_model import PropertyIn
 from relationship.relationship_model import RelationshipIn
 
@@ -144,6 +145,50 @@ class DatabaseServiceTestCase(unittest.TestCase):
         requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
                                               auth=self.database_service.database_auth)
 
+    @mock.patch('database_service.requests')
+    def test_get_nodes_by_query_with_order_and_limit(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        commit_body = {"statements": [{
+            "statement": "MATCH (n_0)-[:`inSec`]->(n_1),(n_0:`Timestamp`),(n_1:`Signal Value`) " +
+                         "WHERE toInteger(n_0.timestamp)>=10 AND toInteger(n_0.timestamp)<20 " +
+                         "RETURN n_0,LABELS(n_0),n_1,LABELS(n_1) ORDER BY toInteger(n_0.timestamp) LIMIT 5"
+        }]}
+        query = NodeRowsQueryIn(
+            nodes=[
+                NodeQueryIn(label="Timestamp", result=True, parameters=[
+                    NodeParameterQueryIn(key="timestamp", operator="greater", value="10"),
+                    NodeParameterQueryIn(key="timestamp", operator="less_than", value="20")
+                ]),
+                NodeQueryIn(label="Signal Value", result=True),
+            ],
+            relations=[RelationQueryIn(begin_node_index=0, end_node_index=1, label="inSec")],
+            order_by=OrderByQueryIn(node_index=0, key="timestamp"),
+            limit=5)
+
+        result = self.database_service.get_nodes_by_query(query)
+
+        self.assertEqual(self.response_content, result)
+        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
+                                              auth=self.database_service.database_auth)
+
+    @mock.patch('database_service.requests')
+    def test_get_nodes_by_query_descending(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        commit_body = {"statements": [{
+            "statement": "MATCH (n_0:`Timestamp`) " +
+                         "RETURN n_0,LABELS(n_0) ORDER BY toInteger(n_0.timestamp) DESC LIMIT 1"
+        }]}
+        query = NodeRowsQueryIn(
+            nodes=[NodeQueryIn(label="Timestamp", result=True)],
+            order_by=OrderByQueryIn(node_index=0, key="timestamp", descending=True),
+            limit=1)
+
+        result = self.database_service.get_nodes_by_query(query)
+
+        self.assertEqual(self.response_content, result)
+        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
+                                              auth=self.database_service.database_auth)
+
     @mock.patch('database_service.requests')
     def test_delete_node(self, requests_mock):
         requests_mock.post.return_value = self.response
@@ -184,7 +229,8 @@ class DatabaseServiceTestCase(unittest.TestCase):
     def test_get_relationship(self, requests_mock):
         requests_mock.post.return_value = self.response
         commit_body = {"statements": [{"statement": "MATCH ()-[r]->() where id(r)=5 "
-                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r)"}]}
+                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r), "
+                                                    "properties(r)"}]}
         relationship_id = 5
 
         result = self.database_service.get_relationship(relationship_id)
@@ -210,7 +256,8 @@ class DatabaseServiceTestCase(unittest.TestCase):
     def test_get_relationships(self, requests_mock):
         requests_mock.post.return_value = self.response
         commit_body = {"statements": [{"statement": "MATCH (n)-[r]->(m) where id(n)=5 or id(m)=5 "
-                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r)"}]}
+                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r), "
+                                                    "properties(r)"}]}
         node_id = 5
 
         result = self.database_service.get_relationships(node_id)
@@ -287,3 +334,237 @@ class DatabaseServiceTestCase(unittest.TestCase):
         self.assertEqual(result, self.response_content)
         requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
                                               auth=self.database_service.database_auth)
+
+    @mock.patch('database_service.requests')
+    def test_post_statement_with_parameters(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        commit_body = {"statements": [{"statement": self.statement, "parameters": {"id": 1}}]}
+
+        result = self.database_service.post_statement(self.statement, {"id": 1})
+
+        self.assertEqual(result, self.response_content)
+        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
+                                              auth=self.database_service.database_auth)
+
+    @mock.patch('database_service.requests')
+    def test_get_timestamp_list_of_experiment(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.get_timestamp_list(None, 2, 50, 100)
+
+        self.assertEqual(result, self.response_content)
+        self.assertEqual(self.database_service.transaction_url, requests_mock.post.call_args[1]["url"])
+        statements = requests_mock.post.call_args[1]["json"]["statements"]
+        self.assertEqual(3, len(statements))
+        self.assertEqual(DatabaseService.lock_statement("experiment_id"), statements[0]["statement"])
+        self.assertIn("t.experiment_id=$experiment_id AND t.timestamp<$first_timestamp", statements[1]["statement"])
+        self.assertEqual({"timestamp_id": None, "experiment_id": 2, "first_timestamp": 50, "last_timestamp": 100},
+                         statements[1]["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_get_timestamp_list_from_timestamp(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        self.database_service.get_timestamp_list(5, None, 50, 100)
+
+        statements = requests_mock.post.call_args[1]["json"]["statements"]
+        self.assertEqual(DatabaseService.lock_statement("timestamp_id"), statements[0]["statement"])
+        self.assertTrue(statements[1]["statement"].startswith("MATCH (first:Timestamp) WHERE id(first)=$timestamp_id"))
+
+    @mock.patch('database_service.requests')
+    def test_begin_transaction(self, requests_mock):
+        response_content = {'commit': 'http://neo4j:7474/db/neo4j/tx/12/commit', 'results': [], 'errors': []}
+        self.response._content = json.dumps(response_content).encode('utf-8')
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.begin_transaction(self.commit_body)
+
+        self.assertEqual(self.database_service.transaction_url + "/12/commit", result["commit"])
+        requests_mock.post.assert_called_with(url=self.database_service.transaction_url, json=self.commit_body,
+                                              auth=self.database_service.database_auth)
+
+    @mock.patch('database_service.requests')
+    def test_merge_timestamp(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.merge_timestamp(2, 100)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertTrue(statement["statement"].startswith(
+            DatabaseService.lock_statement("experiment_id") +
+            " MERGE (t:Timestamp {experiment_id: $experiment_id, timestamp: $timestamp})"))
+        self.assertEqual({"experiment_id": 2, "timestamp": 100}, statement["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_create_timestamp_index(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        DatabaseService.timestamp_index_created = False
+
+        self.database_service.create_timestamp_index()
+        result = self.database_service.create_timestamp_index()
+
+        self.assertIsNone(result)
+        self.assertTrue(DatabaseService.timestamp_index_created)
+        self.assertEqual(2, requests_mock.post.call_count)
+        statements = [call[1]["json"]["statements"][0]["statement"] for call in requests_mock.post.call_args_list]
+        self.assertTrue(statements[0].startswith("CREATE INDEX timestamp_experiment IF NOT EXISTS"))
+
+    @mock.patch('database_service.requests')
+    def test_create_signal_values(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        relationships = [{"name": "inSec", "start_timestamp": 0, "end_signal_value": 0}]
+
+        commit_url = self.database_service.transaction_url + "/12/commit"
+
+        result = self.database_service.create_signal_values([100], [{"value": "1"}], relationships, [7], 2, 8,
+                                                            commit_url)
+
+        self.assertEqual(result, self.response_content)
+        self.assertEqual(commit_url, requests_mock.post.call_args[1]["url"])
+        statements = requests_mock.post.call_args[1]["json"]["statements"]
+        self.assertEqual(1, len(statements))
+        self.assertEqual({"timestamps": [100], "signal_values": [{"value": "1"}], "relationships": relationships,
+                          "deleted_relationships": [7], "experiment_id": 2, "previous_signal_value_id": 8},
+                         statements[0]["parameters"])
+        self.assertIn("CREATE (n)-[:endInSec]->(m)", statements[0]["statement"])
+        self.assertIn("s.sequence=coalesce(previous.sequence, -1) + 1 + index", statements[0]["statement"])
+
+    @mock.patch('database_service.requests')
+    def test_create_signal_value_index(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        DatabaseService.signal_value_index_created = False
+
+        self.database_service.create_signal_value_index()
+        result = self.database_service.create_signal_value_index()
+
+        self.assertIsNone(result)
+        self.assertTrue(DatabaseService.signal_value_index_created)
+        self.assertEqual(2, requests_mock.post.call_count)
+        statements = [call[1]["json"]["statements"][0]["statement"] for call in requests_mock.post.call_args_list]
+        self.assertTrue(statements[0].startswith("CREATE INDEX signal_value_time_series IF NOT EXISTS"))
+        self.assertIn("WHERE first.sequence IS NULL", statements[1])
+
+    @mock.patch('database_service.requests')
+    def test_index_signal_values(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.index_signal_values(1)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertIn("WHERE id(ts)=$time_series_id", statement["statement"])
+        self.assertIn("s.sequence=length(path)", statement["statement"])
+        self.assertEqual({"time_series_id": 1}, statement["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_get_signal_values(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.get_signal_values(1, start_timestamp=50, end_timestamp=200,
+                                                         after_timestamp=100, after_sequence=3, limit=10)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertTrue(statement["statement"].startswith(
+            "MATCH (s:`Signal Value`) WHERE s.time_series_id=$time_series_id AND s.timestamp>=$start_timestamp "
+            "AND s.timestamp<$end_timestamp AND (s.timestamp>$after_timestamp OR "
+            "s.timestamp=$after_timestamp AND s.sequence>$after_sequence) "
+            "WITH s ORDER BY s.timestamp, s.sequence LIMIT $limit "))
+        self.assertNotIn("next", statement["statement"])
+        self.assertEqual({"time_series_id": 1, "start_timestamp": 50, "end_timestamp": 200, "signal_min_value": None,
+                          "signal_max_value": None, "after_timestamp": 100, "after_sequence": 3, "limit": 10},
+                         statement["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_get_signal_values_descending_by_value(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        self.database_service.get_signal_values(1, signal_min_value=2, signal_max_value=5, descending=True)
+
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]["statement"]
+        self.assertIn("AND toInteger(s.value)>=$signal_min_value AND toInteger(s.value)<=$signal_max_value "
+                      "WITH s ORDER BY s.timestamp DESC, s.sequence DESC MATCH", statement)
+
+    @mock.patch('database_service.requests')
+    def test_replace_signal_value_properties(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        signal_values = [{"id": 5, "properties": {"value": "2"}}]
+
+        result = self.database_service.replace_signal_value_properties(1, signal_values)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertIn("SET s = signal_value.properties, s.time_series_id=previous.time_series_id, "
+                      "s.timestamp=previous.timestamp, s.sequence=previous.sequence", statement["statement"])
+        self.assertEqual({"time_series_id": 1, "signal_values": signal_values}, statement["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_delete_signal_values(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.delete_signal_values(1, 100)
+
+        self.assertEqual(result, self.response_content)
+        statements = requests_mock.post.call_args[1]["json"]["statements"]
+        self.assertEqual(7, len(statements))
+        self.assertTrue(all(statement["parameters"] == {"time_series_id": 1, "start_timestamp": 100}
+                            for statement in statements))
+        self.assertTrue(statements[0]["statement"].endswith(
+            "WITH DISTINCT t.experiment_id AS experiment_id " + DatabaseService.lock_statement("experiment_id", True)))
+        self.assertIn("CREATE (previous)-[:hasSignal]->(following)", statements[2]["statement"])
+        self.assertIn("CREATE (previous)-[:takes]->(following)", statements[4]["statement"])
+        self.assertEqual("MATCH (t:DeletedTimestamp) DETACH DELETE t RETURN count(t)", statements[6]["statement"])
+
+    @mock.patch('database_service.requests')
+    def test_create_signal_chunk_index(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        DatabaseService.signal_chunk_index_created = False
+
+        self.database_service.create_signal_chunk_index()
+        result = self.database_service.create_signal_chunk_index()
+
+        self.assertIsNone(result)
+        self.assertTrue(DatabaseService.signal_chunk_index_created)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]["statement"]
+        self.assertTrue(statement.startswith("CREATE INDEX signal_chunk_time_series IF NOT EXISTS"))
+
+    @mock.patch('database_service.requests')
+    def test_save_signal_chunks(self, requests_mock):
+        requests_mock.post.return_value = self.response
+        updated_signal_chunks = [{"id": 5, "properties": {"timestamps": [10], "values": [1.0]}}]
+
+        result = self.database_service.save_signal_chunks(1, updated_signal_chunks, [{"timestamps": [20]}], [7])
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertIn("c.sequence=coalesce(last.sequence, -1) + 1 + index", statement["statement"])
+        self.assertIn("CREATE (ts)-[:hasSignalChunk]->(first)", statement["statement"])
+        self.assertEqual({"time_series_id": 1, "updated_signal_chunks": updated_signal_chunks,
+                          "created_signal_chunks": [{"timestamps": [20]}], "deleted_signal_chunk_ids": [7]},
+                         statement["parameters"])
+
+    @mock.patch('database_service.requests')
+    def test_get_signal_chunks(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.get_signal_chunks(1, start_timestamp=50, end_timestamp=200,
+                                                         signal_min_value=2, after_sequence=3, limit=10,
+                                                         descending=True)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertEqual("MATCH (c:`Signal Chunk`) WHERE c.time_series_id=$time_series_id "
+                         "AND c.last_timestamp>=$start_timestamp AND c.first_timestamp<$end_timestamp "
+                         "AND c.max_value>=$signal_min_value AND c.sequence<$after_sequence "
+                         "RETURN id(c), properties(c) ORDER BY c.sequence DESC LIMIT $limit", statement["statement"])
+
+    @mock.patch('database_service.requests')
+    def test_delete_signal_chunks(self, requests_mock):
+        requests_mock.post.return_value = self.response
+
+        result = self.database_service.delete_signal_chunks(1, 100)
+
+        self.assertEqual(result, self.response_content)
+        statement = requests_mock.post.call_args[1]["json"]["statements"][0]
+        self.assertEqual({"time_series_id": 1, "start_timestamp": 100}, statement["parameters"])
@@ -117,6 +117,17 @@ class NodeServiceTestCase(unittest.TestCase):
                                                   id=0, name="Test")]))
         get_relationships_mock.assert_called_once_with(node_id)
 
+    @mock.patch.object(DatabaseService, 'get_relationships')
+    def test_get_relationships_with_properties(self, get_relationships_mock):
+        get_relationships_mock.return_value = {'results': [{'data': [{'row': [1, 2, 'Test', 0, {'order': '1'}]}]}],
+                                               'errors': []}
+        node_service = NodeService()
+
+        result = node_service.get_relationships(1)
+
+        self.assertEqual(result, RelationshipsOut(relationships=[BasicRelationshipOut(
+            start_node=1, end_node=2, id=0, name="Test", properties=[PropertyIn(key="order", value="1")])]))
+
     @mock.patch.object(DatabaseService, 'get_relationships')
     def test_get_relationships_with_error(self, get_relationships_mock):
         get_relationships_mock.return_value = {'results': [{'data': []}], 'errors': ['error']}
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from signal_chunk.signal_chunk_model import *
+from signal_chunk.signal_chunk_router import *
+
+
+class SignalChunkRouterTestCase(unittest.TestCase):
+
+    @mock.patch.object(SignalChunkService, 'save_signal_chunks')
+    def test_save_signal_chunks_without_error(self, save_signal_chunks_mock):
+        save_signal_chunks_mock.return_value = SignalChunksSavedOut(signal_chunk_ids=[5])
+        response = Response()
+        signal_chunks = SignalChunksIn(time_series_id=1, signal_chunks=[SignalChunkIn(timestamps=[10], values=[1])])
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.save_signal_chunks(signal_chunks, response))
+
+        self.assertEqual(result, SignalChunksSavedOut(signal_chunk_ids=[5], links=get_links(router)))
+        save_signal_chunks_mock.assert_called_once_with(signal_chunks)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalChunkService, 'save_signal_chunks')
+    def test_save_signal_chunks_with_error(self, save_signal_chunks_mock):
+        save_signal_chunks_mock.return_value = SignalChunksSavedOut(errors={'errors': ['test']})
+        response = Response()
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.save_signal_chunks(SignalChunksIn(time_series_id=1), response))
+
+        self.assertEqual(result, SignalChunksSavedOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(SignalChunkService, 'get_signal_chunks')
+    def test_get_signal_chunks_without_error(self, get_signal_chunks_mock):
+        get_signal_chunks_mock.return_value = SignalChunksOut()
+        response = Response()
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.get_signal_chunks(1, response, start_timestamp=100, limit=10))
+
+        self.assertEqual(result, SignalChunksOut(links=get_links(router)))
+        get_signal_chunks_mock.assert_called_once_with(1, 100, None, None, None, None, 10, False)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalChunkService, 'get_signal_chunks')
+    def test_get_signal_chunks_with_error(self, get_signal_chunks_mock):
+        get_signal_chunks_mock.return_value = SignalChunksOut(errors={'errors': ['test']})
+        response = Response()
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.get_signal_chunks(1, response))
+
+        self.assertEqual(result, SignalChunksOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch.object(SignalChunkService, 'delete_signal_chunks')
+    def test_delete_signal_chunks_without_error(self, delete_signal_chunks_mock):
+        delete_signal_chunks_mock.return_value = SignalChunksDeletedOut(signal_chunks_count=2)
+        response = Response()
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.delete_signal_chunks(1, response, start_timestamp=100))
+
+        self.assertEqual(result, SignalChunksDeletedOut(signal_chunks_count=2, links=get_links(router)))
+        delete_signal_chunks_mock.assert_called_once_with(1, 100)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalChunkService, 'delete_signal_chunks')
+    def test_delete_signal_chunks_with_error(self, delete_signal_chunks_mock):
+        delete_signal_chunks_mock.return_value = SignalChunksDeletedOut(errors={'errors': ['test']})
+        response = Response()
+        signal_chunk_router = SignalChunkRouter()
+
+        result = asyncio.run(signal_chunk_router.delete_signal_chunks(1, response))
+
+        self.assertEqual(result, SignalChunksDeletedOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
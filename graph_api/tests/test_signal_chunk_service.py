@@ -0,0 +1,94 @@
+import unittest
+import unittest.mock as mock
+
+from database_service import DatabaseService
+from signal_chunk.signal_chunk_model import *
+from signal_chunk.signal_chunk_service import SignalChunkService, signal_chunk_properties
+
+
+class SignalChunkServiceTestCase(unittest.TestCase):
+
+    @mock.patch.object(DatabaseService, 'create_signal_chunk_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'save_signal_chunks')
+    def test_save_signal_chunks(self, save_signal_chunks_mock, node_exists_mock, create_signal_chunk_index_mock):
+        node_exists_mock.return_value = True
+        save_signal_chunks_mock.return_value = {'results': [{'data': [{'row': [[5, 6]]}]}], 'errors': []}
+        signal_chunks = SignalChunksIn(time_series_id=1, deleted_signal_chunk_ids=[7], signal_chunks=[
+            SignalChunkIn(id=5, timestamps=[10, 20], values=[3, 1.5]),
+            SignalChunkIn(timestamps=[30, 40], end_timestamps=[35, 45], values=["007", 2])])
+
+        result = SignalChunkService().save_signal_chunks(signal_chunks)
+
+        self.assertEqual(result, SignalChunksSavedOut(signal_chunk_ids=[5, 6]))
+        save_signal_chunks_mock.assert_called_once_with(
+            1, [{"id": 5, "properties": {"timestamps": [10, 20], "values": [3.0, 1.5], "first_timestamp": 10,
+                                         "last_timestamp": 20, "min_value": 1.5, "max_value": 3.0}}],
+            [{"timestamps": [30, 40], "end_timestamps": [35, 45], "values": ["007", "2"], "first_timestamp": 30,
+              "last_timestamp": 40, "min_value": None, "max_value": None}],
+            [7])
+        create_signal_chunk_index_mock.assert_called_once_with()
+
+    def test_signal_chunk_properties_keep_value_types(self):
+        self.assertEqual([1, 2], signal_chunk_properties(SignalChunkIn(timestamps=[1, 2], values=[1, 2]))["values"])
+        self.assertEqual(["12", "1e3"], signal_chunk_properties(SignalChunkIn(timestamps=[1, 2],
+                                                                              values=["12", "1e3"]))["values"])
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'save_signal_chunks')
+    def test_save_signal_chunks_not_ordered(self, save_signal_chunks_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        signal_chunks = SignalChunksIn(time_series_id=1, signal_chunks=[
+            SignalChunkIn(timestamps=[20, 10], values=[1, 2])])
+
+        result = SignalChunkService().save_signal_chunks(signal_chunks)
+
+        self.assertEqual(result, SignalChunksSavedOut(errors="Timestamps of signal chunk should be ordered."))
+        save_signal_chunks_mock.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'save_signal_chunks')
+    def test_save_signal_chunks_without_time_series(self, save_signal_chunks_mock, node_exists_mock):
+        node_exists_mock.return_value = False
+
+        result = SignalChunkService().save_signal_chunks(SignalChunksIn(time_series_id=1))
+
+        self.assertEqual(result, SignalChunksSavedOut(errors={"errors": "not matching node id"}))
+        save_signal_chunks_mock.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_signal_chunks')
+    def test_get_signal_chunks(self, get_signal_chunks_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        get_signal_chunks_mock.return_value = {'results': [{'data': [
+            {'row': [5, {'time_series_id': 1, 'sequence': 0, 'timestamps': [10, 20], 'values': [3.0, 1.5],
+                         'first_timestamp': 10, 'last_timestamp': 20, 'min_value': 1.5, 'max_value': 3.0}]}]}],
+            'errors': []}
+
+        result = SignalChunkService().get_signal_chunks(1, start_timestamp=15, after_sequence=2, limit=10)
+
+        self.assertEqual(result, SignalChunksOut(signal_chunks=[
+            SignalChunkOut(id=5, sequence=0, timestamps=[10, 20], values=[3.0, 1.5], first_timestamp=10,
+                           last_timestamp=20, min_value=1.5, max_value=3.0)]))
+        get_signal_chunks_mock.assert_called_once_with(1, 15, None, None, None, 2, 10, False)
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'delete_signal_chunks')
+    def test_delete_signal_chunks(self, delete_signal_chunks_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        delete_signal_chunks_mock.return_value = {'results': [{'data': [{'row': [3]}]}], 'errors': []}
+
+        result = SignalChunkService().delete_signal_chunks(1, 100)
+
+        self.assertEqual(result, SignalChunksDeletedOut(signal_chunks_count=3))
+        delete_signal_chunks_mock.assert_called_once_with(1, 100)
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'delete_signal_chunks')
+    def test_delete_signal_chunks_with_error(self, delete_signal_chunks_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        delete_signal_chunks_mock.return_value = {'results': [], 'errors': ['error']}
+
+        result = SignalChunkService().delete_signal_chunks(1)
+
+        self.assertEqual(result, SignalChunksDeletedOut(errors=['error']))
@@ -0,0 +1,132 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from signal_value.signal_value_model import *
+from signal_value.signal_value_router import *
+
+
+class SignalValueRouterTestCase(unittest.TestCase):
+
+    @mock.patch.object(SignalValueService, 'save_signal_values')
+    def test_create_signal_values_without_error(self, save_signal_values_mock):
+        save_signal_values_mock.return_value = SignalValuesOut(signal_value_ids=[5], timestamp_ids=[6])
+        response = Response()
+        signal_values = SignalValuesIn(time_series_id=1, signal_values=[SignalValueIn(timestamp=100)])
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.create_signal_values(signal_values, response))
+
+        self.assertEqual(result, SignalValuesOut(signal_value_ids=[5], timestamp_ids=[6], links=get_links(router)))
+        save_signal_values_mock.assert_called_once_with(signal_values)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalValueService, 'save_signal_values')
+    def test_create_signal_values_with_error(self, save_signal_values_mock):
+        save_signal_values_mock.return_value = SignalValuesOut(errors={'errors': ['test']})
+        response = Response()
+        signal_values = SignalValuesIn(time_series_id=1)
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.create_signal_values(signal_values, response))
+
+        self.assertEqual(result, SignalValuesOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(SignalValueService, 'get_signal_values')
+    def test_get_signal_values_without_error(self, get_signal_values_mock):
+        get_signal_values_mock.return_value = SignalValueRowsOut(rows=[])
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.get_signal_values(1, response, start_timestamp=100, limit=10))
+
+        self.assertEqual(result, SignalValueRowsOut(rows=[], links=get_links(router)))
+        get_signal_values_mock.assert_called_once_with(1, 100, None, None, None, None, None, 10, False)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalValueService, 'get_signal_values')
+    def test_get_signal_values_with_error(self, get_signal_values_mock):
+        get_signal_values_mock.return_value = SignalValueRowsOut(errors={'errors': ['test']})
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.get_signal_values(1, response))
+
+        self.assertEqual(result, SignalValueRowsOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch.object(SignalValueService, 'replace_signal_value_properties')
+    def test_replace_signal_value_properties_with_error(self, replace_signal_value_properties_mock):
+        replace_signal_value_properties_mock.return_value = SignalValuesPropertiesOut(errors={'errors': ['test']})
+        response = Response()
+        signal_values = SignalValuesPropertiesIn(time_series_id=1, signal_values=[SignalValuePropertiesIn(id=5)])
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.replace_signal_value_properties(signal_values, response))
+
+        self.assertEqual(result, SignalValuesPropertiesOut(errors={'errors': ['test']}, links=get_links(router)))
+        replace_signal_value_properties_mock.assert_called_once_with(signal_values)
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(SignalValueService, 'index_signal_values')
+    def test_index_signal_values_without_error(self, index_signal_values_mock):
+        index_signal_values_mock.return_value = SignalValuesIndexedOut(signal_values_count=5)
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.index_signal_values(1, response))
+
+        self.assertEqual(result, SignalValuesIndexedOut(signal_values_count=5, links=get_links(router)))
+        index_signal_values_mock.assert_called_once_with(1)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalValueService, 'save_timestamp')
+    def test_create_timestamp_without_error(self, save_timestamp_mock):
+        save_timestamp_mock.return_value = NodeOut(id=5, labels={"Timestamp"})
+        response = Response()
+        timestamp = TimestampIn(experiment_id=1, timestamp=100)
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.create_timestamp(timestamp, response))
+
+        self.assertEqual(result, NodeOut(id=5, labels={"Timestamp"}, links=get_links(router)))
+        save_timestamp_mock.assert_called_once_with(timestamp)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalValueService, 'save_timestamp')
+    def test_create_timestamp_with_error(self, save_timestamp_mock):
+        save_timestamp_mock.return_value = NodeOut(errors={'errors': ['test']})
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.create_timestamp(TimestampIn(experiment_id=1, timestamp=100),
+                                                                  response))
+
+        self.assertEqual(result, NodeOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(SignalValueService, 'delete_signal_values')
+    def test_delete_signal_values_without_error(self, delete_signal_values_mock):
+        delete_signal_values_mock.return_value = SignalValuesDeletedOut(signal_values_count=2, timestamps_count=1)
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.delete_signal_values(1, response, 100))
+
+        self.assertEqual(result, SignalValuesDeletedOut(signal_values_count=2, timestamps_count=1,
+                                                        links=get_links(router)))
+        delete_signal_values_mock.assert_called_once_with(1, 100)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(SignalValueService, 'delete_signal_values')
+    def test_delete_signal_values_with_error(self, delete_signal_values_mock):
+        delete_signal_values_mock.return_value = SignalValuesDeletedOut(errors={'errors': ['test']})
+        response = Response()
+        signal_value_router = SignalValueRouter()
+
+        result = asyncio.run(signal_value_router.delete_signal_values(1, response))
+
+        self.assertEqual(result, SignalValuesDeletedOut(errors={'errors': ['test']}, links=get_links(router)))
+        delete_signal_values_mock.assert_called_once_with(1, None)
+        self.assertEqual(response.status_code, 404)
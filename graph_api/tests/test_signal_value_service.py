@@ -0,0 +1,275 @@
+import unittest
+import unittest.mock as mock
+
+from database_service import DatabaseService
+from node.node_model import NodeOut, BasicNodeOut
+from property.property_model import PropertyIn
+from signal_value.signal_value_model import *
+from signal_value.signal_value_service import SignalValueService
+
+
+def timestamp_list_response(rows, experiment_row):
+    return {'results': [{'data': []}, {'data': [{'row': row} for row in rows]},
+                        {'data': [{'row': experiment_row}] if experiment_row is not None else []}],
+            'commit': 'http://localhost:7474/db/neo4j/tx/5/commit', 'errors': []}
+
+
+class SignalValueServiceTestCase(unittest.TestCase):
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'create_signal_values')
+    def test_save_signal_values_without_time_series(self, create_signal_values_mock, node_exists_mock):
+        node_exists_mock.return_value = False
+        signal_values = SignalValuesIn(time_series_id=1, signal_values=[SignalValueIn(timestamp=100)])
+
+        result = SignalValueService().save_signal_values(signal_values)
+
+        self.assertEqual(result, SignalValuesOut(errors={"errors": "not matching node id"}))
+        create_signal_values_mock.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'create_timestamp_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_timestamp_list')
+    @mock.patch.object(DatabaseService, 'create_signal_values')
+    def test_save_signal_values_of_timestamp_type(self, create_signal_values_mock, get_timestamp_list_mock,
+                                                  node_exists_mock, create_timestamp_index_mock,
+                                                  create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        get_timestamp_list_mock.return_value = timestamp_list_response(
+            [[10, 50, 100, 11], [11, 150, None, None]], [90, 10])
+        create_signal_values_mock.return_value = {'results': [{'data': [{'row': [[20, 21], [30, 31, 32]]}]}],
+                                                  'errors': []}
+        signal_values = SignalValuesIn(time_series_id=1, experiment_id=2, signal_values=[
+            SignalValueIn(timestamp=50, properties=[PropertyIn(key="value", value=1)]),
+            SignalValueIn(timestamp=100, properties=[PropertyIn(key="value", value="a")]),
+            SignalValueIn(timestamp=200, properties=[PropertyIn(key="value", value=3)])])
+
+        result = SignalValueService().save_signal_values(signal_values)
+
+        self.assertEqual(result, SignalValuesOut(signal_value_ids=[30, 31, 32], timestamp_ids=[10, 20, 21]))
+        get_timestamp_list_mock.assert_called_once_with(None, 2, 50, 200)
+        create_signal_values_mock.assert_called_once_with(
+            [100, 200], [{"value": "1", "time_series_id": 1, "timestamp": 50},
+                         {"value": "a", "time_series_id": 1, "timestamp": 100},
+                         {"value": "3", "time_series_id": 1, "timestamp": 200}],
+            [{"name": "next", "start_id": 10, "end_timestamp": 0},
+             {"name": "next", "start_timestamp": 0, "end_id": 11},
+             {"name": "next", "start_id": 11, "end_timestamp": 1},
+             {"name": "hasSignal", "start_id": 1, "end_signal_value": 0},
+             {"name": "inSec", "start_id": 10, "end_signal_value": 0},
+             {"name": "next", "start_signal_value": 0, "end_signal_value": 1},
+             {"name": "inSec", "start_timestamp": 0, "end_signal_value": 1},
+             {"name": "next", "start_signal_value": 1, "end_signal_value": 2},
+             {"name": "inSec", "start_timestamp": 1, "end_signal_value": 2}],
+            [100], 2, None, 'http://localhost:7474/db/neo4j/tx/5/commit')
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'create_timestamp_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_timestamp_list')
+    @mock.patch.object(DatabaseService, 'create_signal_values')
+    def test_save_signal_values_of_epoch_type_before_first_timestamp(self, create_signal_values_mock,
+                                                                     get_timestamp_list_mock, node_exists_mock,
+                                                                     create_timestamp_index_mock,
+                                                                     create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        get_timestamp_list_mock.return_value = timestamp_list_response([[10, 100, 91, 12], [12, 150, None, None]],
+                                                                       [90, 10])
+        create_signal_values_mock.return_value = {'results': [{'data': [{'row': [[20], [30]]}]}], 'errors': []}
+        signal_values = SignalValuesIn(time_series_id=1, experiment_id=2, previous_signal_value_id=8,
+                                       timestamp_id=12,
+                                       signal_values=[SignalValueIn(start_timestamp=50, end_timestamp=150)])
+
+        result = SignalValueService().save_signal_values(signal_values)
+
+        self.assertEqual(result, SignalValuesOut(signal_value_ids=[30], timestamp_ids=[20]))
+        get_timestamp_list_mock.assert_called_once_with(None, 2, 50, 150)
+        create_signal_values_mock.assert_called_once_with(
+            [50], [{"time_series_id": 1, "timestamp": 50}],
+            [{"name": "takes", "start_id": 2, "end_timestamp": 0},
+             {"name": "next", "start_timestamp": 0, "end_id": 10},
+             {"name": "next", "start_id": 8, "end_signal_value": 0},
+             {"name": "startInSec", "start_timestamp": 0, "end_signal_value": 0},
+             {"name": "endInSec", "start_id": 12, "end_signal_value": 0}],
+            [90], 2, 8, 'http://localhost:7474/db/neo4j/tx/5/commit')
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'create_timestamp_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_timestamp_list')
+    @mock.patch.object(DatabaseService, 'create_signal_values')
+    def test_save_signal_values_without_experiment_before_timestamp(self, create_signal_values_mock,
+                                                                    get_timestamp_list_mock, node_exists_mock,
+                                                                    create_timestamp_index_mock,
+                                                                    create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        get_timestamp_list_mock.return_value = timestamp_list_response([[12, 150, None, None]], None)
+        create_signal_values_mock.return_value = {'results': [{'data': [{'row': [[20], [30]]}]}], 'errors': []}
+        signal_values = SignalValuesIn(time_series_id=1, timestamp_id=12, signal_values=[SignalValueIn(timestamp=50)])
+
+        result = SignalValueService().save_signal_values(signal_values)
+
+        self.assertEqual(result, SignalValuesOut(signal_value_ids=[30], timestamp_ids=[20]))
+        get_timestamp_list_mock.assert_called_once_with(12, None, 50, 50)
+        create_signal_values_mock.assert_called_once_with(
+            [50], [{"time_series_id": 1, "timestamp": 50}],
+            [{"name": "hasSignal", "start_id": 1, "end_signal_value": 0},
+             {"name": "inSec", "start_timestamp": 0, "end_signal_value": 0}],
+            [], None, None, 'http://localhost:7474/db/neo4j/tx/5/commit')
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'create_timestamp_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_timestamp_list')
+    @mock.patch.object(DatabaseService, 'create_signal_values')
+    def test_save_signal_values_with_error(self, create_signal_values_mock, get_timestamp_list_mock,
+                                           node_exists_mock, create_timestamp_index_mock,
+                                           create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        get_timestamp_list_mock.return_value = timestamp_list_response([], None)
+        create_signal_values_mock.return_value = {'results': [], 'errors': ['error']}
+        signal_values = SignalValuesIn(time_series_id=1, signal_values=[SignalValueIn(timestamp=50),
+                                                                        SignalValueIn(timestamp=60)])
+
+        result = SignalValueService().save_signal_values(signal_values)
+
+        self.assertEqual(result, SignalValuesOut(errors=['error']))
+        create_signal_values_mock.assert_called_once_with(
+            [50, 60], [{"time_series_id": 1, "timestamp": 50}, {"time_series_id": 1, "timestamp": 60}],
+            [{"name": "next", "start_timestamp": 0, "end_timestamp": 1},
+             {"name": "hasSignal", "start_id": 1, "end_signal_value": 0},
+             {"name": "inSec", "start_timestamp": 0, "end_signal_value": 0},
+             {"name": "next", "start_signal_value": 0, "end_signal_value": 1},
+             {"name": "inSec", "start_timestamp": 1, "end_signal_value": 1}],
+            [], None, None, 'http://localhost:7474/db/neo4j/tx/5/commit')
+
+    @mock.patch.object(DatabaseService, 'create_timestamp_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'merge_timestamp')
+    def test_save_timestamp(self, merge_timestamp_mock, node_exists_mock, create_timestamp_index_mock):
+        node_exists_mock.return_value = True
+        merge_timestamp_mock.return_value = {'results': [{'data': [{'row': [20, {"experiment_id": 2,
+                                                                                 "timestamp": 100}]}]}],
+                                             'errors': []}
+
+        result = SignalValueService().save_timestamp(TimestampIn(experiment_id=2, timestamp=100))
+
+        self.assertEqual(result, NodeOut(id=20, labels={"Timestamp"},
+                                         properties=[PropertyIn(key="experiment_id", value=2),
+                                                     PropertyIn(key="timestamp", value=100)]))
+        merge_timestamp_mock.assert_called_once_with(2, 100)
+        create_timestamp_index_mock.assert_called_once_with()
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'merge_timestamp')
+    def test_save_timestamp_without_experiment(self, merge_timestamp_mock, node_exists_mock):
+        node_exists_mock.return_value = False
+
+        result = SignalValueService().save_timestamp(TimestampIn(experiment_id=2, timestamp=100))
+
+        self.assertEqual(result, NodeOut(errors={"errors": "not matching node id"}))
+        merge_timestamp_mock.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_signal_values')
+    def test_get_signal_values(self, get_signal_values_mock, node_exists_mock, create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        get_signal_values_mock.return_value = {'results': [{'data': [
+            {'row': [{'value': '1', 'time_series_id': 1, 'timestamp': 100, 'sequence': 3}, ['Signal Value'],
+                     {'timestamp': 100, 'experiment_id': 5}, ['Timestamp'], None, None],
+             'meta': [{'id': 30}, None, {'id': 20}, None, None, None]},
+            {'row': [{'value': '2', 'time_series_id': 1, 'timestamp': 110, 'sequence': 4}, ['Signal Value'],
+                     {'timestamp': 110, 'experiment_id': 5}, ['Timestamp'], {'timestamp': 120}, ['Timestamp']],
+             'meta': [{'id': 31}, None, {'id': 21}, None, {'id': 22}, None]}]}],
+            'errors': []}
+
+        result = SignalValueService().get_signal_values(1, start_timestamp=100, after_timestamp=90,
+                                                        after_sequence=2, limit=2)
+
+        self.assertEqual(result, SignalValueRowsOut(rows=[
+            [BasicNodeOut(id=30, labels={'Signal Value'}, properties=[PropertyIn(key='value', value='1')]),
+             BasicNodeOut(id=20, labels={'Timestamp'}, properties=[PropertyIn(key='timestamp', value=100)])],
+            [BasicNodeOut(id=31, labels={'Signal Value'}, properties=[PropertyIn(key='value', value='2')]),
+             BasicNodeOut(id=21, labels={'Timestamp'}, properties=[PropertyIn(key='timestamp', value=110)]),
+             BasicNodeOut(id=22, labels={'Timestamp'}, properties=[PropertyIn(key='timestamp', value=120)])]],
+            last_timestamp=110, last_sequence=4))
+        get_signal_values_mock.assert_called_once_with(1, 100, None, None, None, 90, 2, 2, False)
+        create_signal_value_index_mock.assert_called_once_with()
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'get_signal_values')
+    def test_get_signal_values_without_sequence_of_previous_page(self, get_signal_values_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+
+        result = SignalValueService().get_signal_values(1, after_timestamp=90)
+
+        self.assertEqual(result, SignalValueRowsOut(
+            errors="Sequence number of the last signal value of previous page is required."))
+        get_signal_values_mock.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'replace_signal_value_properties')
+    def test_replace_signal_value_properties(self, replace_signal_value_properties_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        replace_signal_value_properties_mock.return_value = {'results': [{'data': [
+            {'row': [30, {'value': '1', 'time_series_id': 1, 'timestamp': 100, 'sequence': 3}, ['Signal Value']]}]}],
+            'errors': []}
+        signal_values = SignalValuesPropertiesIn(time_series_id=1, signal_values=[
+            SignalValuePropertiesIn(id=30, properties=[PropertyIn(key='value', value=2)])])
+
+        result = SignalValueService().replace_signal_value_properties(signal_values)
+
+        self.assertEqual(result, SignalValuesPropertiesOut(signal_values=[
+            BasicNodeOut(id=30, labels={'Signal Value'}, properties=[PropertyIn(key='value', value='1')])]))
+        replace_signal_value_properties_mock.assert_called_once_with(1, [{'id': 30, 'properties': {'value': '2'}}])
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'replace_signal_value_properties')
+    def test_replace_signal_value_properties_with_error(self, replace_signal_value_properties_mock,
+                                                        node_exists_mock):
+        node_exists_mock.return_value = True
+        replace_signal_value_properties_mock.return_value = {'results': [], 'errors': ['error']}
+        signal_values = SignalValuesPropertiesIn(time_series_id=1, signal_values=[SignalValuePropertiesIn(id=30)])
+
+        result = SignalValueService().replace_signal_value_properties(signal_values)
+
+        self.assertEqual(result, SignalValuesPropertiesOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'create_signal_value_index', return_value=None)
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'index_signal_values')
+    def test_index_signal_values(self, index_signal_values_mock, node_exists_mock, create_signal_value_index_mock):
+        node_exists_mock.return_value = True
+        index_signal_values_mock.return_value = {'results': [{'data': [{'row': [5]}]}], 'errors': []}
+
+        result = SignalValueService().index_signal_values(1)
+
+        self.assertEqual(result, SignalValuesIndexedOut(signal_values_count=5))
+        index_signal_values_mock.assert_called_once_with(1)
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'delete_signal_values')
+    def test_delete_signal_values(self, delete_signal_values_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        delete_signal_values_mock.return_value = {'results': [{'data': []}, {'data': []}, {'data': []},
+                                                              {'data': []}, {'data': [{'row': [4]}]},
+                                                              {'data': [{'row': [3]}]}],
+                                                  'errors': []}
+
+        result = SignalValueService().delete_signal_values(1, 100)
+
+        self.assertEqual(result, SignalValuesDeletedOut(signal_values_count=4, timestamps_count=3))
+        delete_signal_values_mock.assert_called_once_with(1, 100)
+
+    @mock.patch.object(DatabaseService, 'node_exists')
+    @mock.patch.object(DatabaseService, 'delete_signal_values')
+    def test_delete_signal_values_with_error(self, delete_signal_values_mock, node_exists_mock):
+        node_exists_mock.return_value = True
+        delete_signal_values_mock.return_value = {'results': [], 'errors': ['error']}
+
+        result = SignalValueService().delete_signal_values(1)
+
+        self.assertEqual(result, SignalValuesDeletedOut(errors=['error']))
+        delete_signal_values_mock.assert_called_once_with(1, None)
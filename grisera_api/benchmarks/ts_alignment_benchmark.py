@@ -0,0 +1,39 @@
+"""
+Benchmark of multidimensional transformation of time series read from MongoDB, aligning signals of all
+channels by equal timestamps. Run from grisera_api directory:
+
+    python -m benchmarks.ts_alignment_benchmark [signals_count] [channels_count]
+"""
+import sys
+import timeit
+
+from time_series.time_series_model import TimeSeriesOut, Type
+from time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import \
+    TimeSeriesTransformationMultidimensional
+
+
+def create_time_series(signals_count: int, channel: int):
+    # every channel misses a different part of timestamps, so only some of them are aligned
+    signal_values = [
+        {"timestamp": timestamp, "signal_value": {"value": timestamp % 100, "additional_properties": None}}
+        for timestamp in range(signals_count) if timestamp % 10 != channel
+    ]
+    return TimeSeriesOut.construct(type=Type.timestamp, signal_values=signal_values)
+
+
+def main():
+    signals_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    channels_count = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    time_series = [create_time_series(signals_count, channel) for channel in range(channels_count)]
+
+    def transform():
+        return TimeSeriesTransformationMultidimensional().transform(time_series)
+
+    aligned_count = len(transform().signal_values)
+    seconds = min(timeit.repeat(transform, number=1, repeat=3))
+    print(f"{channels_count} channels of {signals_count} signals aligned to {aligned_count} signals "
+          f"in {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
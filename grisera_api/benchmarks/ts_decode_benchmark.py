@@ -0,0 +1,66 @@
+"""
+Benchmark of decoding MongoDB time series documents into the response of GET /time_series/{id}.
+
+Compares the per-signal cost of building SignalIn models for each document (the previous decode
+path) with the plain dict decode path of MongoApiService, both for decoding alone and together with
+conversion of the response to dict, as done by FastAPI. Run from grisera_api directory:
+
+    python -m benchmarks.ts_decode_benchmark [signals_count]
+"""
+import sys
+import timeit
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from mongo_service.mongo_api_service import MongoApiService
+from time_series.time_series_model import SignalIn, SignalValueNodesIn, TimeSeriesOut
+
+
+def create_documents(signals_count: int):
+    metadata = {"id": ObjectId(), "type": "Timestamp", "source": "benchmark", "additional_properties": []}
+    return [
+        {
+            "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None),
+            "metadata": metadata,
+            "value": timestamp % 100,
+            "additional_properties": None,
+        }
+        for timestamp in range(1, signals_count + 1)
+    ]
+
+
+def decode_with_models(documents: list):
+    metadata = dict(documents[0]["metadata"], id=str(documents[0]["metadata"]["id"]))
+    signal_values = [
+        SignalIn(
+            timestamp=document["timestamp"].replace(tzinfo=timezone.utc).timestamp(),
+            signal_value=SignalValueNodesIn(
+                value=document["value"],
+                additional_properties=document["additional_properties"],
+            ),
+        )
+        for document in documents
+    ]
+    return TimeSeriesOut(signal_values=signal_values, **metadata)
+
+
+def decode_with_dicts(documents: list):
+    return TimeSeriesOut(**MongoApiService()._time_series_documents_to_dict(documents))
+
+
+def main():
+    signals_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    documents = create_documents(signals_count)
+    assert decode_with_models(documents).dict() == decode_with_dicts(documents).dict()
+    for name, decode in (("models", decode_with_models), ("dicts", decode_with_dicts)):
+        decode_seconds = min(timeit.repeat(lambda: decode(documents), number=1, repeat=5))
+        response_seconds = min(timeit.repeat(lambda: decode(documents).dict(), number=1, repeat=5))
+        print(
+            f"{name:>6}: decode {decode_seconds * 1e9 / signals_count:6.0f} ns per signal, "
+            f"decode and dict {response_seconds * 1e9 / signals_count:6.0f} ns per signal"
+        )
+
+
+if __name__ == "__main__":
+    main()
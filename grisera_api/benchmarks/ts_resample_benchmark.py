@@ -0,0 +1,43 @@
+"""
+Benchmark of resample_nearest transformation of time series read from graph (signal value and timestamp
+nodes). Run from grisera_api directory:
+
+    python -m benchmarks.ts_resample_benchmark [signals_count] [period]
+"""
+import sys
+import timeit
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import TimeSeriesOut, Type
+from time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+
+
+def create_time_series(signals_count: int):
+    signal_values = [
+        {
+            "signal_value": {"id": index, "labels": ["Signal Value"],
+                             "properties": [{"key": "value", "value": str(index % 100)}]},
+            "timestamp": {"id": signals_count + index, "labels": ["Timestamp"],
+                          "properties": [{"key": "timestamp", "value": str(index * 4)}]},
+        }
+        for index in range(signals_count)
+    ]
+    return TimeSeriesOut.construct(type=Type.timestamp, signal_values=signal_values)
+
+
+def main():
+    signals_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    period = sys.argv[2] if len(sys.argv) > 2 else "1"
+    time_series = create_time_series(signals_count)
+
+    def resample():
+        return TimeSeriesTransformationResample().transform([time_series], [PropertyIn(key="period", value=period)])
+
+    new_signals_count = len(resample()[0].signal_values)
+    seconds = min(timeit.repeat(resample, number=1, repeat=3))
+    print(f"{signals_count} signals resampled to {new_signals_count} signals in {seconds:.2f} s, "
+          f"{seconds * 1e9 / new_signals_count:.0f} ns per new signal")
+
+
+if __name__ == "__main__":
+    main()
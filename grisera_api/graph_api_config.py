@@ -4,3 +4,12 @@ import os
 graph_api_host = os.environ.get('GRAPH_API_HOST') or 'localhost'
 graph_api_port = os.environ.get('GRAPH_API_PORT') or '8000'
 graph_api_address = "http://{}:{}".format(graph_api_host, graph_api_port)
+
+# number of signals saved by single request to graph_api, 0 saves each signal with separate requests
+graph_api_bulk_chunk_size = int(os.environ.get('GRAPH_API_BULK_CHUNK_SIZE') or 5000)
+
+# number of signal values read by single request to graph_api
+graph_api_page_size = int(os.environ.get('GRAPH_API_PAGE_SIZE') or 10000)
+
+# number of signals stored in single signal chunk node in signal chunks persistence mode
+graph_api_signal_chunk_size = int(os.environ.get('GRAPH_API_SIGNAL_CHUNK_SIZE') or 4096)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import requests
 from pydantic import BaseModel
 
@@ -153,6 +155,18 @@ class GraphApiService:
         Returns:
             Result of request
         """
+        return self.post("/nodes/{}/properties".format(node_id), self.create_node_properties(node_model))
+
+    def create_node_properties(self, node_model: BaseModel):
+        """
+        Creates request body for properties of node
+
+        Args:
+            node_model (BaseModel): Model of node with properties
+
+        Returns:
+            Request body
+        """
         node_dict = node_model.dict()
         request_body = []
         for key, value in node_dict.items():
@@ -160,8 +174,188 @@ class GraphApiService:
                 request_body.extend(self.create_additional_properties(property_dict=node_dict))
             elif value is not None and not isinstance(value, list) and not isinstance(value, dict):
                 request_body.append({"key": key, "value": value})
+        return request_body
+
+    def create_signal_values(self, time_series_id: int, experiment_id: Optional[int], signal_values: list,
+                             previous_signal_value_id: Optional[int] = None, timestamp_id: Optional[int] = None):
+        """
+        Send to the Graph API request to create signal values of time series with their timestamps in a single
+        transaction
+
+        Args:
+            time_series_id (int): Id of time series
+            experiment_id (Optional[int]): Id of experiment, which takes list of timestamps
+            signal_values (List[SignalIn]): Signals to create
+            previous_signal_value_id (Optional[int]): Id of signal value after which signal values are linked
+            timestamp_id (Optional[int]): Id of timestamp from which list of timestamps is searched
+
+        Returns:
+            Result of request
+        """
+        request_body = {"time_series_id": time_series_id, "experiment_id": experiment_id,
+                        "previous_signal_value_id": previous_signal_value_id, "timestamp_id": timestamp_id,
+                        "signal_values": [{"timestamp": signal_value.timestamp,
+                                           "start_timestamp": signal_value.start_timestamp,
+                                           "end_timestamp": signal_value.end_timestamp,
+                                           "properties": self.create_node_properties(signal_value.signal_value)}
+                                          for signal_value in signal_values]}
+        return self.post("/signal_values", request_body)
+
+    def get_signal_values(self, time_series_id: int, start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None, signal_min_value: Optional[int] = None,
+                          signal_max_value: Optional[int] = None, after_timestamp: Optional[int] = None,
+                          after_sequence: Optional[int] = None, limit: Optional[int] = None,
+                          descending: bool = False):
+        """
+        Send to the Graph API request to get page of signal values of time series with their timestamps, ordered
+        by (start) timestamp
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            signal_min_value (Optional[int]): Filter signal values by min value
+            signal_max_value (Optional[int]): Filter signal values by max value
+            after_timestamp (Optional[int]): (Start) timestamp of the last signal value of previous page
+            after_sequence (Optional[int]): Sequence number of the last signal value of previous page
+            limit (Optional[int]): Maximal number of signal values
+            descending (bool): Whether signal values are read from the last one
+
+        Returns:
+            Result of request
+        """
+        request_params = {"time_series_id": time_series_id, "start_timestamp": start_timestamp,
+                          "end_timestamp": end_timestamp, "signal_min_value": signal_min_value,
+                          "signal_max_value": signal_max_value, "after_timestamp": after_timestamp,
+                          "after_sequence": after_sequence, "limit": limit}
+        request_params = {key: value for key, value in request_params.items() if value is not None}
+        if descending:
+            request_params["descending"] = True
+        return self.get("/signal_values", request_params)
+
+    def replace_signal_value_properties(self, time_series_id: int, signal_values: list):
+        """
+        Send to the Graph API request to replace properties of stored signal values of time series in a single
+        transaction
+
+        Args:
+            time_series_id (int): Id of time series
+            signal_values (list): Pairs of id of signal value node and model of its new properties
+
+        Returns:
+            Result of request
+        """
+        request_body = {"time_series_id": time_series_id,
+                        "signal_values": [{"id": signal_value_id,
+                                           "properties": self.create_node_properties(signal_value)}
+                                          for signal_value_id, signal_value in signal_values]}
+        return self.post("/signal_values/properties", request_body)
+
+    def index_signal_values(self, time_series_id: int):
+        """
+        Send to the Graph API request to number signal values of time series along their list and index them
+
+        Args:
+            time_series_id (int): Id of time series
+
+        Returns:
+            Result of request
+        """
+        return self.post("/signal_values/index?time_series_id={}".format(time_series_id), {})
 
-        return self.post("/nodes/{}/properties".format(node_id), request_body)
+    def delete_signal_values(self, time_series_id: int, start_timestamp: Optional[int] = None):
+        """
+        Send to the Graph API request to delete signal values of time series with timestamps not used by other
+        signal values
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only signal values with (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request
+        """
+        request_params = {"time_series_id": time_series_id}
+        if start_timestamp is not None:
+            request_params["start_timestamp"] = start_timestamp
+        return self.delete("/signal_values", request_params)
+
+    def save_signal_chunks(self, time_series_id: int, signal_chunks: list, deleted_signal_chunk_ids: list = []):
+        """
+        Send to the Graph API request to delete, overwrite and append signal chunks of time series in a single
+        transaction
+
+        Args:
+            time_series_id (int): Id of time series
+            signal_chunks (list): Ordered chunks, overwritten when they have id, otherwise appended after
+                the last chunk of time series
+            deleted_signal_chunk_ids (list): Ids of signal chunks to delete
+
+        Returns:
+            Result of request
+        """
+        return self.post("/signal_chunks", {"time_series_id": time_series_id, "signal_chunks": signal_chunks,
+                                            "deleted_signal_chunk_ids": deleted_signal_chunk_ids})
+
+    def get_signal_chunks(self, time_series_id: int, start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None, signal_min_value: Optional[float] = None,
+                          signal_max_value: Optional[float] = None, after_sequence: Optional[int] = None,
+                          limit: Optional[int] = None, descending: bool = False):
+        """
+        Send to the Graph API request to get page of signal chunks of time series, which may contain signals
+        in given ranges of (start) timestamps and values
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Filter chunks by last (start) timestamp not lower than given one
+            end_timestamp (Optional[int]): Filter chunks by first (start) timestamp lower than given one
+            signal_min_value (Optional[float]): Filter chunks by max value not lower than given one
+            signal_max_value (Optional[float]): Filter chunks by min value not greater than given one
+            after_sequence (Optional[int]): Sequence number of the last chunk of previous page
+            limit (Optional[int]): Maximal number of chunks
+            descending (bool): Whether chunks are read from the last one
+
+        Returns:
+            Result of request
+        """
+        request_params = {"time_series_id": time_series_id, "start_timestamp": start_timestamp,
+                          "end_timestamp": end_timestamp, "signal_min_value": signal_min_value,
+                          "signal_max_value": signal_max_value, "after_sequence": after_sequence, "limit": limit}
+        request_params = {key: value for key, value in request_params.items() if value is not None}
+        if descending:
+            request_params["descending"] = True
+        return self.get("/signal_chunks", request_params)
+
+    def delete_signal_chunks(self, time_series_id: int, start_timestamp: Optional[int] = None):
+        """
+        Send to the Graph API request to delete signal chunks of time series
+
+        Args:
+            time_series_id (int): Id of time series
+            start_timestamp (Optional[int]): Only chunks with the first (start) timestamp not earlier are deleted
+
+        Returns:
+            Result of request
+        """
+        request_params = {"time_series_id": time_series_id}
+        if start_timestamp is not None:
+            request_params["start_timestamp"] = start_timestamp
+        return self.delete("/signal_chunks", request_params)
+
+    def get_or_create_timestamp(self, experiment_id: int, timestamp: int):
+        """
+        Send to the Graph API request to get timestamp node of experiment or to create it in timestamp list
+        of experiment
+
+        Args:
+            experiment_id (int): Id of experiment
+            timestamp (int): Value of timestamp
+
+        Returns:
+            Result of request
+        """
+        request_body = {"experiment_id": experiment_id, "timestamp": timestamp}
+        return self.post("/timestamps", request_body)
 
     def create_relationships(self, start_node: int, end_node: int, name: str):
         """
@@ -29,6 +29,10 @@ from time_series.time_series_router import router as time_series_router
 from registered_data.registered_data_router import router as registered_data_router
 from scenario.scenario_router import router as scenario_router
 from measure_name.measure_name_router import router as measure_name_router
+from migration.migration_router import router as migration_router
+from mongo_service.mongo_migration_service import MongoMigrationService
+from services import Services
+from services.services import PersistenceTypes
 from setup import SetupNodes
 from graph_api_config import *
 
@@ -59,6 +63,7 @@ app.include_router(registered_channel_router)
 app.include_router(registered_data_router)
 app.include_router(scenario_router)
 app.include_router(time_series_router)
+app.include_router(migration_router)
 
 
 @app.on_event("startup")
@@ -68,6 +73,8 @@ async def startup_event():
     if not os.path.exists("lock"):
         open("lock", "w").write("Busy")
         sleep(2)
+        if Services().persistence_type == PersistenceTypes.MONGODB:
+            MongoMigrationService().apply_migrations()
         startup.set_activities()
         startup.set_channels()
         startup.set_arrangements()
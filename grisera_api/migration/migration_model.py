@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import List, Optional, Any
+
+from pydantic import BaseModel
+
+from models.base_model_out import BaseModelOut
+
+
+class IndexOut(BaseModel):
+    """
+    Model of index existing in database
+
+    Attributes:
+    collection (str): Name of indexed collection
+    name (str): Name of the index
+    keys (List[List[Any]]): Indexed fields with their directions
+    """
+
+    collection: str
+    name: str
+    keys: List[List[Any]]
+
+
+class MigrationOut(BaseModel):
+    """
+    Model of applied schema migration
+
+    Attributes:
+    version (int): Version of the schema after the migration
+    description (str): Description of the migration
+    indexes (List[str]): Names of indexes created by the migration
+    applied_at (Optional[datetime]): Time when the migration was applied
+    """
+
+    version: int
+    description: str
+    indexes: List[str] = []
+    applied_at: Optional[datetime]
+
+
+class IndexesOut(BaseModelOut):
+    """
+    Model of indexes and applied migrations to send to client as a result of request
+
+    Attributes:
+    schema_version (int): Version of the last applied migration
+    migrations (List[MigrationOut]): Applied migrations
+    indexes (List[IndexOut]): Indexes existing in database
+    """
+
+    schema_version: int = 0
+    migrations: List[MigrationOut] = []
+    indexes: List[IndexOut] = []
@@ -0,0 +1,40 @@
+from fastapi import Response
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+
+from hateoas import get_links
+from migration.migration_model import IndexesOut
+from mongo_service.mongo_migration_service import MongoMigrationService
+from services import Services
+from services.services import PersistenceTypes
+
+router = InferringRouter()
+
+
+@cbv(router)
+class MigrationRouter:
+    """
+    Class for routing administration requests concerning database schema
+    """
+
+    @router.get("/admin/indexes", tags=["admin"], response_model=IndexesOut)
+    async def get_indexes(self, response: Response):
+        """
+        Get indexes existing in database together with applied schema migrations. Available only for MongoDB
+        persistence type.
+        """
+        if Services().persistence_type != PersistenceTypes.MONGODB:
+            response.status_code = 404
+            return IndexesOut(errors="indexes are managed only for MongoDB persistence", links=get_links(router))
+
+        migration_service = MongoMigrationService()
+        get_response = IndexesOut(
+            schema_version=migration_service.get_schema_version(),
+            migrations=migration_service.get_migrations(),
+            indexes=migration_service.get_indexes(),
+        )
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
@@ -76,6 +76,8 @@ class Collections(str, Enum):
     REGISTERED_DATA = "registered_data"
     SCENARIO = "scenarios"
     TIME_SERIES = "timeSeries"
+    TIME_SERIES_BUCKETS = "timeSeriesBuckets"
+    MIGRATIONS = "migrations"
 
 
 SUPERCLASSES_TO_COLLECTION_NAMES = {
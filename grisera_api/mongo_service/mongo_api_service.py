@@ -1,17 +1,34 @@
-from typing import Union
+from typing import Union, Iterable, List, Optional
 from pydantic import BaseModel
+import numpy as np
 import pymongo
 from bson import ObjectId
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from time_series.time_series_model import (
+    DownsamplingMethod,
+    SignalColumnsIn,
     SignalIn,
-    SignalValueNodesIn,
+    SignalStatistics,
     TimeSeriesIn,
 )
+from time_series.ts_downsampling import downsample
+from time_series.ts_helpers import get_next_page_cursor
+from time_series.ts_statistics import (
+    merge_statistics,
+    next_statistics_version,
+    signal_columns_statistics,
+    signal_values_statistics,
+)
 from models.not_found_model import NotFoundByIdModel
 from mongo_service.collection_mapping import get_collection_name, Collections
-from mongo_service.mongodb_api_config import mongo_api_address, mongo_database_name
+from mongo_service.mongodb_api_config import (
+    mongo_api_address,
+    mongo_database_name,
+    mongo_ts_insert_batch_size,
+    mongo_ts_storage_mode,
+    mongo_ts_bucket_size,
+)
 
 client = pymongo.MongoClient(mongo_api_address)
 db = client[mongo_database_name]
@@ -26,12 +43,16 @@ class MongoApiService:
     MODEL_ID_FIELD = "id"
     TIMESTAMP_FIELD = "timestamp"
     METADATA_FIELD = "metadata"
+    BUCKET_SIGNALS_FIELD = "signals"
+    TS_STORAGE_BUCKETS = "buckets"
 
     def __init__(self):
         """
         Connect to MongoDB database
         """
         self.db = db
+        self.ts_storage_mode = mongo_ts_storage_mode
+        self.ts_bucket_size = mongo_ts_bucket_size
 
     def create_document(self, data_in: BaseModel):
         """
@@ -112,34 +133,200 @@ class MongoApiService:
         self.db[collection_name].delete_one({self.MONGO_ID_FIELD: id})
         return id
 
-    def create_time_series(self, time_series_in: TimeSeriesIn):
-        collection_name = Collections.TIME_SERIES
-        self._create_ts_collection_if_missing(collection_name)
-        ts_id = ObjectId()
-        ts_documents = self._time_series_into_documents(time_series_in, ts_id)
-        self.db[collection_name].insert_many(ts_documents)
-        return ts_id
+    def create_time_series(
+        self, time_series_in: TimeSeriesIn, time_series_id: Union[str, int] = None
+    ):
+        signal_values = time_series_in.signal_values
+        signal_columns = time_series_in.signal_columns
+        statistics = merge_statistics(
+            signal_values_statistics(signal_values),
+            signal_columns_statistics(signal_columns),
+        )
+        metadata = self.create_time_series_metadata(time_series_in, time_series_id)
+        metadata["statistics"] = statistics.dict()
+        self.insert_time_series_signals(signal_values, metadata)
+        if signal_columns is not None:
+            self.insert_time_series_columns(signal_columns, metadata)
+        return metadata["id"]
 
-    def get_time_series(
+    def create_time_series_metadata(
+        self, time_series_in: TimeSeriesIn, time_series_id: Union[str, int] = None
+    ):
+        """
+        Prepare metadata of new time series, which is stored in each of its documents. Signal values
+        of given time series are not stored, they should be inserted with insert_time_series_signals.
+        """
+        if self.ts_storage_mode == self.TS_STORAGE_BUCKETS:
+            self._create_ts_buckets_collection_if_missing()
+        else:
+            self._create_ts_collection_if_missing(Collections.TIME_SERIES)
+        # avoid unnecessary parsing of signal values
+        time_series_in.signal_values = []
+        time_series_in.signal_columns = None
+        return self._get_time_series_metadata(
+            time_series_in, ObjectId(time_series_id) if time_series_id is not None else ObjectId()
+        )
+
+    def insert_time_series_signals(self, signal_values: Iterable[SignalIn], metadata: dict):
+        """
+        Insert signal values of time series described by metadata. Documents are sent to mongo
+        in batches of bounded size, so only a single batch is kept in memory at once.
+        """
+        batch = []
+        for signal in signal_values:
+            batch.append(self._signal_to_dict(signal, metadata))
+            if len(batch) >= mongo_ts_insert_batch_size:
+                self._insert_signal_documents(batch, metadata)
+                batch = []
+        if len(batch) > 0:
+            self._insert_signal_documents(batch, metadata)
+
+    def insert_time_series_columns(self, signal_columns: SignalColumnsIn, metadata: dict):
+        """
+        Insert signal values given in columnar format. Timestamps and values are converted with
+        whole-column numpy operations, no model object is created for single signal.
+        """
+        documents = self._signal_columns_to_mongo(signal_columns)
+        if self.ts_storage_mode == self.TS_STORAGE_BUCKETS:
+            self._insert_buckets(documents, metadata)
+            return
+        fields = list(documents.keys())
+        columns = list(documents.values())
+        for batch_start in range(0, len(signal_columns.values), mongo_ts_insert_batch_size):
+            batch_end = batch_start + mongo_ts_insert_batch_size
+            self.db[Collections.TIME_SERIES].insert_many([
+                {self.METADATA_FIELD: metadata, "additional_properties": None, **dict(zip(fields, row))}
+                for row in zip(*[column[batch_start:batch_end] for column in columns])
+            ])
+
+    def append_time_series_signals(
         self,
         ts_id: Union[str, int],
-        signal_min_value: int = None,
-        signal_max_value: int = None,
+        signal_values: List[SignalIn],
+        signal_columns: Optional[SignalColumnsIn] = None,
+        upsert: bool = False,
     ):
         """
-        Return dict with single time series data
+        Append signals to existing time series. With upsert, stored signals with the same (start) timestamp
+        as appended ones are replaced. Only appended signals are written, bucketed time series additionally
+        rewrite buckets overlapping appended signals and the last bucket, if it is not full. Statistics are
+        merged with statistics of appended signals, unless some signals were replaced.
+
+        Returns:
+            Dict of time series metadata with updated statistics, or NotFoundByIdModel
         """
-        collection_name = Collections.TIME_SERIES
-        query = self._create_ts_query(ts_id, signal_min_value, signal_max_value)
-        time_series_documents = list(self.db[collection_name].find(query))
-        if len(time_series_documents) == 0:
+        metadata, bucketed = self._find_time_series_metadata(ts_id)
+        if metadata is None:
             return NotFoundByIdModel(
                 id=ts_id,
                 errors={"errors": "time series not found"},
             )
-        return self._time_series_documents_to_dict(time_series_documents)
+        columns = self._signals_to_mongo_columns(signal_values, signal_columns)
+        if len(columns["value"]) > 0:
+            order = np.argsort(
+                self._column_timestamps_from_mongo(columns[self.TIMESTAMP_FIELD]), kind="stable"
+            )
+            columns = {field: [column[index] for index in order] for field, column in columns.items()}
+            if bucketed:
+                replaced_count = self._merge_signals_into_buckets(columns, metadata, upsert)
+            else:
+                replaced_count = self._append_signal_documents(columns, metadata, upsert)
+            stored_statistics = metadata.get("statistics")
+            if replaced_count > 0 or stored_statistics is None:
+                statistics = self._compute_time_series_statistics(ts_id)
+            else:
+                statistics = merge_statistics(
+                    SignalStatistics(**stored_statistics),
+                    merge_statistics(
+                        signal_values_statistics(signal_values),
+                        signal_columns_statistics(signal_columns),
+                    ),
+                )
+            statistics.version = next_statistics_version(
+                SignalStatistics(**stored_statistics) if stored_statistics is not None else None
+            )
+            metadata["statistics"] = statistics.dict()
+            self.update_time_series_metadata({"statistics": metadata["statistics"]}, ts_id)
+        return self._time_series_metadata_to_dict(metadata)
 
-    def get_many_time_series(self, query={}, query_params=None):
+    def get_time_series(
+        self,
+        ts_id: Union[str, int],
+        signal_min_value: int = None,
+        signal_max_value: int = None,
+        start_timestamp: int = None,
+        end_timestamp: int = None,
+        limit: int = None,
+        skip: int = 0,
+        max_points: int = None,
+        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb,
+    ):
+        """
+        Return dict with single time series data. Signals are filtered by value and by (start)
+        timestamp, where end_timestamp is exclusive. First skip signals with (start) timestamp equal
+        to start_timestamp are omitted, as they were returned with previous page. When limit is given,
+        only the first limit signals are returned together with cursor of the next page. When max_points is given,
+        signals are downsampled to at most max_points signals.
+        """
+        return self._get_time_series_signals(
+            ts_id,
+            signal_min_value,
+            signal_max_value,
+            start_timestamp,
+            end_timestamp,
+            limit,
+            skip,
+            max_points,
+            downsampling_method,
+            as_columns=False,
+        )
+
+    def get_time_series_columns(
+        self,
+        ts_id: Union[str, int],
+        signal_min_value: int = None,
+        signal_max_value: int = None,
+        start_timestamp: int = None,
+        end_timestamp: int = None,
+        limit: int = None,
+        skip: int = 0,
+        max_points: int = None,
+        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb,
+    ):
+        """
+        Return dict with single time series data, where signals are in columnar format. Signals
+        are filtered, limited and downsampled the same way as in get_time_series.
+        """
+        return self._get_time_series_signals(
+            ts_id,
+            signal_min_value,
+            signal_max_value,
+            start_timestamp,
+            end_timestamp,
+            limit,
+            skip,
+            max_points,
+            downsampling_method,
+            as_columns=True,
+        )
+
+    def get_time_series_statistics(self, ts_id: Union[str, int]):
+        """
+        Get statistics stored in metadata of time series
+        """
+        metadata, _ = self._find_time_series_metadata(ts_id)
+        if metadata is not None:
+            return metadata.get("statistics")
+        return NotFoundByIdModel(
+            id=ts_id,
+            errors={"errors": "time series not found"},
+        )
+
+    def get_many_time_series(self, query={}, query_params=None, include_signal_values=False):
+        """
+        Get time series matching given query or query params. Unless include_signal_values is set, only
+        metadata of each time series is fetched and signal_values are left empty.
+        """
         if query_params:
             ts_ids = self._get_many_ts_filtered(query_params)
             if ts_ids is not None:
@@ -148,10 +335,20 @@ class MongoApiService:
                 query = {}
         else:
             self._fix_input_ids(query)
+        if not include_signal_values:
+            return [
+                self._time_series_metadata_to_dict(ts_metadata["metadata"])
+                for collection_name in (Collections.TIME_SERIES, Collections.TIME_SERIES_BUCKETS)
+                for ts_metadata in self._get_many_ts_metadata(query, collection_name)
+            ]
         ts_documents = self._get_many_ts(query)
+        ts_buckets = self._get_many_ts(query, Collections.TIME_SERIES_BUCKETS)
         return [
             self._time_series_documents_to_dict(ts_document["value"])
             for ts_document in list(ts_documents)
+        ] + [
+            self._time_series_buckets_to_dict(ts_bucket["value"])
+            for ts_bucket in list(ts_buckets)
         ]
 
     def update_time_series_metadata(
@@ -163,6 +360,9 @@ class MongoApiService:
             f"{self.METADATA_FIELD}.{field}": value
             for field, value in fields_to_update.items()
         }
+        self.db[Collections.TIME_SERIES_BUCKETS].update_many(
+            filter=query, update={"$set": update_dict}
+        )
         return self.db[Collections.TIME_SERIES].update_many(
             filter=query, update={"$set": update_dict}
         )
@@ -182,6 +382,7 @@ class MongoApiService:
     def delete_time_series(self, time_series_id: Union[int, str]):
         ts_id = ObjectId(time_series_id)
         query = {f"{self.METADATA_FIELD}.id": ts_id}
+        self.db[Collections.TIME_SERIES_BUCKETS].delete_many(filter=query)
         return self.db[Collections.TIME_SERIES].delete_many(filter=query)
 
     def get_id_in_query(self, id_list):
@@ -257,6 +458,146 @@ class MongoApiService:
             else:
                 mongo_object[field] = func(field, mongo_object[field])
 
+    def _find_time_series_metadata(self, ts_id: Union[str, int]):
+        """
+        Find metadata of time series in collection of signal documents or of buckets
+
+        Returns:
+            Tuple of metadata and flag if time series is bucketed, (None, None) if time series does not exist
+        """
+        query = {f"{self.METADATA_FIELD}.id": ObjectId(ts_id)}
+        for collection_name in (Collections.TIME_SERIES, Collections.TIME_SERIES_BUCKETS):
+            document = self.db[collection_name].find_one(query, {"_id": 0, self.METADATA_FIELD: 1})
+            if document is not None:
+                return document[self.METADATA_FIELD], collection_name == Collections.TIME_SERIES_BUCKETS
+        return None, None
+
+    def _signals_to_mongo_columns(
+        self, signal_values: List[SignalIn], signal_columns: Optional[SignalColumnsIn]
+    ):
+        """
+        Convert signals given as rows and as columns to columns of document field values with naive UTC
+        datetimes
+        """
+        documents = [self._signal_to_dict(signal, None) for signal in signal_values]
+        is_epoch = (
+            len(documents) > 0 and "end_timestamp" in documents[0]
+            or signal_columns is not None and signal_columns.timestamps is None
+        )
+        fields = [self.TIMESTAMP_FIELD, "value", "additional_properties"]
+        if is_epoch:
+            fields.append("end_timestamp")
+        columns = {
+            field: [
+                document[field].replace(tzinfo=None)
+                if field in (self.TIMESTAMP_FIELD, "end_timestamp")
+                else document.get(field)
+                for document in documents
+            ]
+            for field in fields
+        }
+        if signal_columns is not None:
+            mongo_columns = self._signal_columns_to_mongo(signal_columns)
+            for field in fields:
+                columns[field].extend(
+                    mongo_columns.get(field) or [None] * len(signal_columns.values)
+                )
+        return columns
+
+    def _append_signal_documents(self, columns: dict, metadata: dict, upsert: bool):
+        """
+        Insert signals given as columns as separate documents. With upsert, documents with the same
+        (start) timestamps are deleted first.
+
+        Returns:
+            Number of replaced signals
+        """
+        collection = self.db[Collections.TIME_SERIES]
+        replaced_count = 0
+        if upsert:
+            query = {
+                f"{self.METADATA_FIELD}.id": metadata["id"],
+                self.TIMESTAMP_FIELD: {"$in": columns[self.TIMESTAMP_FIELD]},
+            }
+            replaced_count = collection.count_documents(query)
+            if replaced_count > 0:
+                collection.delete_many(query)
+        fields = list(columns.keys())
+        rows = list(zip(*columns.values()))
+        for batch_start in range(0, len(rows), mongo_ts_insert_batch_size):
+            collection.insert_many([
+                {self.METADATA_FIELD: metadata, **dict(zip(fields, row))}
+                for row in rows[batch_start:batch_start + mongo_ts_insert_batch_size]
+            ])
+        return replaced_count
+
+    def _merge_signals_into_buckets(self, columns: dict, metadata: dict, upsert: bool):
+        """
+        Merge ordered signals given as columns into buckets. Buckets overlapping time range of signals
+        and the preceding bucket, if it is not full, are read, merged with signals and packed again,
+        so buckets of time series stay ordered and disjoint.
+
+        Returns:
+            Number of replaced signals
+        """
+        collection = self.db[Collections.TIME_SERIES_BUCKETS]
+        id_query = {f"{self.METADATA_FIELD}.id": metadata["id"]}
+        first_timestamp = columns[self.TIMESTAMP_FIELD][0]
+        last_timestamp = max(columns.get("end_timestamp", columns[self.TIMESTAMP_FIELD]))
+        buckets = list(
+            collection.find(
+                {
+                    **id_query,
+                    "first_timestamp": {"$lte": last_timestamp},
+                    "last_timestamp": {"$gte": first_timestamp},
+                }
+            ).sort("first_timestamp", pymongo.ASCENDING)
+        )
+        if len(buckets) == 0:
+            previous_bucket = collection.find_one(
+                {**id_query, "first_timestamp": {"$lt": first_timestamp}},
+                sort=[("first_timestamp", pymongo.DESCENDING)],
+            )
+            if previous_bucket is not None and previous_bucket["count"] < self.ts_bucket_size:
+                buckets = [previous_bucket]
+        replaced_count = 0
+        if len(buckets) > 0:
+            _, stored_columns = self._buckets_to_columns(buckets)
+            if upsert:
+                appended_timestamps = set(columns[self.TIMESTAMP_FIELD])
+                kept = [
+                    index
+                    for index, timestamp in enumerate(stored_columns[self.TIMESTAMP_FIELD])
+                    if timestamp.replace(tzinfo=None) not in appended_timestamps
+                ]
+                replaced_count = len(stored_columns["value"]) - len(kept)
+                stored_columns = {
+                    field: [column[index] for index in kept]
+                    for field, column in stored_columns.items()
+                }
+            stored_timestamps = self._column_timestamps_from_mongo(stored_columns[self.TIMESTAMP_FIELD])
+            order = np.argsort(
+                stored_timestamps + self._column_timestamps_from_mongo(columns[self.TIMESTAMP_FIELD]),
+                kind="stable",
+            )
+            merged_columns = {}
+            for field, column in columns.items():
+                merged_column = stored_columns.get(field, [None] * len(stored_timestamps)) + column
+                merged_columns[field] = [merged_column[index] for index in order]
+            columns = merged_columns
+            collection.delete_many({"_id": {"$in": [bucket["_id"] for bucket in buckets]}})
+        self._insert_buckets(columns, metadata)
+        return replaced_count
+
+    def _compute_time_series_statistics(self, ts_id: Union[str, int]):
+        """
+        Compute statistics of time series from all its stored signals
+        """
+        time_series = self.get_time_series_columns(ts_id)
+        if type(time_series) is NotFoundByIdModel:
+            return SignalStatistics()
+        return signal_columns_statistics(SignalColumnsIn(**time_series["signal_columns"]))
+
     def _create_ts_collection_if_missing(self, collection_name: str):
         if collection_name not in self.db.list_collection_names():
             self.db.create_collection(
@@ -267,14 +608,412 @@ class MongoApiService:
                 },
             )
 
-    def _time_series_into_documents(
-        self, time_series_in: TimeSeriesIn, time_series_id: ObjectId
+    def _create_ts_buckets_collection_if_missing(self):
+        if Collections.TIME_SERIES_BUCKETS not in self.db.list_collection_names():
+            self.db[Collections.TIME_SERIES_BUCKETS].create_index(
+                [
+                    (f"{self.METADATA_FIELD}.id", pymongo.ASCENDING),
+                    ("first_timestamp", pymongo.ASCENDING),
+                ]
+            )
+
+    def _insert_signal_documents(self, documents: list, metadata: dict):
+        """
+        Insert signal documents of single time series, either directly or packed into buckets
+        """
+        if self.ts_storage_mode != self.TS_STORAGE_BUCKETS:
+            self.db[Collections.TIME_SERIES].insert_many(documents)
+            return
+        fields = [self.TIMESTAMP_FIELD, "value"]
+        if "end_timestamp" in documents[0]:
+            fields.append("end_timestamp")
+        if any(document["additional_properties"] is not None for document in documents):
+            fields.append("additional_properties")
+        columns = {
+            field: [document[field] for document in documents] for field in fields
+        }
+        self._insert_buckets(columns, metadata)
+
+    def _insert_buckets(self, columns: dict, metadata: dict):
+        """
+        Pack consecutive signals given as columns (lists of document field values) into bucket
+        documents of at most ts_bucket_size signals and insert them
+        """
+        signals_count = len(columns["value"])
+        buckets = []
+        for bucket_start in range(0, signals_count, self.ts_bucket_size):
+            bucket_end = bucket_start + self.ts_bucket_size
+            buckets.append(
+                self._create_bucket(
+                    {
+                        field: column[bucket_start:bucket_end]
+                        for field, column in columns.items()
+                    },
+                    metadata,
+                )
+            )
+            if len(buckets) * self.ts_bucket_size >= mongo_ts_insert_batch_size:
+                self.db[Collections.TIME_SERIES_BUCKETS].insert_many(buckets)
+                buckets = []
+        if len(buckets) > 0:
+            self.db[Collections.TIME_SERIES_BUCKETS].insert_many(buckets)
+
+    def _create_bucket(self, columns: dict, metadata: dict):
+        """
+        Create bucket document with signals and their summary, used to skip whole buckets
+        while filtering by value or timestamp
+        """
+        values = columns["value"]
+        timestamps = columns[self.TIMESTAMP_FIELD]
+        numeric_values = [
+            value for value in values if type(value) in (int, float)
+        ]
+        return {
+            self.METADATA_FIELD: metadata,
+            "count": len(values),
+            "first_timestamp": min(timestamps),
+            "last_timestamp": max(columns.get("end_timestamp", timestamps)),
+            "first_value": values[0],
+            "last_value": values[-1],
+            "min_value": min(numeric_values) if len(numeric_values) else None,
+            "max_value": max(numeric_values) if len(numeric_values) else None,
+            self.BUCKET_SIGNALS_FIELD: columns,
+        }
+
+    def _get_time_series_signals(
+        self,
+        ts_id: Union[str, int],
+        signal_min_value: int,
+        signal_max_value: int,
+        start_timestamp: int,
+        end_timestamp: int,
+        limit: int,
+        skip: int,
+        max_points: int,
+        downsampling_method: DownsamplingMethod,
+        as_columns: bool,
     ):
-        signal_values = time_series_in.signal_values
+        buckets = self.db[Collections.TIME_SERIES_BUCKETS].find(
+            self._create_ts_query(
+                ts_id,
+                signal_min_value,
+                signal_max_value,
+                start_timestamp,
+                end_timestamp,
+                bucketed=True,
+            ),
+            {"_id": 0},
+        ).sort("first_timestamp", pymongo.ASCENDING)
+        metadata, columns = self._buckets_to_columns(
+            buckets,
+            signal_min_value,
+            signal_max_value,
+            start_timestamp,
+            end_timestamp,
+            limit + skip if limit is not None else None,
+        )
+        if columns is not None:
+            columns = {field: column[skip:] for field, column in columns.items()}
+            if max_points is not None:
+                columns = self._downsample_columns(columns, max_points, downsampling_method)
+            next_cursor = self._next_signal_cursor(
+                columns[self.TIMESTAMP_FIELD], start_timestamp, skip, limit
+            )
+            if next_cursor is not None:
+                columns = {field: column[:limit] for field, column in columns.items()}
+            if len(columns["value"]) == 0:
+                return NotFoundByIdModel(
+                    id=ts_id,
+                    errors={"errors": "time series not found"},
+                )
+            if as_columns:
+                result = self._time_series_columns_to_dict(metadata, columns)
+            else:
+                result = self._time_series_rows_to_dict(metadata, columns)
+            result["next_cursor"] = next_cursor
+            return result
 
-        time_series_in.signal_values = []  # avoid unnecessary parsing of signal values
-        metadata = self._get_time_series_metadata(time_series_in, time_series_id)
-        return [self._signal_to_dict(signal, metadata) for signal in signal_values]
+        query = self._create_ts_query(
+            ts_id, signal_min_value, signal_max_value, start_timestamp, end_timestamp
+        )
+        time_series_documents = None
+        if max_points is not None:
+            time_series_documents = self._downsample_ts_documents(
+                query, max_points, downsampling_method
+            )
+        if time_series_documents is None:
+            documents = self.db[Collections.TIME_SERIES].find(query, {"_id": 0})
+            if as_columns or limit is not None:
+                documents = documents.sort(
+                    [(self.TIMESTAMP_FIELD, pymongo.ASCENDING), ("_id", pymongo.ASCENDING)]
+                )
+            if skip:
+                documents = documents.skip(skip)
+            if limit is not None:
+                documents = documents.limit(limit + 1)
+            time_series_documents = list(documents)
+        elif skip:
+            time_series_documents = time_series_documents[skip:]
+        if len(time_series_documents) == 0:
+            return NotFoundByIdModel(
+                id=ts_id,
+                errors={"errors": "time series not found"},
+            )
+        next_cursor = self._next_signal_cursor(
+            [document[self.TIMESTAMP_FIELD] for document in time_series_documents],
+            start_timestamp,
+            skip,
+            limit,
+        )
+        if next_cursor is not None:
+            time_series_documents = time_series_documents[:limit]
+        if as_columns:
+            result = self._time_series_documents_to_columns_dict(time_series_documents)
+        else:
+            result = self._time_series_documents_to_dict(time_series_documents)
+        result["next_cursor"] = next_cursor
+        return result
+
+    def _downsample_ts_documents(
+        self, query: dict, max_points: int, downsampling_method: DownsamplingMethod
+    ):
+        """
+        Downsample signal documents matching query with aggregation pipeline, which groups
+        signals into buckets of equal time width. Largest Triangle Three Buckets runs on signals
+        preselected in the pipeline with min-max method.
+
+        Returns:
+            Ordered list of documents or None if there are no more than max_points signals
+        """
+        collection = self.db[Collections.TIME_SERIES]
+        summary = list(
+            collection.aggregate(
+                [
+                    {"$match": query},
+                    {
+                        "$group": {
+                            "_id": None,
+                            "count": {"$sum": 1},
+                            "first_timestamp": {"$min": f"${self.TIMESTAMP_FIELD}"},
+                            "last_timestamp": {"$max": f"${self.TIMESTAMP_FIELD}"},
+                        }
+                    },
+                ]
+            )
+        )
+        if len(summary) == 0 or summary[0]["count"] <= max_points:
+            return None
+        first_timestamp = summary[0]["first_timestamp"]
+        time_range = summary[0]["last_timestamp"] - first_timestamp
+        if downsampling_method == DownsamplingMethod.mean:
+            buckets_count = max_points
+        elif downsampling_method == DownsamplingMethod.min_max:
+            buckets_count = max(max_points // 2, 1)
+        else:
+            buckets_count = 2 * max_points
+        bucket_width = int(time_range.total_seconds() * 1000) // buckets_count + 1
+        bucket = {
+            "$floor": {
+                "$divide": [
+                    {"$subtract": [f"${self.TIMESTAMP_FIELD}", first_timestamp]},
+                    bucket_width,
+                ]
+            }
+        }
+        numeric_query = (
+            query if "value" in query else {**query, "value": {"$type": "number"}}
+        )
+
+        if downsampling_method == DownsamplingMethod.mean:
+            documents = list(
+                collection.aggregate(
+                    [
+                        {"$match": numeric_query},
+                        {
+                            "$group": {
+                                "_id": bucket,
+                                self.TIMESTAMP_FIELD: {"$min": f"${self.TIMESTAMP_FIELD}"},
+                                "end_timestamp": {"$max": "$end_timestamp"},
+                                "value": {"$avg": "$value"},
+                                self.METADATA_FIELD: {"$first": f"${self.METADATA_FIELD}"},
+                            }
+                        },
+                        {"$sort": {"_id": 1}},
+                    ],
+                    allowDiskUse=True,
+                )
+            )
+            for document in documents:
+                del document["_id"]
+                document["additional_properties"] = None
+                if document["end_timestamp"] is None:
+                    del document["end_timestamp"]
+            return documents
+
+        buckets = collection.aggregate(
+            [
+                {"$match": numeric_query},
+                {"$sort": {"value": 1}},
+                {
+                    "$group": {
+                        "_id": bucket,
+                        "min": {"$first": "$$ROOT"},
+                        "max": {"$last": "$$ROOT"},
+                    }
+                },
+            ],
+            allowDiskUse=True,
+        )
+        documents = {}
+        for bucket_documents in buckets:
+            for document in (bucket_documents["min"], bucket_documents["max"]):
+                documents[document["_id"]] = document
+        documents = sorted(
+            documents.values(), key=lambda document: document[self.TIMESTAMP_FIELD]
+        )
+        for document in documents:
+            del document["_id"]
+        if downsampling_method == DownsamplingMethod.lttb:
+            selected, _, _ = downsample(
+                self._column_timestamps_from_mongo(
+                    [document[self.TIMESTAMP_FIELD] for document in documents]
+                ),
+                [document["value"] for document in documents],
+                max_points,
+                downsampling_method,
+            )
+            documents = [documents[index] for index in selected]
+        return documents
+
+    def _downsample_columns(
+        self, columns: dict, max_points: int, downsampling_method: DownsamplingMethod
+    ):
+        """
+        Downsample signals given as columns (lists of document field values)
+        """
+        if len(columns["value"]) <= max_points:
+            return columns
+        first_indices, last_indices, values = downsample(
+            self._column_timestamps_from_mongo(columns[self.TIMESTAMP_FIELD]),
+            columns["value"],
+            max_points,
+            downsampling_method,
+        )
+        if downsampling_method != DownsamplingMethod.mean:
+            return {
+                field: [column[index] for index in first_indices]
+                for field, column in columns.items()
+            }
+        downsampled_columns = {
+            self.TIMESTAMP_FIELD: [
+                columns[self.TIMESTAMP_FIELD][index] for index in first_indices
+            ],
+            "value": values.tolist(),
+            "additional_properties": [None] * len(values),
+        }
+        if "end_timestamp" in columns:
+            downsampled_columns["end_timestamp"] = [
+                columns["end_timestamp"][index] for index in last_indices
+            ]
+        return downsampled_columns
+
+    def _next_signal_cursor(
+        self, timestamps: list, start_timestamp: int = None, skip: int = 0, limit: int = None
+    ):
+        """
+        Return cursor of the next page if there are more signals than limit, otherwise None
+        """
+        if limit is None or len(timestamps) <= limit:
+            return None
+        return get_next_page_cursor(
+            [
+                int(timestamp.replace(tzinfo=timezone.utc).timestamp())
+                for timestamp in timestamps[:limit]
+            ],
+            start_timestamp,
+            skip,
+        )
+
+    def _buckets_to_columns(
+        self,
+        buckets: Iterable[dict],
+        signal_min_value: int = None,
+        signal_max_value: int = None,
+        start_timestamp: int = None,
+        end_timestamp: int = None,
+        limit: int = None,
+    ):
+        """
+        Concatenate signals from buckets of single time series, skipping signals out of given value and
+        timestamp ranges. Buckets are read lazily and reading stops after more than limit signals are
+        collected.
+
+        Returns:
+            Tuple of time series metadata and signal columns, both None when there are no buckets
+        """
+        metadata = None
+        columns = None
+        start_datetime = self._timestamp_to_naive_datetime(start_timestamp)
+        end_datetime = self._timestamp_to_naive_datetime(end_timestamp)
+        filter_signals = any(
+            bound is not None
+            for bound in (signal_min_value, signal_max_value, start_timestamp, end_timestamp)
+        )
+        for bucket in buckets:
+            signals = bucket[self.BUCKET_SIGNALS_FIELD]
+            if columns is None:
+                metadata = bucket[self.METADATA_FIELD]
+                fields = [self.TIMESTAMP_FIELD, "value", "additional_properties"]
+                if "end_timestamp" in signals:
+                    fields.append("end_timestamp")
+                columns = {field: [] for field in fields}
+            signals_count = len(signals["value"])
+            if filter_signals:
+                selected = [
+                    index
+                    for index, (timestamp, value) in enumerate(
+                        zip(signals[self.TIMESTAMP_FIELD], signals["value"])
+                    )
+                    if self._value_in_range(value, signal_min_value, signal_max_value)
+                    and (start_datetime is None or timestamp.replace(tzinfo=None) >= start_datetime)
+                    and (end_datetime is None or timestamp.replace(tzinfo=None) < end_datetime)
+                ]
+            for field in fields:
+                column = signals.get(field) or [None] * signals_count
+                if filter_signals:
+                    column = [column[index] for index in selected]
+                columns[field].extend(column)
+            if limit is not None and len(columns["value"]) > limit:
+                break
+        return metadata, columns
+
+    @staticmethod
+    def _value_in_range(value, min_value, max_value):
+        """
+        Check value the same way as range query in mongo, where only numbers are compared with numbers
+        """
+        if min_value is None and max_value is None:
+            return True
+        if type(value) not in (int, float):
+            return False
+        if min_value is not None and value < min_value:
+            return False
+        if max_value is not None and value > max_value:
+            return False
+        return True
+
+    @staticmethod
+    def _timestamp_to_naive_datetime(timestamp: int = None):
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
+
+    def _time_series_buckets_to_dict(self, buckets: list):
+        """
+        Convert buckets from single time series to BasicTimeSeriesOut
+        """
+        metadata, columns = self._buckets_to_columns(buckets)
+        return self._time_series_rows_to_dict(metadata, columns)
 
     def _signal_to_dict(self, signal, metadata):
         signal_value_dict = signal.signal_value.dict()
@@ -308,6 +1047,7 @@ class MongoApiService:
     ):
         time_series_dict = time_series_in.dict()
         time_series_dict.pop("signal_values")
+        time_series_dict.pop("signal_columns")
         metadata = time_series_dict
 
         self._fix_input_ids(metadata)
@@ -319,50 +1059,180 @@ class MongoApiService:
         Convert documents from single time series to BasicTimeSeriesOut
         """
         metadata = ts_documents[0][self.METADATA_FIELD]
-        type = metadata["type"]
-        signal_values = [
-            self._signal_from_ts_document(document, type) for document in ts_documents
-        ]
+        fields = [self.TIMESTAMP_FIELD, "value", "additional_properties"]
+        if "end_timestamp" in ts_documents[0]:
+            fields.append("end_timestamp")
+        columns = {
+            field: [document.get(field) for document in ts_documents] for field in fields
+        }
+        return self._time_series_rows_to_dict(metadata, columns)
+
+    def _time_series_rows_to_dict(self, metadata: dict, columns: dict):
+        """
+        Convert signals given as columns (lists of document field values) to BasicTimeSeriesOut
+        with signal values as plain dicts. Documents come from database, so signals are not
+        validated again with SignalIn model.
+        """
+        result = self._time_series_metadata_to_dict(metadata)
+        result["signal_values"] = self._signals_from_columns(columns, metadata["type"])
+        return result
+
+    def _time_series_metadata_to_dict(self, metadata: dict):
+        """
+        Convert metadata of single time series to BasicTimeSeriesOut without signal values
+        """
         result = {
-            "signal_values": signal_values,
+            "signal_values": [],
             **metadata,
         }
         self._fix_output_ids(result)
         return result
 
-    def _signal_from_ts_document(self, document, type):
-        if type == "Timestamp":
-            return SignalIn(
-                timestamp=document[self.TIMESTAMP_FIELD]
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
-                signal_value=SignalValueNodesIn(
-                    value=document["value"],
-                    additional_properties=document["additional_properties"],
-                ),
+    def _time_series_documents_to_columns_dict(self, ts_documents: list[dict]):
+        """
+        Convert documents from single time series to BasicTimeSeriesOut with signal columns
+        """
+        metadata = ts_documents[0][self.METADATA_FIELD]
+        fields = [self.TIMESTAMP_FIELD, "value"]
+        if "end_timestamp" in ts_documents[0]:
+            fields.append("end_timestamp")
+        columns = {
+            field: [document[field] for document in ts_documents] for field in fields
+        }
+        return self._time_series_columns_to_dict(metadata, columns)
+
+    def _time_series_columns_to_dict(self, metadata: dict, columns: dict):
+        """
+        Convert signals given as columns (lists of document field values) to BasicTimeSeriesOut
+        with signal columns
+        """
+        signal_columns = {"values": columns["value"]}
+        if "end_timestamp" in columns:
+            signal_columns["start_timestamps"] = self._column_timestamps_from_mongo(
+                columns[self.TIMESTAMP_FIELD]
+            )
+            signal_columns["end_timestamps"] = self._column_timestamps_from_mongo(
+                columns["end_timestamp"]
             )
         else:
-            return SignalIn(
-                start_timestamp=document[self.TIMESTAMP_FIELD]
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
-                end_timestamp=document["end_timestamp"]
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
-                signal_value=SignalValueNodesIn(
-                    value=document["value"],
-                    additional_properties=document["additional_properties"],
-                ),
+            signal_columns["timestamps"] = self._column_timestamps_from_mongo(
+                columns[self.TIMESTAMP_FIELD]
             )
+        result = self._time_series_metadata_to_dict(metadata)
+        result["signal_columns"] = signal_columns
+        return result
+
+    @staticmethod
+    def _column_timestamps_to_mongo(timestamps: list):
+        """
+        Convert timestamps in seconds to UTC datetimes
+        """
+        return np.asarray(timestamps, dtype=np.int64).astype("datetime64[s]").astype("datetime64[ms]").tolist()
+
+    def _signal_columns_to_mongo(self, signal_columns: SignalColumnsIn):
+        """
+        Convert signal columns to columns of document field values
+        """
+        columns = {"value": self._column_values_to_mongo(signal_columns.values)}
+        if signal_columns.timestamps is not None:
+            columns[self.TIMESTAMP_FIELD] = self._column_timestamps_to_mongo(signal_columns.timestamps)
+        else:
+            columns[self.TIMESTAMP_FIELD] = self._column_timestamps_to_mongo(signal_columns.start_timestamps)
+            columns["end_timestamp"] = self._column_timestamps_to_mongo(signal_columns.end_timestamps)
+        return columns
+
+    @staticmethod
+    def _column_timestamps_from_mongo(timestamps: list):
+        """
+        Convert UTC datetimes to timestamps in seconds
+        """
+        if len(timestamps) and timestamps[0].tzinfo is not None:
+            timestamps = [timestamp.replace(tzinfo=None) for timestamp in timestamps]
+        epoch = datetime(1970, 1, 1)
+        second = timedelta(seconds=1)
+        return [(timestamp - epoch) // second for timestamp in timestamps]
+
+    @staticmethod
+    def _column_values_to_mongo(values: list):
+        """
+        Store integral numbers as integers, like numeric values given as signals. Columns with
+        textual values are stored unchanged.
+        """
+        try:
+            numeric_values = np.asarray(values, dtype=np.float64)
+        except ValueError:
+            return values
+        if np.all(np.isfinite(numeric_values)) and np.all(np.mod(numeric_values, 1) == 0):
+            return numeric_values.astype(np.int64).tolist()
+        return numeric_values.tolist()
+
+    def _signals_from_columns(self, columns: dict, type: str):
+        """
+        Convert columns of signal document fields to signal dicts in the format of SignalIn.
+        Values are returned as strings, the same way SignalValueNodesIn coerces them.
+        """
+        values = [
+            value if isinstance(value, str) else str(value) for value in columns["value"]
+        ]
+        additional_properties = columns.get("additional_properties") or [None] * len(values)
+        signal_values = [
+            {"value": value, "additional_properties": properties}
+            for value, properties in zip(values, additional_properties)
+        ]
+        timestamps = self._column_timestamps_from_mongo(columns[self.TIMESTAMP_FIELD])
+        if type == "Timestamp":
+            return [
+                {
+                    "timestamp": timestamp,
+                    "start_timestamp": None,
+                    "end_timestamp": None,
+                    "signal_value": signal_value,
+                }
+                for timestamp, signal_value in zip(timestamps, signal_values)
+            ]
+        end_timestamps = self._column_timestamps_from_mongo(columns["end_timestamp"])
+        return [
+            {
+                "timestamp": None,
+                "start_timestamp": start_timestamp,
+                "end_timestamp": end_timestamp,
+                "signal_value": signal_value,
+            }
+            for start_timestamp, end_timestamp, signal_value in zip(
+                timestamps, end_timestamps, signal_values
+            )
+        ]
 
     def _create_ts_query(
         self,
         ts_id: Union[str, int],
         signal_min_value: int = None,
         signal_max_value: int = None,
+        start_timestamp: int = None,
+        end_timestamp: int = None,
+        bucketed: bool = False,
     ):
+        """
+        Create query for signals of single time series. Bucket query selects buckets which may
+        contain signals within given value and timestamp ranges.
+        """
         query = {f"{self.METADATA_FIELD}.id": ObjectId(ts_id)}
 
+        if bucketed:
+            if signal_min_value is not None:
+                query["max_value"] = {"$gte": signal_min_value}
+            if signal_max_value is not None:
+                query["min_value"] = {"$lte": signal_max_value}
+            if start_timestamp is not None:
+                query["last_timestamp"] = {
+                    "$gte": datetime.fromtimestamp(start_timestamp, tz=timezone.utc)
+                }
+            if end_timestamp is not None:
+                query["first_timestamp"] = {
+                    "$lt": datetime.fromtimestamp(end_timestamp, tz=timezone.utc)
+                }
+            return query
+
         value_query = {}
         if signal_min_value is not None:
             value_query["$gte"] = signal_min_value
@@ -371,20 +1241,59 @@ class MongoApiService:
         if len(value_query) > 0:
             query["value"] = value_query
 
+        timestamp_query = {}
+        if start_timestamp is not None:
+            timestamp_query["$gte"] = datetime.fromtimestamp(
+                start_timestamp, tz=timezone.utc
+            )
+        if end_timestamp is not None:
+            timestamp_query["$lt"] = datetime.fromtimestamp(
+                end_timestamp, tz=timezone.utc
+            )
+        if len(timestamp_query) > 0:
+            query[self.TIMESTAMP_FIELD] = timestamp_query
+
         return query
 
-    def _get_many_ts(self, query={}):
+    def _get_many_ts(self, query={}, collection_name=Collections.TIME_SERIES):
         aggregation = [
             {"$match": query},
             {"$group": {"_id": "$metadata.id", "value": {"$push": "$$ROOT"}}},
         ]
-        return self.db[Collections.TIME_SERIES].aggregate(aggregation)
+        if collection_name == Collections.TIME_SERIES_BUCKETS:
+            aggregation.insert(1, {"$sort": {"first_timestamp": 1}})
+        return self.db[collection_name].aggregate(aggregation)
+
+    def _get_many_ts_metadata(self, query={}, collection_name=Collections.TIME_SERIES):
+        """
+        Get metadata of each time series matching the query. Sorting on the metadata.id and time index lets
+        the $first group be answered with a single index entry per time series instead of all its signals.
+        """
+        time_field = (
+            "first_timestamp"
+            if collection_name == Collections.TIME_SERIES_BUCKETS
+            else self.TIMESTAMP_FIELD
+        )
+        aggregation = [
+            {"$match": query},
+            {"$sort": {f"{self.METADATA_FIELD}.id": 1, time_field: 1}},
+            {
+                "$group": {
+                    "_id": f"${self.METADATA_FIELD}.id",
+                    "metadata": {"$first": f"${self.METADATA_FIELD}"},
+                }
+            },
+        ]
+        return self.db[collection_name].aggregate(aggregation)
 
     def _replace_ts(self, new_time_series: dict, time_series_id: Union[int, str]):
-        with self.client.start_session() as session:
-            with session.start_transaction():
-                self.delete_time_series(time_series_id)
-                self.create_time_series(TimeSeriesIn(**new_time_series))
+        """
+        Replace properties and signals of time series, keeping its id. Time series collections do not
+        support writes in transactions, so the new time series is validated before the old one is deleted.
+        """
+        time_series_in = TimeSeriesIn(**new_time_series)
+        self.delete_time_series(time_series_id)
+        self.create_time_series(time_series_in, time_series_id)
 
     def _get_many_ts_filtered(self, query_params):
         recording_params = {}
@@ -450,10 +1359,25 @@ class MongoApiService:
                     "as": "timeSeries",
                 }
             },
+            {
+                "$lookup": {
+                    "from": "timeSeriesBuckets",
+                    "localField": "observable_informations.id",
+                    "foreignField": "metadata.observable_information_id",
+                    "as": "timeSeriesBuckets",
+                }
+            },
             {
                 "$group": {
                     "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
+                    "tsIds": {
+                        "$addToSet": {
+                            "$setUnion": [
+                                "$timeSeries.metadata.id",
+                                "$timeSeriesBuckets.metadata.id",
+                            ]
+                        }
+                    },
                 }
             },
             {"$unwind": "$tsIds"},
@@ -514,10 +1438,25 @@ class MongoApiService:
                     "as": "timeSeries",
                 }
             },
+            {
+                "$lookup": {
+                    "from": "timeSeriesBuckets",
+                    "localField": "recordings.observable_informations.id",
+                    "foreignField": "metadata.observable_information_id",
+                    "as": "timeSeriesBuckets",
+                }
+            },
             {
                 "$group": {
                     "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
+                    "tsIds": {
+                        "$addToSet": {
+                            "$setUnion": [
+                                "$timeSeries.metadata.id",
+                                "$timeSeriesBuckets.metadata.id",
+                            ]
+                        }
+                    },
                 }
             },
             {"$unwind": "$tsIds"},
@@ -578,10 +1517,25 @@ class MongoApiService:
                     "as": "timeSeries",
                 }
             },
+            {
+                "$lookup": {
+                    "from": "timeSeriesBuckets",
+                    "localField": "recordings.observable_informations.id",
+                    "foreignField": "metadata.observable_information_id",
+                    "as": "timeSeriesBuckets",
+                }
+            },
             {
                 "$group": {
                     "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
+                    "tsIds": {
+                        "$addToSet": {
+                            "$setUnion": [
+                                "$timeSeries.metadata.id",
+                                "$timeSeriesBuckets.metadata.id",
+                            ]
+                        }
+                    },
                 }
             },
             {"$unwind": "$tsIds"},
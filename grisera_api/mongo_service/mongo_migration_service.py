@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+
+import pymongo
+
+from mongo_service.collection_mapping import Collections
+from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongo_migrations import MIGRATIONS, Migration
+
+
+class MongoMigrationService:
+    """
+    Object that applies pending schema migrations and reports indexes of collections
+    """
+
+    def __init__(self):
+        self.mongo_api_service = MongoApiService()
+
+    def apply_migrations(self):
+        """
+        Apply migrations with versions higher than the current schema version, in order of versions
+
+        Returns:
+            List of versions of applied migrations
+        """
+        schema_version = self.get_schema_version()
+        applied_versions = []
+        for migration in sorted(MIGRATIONS, key=lambda migration: migration.version):
+            if migration.version <= schema_version:
+                continue
+            self._apply_migration(migration)
+            applied_versions.append(migration.version)
+        return applied_versions
+
+    def get_schema_version(self):
+        """
+        Get version of the last applied migration, 0 if no migration was applied
+        """
+        last_migration = self.mongo_api_service.db[Collections.MIGRATIONS].find_one(
+            sort=[("version", pymongo.DESCENDING)]
+        )
+        return last_migration["version"] if last_migration is not None else 0
+
+    def get_migrations(self):
+        """
+        Get applied migrations in order of versions
+        """
+        return list(
+            self.mongo_api_service.db[Collections.MIGRATIONS].find(
+                {}, {"_id": 0}, sort=[("version", pymongo.ASCENDING)]
+            )
+        )
+
+    def get_indexes(self):
+        """
+        Get indexes currently existing in all collections
+
+        Returns:
+            List of dicts with collection, name and keys of the index
+        """
+        db = self.mongo_api_service.db
+        indexes = []
+        for collection_name in sorted(db.list_collection_names()):
+            for name, index in db[collection_name].index_information().items():
+                indexes.append(
+                    {
+                        "collection": collection_name,
+                        "name": name,
+                        "keys": [[key, direction] for key, direction in index["key"]],
+                    }
+                )
+        return indexes
+
+    def _apply_migration(self, migration: Migration):
+        db = self.mongo_api_service.db
+        for collection_name in migration.time_series_collections:
+            self.mongo_api_service._create_ts_collection_if_missing(collection_name)
+        index_names = [
+            db[collection_name].create_index(keys)
+            for collection_name, keys in migration.indexes
+        ]
+        db[Collections.MIGRATIONS].update_one(
+            {"version": migration.version},
+            {
+                "$set": {
+                    "version": migration.version,
+                    "description": migration.description,
+                    "indexes": index_names,
+                    "applied_at": datetime.now(timezone.utc),
+                }
+            },
+            upsert=True,
+        )
@@ -0,0 +1,69 @@
+from typing import List, Tuple
+
+import pymongo
+
+from mongo_service.collection_mapping import Collections
+
+"""
+This module provides the ordered registry of MongoDB schema migrations. Each
+migration has a unique version and is applied once, in order of versions, by
+MongoMigrationService at startup. New migrations must be appended with a
+version higher than any existing one, applied migrations must not be changed.
+"""
+
+
+class Migration:
+    """
+    Single schema migration creating indexes
+
+    Attributes:
+        version (int): Version of the schema after this migration is applied
+        description (str): Human readable description of the migration
+        indexes (List[Tuple[str, list]]): Collection names with index keys to create
+        time_series_collections (List[str]): Time series collections created before indexes
+    """
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        indexes: List[Tuple[str, list]],
+        time_series_collections: List[str] = (),
+    ):
+        self.version = version
+        self.description = description
+        self.indexes = indexes
+        self.time_series_collections = list(time_series_collections)
+
+
+MIGRATIONS = [
+    Migration(
+        version=1,
+        description="Indexes used by time series lookups and listing",
+        time_series_collections=[Collections.TIME_SERIES],
+        indexes=[
+            (
+                Collections.TIME_SERIES,
+                [("metadata.id", pymongo.ASCENDING), ("timestamp", pymongo.ASCENDING)],
+            ),
+            (
+                Collections.TIME_SERIES,
+                [("metadata.observable_information_id", pymongo.ASCENDING)],
+            ),
+            (
+                Collections.TIME_SERIES_BUCKETS,
+                [("metadata.id", pymongo.ASCENDING), ("first_timestamp", pymongo.ASCENDING)],
+            ),
+            (
+                Collections.TIME_SERIES_BUCKETS,
+                [("metadata.observable_information_id", pymongo.ASCENDING)],
+            ),
+            (Collections.PARTICIPATION, [("participant_state_id", pymongo.ASCENDING)]),
+            (Collections.PARTICIPATION, [("activity_execution_id", pymongo.ASCENDING)]),
+            (Collections.RECORDING, [("participation_id", pymongo.ASCENDING)]),
+            (Collections.RECORDING, [("observable_informations.id", pymongo.ASCENDING)]),
+            (Collections.PARTICIPANT, [("participant_states.id", pymongo.ASCENDING)]),
+            (Collections.SCENARIO, [("activity_executions", pymongo.ASCENDING)]),
+        ],
+    ),
+]
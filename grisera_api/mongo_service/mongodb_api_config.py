@@ -6,3 +6,13 @@ mongo_api_port = os.environ.get("MONGO_API_PORT") or "27017"
 mongo_api_address = f"mongodb://{mongo_api_host}:{mongo_api_port}"
 
 mongo_database_name = os.environ.get("MONGO_DATABASE") or "road"
+
+# maximal number of signal documents sent to mongo in a single insert
+mongo_ts_insert_batch_size = int(os.environ.get("MONGO_TS_INSERT_BATCH_SIZE") or 10000)
+
+# layout of time series signals: "documents" stores each signal in a separate document, "buckets" packs
+# consecutive signals of a time series into a single bucket document
+mongo_ts_storage_mode = os.environ.get("MONGO_TS_STORAGE_MODE") or "documents"
+
+# maximal number of signals stored in a single bucket document
+mongo_ts_bucket_size = int(os.environ.get("MONGO_TS_BUCKET_SIZE") or 1000)
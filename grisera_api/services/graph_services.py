@@ -40,6 +40,7 @@ from registered_data.registered_data_service import RegisteredDataService
 from scenario.scenario_service import ScenarioService
 from time_series.time_series_service import TimeSeriesService
 from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+from time_series.time_series_service_graphdb_with_signal_chunks import TimeSeriesServiceGraphDBWithSignalChunks
 
 
 class GraphServiceFactory(ServiceFactory):
@@ -65,6 +66,7 @@ class GraphServiceFactory(ServiceFactory):
         self.scenario_service = ScenarioServiceGraphDB()
         self.time_series_service = TimeSeriesServiceGraphDB()
         self.time_series_with_signal_values_service = TimeSeriesServiceGraphDBWithSignalValues()
+        self.time_series_with_signal_chunks_service = TimeSeriesServiceGraphDBWithSignalChunks()
 
         self.activity_service.activity_execution_service = self.activity_execution_service
 
@@ -128,6 +130,9 @@ class GraphServiceFactory(ServiceFactory):
         self.time_series_with_signal_values_service.measure_service = self.measure_service
         self.time_series_with_signal_values_service.observable_information_service = self.observable_information_service
 
+        self.time_series_with_signal_chunks_service.measure_service = self.measure_service
+        self.time_series_with_signal_chunks_service.observable_information_service = self.observable_information_service
+
     def get_activity_service(self) -> ActivityService:
         return self.activity_service
 
@@ -192,3 +197,8 @@ class GraphServiceFactory(ServiceFactory):
 class GraphWithSignalValuesServiceFactory(GraphServiceFactory):
     def get_time_series_service(self) -> TimeSeriesService:
         return self.time_series_with_signal_values_service
+
+
+class GraphWithSignalChunksServiceFactory(GraphServiceFactory):
+    def get_time_series_service(self) -> TimeSeriesService:
+        return self.time_series_with_signal_chunks_service
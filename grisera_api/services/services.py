@@ -6,6 +6,7 @@ from services.service_factory import ServiceFactory
 from services.graph_services import (
     GraphServiceFactory,
     GraphWithSignalValuesServiceFactory,
+    GraphWithSignalChunksServiceFactory,
 )
 from services.ontology_services import OntologyServiceFactory
 from activity.activity_service import ActivityService
@@ -37,6 +38,7 @@ class PersistenceTypes(Enum):
     ONTOLOGY = 2
     GRAPHDB_WITH_SIGNAL_VALUES = 3
     MONGODB = 4
+    GRAPHDB_WITH_SIGNAL_CHUNKS = 5
 
 
 class Services:
@@ -58,6 +60,8 @@ class Services:
             return GraphServiceFactory()
         elif self.persistence_type == PersistenceTypes.GRAPHDB_WITH_SIGNAL_VALUES:
             return GraphWithSignalValuesServiceFactory()
+        elif self.persistence_type == PersistenceTypes.GRAPHDB_WITH_SIGNAL_CHUNKS:
+            return GraphWithSignalChunksServiceFactory()
         elif self.persistence_type == PersistenceTypes.ONTOLOGY:
             return OntologyServiceFactory()
         elif self.persistence_type == PersistenceTypes.MONGODB:
@@ -6,7 +6,7 @@ from requests import Response
 
 from activity_execution.activity_execution_model import ActivityExecutionIn
 from graph_api_service import GraphApiService
-from time_series.time_series_model import TimeSeriesTransformationRelationshipIn
+from time_series.time_series_model import TimeSeriesTransformationRelationshipIn, SignalIn, SignalValueNodesIn
 
 
 class DatabaseServiceTestCase(unittest.TestCase):
@@ -107,6 +107,82 @@ class DatabaseServiceTestCase(unittest.TestCase):
                                                              {'key':'arrangement_id', 'value': 2},
                                                              {'key': 'test', 'value': 'test'}])
 
+    @mock.patch.object(GraphApiService, 'delete')
+    def test_delete_signal_values(self, delete_mock):
+        delete_mock.return_value = self.response_content
+
+        result = self.graph_api_service.delete_signal_values(1, 100)
+
+        self.assertEqual(result, self.response_content)
+        delete_mock.assert_called_with("/signal_values", {"time_series_id": 1, "start_timestamp": 100})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_signal_values(self, get_mock):
+        get_mock.return_value = self.response_content
+
+        result = self.graph_api_service.get_signal_values(1, start_timestamp=100, after_timestamp=150,
+                                                          after_sequence=3, limit=10, descending=True)
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with("/signal_values", {"time_series_id": 1, "start_timestamp": 100,
+                                                       "after_timestamp": 150, "after_sequence": 3, "limit": 10,
+                                                       "descending": True})
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_save_signal_chunks(self, post_mock):
+        post_mock.return_value = self.response_content
+        signal_chunks = [{"id": 5, "timestamps": [10], "values": [1.0]}, {"timestamps": [20], "values": [2.0]}]
+
+        result = self.graph_api_service.save_signal_chunks(1, signal_chunks, [7])
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with("/signal_chunks", {"time_series_id": 1, "signal_chunks": signal_chunks,
+                                                        "deleted_signal_chunk_ids": [7]})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_signal_chunks(self, get_mock):
+        get_mock.return_value = self.response_content
+
+        result = self.graph_api_service.get_signal_chunks(1, start_timestamp=100, signal_min_value=1.5,
+                                                          after_sequence=3, limit=2, descending=True)
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with("/signal_chunks", {"time_series_id": 1, "start_timestamp": 100,
+                                                       "signal_min_value": 1.5, "after_sequence": 3, "limit": 2,
+                                                       "descending": True})
+
+    @mock.patch.object(GraphApiService, 'delete')
+    def test_delete_signal_chunks(self, delete_mock):
+        delete_mock.return_value = self.response_content
+
+        result = self.graph_api_service.delete_signal_chunks(1, 100)
+
+        self.assertEqual(result, self.response_content)
+        delete_mock.assert_called_with("/signal_chunks", {"time_series_id": 1, "start_timestamp": 100})
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_get_or_create_timestamp(self, post_mock):
+        post_mock.return_value = self.response_content
+
+        result = self.graph_api_service.get_or_create_timestamp(2, 100)
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with("/timestamps", {"experiment_id": 2, "timestamp": 100})
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_create_signal_values(self, post_mock):
+        post_mock.return_value = self.response_content
+        signal_values = [SignalIn(start_timestamp=10, end_timestamp=20, signal_value=SignalValueNodesIn(
+            value=1.5, additional_properties=[{'key': 'test', 'value': 'test'}]))]
+
+        result = self.graph_api_service.create_signal_values(1, 2, signal_values, 3, 4)
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with("/signal_values", {
+            "time_series_id": 1, "experiment_id": 2, "previous_signal_value_id": 3, "timestamp_id": 4,
+            "signal_values": [{"timestamp": None, "start_timestamp": 10, "end_timestamp": 20,
+                               "properties": [{'key': 'value', 'value': '1.5'}, {'key': 'test', 'value': 'test'}]}]})
+
     @mock.patch.object(GraphApiService, 'post')
     def test_create_relationships(self, post_mock):
         post_mock.return_value = self.response_content
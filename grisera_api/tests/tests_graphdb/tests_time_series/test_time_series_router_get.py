@@ -6,7 +6,8 @@ from typing import Dict
 from pydantic import BaseModel
 
 from time_series.time_series_router import *
-from time_series.time_series_model import TimeSeriesOut, TimeSeriesNodesOut
+from time_series.time_series_model import TimeSeriesOut, TimeSeriesNodesOut, SignalFormat, DownsamplingMethod, \
+    SignalStatistics, TimeSeriesStatisticsOut
 from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
 
 
@@ -31,7 +32,8 @@ class TestTimeSeriesRouterGet(unittest.TestCase):
         result = asyncio.run(time_series_router.get_time_series(time_series_id, 0, response, 10, 20))
 
         self.assertEqual(result, TimeSeriesOut(type="Epoch", source="cos", links=get_links(router)))
-        get_time_series_mock.assert_called_once_with(time_series_id, 0, 10, 20)
+        get_time_series_mock.assert_called_once_with(time_series_id, 0, 10, 20, SignalFormat.rows, None, None, None, None, None,
+                                                     DownsamplingMethod.lttb)
         self.assertEqual(response.status_code, 200)
 
     @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
@@ -45,9 +47,21 @@ class TestTimeSeriesRouterGet(unittest.TestCase):
 
         self.assertEqual(result, TimeSeriesOut(type="Epoch", source="cos", errors={'errors': ['test']},
                                                links=get_links(router)))
-        get_time_series_mock.assert_called_once_with(time_series_id, 0, 10, 20)
+        get_time_series_mock.assert_called_once_with(time_series_id, 0, 10, 20, SignalFormat.rows, None, None, None, None, None,
+                                                     DownsamplingMethod.lttb)
         self.assertEqual(response.status_code, 404)
 
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    def test_get_time_series_with_invalid_cursor(self, get_time_series_mock):
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.get_time_series(1, 0, response, limit=10, cursor="invalid"))
+
+        self.assertEqual(result.errors, "invalid cursor")
+        get_time_series_mock.assert_not_called()
+        self.assertEqual(response.status_code, 422)
+
     @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series_nodes')
     def test_get_time_series_nodes_without_error(self, get_time_series_nodes_mock):
         get_time_series_nodes_mock.return_value = TimeSeriesNodesOut(time_series_nodes=[
@@ -65,3 +79,29 @@ class TestTimeSeriesRouterGet(unittest.TestCase):
             links=get_links(router)))
         get_time_series_nodes_mock.assert_called_once()
         self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series_statistics')
+    def test_get_time_series_statistics_without_error(self, get_time_series_statistics_mock):
+        statistics = TimeSeriesStatisticsOut(id=1, statistics=SignalStatistics(count=2, first_timestamp=1,
+                                                                               last_timestamp=5))
+        get_time_series_statistics_mock.return_value = statistics
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.get_time_series_statistics(1, response))
+
+        self.assertEqual(result, TimeSeriesStatisticsOut(id=1, statistics=statistics.statistics,
+                                                         links=get_links(router)))
+        get_time_series_statistics_mock.assert_called_once_with(1)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series_statistics')
+    def test_get_time_series_statistics_with_error(self, get_time_series_statistics_mock):
+        get_time_series_statistics_mock.return_value = NotFoundByIdModel(id=1, errors="Node not found.")
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.get_time_series_statistics(1, response))
+
+        self.assertEqual(result, NotFoundByIdModel(id=1, errors="Node not found.", links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
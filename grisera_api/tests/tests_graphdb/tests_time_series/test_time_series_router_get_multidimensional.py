@@ -17,7 +17,7 @@ class TestTimeSeriesRouterPostTransformation(unittest.TestCase):
         result = asyncio.run(time_series_router.get_time_series_multidimensional("15, 20, 25", response))
 
         self.assertEqual(TimeSeriesMultidimensionalOut(signal_values=[], links=get_links(router)), result)
-        get_time_series_multidimensional_mock.assert_called_once_with([15, 20, 25])
+        get_time_series_multidimensional_mock.assert_called_once_with([15, 20, 25], JoinType.inner, None)
         self.assertEqual(response.status_code, 200)
 
     @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series_multidimensional')
@@ -30,5 +30,5 @@ class TestTimeSeriesRouterPostTransformation(unittest.TestCase):
 
         self.assertEqual(TimeSeriesMultidimensionalOut(errors={'errors': ['test']},
                                                        links=get_links(router)), result)
-        get_time_series_multidimensional_mock.assert_called_once_with([15, 20, 25])
+        get_time_series_multidimensional_mock.assert_called_once_with([15, 20, 25], JoinType.inner, None)
         self.assertEqual(response.status_code, 404)
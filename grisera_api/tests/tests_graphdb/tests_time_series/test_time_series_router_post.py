@@ -39,3 +39,70 @@ class TestTimeSeriesRouterPost(unittest.TestCase):
                                                links=get_links(router)))
         save_time_series_mock.assert_called_once_with(time_series)
         self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'save_time_series_stream', new_callable=mock.AsyncMock)
+    def test_create_time_series_stream_without_error(self, save_time_series_stream_mock):
+        received_lines = []
+
+        async def save_time_series_stream_side_effect(lines):
+            async for line in lines:
+                received_lines.append(line)
+            return return_time_series()
+
+        async def stream():
+            yield b'{"type": "Epoch", "source": "cos"}\n{"start_timestamp": 1, "end_'
+            yield b'timestamp": 2, "signal_value": {"value": 1}}\n\n'
+
+        save_time_series_stream_mock.side_effect = save_time_series_stream_side_effect
+        request = mock.Mock()
+        request.stream = stream
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.create_time_series_stream(request, response))
+
+        self.assertEqual(result, TimeSeriesOut(id=1, type="Epoch", source="cos", links=get_links(router)))
+        self.assertEqual(received_lines, ['{"type": "Epoch", "source": "cos"}',
+                                          '{"start_timestamp": 1, "end_timestamp": 2, "signal_value": {"value": 1}}'])
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'save_time_series_stream', new_callable=mock.AsyncMock)
+    def test_create_time_series_stream_with_error(self, save_time_series_stream_mock):
+        async def stream():
+            yield b''
+
+        save_time_series_stream_mock.return_value = NotFoundByIdModel(errors={'errors': 'time series stream is empty'})
+        request = mock.Mock()
+        request.stream = stream
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.create_time_series_stream(request, response))
+
+        self.assertEqual(result, NotFoundByIdModel(errors={'errors': 'time series stream is empty'},
+                                                   links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'append_signal_values')
+    def test_append_signal_values_without_error(self, append_signal_values_mock):
+        append_signal_values_mock.return_value = BasicTimeSeriesOut(id=1, type="Timestamp")
+        response = Response()
+        signals = TimeSeriesSignalsIn(signal_columns={"timestamps": [1, 2], "values": [3, 4]})
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.append_signal_values(1, signals, response))
+
+        self.assertEqual(result, BasicTimeSeriesOut(id=1, type="Timestamp", links=get_links(router)))
+        append_signal_values_mock.assert_called_once_with(1, signals)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'append_signal_values')
+    def test_append_signal_values_not_found(self, append_signal_values_mock):
+        append_signal_values_mock.return_value = NotFoundByIdModel(id=1, errors="Node not found.")
+        response = Response()
+        time_series_router = TimeSeriesRouter()
+
+        result = asyncio.run(time_series_router.append_signal_values(1, TimeSeriesSignalsIn(), response))
+
+        self.assertEqual(result, NotFoundByIdModel(id=1, errors="Node not found.", links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
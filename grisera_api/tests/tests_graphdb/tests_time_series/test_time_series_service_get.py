@@ -5,6 +5,7 @@ from measure.measure_model import BasicMeasureOut
 from observable_information.observable_information_model import BasicObservableInformationOut
 from time_series.time_series_model import *
 from models.not_found_model import *
+from property.property_model import PropertyIn
 
 from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
 from graph_api_service import GraphApiService
@@ -29,6 +30,26 @@ class TestTimeSeriesServiceGet(unittest.TestCase):
         self.assertEqual(result, time_series)
         get_node_mock.assert_called_once_with(id_node)
 
+    @mock.patch.object(GraphApiService, 'get_node')
+    def test_get_time_series_statistics(self, get_node_mock):
+        id_node = 1
+        get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
+                                      'properties': [{'key': 'type', 'value': "Timestamp"},
+                                                     {'key': 'test', 'value': 'test2'},
+                                                     {'key': 'statistics_count', 'value': '3'},
+                                                     {'key': 'statistics_mean', 'value': '2.5'},
+                                                     {'key': 'statistics_first_timestamp', 'value': '10'}],
+                                      "errors": None, 'links': None}
+        time_series_service = TimeSeriesServiceGraphDB()
+
+        result = time_series_service.get_time_series_statistics(id_node)
+        time_series = time_series_service.get_time_series(id_node)
+
+        statistics = SignalStatistics(count=3, mean=2.5, first_timestamp=10)
+        self.assertEqual(result, TimeSeriesStatisticsOut(id=id_node, statistics=statistics))
+        self.assertEqual(time_series.statistics, statistics)
+        self.assertEqual(time_series.additional_properties, [PropertyIn(key='test', value='test2')])
+
     # @mock.patch.object(GraphApiService, 'get_node')
     # @mock.patch.object(GraphApiService, 'get_node_relationships')
     # def test_get_time_series_without_error(self, get_node_relationships_mock, get_node_mock):
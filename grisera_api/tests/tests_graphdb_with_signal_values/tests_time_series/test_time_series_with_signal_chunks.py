@@ -0,0 +1,157 @@
+import unittest
+import unittest.mock as mock
+
+from graph_api_service import GraphApiService
+from time_series.time_series_model import *
+from time_series.time_series_service_graphdb_with_signal_chunks import TimeSeriesServiceGraphDBWithSignalChunks, \
+    chunk_value
+
+
+def signal_chunk(id, sequence, timestamps, values):
+    return {'id': id, 'sequence': sequence, 'timestamps': timestamps, 'end_timestamps': None, 'values': values,
+            'first_timestamp': timestamps[0], 'last_timestamp': timestamps[-1],
+            'min_value': min(values), 'max_value': max(values)}
+
+
+def signal(timestamp, value):
+    return SignalIn(timestamp=timestamp, signal_value=SignalValueNodesIn(value=value))
+
+
+def graph_signal_value(timestamp, value):
+    return {'signal_value': {'id': None, 'labels': ['Signal Value'], 'properties': [{'key': 'value', 'value': value}]},
+            'timestamp': {'id': None, 'labels': ['Timestamp'], 'properties': [{'key': 'timestamp', 'value': timestamp}]}}
+
+
+@mock.patch('time_series.time_series_service_graphdb_with_signal_chunks.graph_api_page_size', 6)
+@mock.patch('time_series.time_series_service_graphdb_with_signal_chunks.graph_api_signal_chunk_size', 3)
+class TestTimeSeriesWithSignalChunksService(unittest.TestCase):
+
+    @mock.patch.object(GraphApiService, 'save_signal_chunks')
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_save_signal_values_filling_last_chunk(self, get_signal_chunks_mock, save_signal_chunks_mock):
+        get_signal_chunks_mock.side_effect = [{'signal_chunks': [], 'errors': None},
+                                              {'signal_chunks': [signal_chunk(7, 1, [10, 20], [1.0, 2.0])],
+                                               'errors': None}]
+        save_signal_chunks_mock.return_value = {'signal_chunk_ids': [7, 8], 'errors': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        errors = time_series_service.save_signal_values([signal(40, 4), signal(30, 3)], 1, None, Type.timestamp)
+
+        self.assertIsNone(errors)
+        self.assertEqual([mock.call(1, 30, None, None, None, None, 2, False),
+                          mock.call(1, None, None, None, None, None, 2, True)], get_signal_chunks_mock.call_args_list)
+        save_signal_chunks_mock.assert_called_once_with(
+            1, [{'id': 7, 'timestamps': [10, 20, 30], 'values': [1.0, 2.0, 3]},
+                {'timestamps': [40], 'values': [4]}], [])
+
+    @mock.patch.object(GraphApiService, 'save_signal_chunks')
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_save_signal_values_merging_earlier_signals(self, get_signal_chunks_mock, save_signal_chunks_mock):
+        get_signal_chunks_mock.side_effect = [{'signal_chunks': [signal_chunk(7, 1, [10, 20, 30], [1.0, 2.0, 3.0]),
+                                                                signal_chunk(8, 2, [40], [4.0])], 'errors': None},
+                                              {'signal_chunks': [], 'errors': None}]
+        save_signal_chunks_mock.return_value = {'signal_chunk_ids': [7, 8], 'errors': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        errors = time_series_service.save_signal_values([signal(20, 5)], 1, None, Type.timestamp)
+
+        self.assertIsNone(errors)
+        self.assertEqual([mock.call(1, 20, None, None, None, None, 2, False),
+                          mock.call(1, 20, None, None, None, 2, 2, False)], get_signal_chunks_mock.call_args_list)
+        save_signal_chunks_mock.assert_called_once_with(
+            1, [{'id': 7, 'timestamps': [10, 20, 20], 'values': [1.0, 2.0, 5]},
+                {'id': 8, 'timestamps': [30, 40], 'values': [3.0, 4.0]}], [])
+
+    def test_chunk_value(self):
+        self.assertEqual([12, 1.5, "007", "1e3", "abc", 2.5],
+                         [chunk_value(value) for value in ["12", "1.5", "007", "1e3", "abc", 2.5]])
+
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_get_signal_values_in_pages_with_limit(self, get_signal_chunks_mock):
+        get_signal_chunks_mock.side_effect = [
+            {'signal_chunks': [signal_chunk(7, 0, [10, 20, 30], [1.0, 2.0, 3.0]),
+                               signal_chunk(8, 1, [40, 50, 60], [4.0, 5.0, 6.0])], 'errors': None},
+            {'signal_chunks': [signal_chunk(9, 2, [70, 80, 90], [7.0, 8.0, 9.0])], 'errors': None}]
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        result = time_series_service.get_signal_values(1, Type.timestamp, signal_min_value=2, start_timestamp=30,
+                                                       limit=4)
+
+        self.assertEqual([graph_signal_value(30, 3.0), graph_signal_value(40, 4.0), graph_signal_value(50, 5.0),
+                          graph_signal_value(60, 6.0)], result)
+        get_signal_chunks_mock.assert_called_once_with(1, 30, None, 2, None, None, 2, False)
+
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_get_signal_values_descending(self, get_signal_chunks_mock):
+        get_signal_chunks_mock.side_effect = [
+            {'signal_chunks': [signal_chunk(8, 1, [40, 50], [4.0, 5.0]),
+                               signal_chunk(7, 0, [10, 20, 30], [1.0, 2.0, 3.0])], 'errors': None},
+            {'signal_chunks': [], 'errors': None}]
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        result = time_series_service.get_signal_values(1, Type.timestamp, end_timestamp=50, descending=True)
+
+        self.assertEqual([graph_signal_value(40, 4.0), graph_signal_value(30, 3.0), graph_signal_value(20, 2.0),
+                          graph_signal_value(10, 1.0)], result)
+        self.assertEqual([mock.call(1, None, 50, None, None, None, 2, True),
+                          mock.call(1, None, 50, None, None, 0, 2, True)], get_signal_chunks_mock.call_args_list)
+
+    @mock.patch.object(GraphApiService, 'save_signal_chunks')
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_replace_signal_values(self, get_signal_chunks_mock, save_signal_chunks_mock):
+        get_signal_chunks_mock.return_value = {'signal_chunks': [signal_chunk(7, 0, [10, 20, 30], [1.0, 2.0, 3.0])],
+                                               'errors': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        new_signal_values, replaced_signal_values, previous_signal_values = \
+            time_series_service.replace_signal_values(1, "Timestamp", [signal(20, 5), signal(25, 6)])
+
+        self.assertEqual([signal(25, 6)], new_signal_values)
+        self.assertEqual([signal(20, 5)], replaced_signal_values)
+        self.assertEqual([signal(20, 2.0)], previous_signal_values)
+        get_signal_chunks_mock.assert_called_once_with(1, 20, 26, None, None, None, 2, False)
+        save_signal_chunks_mock.assert_called_once_with(1, [{'id': 7, 'timestamps': [10, 20, 30],
+                                                             'end_timestamps': None, 'values': [1.0, 5, 3.0]}])
+
+    @mock.patch.object(GraphApiService, 'delete_signal_chunks')
+    @mock.patch.object(GraphApiService, 'save_signal_chunks')
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_delete_signal_values_trimming_chunk(self, get_signal_chunks_mock, save_signal_chunks_mock,
+                                                 delete_signal_chunks_mock):
+        get_signal_chunks_mock.return_value = {'signal_chunks': [signal_chunk(7, 0, [10, 20, 30], [1.0, 2.0, 3.0])],
+                                               'errors': None}
+        save_signal_chunks_mock.return_value = {'signal_chunk_ids': [7], 'errors': None}
+        delete_signal_chunks_mock.return_value = {'signal_chunks_count': 2, 'errors': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        errors = time_series_service.delete_signal_values(1, 20)
+
+        self.assertIsNone(errors)
+        get_signal_chunks_mock.assert_called_once_with(1, 20, 21, None, None, None, 2, False)
+        save_signal_chunks_mock.assert_called_once_with(1, [{'id': 7, 'timestamps': [10], 'values': [1.0]}])
+        delete_signal_chunks_mock.assert_called_once_with(1, 20)
+
+    @mock.patch.object(GraphApiService, 'delete_signal_chunks')
+    @mock.patch.object(GraphApiService, 'save_signal_chunks')
+    def test_delete_all_signal_values(self, save_signal_chunks_mock, delete_signal_chunks_mock):
+        delete_signal_chunks_mock.return_value = {'signal_chunks_count': 0, 'errors': ['error']}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        errors = time_series_service.delete_signal_values(1)
+
+        self.assertEqual(['error'], errors)
+        save_signal_chunks_mock.assert_not_called()
+        delete_signal_chunks_mock.assert_called_once_with(1, None)
+
+    @mock.patch.object(GraphApiService, 'get_signal_chunks')
+    def test_get_source_signal_values(self, get_signal_chunks_mock):
+        get_signal_chunks_mock.return_value = {'signal_chunks': [
+            {'id': 7, 'sequence': 0, 'timestamps': [10, 20], 'end_timestamps': [15, 25], 'values': ['a', 'b'],
+             'first_timestamp': 10, 'last_timestamp': 20, 'min_value': None, 'max_value': None}], 'errors': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalChunks()
+
+        result = time_series_service.get_source_signal_values(1, Type.epoch, 20)
+
+        self.assertEqual([{'start_timestamp': 20, 'end_timestamp': 25, 'signal_value': {'id': None, 'value': 'b'}}],
+                         result)
+        get_signal_chunks_mock.assert_called_once_with(1, 20, None, None, None, None, 2, False)
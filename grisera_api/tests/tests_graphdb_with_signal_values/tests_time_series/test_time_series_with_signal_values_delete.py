@@ -11,11 +11,11 @@ from time_series.time_series_service_graphdb_with_signal_values import TimeSerie
 class TestTimeSeriesWithSignalValuesServiceDelete(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'delete_node')
+    @mock.patch.object(GraphApiService, 'delete_signal_values')
     @mock.patch.object(GraphApiService, 'get_node_relationships')
-    @mock.patch.object(GraphApiService, 'create_relationships')
-    @mock.patch.object(TimeSeriesServiceGraphDB, 'delete_time_series')
-    def test_delete_time_series_without_error(self, delete_time_series_mock, create_relationships_mock,
-                                              get_node_relationships_mock, delete_node_mock):
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_time_series')
+    def test_delete_time_series_without_error(self, get_time_series_mock, get_node_relationships_mock,
+                                              delete_signal_values_mock, delete_node_mock):
         time_series = TimeSeriesOut(id=10, type="Timestamp", source="cos",
                                     signal_values=[
                                         {
@@ -23,89 +23,34 @@ class TestTimeSeriesWithSignalValuesServiceDelete(unittest.TestCase):
                                                              'properties': [{'key': 'value', 'value': '10'}]},
                                             'timestamp': {'labels': ['Timestamp'], 'id': 1, 'properties': [
                                                 {'key': 'timestamp', 'value': '100'}]}
-                                        },
-                                        {
-                                            'signal_value': {'labels': ['Signal Value'], 'id': 4,
-                                                             'properties': [
-                                                                 {'key': 'value', 'value': '20'}]},
-                                            'timestamp': {'labels': ['Timestamp'], 'id': 3, 'properties': [
-                                                {'key': 'timestamp', 'value': '200'}]}
-                                        },
-                                        {
-                                            'signal_value': {'labels': ['Signal Value'], 'id': 6,
-                                                             'properties': [
-                                                                 {'key': 'value', 'value': '30'}]},
-                                            'timestamp': {'labels': ['Timestamp'], 'id': 5, 'properties': [
-                                                {'key': 'timestamp', 'value': '300'}]}
-                                        },
-                                        {
-                                            'signal_value': {'labels': ['Signal Value'], 'id': 8,
-                                                             'properties': [
-                                                                 {'key': 'value', 'value': '40'}]},
-                                            'timestamp': {'labels': ['Timestamp'], 'id': 7, 'properties': [
-                                                {'key': 'timestamp', 'value': '400'}]}
                                         }
                                     ])
-        delete_time_series_mock.return_value = time_series
+        get_time_series_mock.return_value = time_series
+        delete_signal_values_mock.return_value = {'signal_values_count': 1, 'timestamps_count': 1, 'errors': None,
+                                                  'links': None}
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
 
-        def get_node_relationships_side_effect(*args):
-            if args[0] == 1:
-                return {"relationships": [
-                    {"start_node": 20, "end_node": 1,
-                     "name": "takes", "id": 100,
-                     "properties": None},
-                    {"start_node": 1, "end_node": 3,
-                     "name": "next", "id": 101,
-                     "properties": None}]}
-            elif args[0] == 3:
-                return {"relationships": [
-                    {"start_node": 20, "end_node": 3,
-                     "name": "takes", "id": 102,
-                     "properties": None},
-                    {"start_node": 3, "end_node": 30,
-                     "name": "startInSec", "id": 103,
-                     "properties": None},
-                    {"start_node": 1, "end_node": 3,
-                     "name": "next", "id": 101,
-                     "properties": None},
-                    {"start_node": 3, "end_node": 5,
-                     "name": "next", "id": 104,
-                     "properties": None}]}
-            elif args[0] == 5:
-                return {"relationships": [
-                    {"start_node": 3, "end_node": 5,
-                     "name": "next", "id": 104,
-                     "properties": None},
-                    {"start_node": 5, "end_node": 7,
-                     "name": "next", "id": 105,
-                     "properties": None}]}
-            elif args[0] == 7:
-                return {"relationships": [
-                    {"start_node": 5, "end_node": 7,
-                     "name": "next", "id": 105,
-                     "properties": None},
-                    {"start_node": 7, "end_node": 30,
-                     "name": "endInSec", "id": 106,
-                     "properties": None}]}
+        result = time_series_service.delete_time_series(10)
 
-        get_node_relationships_mock.side_effect = get_node_relationships_side_effect
+        self.assertEqual(time_series, result)
+        delete_signal_values_mock.assert_called_once_with(10, None)
+        delete_node_mock.assert_called_once_with(10)
+        get_node_relationships_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'delete_node')
+    @mock.patch.object(GraphApiService, 'delete_signal_values')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_time_series')
+    def test_delete_time_series_with_signal_values_error(self, get_time_series_mock, delete_signal_values_mock,
+                                                         delete_node_mock):
+        get_time_series_mock.return_value = TimeSeriesOut(id=10, type="Timestamp", source="cos")
+        delete_signal_values_mock.return_value = {'signal_values_count': 0, 'timestamps_count': 0,
+                                                  'errors': ['error'], 'links': None}
         time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
 
         result = time_series_service.delete_time_series(10)
 
-        self.assertEqual(time_series, result)
-        self.assertEqual([
-            mock.call(2),
-            mock.call(4),
-            mock.call(6),
-            mock.call(8),
-            mock.call(1),
-            mock.call(5),
-        ], delete_node_mock.call_args_list)
-        self.assertEqual([
-            mock.call(start_node=20, end_node=3, name='takes'),
-            mock.call(start_node=3, end_node=7, name='next')
-        ], create_relationships_mock.call_args_list)
+        self.assertEqual(TimeSeriesOut(id=10, type="Timestamp", source="cos", errors=['error']), result)
+        delete_node_mock.assert_not_called()
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_delete_time_series_with_error(self, get_node_mock):
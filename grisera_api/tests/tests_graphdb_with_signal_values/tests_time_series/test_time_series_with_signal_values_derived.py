@@ -0,0 +1,149 @@
+import json
+import unittest
+from unittest import mock
+
+from graph_api_service import GraphApiService
+from time_series.time_series_model import Type, BasicTimeSeriesOut, SignalStatistics
+from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
+from time_series.time_series_service_graphdb_with_signal_values import \
+    TimeSeriesServiceGraphDBWithSignalValues
+from time_series.ts_statistics import statistics_from_properties
+
+
+def graph_signal_value(signal_value_id: int, timestamp: int, value):
+    return {'signal_value': {'labels': ['Signal Value'], 'id': signal_value_id,
+                             'properties': [{'key': 'value', 'value': value}]},
+            'timestamp': {'labels': ['Timestamp'], 'id': signal_value_id + 1000,
+                          'properties': [{'key': 'timestamp', 'value': timestamp}]}}
+
+
+def transformed_from(derived_id: int, source_id: int, steps):
+    return {'start_node': derived_id, 'end_node': source_id, 'name': 'transformedFrom', 'id': 1,
+            'properties': [{'key': 'order', 'value': 1}]
+            + ([{'key': 'transformation', 'value': json.dumps(steps)}] if steps is not None else [])}
+
+
+class TestTimeSeriesWithSignalValuesServiceDerived(unittest.TestCase):
+
+    def setUp(self):
+        self.time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        self.time_series_service.delete_signal_values = mock.Mock(return_value=None)
+        self.time_series_service.add_signal_values = mock.Mock(
+            side_effect=lambda time_series_id, time_series, signal_values: time_series)
+        self.time_series_service.create_lineage_relationships = mock.Mock()
+
+    def relationships(self, steps):
+        relationships = [transformed_from(2, 1, steps)]
+        return lambda node_id: {'relationships': relationships}
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_update_derived_time_series_tail_window(self, get_node_relationships_mock, get_time_series_mock):
+        steps = [{'name': 'resample_mean', 'additional_properties': [{'key': 'period', 'value': '10'}]}]
+        get_node_relationships_mock.side_effect = self.relationships(steps)
+        statistics = SignalStatistics(count=3, min_value=1, max_value=4, mean=8 / 3, std=(14 / 9) ** 0.5,
+                                      first_timestamp=0, last_timestamp=20)
+        get_time_series_mock.side_effect = lambda time_series_id: BasicTimeSeriesOut(
+            id=time_series_id, type=Type.timestamp, statistics=statistics)
+        source_tail = [graph_signal_value(11, 20, '1'), graph_signal_value(12, 25, '3'),
+                       graph_signal_value(13, 31, '5')]
+        saved_tail = [graph_signal_value(23, 20, 2.0), graph_signal_value(24, 30, 5.0)]
+        get_signal_values_mock = mock.Mock(side_effect=[source_tail, [graph_signal_value(22, 20, 3.0)],
+                                                        [graph_signal_value(21, 10, 4.0)], saved_tail])
+        self.time_series_service.get_signal_values = get_signal_values_mock
+
+        errors = self.time_series_service.update_derived_time_series(1, 25)
+
+        self.assertIsNone(errors)
+        self.assertEqual([mock.call(1, Type.timestamp, start_timestamp=15),
+                          mock.call(2, Type.timestamp, start_timestamp=15),
+                          mock.call(2, Type.timestamp, limit=1, descending=True),
+                          mock.call(2, Type.timestamp, start_timestamp=15)], get_signal_values_mock.call_args_list)
+        self.time_series_service.delete_signal_values.assert_called_once_with(2, 15)
+        added_signal_values = self.time_series_service.add_signal_values.call_args[0][2]
+        self.assertEqual([(20, 2.0), (30, 5.0)], [(signal_value.timestamp, signal_value.signal_value.value)
+                                                  for signal_value in added_signal_values])
+        remaining_statistics = self.time_series_service.add_signal_values.call_args[0][1].statistics
+        self.assertEqual((2, 1, 4, 0, 10), (remaining_statistics.count, remaining_statistics.min_value,
+                                            remaining_statistics.max_value, remaining_statistics.first_timestamp,
+                                            remaining_statistics.last_timestamp))
+        self.assertAlmostEqual(2.5, remaining_statistics.mean)
+        self.assertAlmostEqual(1.5, remaining_statistics.std)
+        lineage_signal_values, lineage = self.time_series_service.create_lineage_relationships.call_args[0]
+        self.assertEqual(saved_tail, lineage_signal_values)
+        self.assertEqual([(11, 12, 2), (13, 13, 1)], list(lineage.bounds()))
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_update_derived_time_series_unbounded_window(self, get_node_relationships_mock, get_time_series_mock):
+        steps = [{'name': 'rolling', 'additional_properties': [{'key': 'window', 'value': '2'},
+                                                               {'key': 'function', 'value': 'max'}]}]
+        get_node_relationships_mock.side_effect = self.relationships(steps)
+        get_time_series_mock.side_effect = lambda time_series_id: BasicTimeSeriesOut(id=time_series_id,
+                                                                                     type=Type.timestamp)
+        source = [graph_signal_value(11, 10, '1'), graph_signal_value(12, 20, '3'), graph_signal_value(13, 30, '2')]
+        stored = [graph_signal_value(21, 10, 1.0), graph_signal_value(22, 20, 3.0)]
+        get_signal_values_mock = mock.Mock(side_effect=[source, stored, [graph_signal_value(23, 30, 3.0)]])
+        self.time_series_service.get_signal_values = get_signal_values_mock
+
+        errors = self.time_series_service.update_derived_time_series(1, 30)
+
+        self.assertIsNone(errors)
+        self.assertEqual([mock.call(1, Type.timestamp, start_timestamp=None), mock.call(2, Type.timestamp),
+                          mock.call(2, Type.timestamp, start_timestamp=30)], get_signal_values_mock.call_args_list)
+        self.time_series_service.delete_signal_values.assert_called_once_with(2, 30)
+        added_signal_values = self.time_series_service.add_signal_values.call_args[0][2]
+        self.assertEqual([(30, 3.0)], [(signal_value.timestamp, signal_value.signal_value.value)
+                                       for signal_value in added_signal_values])
+        self.assertEqual([[12, 13]], list(self.time_series_service.create_lineage_relationships.call_args[0][1]))
+
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.transformation_cache')
+    @mock.patch.object(GraphApiService, 'create_properties')
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_update_derived_time_series_deleting_tail(self, get_node_relationships_mock, get_time_series_mock,
+                                                      create_properties_mock, transformation_cache_mock):
+        steps = [{'name': 'rolling', 'additional_properties': [{'key': 'window', 'value': '2'},
+                                                               {'key': 'function', 'value': 'max'}]}]
+        get_node_relationships_mock.side_effect = self.relationships(steps)
+        statistics = SignalStatistics(count=3, min_value=1, max_value=3, mean=2, std=(2 / 3) ** 0.5,
+                                      first_timestamp=10, last_timestamp=30)
+        get_time_series_mock.side_effect = lambda time_series_id: BasicTimeSeriesOut(
+            id=time_series_id, type=Type.timestamp, statistics=statistics)
+        source = [graph_signal_value(11, 10, '1'), graph_signal_value(12, 20, '3')]
+        stored = [graph_signal_value(21, 10, 1.0), graph_signal_value(22, 20, 3.0), graph_signal_value(23, 30, 2.0)]
+        get_signal_values_mock = mock.Mock(side_effect=[source, stored, [graph_signal_value(22, 20, 3.0)]])
+        self.time_series_service.get_signal_values = get_signal_values_mock
+
+        errors = self.time_series_service.update_derived_time_series(1, 30)
+
+        self.assertIsNone(errors)
+        self.time_series_service.delete_signal_values.assert_called_once_with(2, 30)
+        self.time_series_service.add_signal_values.assert_not_called()
+        transformation_cache_mock.invalidate.assert_called_once_with(2)
+        self.assertEqual(2, create_properties_mock.call_args[0][0])
+        saved_statistics = statistics_from_properties(create_properties_mock.call_args[0][1].additional_properties)[1]
+        self.assertEqual(SignalStatistics(count=2, min_value=1, max_value=3, mean=2, std=1, first_timestamp=10,
+                                          last_timestamp=20, version=1), saved_statistics)
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_update_derived_time_series_without_transformation(self, get_node_relationships_mock,
+                                                               get_time_series_mock):
+        get_node_relationships_mock.side_effect = self.relationships(None)
+        get_time_series_mock.return_value = BasicTimeSeriesOut(id=2, type=Type.timestamp)
+        self.time_series_service.get_signal_values = mock.Mock()
+
+        errors = self.time_series_service.update_derived_time_series(1, 30)
+
+        self.assertIsNone(errors)
+        self.time_series_service.get_signal_values.assert_not_called()
+        self.time_series_service.add_signal_values.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_update_derived_time_series_skips_sources(self, get_node_relationships_mock):
+        get_node_relationships_mock.return_value = {'relationships': [transformed_from(1, 0, [])]}
+        self.time_series_service.update_derived_time_series_tail = mock.Mock()
+
+        self.assertIsNone(self.time_series_service.update_derived_time_series(1, 30))
+        self.time_series_service.update_derived_time_series_tail.assert_not_called()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from time_series.time_series_model import DownsamplingMethod, Type
+from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+from time_series.ts_downsampling import downsample, lttb_indices, min_max_indices
+
+
+def signal_value_node(node_id, timestamp, value):
+    return {
+        'signal_value': {'labels': ['Signal Value'], 'id': node_id,
+                         'properties': [{'key': 'value', 'value': str(value)}]},
+        'timestamp': {'labels': ['Timestamp'], 'id': node_id + 1000,
+                      'properties': [{'key': 'timestamp', 'value': str(timestamp)}]}
+    }
+
+
+class TestTimeSeriesDownsampling(unittest.TestCase):
+    timestamps = np.arange(12)
+    values = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0, 1, 1], dtype=np.float64)
+
+    def test_min_max_indices(self):
+        result = min_max_indices(self.timestamps, self.values, 4)
+
+        self.assertEqual(result.tolist(), [1, 4, 8, 9])
+
+    def test_lttb_indices(self):
+        result = lttb_indices(self.timestamps, self.values, 4)
+
+        self.assertEqual(result.tolist(), [0, 1, 8, 11])
+
+    def test_lttb_indices_without_reduction(self):
+        result = lttb_indices(self.timestamps, self.values, 20)
+
+        self.assertEqual(result.tolist(), list(range(12)))
+
+    def test_downsample_mean_skips_text_values(self):
+        first_indices, last_indices, values = downsample([3, 0, 1, 2], ["4", "2", "x", 6], 2,
+                                                         DownsamplingMethod.mean)
+
+        self.assertEqual(first_indices.tolist(), [1, 3])
+        self.assertEqual(last_indices.tolist(), [1, 0])
+        self.assertEqual(values.tolist(), [2, 5])
+
+    def test_downsample_signal_values_min_max(self):
+        signal_values = [signal_value_node(index, timestamp, value)
+                         for index, (timestamp, value) in enumerate(zip(self.timestamps, self.values))]
+
+        result = TimeSeriesServiceGraphDBWithSignalValues().downsample_signal_values(
+            signal_values, Type.timestamp, 4, DownsamplingMethod.min_max)
+
+        self.assertEqual([signal_value['signal_value']['id'] for signal_value in result], [1, 4, 8, 9])
+
+    def test_downsample_signal_values_mean(self):
+        signal_values = [signal_value_node(index, index, index) for index in range(4)]
+
+        result = TimeSeriesServiceGraphDBWithSignalValues().downsample_signal_values(
+            signal_values, Type.timestamp, 2, DownsamplingMethod.mean)
+
+        self.assertEqual(result, [
+            {'signal_value': {'id': None, 'labels': ['Signal Value'], 'properties': [{'key': 'value', 'value': '0.5'}]},
+             'timestamp': signal_values[0]['timestamp']},
+            {'signal_value': {'id': None, 'labels': ['Signal Value'], 'properties': [{'key': 'value', 'value': '2.5'}]},
+             'timestamp': signal_values[2]['timestamp']}
+        ])
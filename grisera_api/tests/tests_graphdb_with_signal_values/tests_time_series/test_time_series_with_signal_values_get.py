@@ -6,22 +6,25 @@ from measure.measure_model import BasicMeasureOut
 from models.not_found_model import NotFoundByIdModel
 from observable_information.observable_information_model import BasicObservableInformationOut
 from property.property_model import PropertyIn
-from time_series.time_series_model import TimeSeriesOut, TimeSeriesNodesOut, BasicTimeSeriesOut
+from time_series.time_series_model import TimeSeriesOut, TimeSeriesNodesOut, BasicTimeSeriesOut, SignalFormat, \
+    SignalColumnsIn
 from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+from time_series.ts_helpers import decode_signal_cursor, encode_signal_cursor, get_node_property
 
 
 class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_nodes_by_query')
+    @mock.patch.object(GraphApiService, 'get_signal_values')
     @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_time_series_without_error(self, get_node_relationships_mock, get_nodes_by_query_mock, get_node_mock):
+    def test_get_time_series_without_error(self, get_node_relationships_mock, get_signal_values_mock,
+                                           get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
                                       'properties': [{'key': 'type', 'value': "Timestamp"},
                                                      {'key': 'source', 'value': "cos"},
                                                      {'key': 'test', 'value': 'test2'}],
                                       "errors": None, 'links': None}
-        get_nodes_by_query_mock.return_value = {
+        get_signal_values_mock.return_value = {
             'rows': [
                 [{'labels': ['Signal Value'], 'id': 2, 'properties': [{'key': 'value', 'value': '10'}]},
                  {'labels': ['Timestamp'], 'id': 1, 'properties': [{'key': 'timestamp', 'value': '100'}]}],
@@ -74,6 +77,98 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
         get_node_mock.assert_called_once_with(id_node)
         get_node_relationships_mock.assert_not_called()
 
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'get_signal_values')
+    def test_get_time_series_signal_columns_without_error(self, get_signal_values_mock, get_node_mock):
+        id_node = 1
+        get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
+                                      'properties': [{'key': 'type', 'value': "Timestamp"}],
+                                      "errors": None, 'links': None}
+        get_signal_values_mock.return_value = {
+            'rows': [
+                [{'labels': ['Signal Value'], 'id': 2, 'properties': [{'key': 'value', 'value': '10'}]},
+                 {'labels': ['Timestamp'], 'id': 1, 'properties': [{'key': 'timestamp', 'value': '100'}]}],
+                [{'labels': ['Signal Value'], 'id': 4, 'properties': [{'key': 'value', 'value': '20.5'}]},
+                 {'labels': ['Timestamp'], 'id': 3, 'properties': [{'key': 'timestamp', 'value': '200'}]}]
+            ],
+            'errors': []
+        }
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.get_time_series(id_node, signal_format=SignalFormat.columns)
+
+        self.assertEqual(result.signal_values, [])
+        self.assertEqual(result.signal_columns, SignalColumnsIn(timestamps=[100, 200], values=[10, 20.5]))
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'get_signal_values')
+    def test_get_time_series_page_without_error(self, get_signal_values_mock, get_node_mock):
+        id_node = 1
+        get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
+                                      'properties': [{'key': 'type', 'value': "Timestamp"}],
+                                      "errors": None, 'links': None}
+        get_signal_values_mock.return_value = {
+            'rows': [
+                [{'labels': ['Signal Value'], 'id': 2, 'properties': [{'key': 'value', 'value': '10'}]},
+                 {'labels': ['Timestamp'], 'id': 1, 'properties': [{'key': 'timestamp', 'value': '100'}]}],
+                [{'labels': ['Signal Value'], 'id': 4, 'properties': [{'key': 'value', 'value': '20'}]},
+                 {'labels': ['Timestamp'], 'id': 3, 'properties': [{'key': 'timestamp', 'value': '200'}]}]
+            ],
+            'errors': []
+        }
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.get_time_series(id_node, start_timestamp=50, end_timestamp=500, limit=1)
+
+        self.assertEqual(len(result.signal_values), 1)
+        self.assertEqual(decode_signal_cursor(result.next_cursor), (100, 1))
+        get_signal_values_mock.assert_called_once_with(id_node, 50, 500, None, None, None, None, 2, False)
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'get_signal_values')
+    def test_get_time_series_page_with_duplicated_timestamps(self, get_signal_values_mock, get_node_mock):
+        id_node = 1
+        get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
+                                      'properties': [{'key': 'type', 'value': "Timestamp"}],
+                                      "errors": None, 'links': None}
+        get_signal_values_mock.return_value = {
+            'rows': [
+                [{'labels': ['Signal Value'], 'id': 2, 'properties': [{'key': 'value', 'value': '20'}]},
+                 {'labels': ['Timestamp'], 'id': 1, 'properties': [{'key': 'timestamp', 'value': '200'}]}],
+                [{'labels': ['Signal Value'], 'id': 4, 'properties': [{'key': 'value', 'value': '30'}]},
+                 {'labels': ['Timestamp'], 'id': 1, 'properties': [{'key': 'timestamp', 'value': '200'}]}],
+                [{'labels': ['Signal Value'], 'id': 6, 'properties': [{'key': 'value', 'value': '40'}]},
+                 {'labels': ['Timestamp'], 'id': 5, 'properties': [{'key': 'timestamp', 'value': '300'}]}]
+            ],
+            'errors': []
+        }
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.get_time_series(id_node, limit=1, cursor=encode_signal_cursor(200, 1))
+
+        self.assertEqual([get_node_property(signal['signal_value'], 'value') for signal in result.signal_values],
+                         ['30'])
+        self.assertEqual(decode_signal_cursor(result.next_cursor), (200, 2))
+        get_signal_values_mock.assert_called_once_with(id_node, 200, None, None, None, None, None, 3, False)
+
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.graph_api_page_size', 2)
+    @mock.patch.object(GraphApiService, 'get_signal_values')
+    def test_get_signal_values_in_pages(self, get_signal_values_mock):
+        def signal_value_row(id, value, timestamp):
+            return [{'labels': ['Signal Value'], 'id': id, 'properties': [{'key': 'value', 'value': value}]},
+                    {'labels': ['Timestamp'], 'id': id + 1, 'properties': [{'key': 'timestamp', 'value': timestamp}]}]
+        get_signal_values_mock.side_effect = [
+            {'rows': [signal_value_row(2, '10', '100'), signal_value_row(4, '20', '100')],
+             'last_timestamp': 100, 'last_sequence': 1, 'errors': None},
+            {'rows': [signal_value_row(6, '30', '200')], 'last_timestamp': 200, 'last_sequence': 2, 'errors': None}]
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.get_signal_values(1, "Timestamp", signal_min_value=5)
+
+        self.assertEqual([2, 4, 6], [signal_value['signal_value']['id'] for signal_value in result])
+        self.assertEqual([mock.call(1, None, None, 5, None, None, None, 2, False),
+                          mock.call(1, None, None, 5, None, 100, 1, 2, False)], get_signal_values_mock.call_args_list)
+
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_time_series_with_error(self, get_node_mock):
         id_node = 1
@@ -127,3 +222,25 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
                 {'begin_node_index': 2, 'end_node_index': 1, 'label': 'hasParticipant'}
             ]
         })
+
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_signal_values')
+    @mock.patch.object(GraphApiService, 'get_nodes_by_query')
+    def test_get_time_series_nodes_with_signal_values(self, get_nodes_by_query, get_signal_values_mock):
+        get_nodes_by_query.return_value = {
+            'rows': [
+                [{'labels': ['Time Series'], 'id': 2, 'properties': [{'key': 'type', 'value': 'Timestamp'}]}],
+            ],
+            'errors': []
+        }
+        signal_values = [{'signal_value': {'id': 3, 'labels': ['Signal Value'],
+                                           'properties': [{'key': 'value', 'value': '10'}]},
+                          'timestamp': {'id': 4, 'labels': ['Timestamp'],
+                                        'properties': [{'key': 'timestamp', 'value': '100'}]}}]
+        get_signal_values_mock.return_value = signal_values
+        time_series_nodes_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_nodes_service.get_time_series_nodes({}, include_signal_values=True)
+
+        self.assertEqual(result, TimeSeriesNodesOut(time_series_nodes=[
+            BasicTimeSeriesOut(id=2, type="Timestamp", additional_properties=[], signal_values=signal_values)]))
+        get_signal_values_mock.assert_called_once_with(2, "Timestamp")
@@ -1,11 +1,17 @@
 import unittest
 
+from unittest import mock
+
 from time_series.time_series_model import TimeSeriesOut, Type, \
-    TimeSeriesMultidimensionalOut
+    TimeSeriesMultidimensionalOut, TimeSeriesStatisticsOut, SignalStatistics
 from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+from time_series.transformation.TimeSeriesTransformationCache import transformation_cache
 
 
 class TestTimeSeriesWithSignalValuesServiceGetMultidimensional(unittest.TestCase):
+    def setUp(self):
+        transformation_cache.clear()
+
     def test_get_time_series_multidimensional_without_errors(self):
         result_timeseries = TimeSeriesMultidimensionalOut(
             type=Type.timestamp,
@@ -91,6 +97,40 @@ class TestTimeSeriesWithSignalValuesServiceGetMultidimensional(unittest.TestCase
 
         time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
         time_series_service.get_time_series = get_time_series_side_effect
+        time_series_service.get_time_series_statistics = \
+            lambda time_series_id: TimeSeriesStatisticsOut(id=time_series_id)
         result = time_series_service.get_time_series_multidimensional([60, 61])
 
         self.assertEqual(result_timeseries, result)
+
+    def test_get_time_series_multidimensional_cached(self):
+        def get_time_series_side_effect(time_series_id: int):
+            return TimeSeriesOut(id=time_series_id, type=Type.timestamp, signal_values=[{
+                'signal_value': {'labels': ['Signal Value'], 'id': time_series_id + 1,
+                                 'properties': [{'key': 'value', 'value': '10'}]},
+                'timestamp': {'labels': ['Timestamp'], 'id': 1,
+                              'properties': [{'key': 'timestamp', 'value': '100'}]}
+            }])
+        statistics = {60: SignalStatistics(count=1), 61: SignalStatistics(count=1)}
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        time_series_service.get_time_series = mock.Mock(side_effect=get_time_series_side_effect)
+        time_series_service.get_time_series_statistics = \
+            lambda time_series_id: TimeSeriesStatisticsOut(id=time_series_id, statistics=statistics[time_series_id])
+        result = time_series_service.get_time_series_multidimensional([60, 61])
+        cached_result = time_series_service.get_time_series_multidimensional([60, 61])
+
+        self.assertEqual(result, cached_result)
+        self.assertEqual(1, len(result.signal_values))
+        self.assertEqual(2, time_series_service.get_time_series.call_count)
+
+        time_series_service.get_time_series_multidimensional([60, 61], tolerance=10)
+        self.assertEqual(4, time_series_service.get_time_series.call_count)
+
+        statistics[61] = SignalStatistics(count=1, version=1)
+        time_series_service.get_time_series_multidimensional([60, 61])
+        self.assertEqual(6, time_series_service.get_time_series.call_count)
+
+        transformation_cache.invalidate(60)
+        time_series_service.get_time_series_multidimensional([60, 61])
+        self.assertEqual(8, time_series_service.get_time_series.call_count)
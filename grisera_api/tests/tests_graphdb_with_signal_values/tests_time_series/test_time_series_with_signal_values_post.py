@@ -3,9 +3,11 @@ from unittest import mock
 
 from graph_api_service import GraphApiService
 from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TimestampNodesIn, \
-    SignalValueNodesIn
+    SignalValueNodesIn, SignalStatistics, BasicTimeSeriesOut, TimeSeriesSignalsIn, SignalColumnsIn
+from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
 from time_series.time_series_service_graphdb_with_signal_values import \
     TimeSeriesServiceGraphDBWithSignalValues
+from time_series.ts_statistics import statistics_from_properties
 
 
 class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
@@ -200,6 +202,23 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
         self.assertEqual([mock.call(15)], delete_relationship_mock.call_args_list)
         self.assertEqual([mock.call(10)], get_node_relationships_mock.call_args_list)
 
+    @mock.patch.object(GraphApiService, 'get_or_create_timestamp')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_get_or_create_timestamp_node_of_experiment(self, get_node_relationships_mock,
+                                                        get_or_create_timestamp_mock):
+        timestamp_node = {'id': 60, 'labels': ['Timestamp'], 'properties': [{"key": "timestamp", "value": "100"}],
+                          "errors": None, 'links': None}
+        get_or_create_timestamp_mock.return_value = timestamp_node
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.get_or_create_timestamp_node(100, {'id': 50}, 20)
+
+        self.assertEqual(timestamp_node, result)
+        get_or_create_timestamp_mock.assert_called_once_with(20, 100)
+        get_node_relationships_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'index_signal_values', return_value={'errors': None})
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.graph_api_bulk_chunk_size', 0)
     @mock.patch.object(GraphApiService, 'create_node')
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'create_relationships')
@@ -214,7 +233,8 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
                                                      get_node_mock,
                                                      create_relationships_mock,
                                                      create_properties_mock,
-                                                     create_node_mock):
+                                                     create_node_mock,
+                                                     index_signal_values_mock):
         get_or_create_timestamp_node_mock.return_value = {'id': 60, 'properties': [{"key": "timestamp", "value": 100}],
                                                           "errors": None, 'links': None}
         create_signal_value_mock.return_value = {'id': 70, 'properties': [{"key": "value", "value": 10}],
@@ -231,15 +251,17 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
         create_properties_mock.assert_not_called()
         get_node_mock.assert_not_called()
         self.assertEqual([
-            mock.call(start_node=20, end_node=60, name='takes'),
             mock.call(start_node=60, end_node=70, name='inSec')
         ], create_relationships_mock.call_args_list)
 
         delete_relationship_mock.assert_not_called()
-        self.assertEqual([mock.call(20)], get_node_relationships_mock.call_args_list)
+        get_node_relationships_mock.assert_not_called()
         self.assertEqual([mock.call(SignalValueNodesIn(value=10), None, 15)], create_signal_value_mock.call_args_list)
-        self.assertEqual([mock.call(100, None)], get_or_create_timestamp_node_mock.call_args_list)
+        self.assertEqual([mock.call(100, None, 20)], get_or_create_timestamp_node_mock.call_args_list)
+        index_signal_values_mock.assert_called_once_with(15)
 
+    @mock.patch.object(GraphApiService, 'index_signal_values', return_value={'errors': None})
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.graph_api_bulk_chunk_size', 0)
     @mock.patch.object(GraphApiService, 'create_node')
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'create_relationships')
@@ -254,19 +276,14 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
                                                       get_node_mock,
                                                       create_relationships_mock,
                                                       create_properties_mock,
-                                                      create_node_mock):
-        previous_timestamp_node = {'id': 1000, 'properties': [{"key": "timestamp", "value": 75}], "errors": None,
-                                   'links': None}
+                                                      create_node_mock,
+                                                      index_signal_values_mock):
         timestamp_node = {'id': 60, 'properties': [{"key": "timestamp", "value": 100}],
                           "errors": None, 'links': None}
         get_or_create_timestamp_node_mock.return_value = timestamp_node
         create_signal_value_mock.return_value = {'id': 70, 'properties': [{"key": "value", "value": 10}],
                                                  "errors": None,
                                                  'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": 20, "end_node": 1000, "name": "takes", "id": 15, "properties": None}
-        ]}
-        get_node_mock.return_value = previous_timestamp_node
 
         time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
         result = time_series_service.save_signal_values([SignalIn(start_timestamp=100, end_timestamp=200,
@@ -277,17 +294,50 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
 
         create_node_mock.assert_not_called()
         create_properties_mock.assert_not_called()
-        self.assertEqual([mock.call(1000)], get_node_mock.call_args_list)
+        get_node_mock.assert_not_called()
         self.assertEqual([
             mock.call(start_node=60, end_node=70, name='startInSec'),
             mock.call(start_node=60, end_node=70, name='endInSec')
         ], create_relationships_mock.call_args_list)
         delete_relationship_mock.assert_not_called()
-        self.assertEqual([mock.call(20)], get_node_relationships_mock.call_args_list)
+        get_node_relationships_mock.assert_not_called()
         self.assertEqual([mock.call(SignalValueNodesIn(value=10), None, 15)], create_signal_value_mock.call_args_list)
-        self.assertEqual([mock.call(100, previous_timestamp_node), mock.call(200, timestamp_node)],
+        self.assertEqual([mock.call(100, None, 20), mock.call(200, timestamp_node, 20)],
                          get_or_create_timestamp_node_mock.call_args_list)
 
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.graph_api_bulk_chunk_size', 2)
+    @mock.patch.object(GraphApiService, 'create_signal_values')
+    @mock.patch.object(GraphApiService, 'create_node')
+    def test_save_signal_values_in_chunks(self, create_node_mock, create_signal_values_mock):
+        create_signal_values_mock.side_effect = [
+            {"signal_value_ids": [70, 71], "timestamp_ids": [60, 61], "errors": None, "links": None},
+            {"signal_value_ids": [72], "timestamp_ids": [62], "errors": None, "links": None}]
+        signal_values = [SignalIn(timestamp=timestamp, signal_value=SignalValueNodesIn(value=10))
+                         for timestamp in [100, 200, 300]]
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        result = time_series_service.save_signal_values(signal_values, 15, 20, Type.timestamp,
+                                                        {'id': 50}, {'id': 40})
+
+        self.assertEqual(None, result)
+        create_node_mock.assert_not_called()
+        self.assertEqual([mock.call(15, 20, signal_values[:2], 50, 40), mock.call(15, 20, signal_values[2:], 71, 61)],
+                         create_signal_values_mock.call_args_list)
+
+    @mock.patch('time_series.time_series_service_graphdb_with_signal_values.graph_api_bulk_chunk_size', 2)
+    @mock.patch.object(GraphApiService, 'create_signal_values')
+    def test_save_signal_values_in_chunks_with_error(self, create_signal_values_mock):
+        create_signal_values_mock.return_value = {"signal_value_ids": [], "timestamp_ids": [], "errors": ['error'],
+                                                  "links": None}
+        signal_values = [SignalIn(timestamp=timestamp, signal_value=SignalValueNodesIn(value=10))
+                         for timestamp in [100, 200, 300]]
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        result = time_series_service.save_signal_values(signal_values, 15, None, Type.timestamp)
+
+        self.assertEqual(['error'], result)
+        create_signal_values_mock.assert_called_once_with(15, None, signal_values[:2], None, None)
+
     @mock.patch.object(GraphApiService, 'create_node')
     def test_save_time_series_with_node_error(self, create_node_mock):
         id_node = 1
@@ -314,3 +364,125 @@ class TestTimeSeriesWithSignalValuesServicePost(unittest.TestCase):
 
         self.assertEqual(23, result)
         get_nodes_by_query_mock.assert_called_once()
+
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'save_time_series')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'save_signal_values')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_experiment_id')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_signal_values')
+    def test_save_time_series_with_statistics(self, get_signal_values_mock, get_experiment_id_mock,
+                                              save_signal_values_mock, save_time_series_mock):
+        save_time_series_mock.return_value = TimeSeriesOut(id=1, type=Type.timestamp)
+        save_signal_values_mock.return_value = None
+        get_signal_values_mock.return_value = []
+        time_series = TimeSeriesIn(type=Type.timestamp, signal_values=[
+            SignalIn(timestamp=10, signal_value=SignalValueNodesIn(value=1)),
+            SignalIn(timestamp=20, signal_value=SignalValueNodesIn(value=3))])
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        time_series_service.save_time_series(time_series)
+
+        saved_time_series = save_time_series_mock.call_args[0][0]
+        self.assertEqual(statistics_from_properties(saved_time_series.additional_properties)[1],
+                         SignalStatistics(count=2, min_value=1, max_value=3, mean=2, std=1, first_timestamp=10,
+                                          last_timestamp=20))
+
+    @mock.patch.object(GraphApiService, 'get_node_relationships', return_value={"relationships": []})
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'save_signal_values')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_experiment_id')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_signal_values')
+    @mock.patch.object(GraphApiService, 'create_properties')
+    def test_append_signal_values_after_last(self, create_properties_mock, get_signal_values_mock,
+                                             get_experiment_id_mock, save_signal_values_mock, get_time_series_mock,
+                                             _):
+        statistics = SignalStatistics(count=1, min_value=1, max_value=1, mean=1, std=0, first_timestamp=10,
+                                      last_timestamp=10)
+        get_time_series_mock.return_value = BasicTimeSeriesOut(id=1, type=Type.timestamp, statistics=statistics)
+        last_signal_value = {'signal_value': {'id': 5, 'properties': [{'key': 'value', 'value': '1'}]},
+                             'timestamp': {'id': 6, 'properties': [{'key': 'timestamp', 'value': '10'}]}}
+        get_signal_values_mock.return_value = [last_signal_value]
+        get_experiment_id_mock.return_value = 23
+        save_signal_values_mock.return_value = None
+        signals = TimeSeriesSignalsIn(signal_values=[SignalIn(timestamp=30, signal_value=SignalValueNodesIn(value=5))],
+                                      signal_columns=SignalColumnsIn(timestamps=[20], values=[3]))
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.append_signal_values(1, signals)
+
+        self.assertEqual(result.statistics, SignalStatistics(count=3, min_value=1, max_value=5, mean=3, std=(8 / 3) ** 0.5,
+                                                             first_timestamp=10, last_timestamp=30, version=1))
+        get_signal_values_mock.assert_called_once_with(1, Type.timestamp, limit=1, descending=True)
+        saved_signal_values = save_signal_values_mock.call_args[0][0]
+        self.assertEqual([signal.timestamp for signal in saved_signal_values], [20, 30])
+        self.assertEqual(save_signal_values_mock.call_args[0][1:],
+                         (1, 23, Type.timestamp, last_signal_value['signal_value'], last_signal_value['timestamp']))
+        self.assertEqual(statistics_from_properties(create_properties_mock.call_args[0][1].additional_properties)[1],
+                         result.statistics)
+
+    @mock.patch.object(GraphApiService, 'index_signal_values')
+    @mock.patch.object(GraphApiService, 'get_node_relationships', return_value={"relationships": []})
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'save_signal_values')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_signal_values')
+    @mock.patch.object(GraphApiService, 'create_properties')
+    @mock.patch.object(GraphApiService, 'replace_signal_value_properties')
+    def test_append_signal_values_upsert(self, replace_signal_value_properties_mock, create_properties_mock,
+                                         get_signal_values_mock, save_signal_values_mock, get_time_series_mock, _,
+                                         index_signal_values_mock):
+        get_time_series_mock.return_value = BasicTimeSeriesOut(id=1, type=Type.timestamp,
+                                                               statistics=SignalStatistics(count=1))
+        stored_signal_value = {'signal_value': {'id': 5, 'properties': [{'key': 'value', 'value': '7'}]},
+                               'timestamp': {'id': 6, 'properties': [{'key': 'timestamp', 'value': '10'}]}}
+        get_signal_values_mock.side_effect = [[stored_signal_value], [stored_signal_value]]
+        replace_signal_value_properties_mock.return_value = {
+            'signal_values': [{'id': 5, 'labels': ['Signal Value'], 'properties': [{'key': 'value', 'value': '3'}]}],
+            'errors': None}
+        signals = TimeSeriesSignalsIn(signal_columns=SignalColumnsIn(timestamps=[10], values=[7]), upsert=True)
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.append_signal_values(1, signals)
+
+        save_signal_values_mock.assert_not_called()
+        index_signal_values_mock.assert_not_called()
+        replaced_signal_values = replace_signal_value_properties_mock.call_args[0][1]
+        self.assertEqual((replaced_signal_values[0][0], replaced_signal_values[0][1].value), (5, 7))
+        self.assertEqual(result.statistics, SignalStatistics(count=1, min_value=7, max_value=7, mean=7, std=0,
+                                                             first_timestamp=10, last_timestamp=10, version=1))
+
+    @mock.patch.object(GraphApiService, 'index_signal_values')
+    @mock.patch.object(GraphApiService, 'get_node_relationships', return_value={"relationships": []})
+    @mock.patch.object(TimeSeriesServiceGraphDB, 'get_time_series')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'save_signal_values', return_value=None)
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_experiment_id')
+    @mock.patch.object(TimeSeriesServiceGraphDBWithSignalValues, 'get_signal_values')
+    @mock.patch.object(GraphApiService, 'create_properties')
+    @mock.patch.object(GraphApiService, 'replace_signal_value_properties')
+    def test_append_signal_values_upsert_updating_statistics(self, replace_signal_value_properties_mock,
+                                                             create_properties_mock, get_signal_values_mock,
+                                                             get_experiment_id_mock, save_signal_values_mock,
+                                                             get_time_series_mock, _, index_signal_values_mock):
+        statistics = SignalStatistics(count=3, min_value=1, max_value=10, mean=5, std=14 ** 0.5,
+                                      first_timestamp=5, last_timestamp=30)
+        get_time_series_mock.return_value = BasicTimeSeriesOut(id=1, type=Type.timestamp, statistics=statistics)
+        stored_signal_value = {'signal_value': {'id': 5, 'properties': [{'key': 'value', 'value': '4'}]},
+                               'timestamp': {'id': 6, 'properties': [{'key': 'timestamp', 'value': '10'}]}}
+        last_signal_value = {'signal_value': {'id': 7, 'properties': [{'key': 'value', 'value': '10'}]},
+                             'timestamp': {'id': 8, 'properties': [{'key': 'timestamp', 'value': '30'}]}}
+        get_signal_values_mock.side_effect = [[stored_signal_value], [last_signal_value]]
+        replace_signal_value_properties_mock.return_value = {
+            'signal_values': [{'id': 5, 'labels': ['Signal Value'], 'properties': [{'key': 'value', 'value': '4'}]}],
+            'errors': None}
+        signals = TimeSeriesSignalsIn(signal_columns=SignalColumnsIn(timestamps=[10, 40], values=[6, 2]),
+                                      upsert=True)
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+
+        result = time_series_service.append_signal_values(1, signals)
+
+        self.assertEqual(2, get_signal_values_mock.call_count)
+        self.assertEqual([signal.timestamp for signal in save_signal_values_mock.call_args[0][0]], [40])
+        self.assertEqual(4, result.statistics.count)
+        self.assertEqual((1, 10, 5, 40), (result.statistics.min_value, result.statistics.max_value,
+                                          result.statistics.first_timestamp, result.statistics.last_timestamp))
+        self.assertAlmostEqual(4.75, result.statistics.mean)
+        self.assertAlmostEqual(12.6875 ** 0.5, result.statistics.std)
+        self.assertEqual(1, result.statistics.version)
@@ -4,8 +4,9 @@ from unittest import mock
 from graph_api_service import GraphApiService
 from property.property_model import PropertyIn
 from time_series.time_series_model import TimeSeriesOut, TimeSeriesTransformationIn, TimeSeriesIn, Type, \
-    TimeSeriesTransformationRelationshipIn
+    TimeSeriesTransformationRelationshipIn, TimeSeriesTransformationStepIn, TimeSeriesStatisticsOut
 from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+from time_series.transformation.TimeSeriesTransformationCache import transformation_cache
 
 
 class TestTimeSeriesWithSignalValuesServiceTransformation(unittest.TestCase):
@@ -110,6 +111,8 @@ class TestTimeSeriesWithSignalValuesServiceTransformation(unittest.TestCase):
         time_series_service.save_time_series = save_time_series_side_effect
         result = time_series_service.transform_time_series(transformation)
 
+        transformation_steps = '[{"name": "quadrants", "additional_properties": ' \
+                               '[{"key": "origin_x", "value": "5"}, {"key": "origin_y", "value": "10"}]}]'
         self.assertEqual(result_timeseries, result)
         self.assertEqual([
             mock.call(50, 60, 'transformedFrom'),
@@ -121,9 +124,11 @@ class TestTimeSeriesWithSignalValuesServiceTransformation(unittest.TestCase):
         ], create_relationships_mock.call_args_list)
         self.assertEqual([
             mock.call(5060, TimeSeriesTransformationRelationshipIn(
-                additional_properties=[PropertyIn(key='order', value='1')])),
+                additional_properties=[PropertyIn(key='order', value='1'),
+                                       PropertyIn(key='transformation', value=transformation_steps)])),
             mock.call(5061, TimeSeriesTransformationRelationshipIn(
-                additional_properties=[PropertyIn(key='order', value='2')])),
+                additional_properties=[PropertyIn(key='order', value='2'),
+                                       PropertyIn(key='transformation', value=transformation_steps)])),
             mock.call(2202, TimeSeriesTransformationRelationshipIn(
                 additional_properties=[PropertyIn(key='order', value='1')])),
             mock.call(2212, TimeSeriesTransformationRelationshipIn(
@@ -133,3 +138,125 @@ class TestTimeSeriesWithSignalValuesServiceTransformation(unittest.TestCase):
             mock.call(2414, TimeSeriesTransformationRelationshipIn(
                 additional_properties=[PropertyIn(key='order', value='2')]))
         ], create_relationship_properties_mock.call_args_list)
+
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'create_relationship_properties')
+    def test_transform_time_series_rolling_lineage(self, create_relationship_properties_mock,
+                                                   create_relationships_mock):
+        transformation = TimeSeriesTransformationIn(
+            name="rolling",
+            source_time_series_ids=[60],
+            destination_observable_information_id=102,
+            destination_measure_id=103,
+            additional_properties=[PropertyIn(key="window", value="2")]
+        )
+        source_time_series = TimeSeriesOut(
+            id=60,
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2 * index + 2,
+                                     'properties': [{'key': 'value', 'value': str(index)}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 2 * index + 1,
+                                  'properties': [{'key': 'timestamp', 'value': str(100 * index)}]}
+                } for index in range(3)
+            ])
+        result_timeseries = TimeSeriesOut(
+            id=50,
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2 * index + 22, 'properties': []},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 2 * index + 21, 'properties': []}
+                } for index in range(3)
+            ])
+
+        create_relationships_mock.side_effect = lambda id_from, id_to, name: {"id": f"{id_from}-{id_to}"}
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        time_series_service.get_time_series = lambda time_series_id: source_time_series
+        time_series_service.save_time_series = lambda time_series: result_timeseries
+        result = time_series_service.transform_time_series(transformation)
+
+        self.assertEqual(result_timeseries, result)
+        self.assertEqual([
+            mock.call(50, '60', 'transformedFrom'),
+            mock.call(22, 2, 'basedOn'),
+            mock.call(24, 2, 'basedOn'),
+            mock.call(24, 4, 'basedOn'),
+            mock.call(26, 4, 'basedOn'),
+            mock.call(26, 6, 'basedOn')
+        ], create_relationships_mock.call_args_list)
+        self.assertEqual(['1', '1', '1', '2', '1', '2'],
+                         [call.args[1].additional_properties[0].value
+                          for call in create_relationship_properties_mock.call_args_list])
+
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    def test_transform_time_series_dry_run(self, create_relationships_mock):
+        transformation = TimeSeriesTransformationIn(
+            source_time_series_ids=[60],
+            destination_measure_id=103,
+            steps=[
+                TimeSeriesTransformationStepIn(name="resample_last",
+                                               additional_properties=[PropertyIn(key="period", value="100")]),
+                TimeSeriesTransformationStepIn(name="rolling", additional_properties=[
+                    PropertyIn(key="function", value="max"),
+                    PropertyIn(key="window", value="2")
+                ])
+            ],
+            dry_run=True
+        )
+        source_time_series = TimeSeriesOut(
+            id=60,
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2 * index + 2,
+                                     'properties': [{'key': 'value', 'value': str(3 - index)}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 2 * index + 1,
+                                  'properties': [{'key': 'timestamp', 'value': str(100 * index)}]}
+                } for index in range(3)
+            ])
+        save_time_series_mock = mock.Mock()
+        transformation_cache.clear()
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        time_series_service.get_time_series = mock.Mock(return_value=source_time_series)
+        time_series_service.get_time_series_statistics = \
+            lambda time_series_id: TimeSeriesStatisticsOut(id=time_series_id)
+        time_series_service.save_time_series = save_time_series_mock
+        result = time_series_service.transform_time_series(transformation)
+        cached_result = time_series_service.transform_time_series(transformation.copy(
+            update={"destination_measure_id": 104}))
+
+        self.assertIsNone(result.errors)
+        self.assertIsNone(result.id)
+        self.assertEqual(103, result.measure_id)
+        self.assertEqual([(0, 3.0), (100, 3.0), (200, 2.0)],
+                         [(signal_value['timestamp'], signal_value['signal_value']['value'])
+                          for signal_value in result.signal_values])
+        self.assertEqual(104, cached_result.measure_id)
+        self.assertEqual(result.signal_values, cached_result.signal_values)
+        time_series_service.get_time_series.assert_called_once()
+        save_time_series_mock.assert_not_called()
+        create_relationships_mock.assert_not_called()
+
+    def test_transform_time_series_with_invalid_parameters(self):
+        transformation = TimeSeriesTransformationIn(
+            source_time_series_ids=[60],
+            steps=[
+                TimeSeriesTransformationStepIn(name="resample_mean", additional_properties=[]),
+                TimeSeriesTransformationStepIn(name="rolling", additional_properties=[
+                    PropertyIn(key="window", value="-1")
+                ])
+            ]
+        )
+        get_time_series_mock = mock.Mock()
+
+        time_series_service = TimeSeriesServiceGraphDBWithSignalValues()
+        time_series_service.get_time_series = get_time_series_mock
+        result = time_series_service.transform_time_series(transformation)
+
+        self.assertEqual("invalid parameters of transformation resample_mean: period additional parameter is required",
+                         result.errors)
+        get_time_series_mock.assert_not_called()
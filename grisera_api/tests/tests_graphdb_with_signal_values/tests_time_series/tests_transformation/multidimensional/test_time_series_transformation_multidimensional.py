@@ -1,6 +1,6 @@
 import unittest
 
-from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesMultidimensionalOut
+from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesMultidimensionalOut, JoinType
 from time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import \
     TimeSeriesTransformationMultidimensional
 
@@ -193,3 +193,29 @@ class TestTimeSeriesTransformationMultidimensional(unittest.TestCase):
                 ]
             ),
             result)
+
+    def test_transform_timestamp_outer_join(self):
+        time_series_transformation = TimeSeriesTransformationMultidimensional()
+        result = time_series_transformation.transform(self.time_series_timestamp, JoinType.outer)
+
+        self.assertEqual([signal_value['timestamp']['id'] for signal_value in result.signal_values], [1, 0, 3, 5])
+        self.assertEqual([[signal_value['id'] if signal_value is not None else None
+                           for signal_value in row['signal_values']] for row in result.signal_values],
+                         [[2, 12, 22], [0, None, 24], [4, 14, 16], [6, 16, None]])
+
+    def test_transform_timestamp_asof_join(self):
+        time_series_transformation = TimeSeriesTransformationMultidimensional()
+        result = time_series_transformation.transform(self.time_series_timestamp, JoinType.asof)
+
+        self.assertEqual([signal_value['timestamp']['id'] for signal_value in result.signal_values], [1, 0, 3, 5])
+        self.assertEqual([[signal_value['id'] for signal_value in row['signal_values']]
+                          for row in result.signal_values],
+                         [[2, 12, 22], [0, 12, 24], [4, 14, 16], [6, 16, 16]])
+
+    def test_transform_timestamp_inner_join_tolerance(self):
+        time_series_transformation = TimeSeriesTransformationMultidimensional()
+        result = time_series_transformation.transform(self.time_series_timestamp, JoinType.inner, tolerance=1)
+
+        self.assertEqual([[signal_value['id'] for signal_value in row['signal_values']]
+                          for row in result.signal_values],
+                         [[2, 12, 22], [0, 12, 24], [4, 14, 16], [6, 16, 16]])
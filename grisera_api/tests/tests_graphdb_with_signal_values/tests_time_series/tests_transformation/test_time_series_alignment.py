@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from time_series.time_series_model import JoinType
+from time_series.ts_alignment import align_exact, align_asof, align_nearest, align_outer, align, complete_rows, \
+    signal_timestamps
+
+
+class TestTimeSeriesAlignment(unittest.TestCase):
+    timestamps = [np.array([1, 3, 5, 7]), np.array([0, 3, 4, 7, 9]), np.array([7, 1, 3])]
+
+    def test_align_exact(self):
+        indices = align_exact(self.timestamps)
+
+        np.testing.assert_array_equal(indices, [[0, 1, 2, 3], [-1, 1, -1, 3], [1, 2, -1, 0]])
+        np.testing.assert_array_equal(complete_rows(indices), [[1, 3], [1, 3], [2, 0]])
+
+    def test_align_exact_end_timestamps(self):
+        indices = align_exact([np.array([1, 5]), np.array([1, 5])], [np.array([2, 6]), np.array([2, 7])])
+
+        np.testing.assert_array_equal(indices, [[0, 1], [0, -1]])
+
+    def test_align_asof(self):
+        indices = align_asof(self.timestamps)
+
+        np.testing.assert_array_equal(indices, [[0, 1, 2, 3], [0, 1, 2, 3], [1, 2, 2, 0]])
+
+    def test_align_asof_tolerance(self):
+        indices = align_asof(self.timestamps, tolerance=1)
+
+        np.testing.assert_array_equal(indices, [[0, 1, 2, 3], [0, 1, 2, 3], [1, 2, -1, 0]])
+
+    def test_align_nearest(self):
+        indices = align_nearest(self.timestamps, tolerance=1)
+
+        np.testing.assert_array_equal(indices, [[0, 1, 2, 3], [0, 1, 2, 3], [1, 2, -1, 0]])
+
+    def test_align_outer(self):
+        indices, sources = align_outer(self.timestamps)
+
+        np.testing.assert_array_equal(indices, [[-1, 0, 1, -1, 2, 3, -1],
+                                                [0, -1, 1, 2, -1, 3, 4],
+                                                [-1, 1, 2, -1, -1, 0, -1]])
+        np.testing.assert_array_equal(sources, [1, 0, 0, 1, 0, 0, 1])
+
+    def test_align_outer_tolerance(self):
+        indices, sources = align_outer(self.timestamps[:2], tolerance=1)
+
+        np.testing.assert_array_equal(indices, [[0, 1, -1, 2, 3, -1], [0, 1, 2, -1, 3, 4]])
+        np.testing.assert_array_equal(sources, [0, 0, 1, 0, 0, 1])
+
+    def test_align_join(self):
+        indices, sources = align(self.timestamps, JoinType.inner)
+        np.testing.assert_array_equal(indices, [[1, 3], [1, 3], [2, 0]])
+        np.testing.assert_array_equal(sources, [0, 0])
+
+        indices, _ = align(self.timestamps, JoinType.inner, tolerance=1)
+        np.testing.assert_array_equal(indices, [[0, 1, 3], [0, 1, 3], [1, 2, 0]])
+
+        indices, _ = align(self.timestamps, JoinType.asof)
+        np.testing.assert_array_equal(indices, [[0, 1, 2, 3], [0, 1, 2, 3], [1, 2, 2, 0]])
+
+        indices, _ = align(self.timestamps, JoinType.outer)
+        self.assertEqual(indices.shape, (3, 7))
+
+    def test_align_empty_time_series(self):
+        np.testing.assert_array_equal(align_exact([np.array([1, 2]), np.array([], dtype=np.int64)]),
+                                      [[0, 1], [-1, -1]])
+        np.testing.assert_array_equal(align_asof([np.array([1, 2]), np.array([], dtype=np.int64)]),
+                                      [[0, 1], [-1, -1]])
+        np.testing.assert_array_equal(align_outer([np.array([1, 2]), np.array([], dtype=np.int64)])[0],
+                                      [[0, 1], [-1, -1]])
+
+    def test_signal_timestamps(self):
+        graph_signal_values = [{'signal_value': {'id': 1, 'properties': []},
+                                'start_timestamp': {'id': 2, 'properties': [{'key': 'timestamp', 'value': '5'}]}}]
+        mongo_signal_values = [{'signal_value': {'value': 1}, 'start_timestamp': 5}]
+
+        self.assertEqual(signal_timestamps(graph_signal_values, "start_timestamp").tolist(), [5])
+        self.assertEqual(signal_timestamps(mongo_signal_values, "start_timestamp").tolist(), [5])
@@ -0,0 +1,78 @@
+import unittest
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import TimeSeriesIn, Type, SignalIn, SignalValueNodesIn, \
+    TimeSeriesTransformationStepIn
+from time_series.transformation.TimeSeriesTransformationCache import TimeSeriesTransformationCache, normalize_steps
+
+
+def time_series_with_signals(count: int):
+    return TimeSeriesIn(type=Type.timestamp, signal_values=[
+        SignalIn(timestamp=index, signal_value=SignalValueNodesIn(value=index)) for index in range(count)])
+
+
+class TestTimeSeriesTransformationCache(unittest.TestCase):
+
+    def test_normalize_steps(self):
+        steps = [TimeSeriesTransformationStepIn(name="rolling", additional_properties=[
+            PropertyIn(key="window", value="3"), PropertyIn(key="function", value="max")])]
+        reordered_steps = [TimeSeriesTransformationStepIn(name="rolling", additional_properties=[
+            PropertyIn(key="function", value="max"), PropertyIn(key="window", value=3)])]
+
+        self.assertEqual((("rolling", (("function", "max"), ("window", "3"))),), normalize_steps(steps))
+        self.assertEqual(normalize_steps(steps), normalize_steps(reordered_steps))
+        self.assertEqual((("quadrants", ()),), normalize_steps([TimeSeriesTransformationStepIn(name="quadrants")]))
+
+    def test_get_copy_of_cached_result(self):
+        cache = TimeSeriesTransformationCache(max_entries=2, max_signals=10)
+        key = cache.key("pipeline", (), [1, "2"], [None, None])
+        cache.put(key, time_series_with_signals(2), 2)
+
+        result = cache.get(cache.key("pipeline", (), ["1", 2], [None, None]))
+        result.signal_values.pop()
+
+        self.assertEqual(2, len(cache.get(key).signal_values))
+        self.assertIsNone(cache.get(cache.key("pipeline", (), [1, 2], [None, 1])))
+        self.assertIsNone(cache.get(cache.key("multidimensional", (), [1, 2], [None, None])))
+
+    def test_evict_least_recently_used(self):
+        cache = TimeSeriesTransformationCache(max_entries=2, max_signals=10)
+        keys = [cache.key("pipeline", (), [index], [None]) for index in range(3)]
+        cache.put(keys[0], time_series_with_signals(1), 1)
+        cache.put(keys[1], time_series_with_signals(1), 1)
+        cache.get(keys[0])
+        cache.put(keys[2], time_series_with_signals(1), 1)
+
+        self.assertEqual([keys[0], keys[2]], list(cache.entries))
+        self.assertEqual(2, cache.signals)
+
+    def test_evict_by_size(self):
+        cache = TimeSeriesTransformationCache(max_entries=10, max_signals=5)
+        keys = [cache.key("pipeline", (), [index], [None]) for index in range(3)]
+        cache.put(keys[0], time_series_with_signals(3), 3)
+        cache.put(keys[1], time_series_with_signals(2), 2)
+        cache.put(keys[2], time_series_with_signals(6), 6)
+        cache.put(keys[2], time_series_with_signals(1), 1)
+
+        self.assertEqual([keys[1], keys[2]], list(cache.entries))
+        self.assertEqual(3, cache.signals)
+
+    def test_invalidate(self):
+        cache = TimeSeriesTransformationCache(max_entries=10, max_signals=10)
+        first_key = cache.key("multidimensional", ("inner", None), [1, 2], [None, None])
+        second_key = cache.key("pipeline", (), [2], [None])
+        cache.put(first_key, time_series_with_signals(1), 1)
+        cache.put(second_key, time_series_with_signals(1), 1)
+
+        cache.invalidate("1")
+
+        self.assertEqual([second_key], list(cache.entries))
+        self.assertNotEqual(first_key, cache.key("multidimensional", ("inner", None), [1, 2], [None, None]))
+        self.assertEqual(second_key, cache.key("pipeline", (), [2], [None]))
+
+    def test_disabled_cache(self):
+        cache = TimeSeriesTransformationCache(max_entries=0, max_signals=10)
+        key = cache.key("pipeline", (), [1], [None])
+        cache.put(key, time_series_with_signals(1), 1)
+
+        self.assertIsNone(cache.get(key))
@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from property.property_model import PropertyIn
+from time_series.ts_lineage import SignalValuesLineage, compose_lineage
+from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesTransformationStepIn
+from time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+
+
+class TestTimeSeriesTransformationPipeline(unittest.TestCase):
+    time_series_timestamp = [
+        TimeSeriesOut(
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2 * index + 2,
+                                     'properties': [{'key': 'value', 'value': str(index * index)}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 2 * index + 1, 'properties': [
+                        {'key': 'timestamp', 'value': str(10 * index)}]}
+                } for index in range(6)
+            ]),
+        TimeSeriesOut(
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2 * index + 102,
+                                     'properties': [{'key': 'value', 'value': str(5 - index)}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 2 * index + 101, 'properties': [
+                        {'key': 'timestamp', 'value': str(10 * index)}]}
+                } for index in range(6)
+            ])
+    ]
+
+    resample_mean_step = TimeSeriesTransformationStepIn(name="resample_mean",
+                                                        additional_properties=[PropertyIn(key="period", value="20")])
+    rolling_step = TimeSeriesTransformationStepIn(name="rolling",
+                                                  additional_properties=[PropertyIn(key="window", value="2")])
+    quadrants_step = TimeSeriesTransformationStepIn(name="quadrants",
+                                                    additional_properties=[PropertyIn(key="origin_x", value="5"),
+                                                                           PropertyIn(key="origin_y", value="2")])
+
+    def test_transform_single_step(self):
+        result, lineage = TimeSeriesTransformationPipeline().transform(self.time_series_timestamp[:1],
+                                                                       [self.resample_mean_step])
+
+        self.assertEqual([0.5, 6.5, 20.5], [signal_value.signal_value.value for signal_value in result.signal_values])
+        self.assertEqual([[2, 4], [6, 8], [10, 12]], list(lineage))
+        self.assertEqual(['period', 'transformation_name'],
+                         [additional_property.key for additional_property in result.additional_properties])
+
+    def test_transform_steps_lineage(self):
+        result, lineage = TimeSeriesTransformationPipeline().transform(self.time_series_timestamp[:1],
+                                                                       [self.resample_mean_step, self.rolling_step])
+
+        self.assertEqual([0.5, 3.5, 13.5], [signal_value.signal_value.value for signal_value in result.signal_values])
+        self.assertIsInstance(lineage, SignalValuesLineage)
+        self.assertEqual([(2, 4, 2), (2, 8, 4), (6, 12, 4)], list(lineage.bounds()))
+        self.assertEqual(PropertyIn(key='transformation_steps', value='resample_mean,rolling'),
+                         result.additional_properties[-1])
+
+    def test_transform_steps_of_each_time_series(self):
+        result, lineage = TimeSeriesTransformationPipeline().transform(
+            self.time_series_timestamp, [self.resample_mean_step, self.rolling_step, self.quadrants_step])
+
+        self.assertEqual([0, 20, 40], [signal_value.timestamp for signal_value in result.signal_values])
+        self.assertEqual(['2', '2', '4'], [signal_value.signal_value.value for signal_value in result.signal_values])
+        self.assertEqual([[2, 4, 102, 104], [2, 4, 6, 8, 102, 104, 106, 108], [6, 8, 10, 12, 106, 108, 110, 112]],
+                         lineage)
+        self.assertEqual('resample_mean,rolling,quadrants', result.additional_properties[-1].value)
+        self.assertEqual(1, len(self.resample_mean_step.additional_properties))
+
+    def test_transform_steps_resulting_in_many_time_series(self):
+        with self.assertRaises(AssertionError):
+            TimeSeriesTransformationPipeline().transform(self.time_series_timestamp, [self.resample_mean_step])
+
+    def test_compose_lineage(self):
+        source_lineage = SignalValuesLineage([1, 2, 3, 4], np.array([0, 2]), np.array([1, 3]))
+
+        self.assertEqual([[1, 2, 7], [3, 4]], compose_lineage([[(0, 0), 7], [(0, 1)]], [source_lineage]))
+        self.assertEqual([[5], [6]], compose_lineage([[5], [6]], [None]))
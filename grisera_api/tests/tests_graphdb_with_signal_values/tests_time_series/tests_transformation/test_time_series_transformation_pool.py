@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesTransformationStepIn, JoinType
+from time_series.ts_alignment import align
+from time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+from time_series.transformation.TimeSeriesTransformationPool import TimeSeriesTransformationPool
+
+
+class TestTimeSeriesTransformationPool(unittest.TestCase):
+    time_series_timestamp = [
+        TimeSeriesOut(
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 1000 * series + 2 * index + 2,
+                                     'properties': [{'key': 'value', 'value': str((index * 7 + series) % 11 - 5)}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 1000 * series + 2 * index + 1, 'properties': [
+                        {'key': 'timestamp', 'value': str(10 * index + series)}]}
+                } for index in range(50)
+            ]) for series in range(2)
+    ]
+
+    steps = [
+        TimeSeriesTransformationStepIn(name="resample_mean", additional_properties=[PropertyIn(key="period", value="30")]),
+        TimeSeriesTransformationStepIn(name="rolling", additional_properties=[PropertyIn(key="window", value="3")]),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = TimeSeriesTransformationPool(size=1, queue_depth=2, min_signals=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.pool.executor is not None:
+            cls.pool.executor.shutdown()
+
+    def assert_transformed_equal(self, expected, result):
+        self.assertEqual(expected[0].type, result[0].type)
+        self.assertEqual(expected[0].additional_properties, result[0].additional_properties)
+        self.assertEqual([signal_value.dict() for signal_value in expected[0].signal_values],
+                         [signal_value.dict() for signal_value in result[0].signal_values])
+        self.assertEqual(list(expected[1]), list(result[1]))
+
+    def test_transform_in_pool(self):
+        for time_series, steps in [
+            (self.time_series_timestamp[:1], self.steps),
+            (self.time_series_timestamp, self.steps + [TimeSeriesTransformationStepIn(name="quadrants")]),
+            (self.time_series_timestamp[:1], [TimeSeriesTransformationStepIn(
+                name="resample_nearest", additional_properties=[PropertyIn(key="period", value="25")])]),
+        ]:
+            expected = TimeSeriesTransformationPipeline().transform(time_series, steps)
+            result = self.pool.transform(time_series, steps)
+
+            self.assert_transformed_equal(expected, result)
+        self.assertEqual(0, self.pool.pending)
+
+    def test_transform_error_in_pool(self):
+        with self.assertRaisesRegex(AssertionError, "Number of time series should equals 2"):
+            self.pool.transform(self.time_series_timestamp, [TimeSeriesTransformationStepIn(name="quadrants")] * 2)
+        self.assertEqual(0, self.pool.pending)
+
+    def test_align_in_pool(self):
+        timestamps = [np.array([1, 3, 5, 7]), np.array([0, 3, 4, 7, 9])]
+
+        for join in JoinType:
+            expected_indices, expected_sources = align(timestamps, join, 1)
+            indices, sources = self.pool.align(timestamps, join, 1)
+
+            np.testing.assert_array_equal(expected_indices, indices)
+            np.testing.assert_array_equal(expected_sources, sources)
+
+    def test_full_queue(self):
+        pool = TimeSeriesTransformationPool(size=1, queue_depth=0, min_signals=1)
+
+        with self.assertRaisesRegex(Exception, "transformation queue is full"):
+            pool.transform(self.time_series_timestamp[:1], self.steps)
+        self.assertEqual({"size": 1, "pending": 0, "queue_depth": 0}, pool.status())
+
+    def test_transform_small_time_series_in_process(self):
+        pool = TimeSeriesTransformationPool(size=1, queue_depth=0, min_signals=1000)
+
+        self.assert_transformed_equal(TimeSeriesTransformationPipeline().transform(self.time_series_timestamp[:1],
+                                                                                   self.steps),
+                                      pool.transform(self.time_series_timestamp[:1], self.steps))
+        self.assertIsNone(pool.executor)
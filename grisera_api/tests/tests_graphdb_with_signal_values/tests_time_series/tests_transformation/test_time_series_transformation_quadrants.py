@@ -181,6 +181,39 @@ class TestTimeSeriesTransformationQuadrants(unittest.TestCase):
             ),
             result)
 
+    def test_transform_timestamp_fractional_origin_parameters(self):
+        additional_properties = [
+            PropertyIn(key="origin_x", value="5.5"),
+            PropertyIn(key="origin_y", value="2.5")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationQuadrants()
+        result = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual(['2', '4', '2', '3'],
+                         [signal_value.signal_value.value for signal_value in result[0].signal_values])
+
+    def test_transform_timestamp_asof_join(self):
+        additional_properties = [
+            PropertyIn(key="join", value="asof"),
+            PropertyIn(key="tolerance", value="1")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationQuadrants()
+        result = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual([0, 1, 2, 3, 4],
+                         [int(signal_value.timestamp) for signal_value in result[0].signal_values])
+        self.assertEqual([[2, 12], [0, 12], [4, 14], [6, 16], [8, 18]], result[1])
+
+    def test_transform_outer_join_not_supported(self):
+        additional_properties = [PropertyIn(key="join", value="outer")]
+
+        time_series_transformation = TimeSeriesTransformationQuadrants()
+
+        with self.assertRaises(AssertionError):
+            time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
     def test_transform_epoch(self):
         additional_properties = []
 
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+
+from property.property_model import PropertyIn
+from time_series.transformation.TimeSeriesTransformationRegistry import TimeSeriesTransformationRegistry, \
+    TransformationSpec, TransformationParameter, ParameterType
+from time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+from time_series.transformation.TimeSeriesTransformationRolling import TimeSeriesTransformationRolling
+
+# specs discovered when this module is configured in transformation_modules
+TRANSFORMATIONS = [
+    TransformationSpec(name="smoothing",
+                       target="time_series.transformation.TimeSeriesTransformationRolling:"
+                              "TimeSeriesTransformationRolling",
+                       parameters=[TransformationParameter(key="window", type=ParameterType.int, required=True)])
+]
+
+
+class TestTimeSeriesTransformationRegistry(unittest.TestCase):
+
+    def test_get_builtin_transformation(self):
+        registry = TimeSeriesTransformationRegistry()
+
+        self.assertEqual({}, registry.implementations)
+        transformation = registry.get_transformation("resample_mean")
+
+        self.assertIsInstance(transformation, TimeSeriesTransformationResample)
+        self.assertEqual("resample_mean", transformation.transformation_name)
+        self.assertEqual(["resample_mean"], list(registry.implementations))
+
+    def test_get_unknown_transformation(self):
+        registry = TimeSeriesTransformationRegistry()
+
+        with self.assertRaisesRegex(Exception, "transformation unknown is unknown"):
+            registry.get_transformation("unknown")
+
+    @mock.patch("time_series.transformation.transformation_config.transformation_modules",
+                [__name__])
+    def test_discover_configured_module(self):
+        registry = TimeSeriesTransformationRegistry()
+
+        self.assertIsInstance(registry.get_transformation("smoothing"), TimeSeriesTransformationRolling)
+        with self.assertRaisesRegex(Exception, "window additional parameter is required"):
+            registry.validate_parameters("smoothing", [])
+
+    @mock.patch("importlib.metadata.entry_points")
+    def test_discover_entry_points(self, entry_points_mock):
+        entry_point = mock.Mock()
+        entry_point.load.return_value = TRANSFORMATIONS[0]
+        entry_points_mock.return_value.select.return_value = [entry_point]
+        registry = TimeSeriesTransformationRegistry()
+
+        self.assertEqual(TRANSFORMATIONS[0], registry.get_spec("smoothing"))
+        entry_points_mock.return_value.select.assert_called_once_with(group="grisera.transformations")
+
+    @mock.patch("importlib.metadata.entry_points")
+    def test_discover_again_after_failure(self, entry_points_mock):
+        entry_point = mock.Mock()
+        entry_point.load.side_effect = [ImportError("plugin"), TRANSFORMATIONS[0]]
+        entry_points_mock.return_value.select.return_value = [entry_point]
+        registry = TimeSeriesTransformationRegistry()
+
+        with self.assertRaises(ImportError):
+            registry.get_spec("smoothing")
+        self.assertFalse(registry.discovered)
+        self.assertEqual(TRANSFORMATIONS[0], registry.get_spec("smoothing"))
+        self.assertTrue(registry.discovered)
+
+    def test_validate_parameters(self):
+        registry = TimeSeriesTransformationRegistry()
+
+        registry.validate_parameters("resample_nearest", [PropertyIn(key="period", value="10"),
+                                                          PropertyIn(key="label", value="any")])
+        registry.validate_parameters("rolling", [PropertyIn(key="function", value="median"),
+                                                 PropertyIn(key="window", value=3)])
+        for transformation_name, additional_properties, message in [
+            ("resample_nearest", None, "period additional parameter is required"),
+            ("resample_nearest", [PropertyIn(key="period", value="ten")], "period additional parameter should be int"),
+            ("resample_nearest", [PropertyIn(key="period", value="0")],
+             "period additional parameter should be at least 1"),
+            ("rolling", [PropertyIn(key="function", value="sum")],
+             "function additional parameter should be one of mean, min, max, std, median"),
+            ("quadrants", [PropertyIn(key="origin_x", value="left")], "origin_x additional parameter should be float"),
+        ]:
+            with self.assertRaisesRegex(Exception, message):
+                registry.validate_parameters(transformation_name, additional_properties)
@@ -1,7 +1,10 @@
 import unittest
 
+import numpy as np
+
 from property.property_model import PropertyIn
-from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesIn, SignalIn, SignalValueNodesIn
+from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesIn, SignalIn, SignalValueNodesIn, \
+    TransformationType
 from time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
 
 
@@ -199,3 +202,52 @@ class TestTimeSeriesTransformationResample(unittest.TestCase):
                 [[4], [4], [8]]
             ),
             result)
+
+    def test_transform_timestamp_mean(self):
+        additional_properties = [PropertyIn(key="period", value="10")]
+
+        time_series_transformation = TimeSeriesTransformationResample(TransformationType.RESAMPLE_MEAN)
+        result, lineage = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual([(0, 20.0), (10, 40.0), (20, 50.0)],
+                         [(signal_value.timestamp, signal_value.signal_value.value)
+                          for signal_value in result.signal_values])
+        self.assertEqual([[2, 4, 6], [8], [10]], list(lineage))
+        self.assertEqual(PropertyIn(key='transformation_name', value='resample_mean'),
+                         result.additional_properties[-1])
+
+    def test_transform_timestamp_last(self):
+        additional_properties = [PropertyIn(key="period", value="10")]
+
+        time_series_transformation = TimeSeriesTransformationResample(TransformationType.RESAMPLE_LAST)
+        result, lineage = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual([(0, 30.0), (10, 40.0), (20, 50.0)],
+                         [(signal_value.timestamp, signal_value.signal_value.value)
+                          for signal_value in result.signal_values])
+        self.assertEqual([[6], [8], [10]], list(lineage))
+
+    def test_transform_timestamp_linear(self):
+        additional_properties = [PropertyIn(key="period", value="10")]
+
+        time_series_transformation = TimeSeriesTransformationResample(TransformationType.RESAMPLE_LINEAR)
+        result, lineage = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual([0, 10, 20], [signal_value.timestamp for signal_value in result.signal_values])
+        np.testing.assert_allclose([signal_value.signal_value.value for signal_value in result.signal_values],
+                                   [10, 30 + 10 / 3, 40 + 10 * 8 / 17])
+        self.assertEqual([[2], [6, 8], [8, 10]], list(lineage))
+
+    def test_transform_epoch_linear(self):
+        additional_properties = [
+            PropertyIn(key="period", value="10"),
+            PropertyIn(key="start_timestamp", value="1")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationResample(TransformationType.RESAMPLE_LINEAR)
+        result, lineage = time_series_transformation.transform(self.time_series_epoch, additional_properties)
+
+        self.assertEqual([(1, 10.0), (11, 22.5), (21, 28.75)],
+                         [(signal_value.timestamp, signal_value.signal_value.value)
+                          for signal_value in result.signal_values])
+        self.assertEqual([[2], [4, 6], [4, 6]], list(lineage))
@@ -0,0 +1,152 @@
+import unittest
+
+import numpy as np
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import TimeSeriesOut, Type, RollingFunction
+from time_series.transformation.TimeSeriesTransformationRolling import TimeSeriesTransformationRolling, \
+    window_starts, rolling_aggregate
+
+
+class TestTimeSeriesTransformationRolling(unittest.TestCase):
+    time_series_timestamp = [
+        TimeSeriesOut(
+            type=Type.timestamp,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2,
+                                     'properties': [{'key': 'value', 'value': '4'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 1, 'properties': [
+                        {'key': 'timestamp', 'value': '0'}]}
+                },
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 4,
+                                     'properties': [{'key': 'value', 'value': '2'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 3, 'properties': [
+                        {'key': 'timestamp', 'value': '10'}]}
+                },
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 6,
+                                     'properties': [{'key': 'value', 'value': 'invalid'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 5, 'properties': [
+                        {'key': 'timestamp', 'value': '15'}]}
+                },
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 8,
+                                     'properties': [{'key': 'value', 'value': '9'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 7, 'properties': [
+                        {'key': 'timestamp', 'value': '30'}]}
+                }
+            ])
+    ]
+
+    time_series_epoch = [
+        TimeSeriesOut(
+            type=Type.epoch,
+            signal_values=[
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 2,
+                                     'properties': [{'key': 'value', 'value': '1'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 1, 'properties': [
+                        {'key': 'start_timestamp', 'value': 0},
+                        {'key': 'end_timestamp', 'value': 5}
+                    ]}
+                },
+                {
+                    'signal_value': {'labels': ['Signal Value'], 'id': 4,
+                                     'properties': [{'key': 'value', 'value': '3'}]},
+                    'timestamp': {'labels': ['Timestamp'], 'id': 3, 'properties': [
+                        {'key': 'start_timestamp', 'value': 5},
+                        {'key': 'end_timestamp', 'value': 10}
+                    ]}
+                }
+            ])
+    ]
+
+    def test_transform_timestamp_window(self):
+        additional_properties = [PropertyIn(key="window", value="2")]
+
+        time_series_transformation = TimeSeriesTransformationRolling()
+        result, lineage = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual(Type.timestamp, result.type)
+        self.assertEqual([(0, 4.0), (10, 3.0), (30, 5.5)],
+                         [(signal_value.timestamp, signal_value.signal_value.value)
+                          for signal_value in result.signal_values])
+        self.assertEqual([[2], [2, 4], [4, 8]], list(lineage))
+        self.assertEqual([(2, 2, 1), (2, 4, 2), (4, 8, 2)], list(lineage.bounds()))
+        self.assertEqual(PropertyIn(key='transformation_name', value='rolling'), result.additional_properties[-1])
+
+    def test_transform_timestamp_duration(self):
+        additional_properties = [
+            PropertyIn(key="function", value="max"),
+            PropertyIn(key="duration", value="20")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationRolling()
+        result, lineage = time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+        self.assertEqual([4.0, 4.0, 9.0], [signal_value.signal_value.value for signal_value in result.signal_values])
+        self.assertEqual([[2], [2, 4], [8]], list(lineage))
+
+    def test_transform_epoch(self):
+        additional_properties = [
+            PropertyIn(key="function", value="std"),
+            PropertyIn(key="window", value="2")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationRolling()
+        result, _ = time_series_transformation.transform(self.time_series_epoch, additional_properties)
+
+        self.assertEqual(Type.epoch, result.type)
+        self.assertEqual([(0, 5, 0.0), (5, 10, 1.0)],
+                         [(signal_value.start_timestamp, signal_value.end_timestamp, signal_value.signal_value.value)
+                          for signal_value in result.signal_values])
+
+    def test_transform_window_and_duration(self):
+        additional_properties = [
+            PropertyIn(key="window", value="2"),
+            PropertyIn(key="duration", value="20")
+        ]
+
+        time_series_transformation = TimeSeriesTransformationRolling()
+
+        with self.assertRaises(AssertionError):
+            time_series_transformation.transform(self.time_series_timestamp, additional_properties)
+
+    def test_rolling_aggregate(self):
+        values = np.array([5, 1, 4, 1, 5, 9, 2, 6], dtype=np.float64)
+        starts = window_starts(np.arange(len(values)), window=3)
+
+        expected = {
+            RollingFunction.mean: [np.mean(values[max(i - 2, 0):i + 1]) for i in range(len(values))],
+            RollingFunction.min: [np.min(values[max(i - 2, 0):i + 1]) for i in range(len(values))],
+            RollingFunction.max: [np.max(values[max(i - 2, 0):i + 1]) for i in range(len(values))],
+            RollingFunction.std: [np.std(values[max(i - 2, 0):i + 1]) for i in range(len(values))],
+            RollingFunction.median: [np.median(values[max(i - 2, 0):i + 1]) for i in range(len(values))]
+        }
+        for function, expected_values in expected.items():
+            np.testing.assert_allclose(rolling_aggregate(values, starts, function), expected_values)
+
+    def test_rolling_std_precision(self):
+        # values drift far from their global mean, while variance within windows is small
+        values = 1e9 + 1e6 * np.arange(1000) + np.sin(np.arange(1000))
+        for window in (1, 2, 50):
+            starts = window_starts(np.arange(len(values)), window=window)
+            expected = [np.std(values[max(i - window + 1, 0):i + 1]) for i in range(len(values))]
+
+            result = rolling_aggregate(values, starts, RollingFunction.std)
+
+            np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-6)
+            if window == 1:
+                np.testing.assert_array_equal(result, np.zeros(len(values)))
+
+    def test_rolling_median_with_duration(self):
+        values = np.array([3, 3, 1, 7, 3, 2, 2, 8, 0, 5], dtype=np.float64)
+        starts = window_starts(np.array([0, 1, 1, 2, 6, 7, 7, 8, 20, 21]), duration=4)
+
+        np.testing.assert_allclose(rolling_aggregate(values, starts, RollingFunction.median),
+                                   [np.median(values[start:end + 1]) for end, start in enumerate(starts)])
+
+    def test_window_starts_duration(self):
+        np.testing.assert_array_equal(window_starts(np.array([0, 10, 15, 30]), duration=15), [0, 0, 1, 3])
@@ -0,0 +1,36 @@
+from unittest import mock
+
+import mongomock
+
+from mongo_service.collection_mapping import Collections
+from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongo_migration_service import MongoMigrationService
+from mongo_service.mongo_migrations import MIGRATIONS
+from tests.tests_mongodb.utils import MongoTestCase
+
+
+@mock.patch.object(MongoApiService, "_create_ts_collection_if_missing")
+class TestMongoMigrations(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = MongoMigrationService()
+        self.service.mongo_api_service.db = mongomock.MongoClient().db
+
+    def test_apply_migrations(self, create_ts_collection_mock):
+        applied = self.service.apply_migrations()
+
+        self.assertEqual(applied, [migration.version for migration in MIGRATIONS])
+        self.assertEqual(self.service.get_schema_version(), MIGRATIONS[-1].version)
+        create_ts_collection_mock.assert_called_once_with(Collections.TIME_SERIES)
+        indexes = {(index["collection"], index["name"]) for index in self.service.get_indexes()}
+        self.assertIn((Collections.TIME_SERIES, "metadata.id_1_timestamp_1"), indexes)
+        self.assertIn((Collections.RECORDING, "participation_id_1"), indexes)
+        self.assertIn((Collections.PARTICIPATION, "participant_state_id_1"), indexes)
+
+    def test_apply_migrations_only_once(self, _):
+        self.service.apply_migrations()
+
+        applied = self.service.apply_migrations()
+
+        self.assertEqual(applied, [])
+        self.assertEqual(len(self.service.get_migrations()), len(MIGRATIONS))
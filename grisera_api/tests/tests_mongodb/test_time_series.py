@@ -0,0 +1,421 @@
+import asyncio
+import json
+from unittest import mock
+
+import mongomock
+
+from models.not_found_model import NotFoundByIdModel
+from mongo_service.mongo_api_service import MongoApiService
+from tests.tests_mongodb.utils import MongoTestCase
+from time_series.time_series_model import TimeSeriesIn, SignalColumnsIn, SignalFormat, DownsamplingMethod, \
+    SignalStatistics, TimeSeriesSignalsIn, TimeSeriesTransformationIn, TimeSeriesTransformationStepIn
+from property.property_model import PropertyIn
+from time_series.time_series_service_mongodb import TimeSeriesServiceMongoDB
+
+
+async def lines_stream(lines):
+    for line in lines:
+        yield line
+
+
+@mock.patch.object(MongoApiService, "_create_ts_collection_if_missing")
+class TestMongoTimeSeries(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = TimeSeriesServiceMongoDB()
+        self.service.mongo_api_service.db = mongomock.MongoClient().db
+        self.service.measure_service = mock.Mock()
+        self.service.measure_service.get_measure.return_value = NotFoundByIdModel
+        self.service.observable_information_service = mock.Mock()
+
+    def test_save_stream(self, _):
+        lines = [json.dumps({"type": "Timestamp", "source": "ecg"})] + [
+            json.dumps({"timestamp": timestamp, "signal_value": {"value": timestamp * 2}})
+            for timestamp in range(1, 6)
+        ]
+
+        with mock.patch("time_series.time_series_service_mongodb.mongo_ts_insert_batch_size", 2):
+            result = asyncio.run(self.service.save_time_series_stream(lines_stream(lines)))
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.source, "ecg")
+        self.assertEqual(result.signal_values, [])
+        fetched = self.service.get_time_series(result.id)
+        self.assertEqual([signal["timestamp"] for signal in fetched.signal_values], [1, 2, 3, 4, 5])
+        self.assertEqual([signal["signal_value"]["value"] for signal in fetched.signal_values],
+                         ["2", "4", "6", "8", "10"])
+
+    def test_save_stream_with_signal_columns(self, _):
+        lines = [
+            json.dumps({"type": "Timestamp", "signal_columns": {"timestamps": [1, 2], "values": [2, 4]}}),
+            json.dumps({"timestamp": 3, "signal_value": {"value": 6}}),
+            "not a signal",
+        ]
+
+        invalid = asyncio.run(self.service.save_time_series_stream(lines_stream(lines)))
+        result = asyncio.run(self.service.save_time_series_stream(lines_stream(lines[:2])))
+
+        self.assertIn("invalid signal value at line 3", invalid.errors["errors"])
+        self.assertIsNone(result.signal_columns)
+        fetched = self.service.get_time_series(result.id)
+        self.assertEqual([signal["timestamp"] for signal in fetched.signal_values], [1, 2, 3])
+        self.assertEqual(self.service.get_time_series_statistics(result.id).statistics.count, 3)
+
+    def test_save_stream_with_invalid_signal(self, _):
+        lines = [
+            json.dumps({"type": "Timestamp"}),
+            json.dumps({"timestamp": 1, "signal_value": {"value": 1}}),
+            "not a signal",
+        ]
+
+        result = asyncio.run(self.service.save_time_series_stream(lines_stream(lines)))
+
+        self.assertIsNotNone(result.errors)
+        self.assertEqual(self.service.mongo_api_service.db.timeSeries.count_documents({}), 0)
+
+    def test_save_stream_empty(self, _):
+        result = asyncio.run(self.service.save_time_series_stream(lines_stream([])))
+
+        self.assertEqual(result.errors, {"errors": "time series stream is empty"})
+
+    def test_save_signal_columns(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 3], values=[1, 2.5, 3]),
+        )
+
+        result = self.service.save_time_series(time_series)
+
+        self.assertIsNone(result.errors)
+        self.assertEqual([signal["timestamp"] for signal in result.signal_values], [1, 2, 3])
+        columns = self.service.get_time_series(result.id, signal_format=SignalFormat.columns)
+        self.assertEqual(columns.signal_values, [])
+        self.assertEqual(columns.signal_columns, SignalColumnsIn(timestamps=[1, 2, 3], values=[1, 2.5, 3]))
+
+    def test_save_epoch_signal_columns(self, _):
+        time_series = TimeSeriesIn(
+            type="Epoch",
+            signal_columns=SignalColumnsIn(start_timestamps=[1, 5], end_timestamps=[4, 8], values=["a", "b"]),
+        )
+
+        result = self.service.save_time_series(time_series)
+
+        columns = self.service.get_time_series(result.id, signal_format=SignalFormat.columns)
+        self.assertEqual(columns.signal_columns.start_timestamps, [1, 5])
+        self.assertEqual(columns.signal_columns.end_timestamps, [4, 8])
+        self.assertEqual(columns.signal_columns.values, ["a", "b"])
+
+    def test_save_and_get_bucketed(self, _):
+        mongo_api_service = self.service.mongo_api_service
+        mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        mongo_api_service.ts_bucket_size = 2
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_values=[
+                {"timestamp": timestamp, "signal_value": {"value": timestamp * 10}}
+                for timestamp in range(1, 6)
+            ],
+        )
+
+        result = self.service.save_time_series(time_series)
+
+        self.assertEqual(mongo_api_service.db.timeSeriesBuckets.count_documents({}), 3)
+        self.assertEqual(mongo_api_service.db.timeSeries.count_documents({}), 0)
+        self.assertEqual([signal["timestamp"] for signal in result.signal_values], [1, 2, 3, 4, 5])
+        filtered = self.service.get_time_series(
+            result.id, signal_min_value=20, signal_max_value=30, signal_format=SignalFormat.columns
+        )
+        self.assertEqual(filtered.signal_columns, SignalColumnsIn(timestamps=[2, 3], values=[20, 30]))
+        self.assertEqual(len(self.service.get_multiple()), 1)
+
+        self.service.delete_time_series(result.id)
+
+        self.assertEqual(mongo_api_service.db.timeSeriesBuckets.count_documents({}), 0)
+
+    def test_save_bucketed_signal_columns(self, _):
+        mongo_api_service = self.service.mongo_api_service
+        mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        mongo_api_service.ts_bucket_size = 2
+        time_series = TimeSeriesIn(
+            type="Epoch",
+            signal_columns=SignalColumnsIn(start_timestamps=[1, 5, 9], end_timestamps=[4, 8, 12], values=[1.5, 2, 3]),
+        )
+
+        result = self.service.save_time_series(time_series)
+
+        bucket = mongo_api_service.db.timeSeriesBuckets.find_one({"first_value": 1.5})
+        self.assertEqual((bucket["count"], bucket["min_value"], bucket["max_value"]), (2, 1.5, 2))
+        self.assertEqual([signal["end_timestamp"] for signal in result.signal_values], [4, 8, 12])
+        self.assertEqual(self.service.get_time_series(result.id, signal_min_value=10).errors,
+                         {"errors": "time series not found"})
+
+    def test_get_time_range_pages(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=list(range(1, 11)), values=list(range(10))),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        self.assert_time_range_pages(ts_id)
+
+    def test_get_time_range_pages_bucketed(self, _):
+        self.service.mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        self.service.mongo_api_service.ts_bucket_size = 3
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=list(range(1, 11)), values=list(range(10))),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        self.assert_time_range_pages(ts_id)
+
+    def assert_time_range_pages(self, ts_id):
+        pages = []
+        cursor = None
+        while True:
+            page = self.service.get_time_series(
+                ts_id, start_timestamp=3, end_timestamp=10, limit=3, cursor=cursor
+            )
+            pages.append([signal["timestamp"] for signal in page.signal_values])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, [[3, 4, 5], [6, 7, 8], [9]])
+
+    def test_get_pages_with_duplicated_timestamps(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 2, 3], values=[10, 20, 30, 40]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        self.assert_duplicated_timestamp_pages(ts_id)
+
+    def test_get_pages_with_duplicated_timestamps_bucketed(self, _):
+        self.service.mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        self.service.mongo_api_service.ts_bucket_size = 3
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 2, 3], values=[10, 20, 30, 40]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        self.assert_duplicated_timestamp_pages(ts_id)
+
+    def assert_duplicated_timestamp_pages(self, ts_id):
+        pages = []
+        cursor = None
+        while True:
+            page = self.service.get_time_series(ts_id, limit=2, cursor=cursor)
+            pages.append([signal["signal_value"]["value"] for signal in page.signal_values])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, [["10", "20"], ["30", "40"]])
+
+    def test_get_downsampled(self, _):
+        values = [0, 5, 1, 1, -3, 2, 2, 2, 9, 0, 1, 1]
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=list(range(1, 13)), values=values),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        min_max = self.service.get_time_series(
+            ts_id, max_points=4, downsampling_method=DownsamplingMethod.min_max, signal_format=SignalFormat.columns
+        )
+        mean = self.service.get_time_series(
+            ts_id, max_points=3, downsampling_method=DownsamplingMethod.mean, signal_format=SignalFormat.columns
+        )
+        lttb = self.service.get_time_series(ts_id, max_points=4)
+
+        self.assertEqual(min_max.signal_columns, SignalColumnsIn(timestamps=[2, 5, 9, 10], values=[5, -3, 9, 0]))
+        self.assertEqual(mean.signal_columns, SignalColumnsIn(timestamps=[1, 5, 9], values=[1.75, 0.75, 2.75]))
+        self.assertEqual([signal["timestamp"] for signal in lttb.signal_values], [1, 2, 9, 12])
+
+    def test_get_downsampled_bucketed(self, _):
+        self.service.mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        self.service.mongo_api_service.ts_bucket_size = 5
+        values = [0, 5, 1, 1, -3, 2, 2, 2, 9, 0, 1, 1]
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=list(range(1, 13)), values=values),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        min_max = self.service.get_time_series(
+            ts_id, max_points=4, downsampling_method=DownsamplingMethod.min_max, signal_format=SignalFormat.columns
+        )
+
+        self.assertEqual(min_max.signal_columns, SignalColumnsIn(timestamps=[2, 5, 9, 10], values=[5, -3, 9, 0]))
+
+    def test_get_multiple_metadata_only(self, _):
+        self.service.save_time_series(TimeSeriesIn(
+            type="Timestamp",
+            source="ecg",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 3], values=[1, 2, 3]),
+        ))
+        self.service.mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        self.service.mongo_api_service.ts_bucket_size = 2
+        self.service.save_time_series(TimeSeriesIn(
+            type="Timestamp",
+            source="eeg",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 3], values=[1, 2, 3]),
+        ))
+
+        listed = self.service.get_time_series_nodes({})
+        with_signals = self.service.get_time_series_nodes({}, include_signal_values=True)
+
+        self.assertEqual(sorted(ts.source for ts in listed.time_series_nodes), ["ecg", "eeg"])
+        self.assertTrue(all(ts.signal_values == [] for ts in listed.time_series_nodes))
+        self.assertEqual([len(ts.signal_values) for ts in with_signals.time_series_nodes], [3, 3])
+
+    def test_statistics(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_values=[{"timestamp": 1, "signal_value": {"value": 2}}],
+            signal_columns=SignalColumnsIn(timestamps=[2, 3, 4], values=[4, 4, 6]),
+        )
+
+        result = self.service.save_time_series(time_series)
+
+        expected = SignalStatistics(count=4, min_value=2, max_value=6, mean=4, std=2 ** 0.5, first_timestamp=1,
+                                    last_timestamp=4)
+        self.assertEqual(self.service.get_time_series_statistics(result.id).statistics, expected)
+        self.assertEqual(result.statistics, expected)
+        self.assertEqual(self.service.get_time_series_nodes({}).time_series_nodes[0].statistics, expected)
+
+    def test_statistics_of_stream(self, _):
+        lines = [json.dumps({"type": "Epoch"})] + [
+            json.dumps({"start_timestamp": timestamp, "end_timestamp": timestamp + 1,
+                        "signal_value": {"value": "a" if timestamp == 3 else timestamp}})
+            for timestamp in range(1, 6)
+        ]
+
+        with mock.patch("time_series.time_series_service_mongodb.mongo_ts_insert_batch_size", 2):
+            result = asyncio.run(self.service.save_time_series_stream(lines_stream(lines)))
+
+        self.assertEqual(self.service.get_time_series_statistics(result.id).statistics,
+                         SignalStatistics(count=5, first_timestamp=1, last_timestamp=6))
+
+    def test_append_signals(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2], values=[1, 2]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        result = self.service.append_signal_values(ts_id, TimeSeriesSignalsIn(
+            signal_values=[{"timestamp": 4, "signal_value": {"value": 4}}],
+            signal_columns=SignalColumnsIn(timestamps=[3], values=[3]),
+        ))
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.id, ts_id)
+        self.assertEqual(result.statistics.count, 4)
+        self.assertEqual(result.statistics.last_timestamp, 4)
+        columns = self.service.get_time_series(ts_id, signal_format=SignalFormat.columns)
+        self.assertEqual(columns.signal_columns, SignalColumnsIn(timestamps=[1, 2, 3, 4], values=[1, 2, 3, 4]))
+
+    def test_append_signals_upsert(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 3], values=[1, 2, 3]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        result = self.service.append_signal_values(ts_id, TimeSeriesSignalsIn(
+            signal_columns=SignalColumnsIn(timestamps=[3, 4], values=[30, 40]), upsert=True
+        ))
+
+        self.assertEqual((result.statistics.count, result.statistics.max_value), (4, 40))
+        columns = self.service.get_time_series(ts_id, signal_format=SignalFormat.columns)
+        self.assertEqual(columns.signal_columns, SignalColumnsIn(timestamps=[1, 2, 3, 4], values=[1, 2, 30, 40]))
+
+    def test_append_signals_bucketed(self, _):
+        mongo_api_service = self.service.mongo_api_service
+        mongo_api_service.ts_storage_mode = MongoApiService.TS_STORAGE_BUCKETS
+        mongo_api_service.ts_bucket_size = 3
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[1, 2, 3, 5], values=[1, 2, 3, 5]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+
+        self.service.append_signal_values(ts_id, TimeSeriesSignalsIn(
+            signal_columns=SignalColumnsIn(timestamps=[7, 6], values=[7, 6])
+        ))
+        result = self.service.append_signal_values(ts_id, TimeSeriesSignalsIn(
+            signal_columns=SignalColumnsIn(timestamps=[2, 4], values=[20, 4]), upsert=True
+        ))
+
+        self.assertEqual(result.statistics.count, 7)
+        counts = [bucket["count"] for bucket in mongo_api_service.db.timeSeriesBuckets.find().sort("first_timestamp")]
+        self.assertEqual(counts, [3, 1, 3])
+        columns = self.service.get_time_series(ts_id, signal_format=SignalFormat.columns)
+        self.assertEqual(columns.signal_columns,
+                         SignalColumnsIn(timestamps=[1, 2, 3, 4, 5, 6, 7], values=[1, 20, 3, 4, 5, 6, 7]))
+
+    def test_append_signals_not_found(self, _):
+        result = self.service.append_signal_values(
+            "5f9f1b9b9c9d440000000000", TimeSeriesSignalsIn(signal_columns=SignalColumnsIn(timestamps=[1], values=[1]))
+        )
+
+        self.assertEqual(result.errors, {"errors": "time series not found"})
+
+    def test_transform_pipeline(self, _):
+        time_series = TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[0, 5, 10, 15, 20], values=[1, 3, 5, 7, 9]),
+        )
+        ts_id = self.service.save_time_series(time_series).id
+        transformation = TimeSeriesTransformationIn(
+            source_time_series_ids=[ts_id],
+            steps=[
+                TimeSeriesTransformationStepIn(name="resample_mean",
+                                               additional_properties=[PropertyIn(key="period", value="10")]),
+                TimeSeriesTransformationStepIn(name="rolling",
+                                               additional_properties=[PropertyIn(key="window", value="2")]),
+            ],
+        )
+
+        documents_count = self.service.mongo_api_service.db.timeSeries.count_documents({})
+
+        dry_run_result = self.service.transform_time_series(transformation.copy(update={"dry_run": True}))
+        self.assertIsNone(dry_run_result.errors)
+        self.assertEqual(self.service.mongo_api_service.db.timeSeries.count_documents({}), documents_count)
+        result = self.service.transform_time_series(transformation)
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(self.service.mongo_api_service.db.timeSeries.count_documents({}), documents_count + 3)
+        for transformed in [dry_run_result, self.service.get_time_series(result.id)]:
+            self.assertEqual([(signal["timestamp"], float(signal["signal_value"]["value"]))
+                              for signal in transformed.signal_values], [(0, 2.0), (10, 4.0), (20, 7.5)])
+
+    def test_dry_run_cached_until_append(self, _):
+        ts_id = self.service.save_time_series(TimeSeriesIn(
+            type="Timestamp",
+            signal_columns=SignalColumnsIn(timestamps=[0, 5, 10], values=[1, 3, 5]),
+        )).id
+        transformation = TimeSeriesTransformationIn(
+            source_time_series_ids=[ts_id],
+            name="resample_mean",
+            additional_properties=[PropertyIn(key="period", value="10")],
+            dry_run=True,
+        )
+
+        with mock.patch.object(self.service, "get_time_series", wraps=self.service.get_time_series) as get_mock:
+            first_result = self.service.transform_time_series(transformation)
+            cached_result = self.service.transform_time_series(transformation)
+            self.assertEqual(get_mock.call_count, 1)
+            self.service.append_signal_values(ts_id, TimeSeriesSignalsIn(
+                signal_columns=SignalColumnsIn(timestamps=[15], values=[7])
+            ))
+            appended_result = self.service.transform_time_series(transformation)
+            self.assertEqual(get_mock.call_count, 2)
+
+        self.assertEqual(first_result.signal_values, cached_result.signal_values)
+        self.assertEqual([(signal["timestamp"], float(signal["signal_value"]["value"]))
+                          for signal in appended_result.signal_values], [(0, 2.0), (10, 6.0)])
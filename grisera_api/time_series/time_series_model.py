@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Optional, List, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, root_validator
 
 from models.base_model_out import BaseModelOut
 from property.property_model import PropertyIn
@@ -13,7 +13,11 @@ class TransformationType(str, Enum):
     """
 
     RESAMPLE_NEAREST = "resample_nearest"
+    RESAMPLE_MEAN = "resample_mean"
+    RESAMPLE_LINEAR = "resample_linear"
+    RESAMPLE_LAST = "resample_last"
     QUADRANTS = "quadrants"
+    ROLLING = "rolling"
 
 
 class TimestampNodesIn(BaseModel):
@@ -54,6 +58,94 @@ class SignalIn(BaseModel):
     signal_value: SignalValueNodesIn
 
 
+class SignalColumnsIn(BaseModel):
+    """
+    Model of signal values in columnar format. Each attribute is a list with one element per signal,
+    elements with the same index describe the same signal.
+    Attributes:
+        timestamps (Optional[List[int]]): Timestamps of signal measures of type Timestamp in milliseconds
+        start_timestamps (Optional[List[int]]): Timestamps of begin signal measures of type Epoch in milliseconds
+        end_timestamps (Optional[List[int]]): Timestamps of end signal measures of type Epoch in milliseconds
+        values (List[Union[float, str]]): Values of signals
+    """
+
+    timestamps: Optional[List[int]]
+    start_timestamps: Optional[List[int]]
+    end_timestamps: Optional[List[int]]
+    values: List[Union[float, str]] = []
+
+    @root_validator(skip_on_failure=True)
+    def check_columns_length(cls, columns):
+        if columns["timestamps"] is None and (columns["start_timestamps"] is None or columns["end_timestamps"] is None):
+            raise ValueError("timestamps or both start_timestamps and end_timestamps should be given")
+        for column_name in ["timestamps", "start_timestamps", "end_timestamps"]:
+            if columns[column_name] is not None and len(columns[column_name]) != len(columns["values"]):
+                raise ValueError(f"{column_name} and values should have equal length")
+        return columns
+
+
+class SignalFormat(str, Enum):
+    """
+    Format of signal values sent to client
+
+    Attributes:
+        rows (str): List of signal objects in signal_values
+        columns (str): Parallel lists of timestamps and values in signal_columns
+    """
+
+    rows = "rows"
+    columns = "columns"
+
+
+class DownsamplingMethod(str, Enum):
+    """
+    Method of reducing number of signals sent to client
+
+    Attributes:
+        min_max (str): Signals with minimal and maximal value in each time bucket
+        mean (str): Mean value of signals in each time bucket
+        lttb (str): Signals selected with Largest Triangle Three Buckets algorithm
+    """
+
+    min_max = "min_max"
+    mean = "mean"
+    lttb = "lttb"
+
+
+class RollingFunction(str, Enum):
+    """
+    Aggregation function of rolling transformation applied to each window of signals
+
+    Attributes:
+        mean (str): Mean value of signals in window
+        min (str): Minimal value of signals in window
+        max (str): Maximal value of signals in window
+        std (str): Population standard deviation of signals in window
+        median (str): Median value of signals in window
+    """
+
+    mean = "mean"
+    min = "min"
+    max = "max"
+    std = "std"
+    median = "median"
+
+
+class JoinType(str, Enum):
+    """
+    Method of aligning signals of multiple time series by timestamps
+
+    Attributes:
+        inner (str): Signals with equal timestamps (or the nearest ones within tolerance) in all time series
+        outer (str): All signals, those with equal timestamps (or within tolerance) are aligned
+        asof (str): Signals of the first time series with the latest earlier signals of other time series
+    """
+
+    inner = "inner"
+    outer = "outer"
+    asof = "asof"
+
+
 class Type(str, Enum):
     """
     Types of time series
@@ -79,12 +171,27 @@ class TimeSeriesPropertyIn(BaseModel):
         type (Type): Type of the signal
         source (str): TimeSeries source
         signal_values (List[SignalIn]): list of signals
+        signal_columns (Optional[SignalColumnsIn]): signals in columnar format, alternative to signal_values
         additional_properties (Optional[List[PropertyIn]]): Additional properties for signal
     """
 
     type: Type
     source: Optional[str]
     signal_values: List[SignalIn] = []
+    signal_columns: Optional[SignalColumnsIn]
+    additional_properties: Optional[List[PropertyIn]]
+
+
+class TimeSeriesTransformationStepIn(BaseModel):
+    """
+    Model of single step of time series transformation pipeline to acquire from client
+
+    Attributes:
+        name (str): Name of the transformation, one of TransformationType or registered by plugin
+        additional_properties (Optional[List[PropertyIn]]): Additional properties for transformation
+    """
+
+    name: str
     additional_properties: Optional[List[PropertyIn]]
 
 
@@ -93,18 +200,38 @@ class TimeSeriesTransformationIn(BaseModel):
     Model of time series transformation to acquire from client
 
     Attributes:
-        name (TransformationType): Name of the transformation
+        name (Optional[str]): Name of the transformation, one of TransformationType or registered by plugin,
+            required if there are no steps
         source_time_series_ids (List[int]): Ids of source time series
         destination_observable_information_id (Optional[int]): Id of destination observable information
         destination_measure_id (Optional[int]): Id of destination measure
         additional_properties (Optional[List[PropertyIn]]): Additional properties for transformation
+        steps (Optional[List[TimeSeriesTransformationStepIn]]): Transformations applied in order instead of
+            single transformation, only the result of the last one is saved
+        dry_run (bool): Whether to return transformed time series without saving it
     """
 
-    name: TransformationType
+    name: Optional[str]
     source_time_series_ids: List[Union[str, int]]
     destination_observable_information_id: Optional[int]
     destination_measure_id: Optional[int]
     additional_properties: Optional[List[PropertyIn]]
+    steps: Optional[List[TimeSeriesTransformationStepIn]]
+    dry_run: bool = False
+
+    @root_validator(skip_on_failure=True)
+    def check_name_or_steps(cls, transformation):
+        if transformation["name"] is None and not transformation["steps"]:
+            raise ValueError("name or steps should be given")
+        return transformation
+
+    def get_steps(self):
+        """
+        Get steps of transformation pipeline, single transformation is a pipeline with one step
+        """
+        if self.steps:
+            return self.steps
+        return [TimeSeriesTransformationStepIn(name=self.name, additional_properties=self.additional_properties)]
 
 
 class TimeSeriesTransformationRelationshipIn(BaseModel):
@@ -138,6 +265,46 @@ class TimeSeriesIn(TimeSeriesPropertyIn, TimeSeriesRelationIn):
     """
 
 
+class TimeSeriesSignalsIn(BaseModel):
+    """
+    Model of batch of signals appended to existing time series
+
+    Attributes:
+        signal_values (List[SignalIn]): list of signals
+        signal_columns (Optional[SignalColumnsIn]): signals in columnar format, alternative to signal_values
+        upsert (bool): Replace stored signals with the same (start) timestamp as appended ones
+    """
+
+    signal_values: List[SignalIn] = []
+    signal_columns: Optional[SignalColumnsIn]
+    upsert: bool = False
+
+
+class SignalStatistics(BaseModel):
+    """
+    Model of summary of all signals of time series, computed when signals are stored
+
+    Attributes:
+        count (int): Number of signals
+        min_value (Optional[float]): Minimal value of signals, only if all values are numeric
+        max_value (Optional[float]): Maximal value of signals, only if all values are numeric
+        mean (Optional[float]): Mean value of signals, only if all values are numeric
+        std (Optional[float]): Population standard deviation of values, only if all values are numeric
+        first_timestamp (Optional[int]): The lowest (start) timestamp of signals
+        last_timestamp (Optional[int]): The highest (end) timestamp of signals
+        version (int): Number of changes of signals, used as version of their content
+    """
+
+    count: int = 0
+    min_value: Optional[float]
+    max_value: Optional[float]
+    mean: Optional[float]
+    std: Optional[float]
+    first_timestamp: Optional[int]
+    last_timestamp: Optional[int]
+    version: int = 0
+
+
 class BasicTimeSeriesOut(TimeSeriesPropertyIn, TimeSeriesRelationIn, BaseModelOut):
     """
     Basic model of time series
@@ -145,10 +312,14 @@ class BasicTimeSeriesOut(TimeSeriesPropertyIn, TimeSeriesRelationIn, BaseModelOu
     Attributes:
     id (Optional[Union[int, str]]): Id of time series returned from api
     signal_values (list): list of signals
+    next_cursor (Optional[str]): Cursor of the next page of signal values, if signals were limited
+    statistics (Optional[SignalStatistics]): Summary of all signals of time series
     """
 
     id: Optional[Union[int, str]]
     signal_values: list = []
+    next_cursor: Optional[str]
+    statistics: Optional[SignalStatistics]
 
 
 class TimeSeriesOut(BasicTimeSeriesOut, BaseModelOut):
@@ -178,6 +349,34 @@ class TimeSeriesMultidimensionalOut(BaseModelOut):
     time_series: List[TimeSeriesOut] = []
 
 
+class TransformationPoolOut(BaseModelOut):
+    """
+    Model of state of pool of processes transforming time series to send to client as a result of request
+
+    Attributes:
+        size (int): Number of worker processes, 0 if transformations run in processes handling requests
+        pending (int): Number of transformations waiting for or running in the pool
+        queue_depth (int): Maximal number of pending transformations
+    """
+
+    size: int
+    pending: int
+    queue_depth: int
+
+
+class TimeSeriesStatisticsOut(BaseModelOut):
+    """
+    Model of statistics of time series to send to client as a result of request
+
+    Attributes:
+        id (Optional[Union[int, str]]): Id of time series
+        statistics (Optional[SignalStatistics]): Summary of all signals of time series
+    """
+
+    id: Optional[Union[int, str]]
+    statistics: Optional[SignalStatistics]
+
+
 class TimeSeriesNodesOut(BaseModelOut):
     """
     Model of time series nodes to send to client as a result of request
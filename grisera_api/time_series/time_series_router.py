@@ -3,6 +3,7 @@ from typing import Union, Optional
 from fastapi import Response
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 
 from hateoas import get_links
@@ -13,9 +14,18 @@ from time_series.time_series_model import (
     TimeSeriesPropertyIn,
     TimeSeriesRelationIn,
     TimeSeriesTransformationIn,
-    TimeSeriesMultidimensionalOut
+    TimeSeriesMultidimensionalOut,
+    SignalFormat,
+    DownsamplingMethod,
+    TimeSeriesStatisticsOut,
+    TimeSeriesSignalsIn,
+    BasicTimeSeriesOut,
+    JoinType,
+    TransformationPoolOut,
 )
 from time_series.time_series_service import TimeSeriesService
+from time_series.ts_helpers import iterate_lines, decode_signal_cursor
+from time_series.transformation.TimeSeriesTransformationPool import transformation_pool
 from models.not_found_model import NotFoundByIdModel
 from services import Services
 
@@ -40,6 +50,8 @@ class TimeSeriesRouter:
         Create time series in database
 
         Signal values:
+        - can be provided as list of signal objects in signal_values or as parallel lists of timestamps
+          (start_timestamps and end_timestamps for Epoch type) and values in signal_columns
         - should be provided in ascending order of (start) timestamp
         - timestamps within one time series should be unique (for Timestamp type) and disjoint (for Epoch type)
         """
@@ -53,6 +65,29 @@ class TimeSeriesRouter:
 
         return create_response
 
+    @router.post("/time_series/stream", tags=["time series"],
+                 response_model=Union[TimeSeriesOut, NotFoundByIdModel])
+    async def create_time_series_stream(self, request: Request, response: Response):
+        """
+        Create time series in database from newline delimited JSON (NDJSON) request body
+
+        Request body:
+        - first line contains time series in the same format as in POST /time_series (signal values may be omitted)
+        - each following line contains a single signal value
+
+        Signal values are parsed incrementally and stored in batches, so long recordings can be sent without
+        keeping the whole time series in memory. Response does not contain signal values.
+        """
+
+        create_response = await self.time_series_service.save_time_series_stream(iterate_lines(request.stream()))
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
     @router.post("/time_series/transformation", tags=["time series"],
                  response_model=Union[TimeSeriesOut, NotFoundByIdModel])
     async def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn, response: Response):
@@ -66,14 +101,35 @@ class TimeSeriesRouter:
             - period (required) - difference between output timestamps
             - start_timestamp - first output timestamp (default 0)
             - end_timestamp - last output timestamp will be less than end_timestamp (default last input end timestamp + period)
+        - resample_mean, resample_linear, resample_last:
+            - the same parameters as resample_nearest
+            - mean or last signal value in each period, or signal value interpolated between the nearest ones
         - quadrants:
             - origin_x - X value of the center point of coordinate system (default 0)
             - origin_y - Y value of the center point of coordinate system (default 0)
+            - join - inner (default) or asof, the same as in multidimensional time series
+            - tolerance - maximal distance between timestamps of X and Y signal values (default exact match)
+        - rolling:
+            - function - mean (default), min, max, std or median of signal values in window
+            - window - number of signal values in window ending with each signal value
+            - duration - time span of window ending with each signal value, exclusive with window
+
+        Other transformations may be registered by plugins. Parameters are checked against parameters declared by
+        transformation before source time series are loaded.
+
+        Instead of name and additional_properties, steps with name and additional_properties of each transformation
+        may be given. Each step transforms result of the previous one in memory and only the result of the last step
+        is saved. Transformations of single time series are applied to each of time series separately.
+        With dry_run transformed time series is returned without saving it.
+
+        Transformations of large time series run in a pool of processes, so they do not block other requests.
+        When too many transformations are pending, the request is rejected.
 
         To read about the implementation details go to TimeSeriesTransformation docstring documentation.
         """
 
-        create_response = self.time_series_service.transform_time_series(time_series_transformation)
+        create_response = await run_in_threadpool(self.time_series_service.transform_time_series,
+                                                  time_series_transformation)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -82,6 +138,18 @@ class TimeSeriesRouter:
 
         return create_response
 
+    @router.get("/time_series/transformation/pool", tags=["time series"], response_model=TransformationPoolOut)
+    async def get_transformation_pool(self, response: Response):
+        """
+        Get size of pool of processes transforming time series and number of pending transformations
+        """
+        get_response = TransformationPoolOut(**transformation_pool.status())
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
     @router.get("/time_series", tags=["time series"], response_model=TimeSeriesNodesOut)
     async def get_time_series_nodes(self, response: Response, request: Request,
                                     entityname_property_name: Optional[str] = None,
@@ -92,7 +160,8 @@ class TimeSeriesRouter:
                                     participant_name: Optional[str] = None,
                                     participantstate_age: Optional[str] = None,
                                     recording_id: Optional[int] = None,
-                                    recording_source: Optional[str] = None):
+                                    recording_source: Optional[str] = None,
+                                    include_signal_values: bool = False):
         """
         Get time series from database.
 
@@ -113,9 +182,11 @@ class TimeSeriesRouter:
         - registeredchannel
         - channel
         - registereddata
-        """
 
-        get_response = self.time_series_service.get_time_series_nodes(request.query_params)
+        Only metadata of time series is returned, unless include_signal_values is set.
+        """
+        params = {key: value for key, value in request.query_params.items() if key != "include_signal_values"}
+        get_response = self.time_series_service.get_time_series_nodes(params, include_signal_values)
 
         # add links from hateoas
         get_response.links = get_links(router)
@@ -130,16 +201,74 @@ class TimeSeriesRouter:
     async def get_time_series(
         self, time_series_id: Union[int, str], depth: int, response: Response,
         signal_min_value: Optional[int] = None,
-        signal_max_value: Optional[int] = None
+        signal_max_value: Optional[int] = None,
+        signal_format: SignalFormat = SignalFormat.rows,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        max_points: Optional[int] = None,
+        method: DownsamplingMethod = DownsamplingMethod.lttb
     ):
         """
         Get time series by id from database with signal values. Depth attribute specifies how many models will be traversed to create the
         response.
 
         Signal values will be filtered using minimum and maximum value if present.
+
+        Signal values will be filtered by (start) timestamp if start_timestamp or end_timestamp is present. Start timestamp is
+        inclusive and end timestamp is exclusive.
+
+        If limit is present, at most limit signal values are returned in ascending order of (start) timestamp. When there are
+        more signal values, response contains next_cursor, which should be passed as cursor to get the next page.
+
+        If max_points is present, signal values are downsampled on server to at most max_points signal values using given method:
+        - min_max - signal values with minimal and maximal value in each of max_points / 2 buckets of equal time width
+        - mean - mean value of signal values in each of max_points buckets of equal time width
+        - lttb - signal values selected with Largest Triangle Three Buckets algorithm
+
+        Downsampling skips signal values with non-numeric values and cannot be combined with limit.
+
+        With signal_format=columns signals are returned in signal_columns as parallel lists of timestamps and values
+        instead of list of signal objects in signal_values.
         """
+        if limit is not None and limit < 1:
+            response.status_code = 422
+            return NotFoundByIdModel(id=time_series_id, errors="Limit must be positive")
+        if max_points is not None and (max_points < 2 or limit is not None):
+            response.status_code = 422
+            return NotFoundByIdModel(id=time_series_id,
+                                     errors="Max points must be at least 2 and cannot be combined with limit")
+        try:
+            if cursor is not None:
+                decode_signal_cursor(cursor)
+        except ValueError as e:
+            response.status_code = 422
+            return NotFoundByIdModel(id=time_series_id, errors=str(e))
+
+        get_response = self.time_series_service.get_time_series(time_series_id, depth, signal_min_value,
+                                                                signal_max_value, signal_format, start_timestamp,
+                                                                end_timestamp, limit, cursor, max_points, method)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
 
-        get_response = self.time_series_service.get_time_series(time_series_id, depth, signal_min_value, signal_max_value)
+    @router.get(
+        "/time_series/{time_series_id}/stats",
+        tags=["time series"],
+        response_model=Union[TimeSeriesStatisticsOut, NotFoundByIdModel],
+    )
+    async def get_time_series_statistics(self, time_series_id: Union[int, str], response: Response):
+        """
+        Get statistics of signal values of time series: count, min, max, mean and standard deviation of values and
+        the first and the last timestamp. Statistics are computed when signal values are stored, so signal values
+        are not read. Value statistics are present only if all values are numeric.
+        """
+        get_response = self.time_series_service.get_time_series_statistics(time_series_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -148,13 +277,49 @@ class TimeSeriesRouter:
 
         return get_response
 
+    @router.post(
+        "/time_series/{time_series_id}/signals",
+        tags=["time series"],
+        response_model=Union[BasicTimeSeriesOut, NotFoundByIdModel],
+    )
+    async def append_signal_values(
+        self,
+        time_series_id: Union[int, str],
+        signals: TimeSeriesSignalsIn,
+        response: Response,
+    ):
+        """
+        Append signal values to existing time series. Signal values are given in signal_values or in
+        signal_columns, with upsert stored signal values with the same (start) timestamp are replaced.
+        Only appended signal values are written, so batches of live recordings can be sent as they arrive.
+        Time series is returned without signal values.
+        """
+        append_response = self.time_series_service.append_signal_values(time_series_id, signals)
+        if type(append_response) is NotFoundByIdModel:
+            response.status_code = 404
+        elif append_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        append_response.links = get_links(router)
+
+        return append_response
+
     @router.get("/time_series/multidimensional/{time_series_ids}", tags=["time series"],
                 response_model=Union[TimeSeriesMultidimensionalOut, NotFoundByIdModel])
-    async def get_time_series_multidimensional(self, time_series_ids: str, response: Response):
+    async def get_time_series_multidimensional(self, time_series_ids: str, response: Response,
+                                               join: JoinType = JoinType.inner, tolerance: Optional[int] = None):
         """
         Get multidimensional time series by ids from database with signal values.
 
         Time series ids is comma separated string.
+
+        Signal values are grouped by timestamps with join:
+        - inner - signal values with equal timestamps in all time series, or the nearest ones within tolerance
+        - asof - signal values of the first time series with the latest earlier signal values of other time series,
+          not earlier than tolerance
+        - outer - all signal values, the ones with equal timestamps (or within tolerance) are grouped and missing
+          signal values are null
         """
         try:
             ids = [int(time_series_id.strip()) for time_series_id in time_series_ids.split(",")]
@@ -162,7 +327,8 @@ class TimeSeriesRouter:
             response.status_code = 422
             return TimeSeriesMultidimensionalOut(errors="Ids must be integers")
 
-        get_response = self.time_series_service.get_time_series_multidimensional(ids)
+        get_response = await run_in_threadpool(self.time_series_service.get_time_series_multidimensional, ids, join,
+                                               tolerance)
         if get_response.errors is not None:
             response.status_code = 404
 
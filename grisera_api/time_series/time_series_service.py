@@ -1,9 +1,9 @@
-from typing import Union, Optional, List
+from typing import Union, Optional, List, AsyncIterator
 
 from starlette.datastructures import QueryParams
 
 from time_series.time_series_model import TimeSeriesPropertyIn, TimeSeriesIn, TimeSeriesRelationIn, \
-    TimeSeriesTransformationIn
+    TimeSeriesTransformationIn, SignalFormat, DownsamplingMethod, TimeSeriesSignalsIn, JoinType
 
 
 class TimeSeriesService:
@@ -24,6 +24,19 @@ class TimeSeriesService:
         """
         raise Exception("save_time_series not implemented yet")
 
+    async def save_time_series_stream(self, time_series_lines: AsyncIterator[str]):
+        """
+        Send request to graph api to create new time series from newline delimited JSON stream
+
+        Args:
+            time_series_lines (AsyncIterator[str]): Lines of the stream. First line contains time series without
+                signal values, each following line contains single signal value
+
+        Returns:
+            Result of request as time series object
+        """
+        raise Exception("save_time_series_stream not implemented yet")
+
     def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn):
         """
         Send request to graph api to create new transformed time series
@@ -36,12 +49,13 @@ class TimeSeriesService:
         """
         raise Exception("transform_time_series not implemented yet")
 
-    def get_time_series_nodes(self, params: QueryParams = None):
+    def get_time_series_nodes(self, params: QueryParams = None, include_signal_values: bool = False):
         """
         Send request to graph api to get time series nodes
 
         Args:
             params (QueryParams): Get parameters
+            include_signal_values (bool): Whether signal values of each time series should be returned
 
         Returns:
             Result of request as list of time series nodes objects
@@ -50,7 +64,14 @@ class TimeSeriesService:
 
     def get_time_series(self, time_series_id: Union[int, str], depth: int = 0,
                         signal_min_value: Optional[int] = None,
-                        signal_max_value: Optional[int] = None):
+                        signal_max_value: Optional[int] = None,
+                        signal_format: SignalFormat = SignalFormat.rows,
+                        start_timestamp: Optional[int] = None,
+                        end_timestamp: Optional[int] = None,
+                        limit: Optional[int] = None,
+                        cursor: Optional[str] = None,
+                        max_points: Optional[int] = None,
+                        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb):
         """
         Send request to graph api to get given time series
 
@@ -59,18 +80,59 @@ class TimeSeriesService:
             depth: (int): specifies how many related entities will be traversed to create the response
             signal_min_value (Optional[int]): Filter signal values by min value
             signal_max_value (Optional[int]): Filter signal values by max value
+            signal_format (SignalFormat): Format of returned signals
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of returned signal values
+            cursor (Optional[str]): Cursor of requested page returned with previous page
+            max_points (Optional[int]): Maximal number of returned signal values, signals are downsampled if needed
+            downsampling_method (DownsamplingMethod): Method used to downsample signal values
 
         Returns:
             Result of request as time series object
         """
         raise Exception("get_time_series not implemented yet")
 
-    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]]):
+    def get_time_series_statistics(self, time_series_id: Union[int, str]):
+        """
+        Send request to database to get statistics of signals of given time series
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Result of request as time series statistics object
+        """
+        raise Exception("get_time_series_statistics not implemented yet")
+
+    def get_time_series_versions(self, time_series_ids: List[Union[int, str]]):
+        """
+        Get versions of content of given time series. Version is stored with statistics of signals and it is
+        incremented with each change of signal values, so it is shared by all processes.
+
+        Args:
+            time_series_ids (List[int | str]): Ids of the time series
+
+        Returns:
+            List of versions of time series, or result of request of the first missing time series
+        """
+        versions = []
+        for time_series_id in time_series_ids:
+            statistics = self.get_time_series_statistics(time_series_id)
+            if statistics.errors is not None:
+                return statistics
+            versions.append(statistics.statistics.version if statistics.statistics is not None else 0)
+        return versions
+
+    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]],
+                                         join: JoinType = JoinType.inner, tolerance: Optional[int] = None):
         """
         Send request to graph api to get given time series
 
         Args:
             time_series_ids (List[int | str]): Ids of the time series
+            join (JoinType): Type of join of signal values of time series
+            tolerance (Optional[int]): Maximal distance between timestamps of joined signal values
 
         Returns:
             Result of request as time series object
@@ -102,6 +164,19 @@ class TimeSeriesService:
         """
         raise Exception("update_time_series not implemented yet")
 
+    def append_signal_values(self, time_series_id: Union[int, str], signals: TimeSeriesSignalsIn):
+        """
+        Send request to database to append signals to given time series
+
+        Args:
+            time_series_id (int | str): identity of time series
+            signals (TimeSeriesSignalsIn): Signals to append
+
+        Returns:
+            Result of request as time series object without signal values
+        """
+        raise Exception("append_signal_values not implemented yet")
+
     def update_time_series_relationships(self, time_series_id: Union[int, str],
                                          time_series: TimeSeriesRelationIn):
         """
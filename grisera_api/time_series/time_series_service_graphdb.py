@@ -5,9 +5,12 @@ from starlette.datastructures import QueryParams
 from graph_api_service import GraphApiService
 from helpers import create_stub_from_response
 from time_series.time_series_model import TimeSeriesPropertyIn, BasicTimeSeriesOut, \
-    TimeSeriesNodesOut, TimeSeriesOut, TimeSeriesIn, TimeSeriesRelationIn
+    TimeSeriesNodesOut, TimeSeriesOut, TimeSeriesIn, TimeSeriesRelationIn, SignalFormat, DownsamplingMethod, \
+    TimeSeriesStatisticsOut
 from models.not_found_model import NotFoundByIdModel
 from time_series.time_series_service import TimeSeriesService
+from time_series.ts_statistics import statistics_from_properties, statistics_to_properties
+from time_series.transformation.TimeSeriesTransformationCache import transformation_cache
 
 
 class TimeSeriesServiceGraphDB(TimeSeriesService):
@@ -59,9 +62,14 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
 
         return self.get_time_series(time_series_id)
 
-    def get_time_series_nodes(self, params: QueryParams = None):
+    def get_time_series_nodes(self, params: QueryParams = None, include_signal_values: bool = False):
         """
-        Send request to graph api to get time series nodes
+        Send request to graph api to get time series nodes. Signal values are not stored in this database,
+        so include_signal_values has no effect.
+
+        Args:
+            params (QueryParams): Get parameters
+            include_signal_values (bool): Whether signal values of each time series should be returned
 
         Returns:
             Result of request as list of time series nodes objects
@@ -77,6 +85,8 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
                     properties[property["key"]] = property["value"]
                 else:
                     properties['additional_properties'].append({'key': property['key'], 'value': property['value']})
+            properties['additional_properties'], properties['statistics'] = \
+                statistics_from_properties(properties['additional_properties'])
             time_series = BasicTimeSeriesOut(**properties)
             time_series_nodes.append(time_series)
 
@@ -84,7 +94,14 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
 
     def get_time_series(self, time_series_id: Union[int, str], depth: int = 0,
                         signal_min_value: Optional[int] = None,
-                        signal_max_value: Optional[int] = None):
+                        signal_max_value: Optional[int] = None,
+                        signal_format: SignalFormat = SignalFormat.rows,
+                        start_timestamp: Optional[int] = None,
+                        end_timestamp: Optional[int] = None,
+                        limit: Optional[int] = None,
+                        cursor: Optional[str] = None,
+                        max_points: Optional[int] = None,
+                        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb):
         """
         Send request to graph api to get given time series
 
@@ -93,6 +110,13 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
             depth: (int): specifies how many related entities will be traversed to create the response
             signal_min_value (Optional[int]): Filter signal values by min value
             signal_max_value (Optional[int]): Filter signal values by max value
+            signal_format (SignalFormat): Format of returned signals
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of returned signal values
+            cursor (Optional[str]): Cursor of requested page returned with previous page
+            max_points (Optional[int]): Maximal number of returned signal values, signals are downsampled if needed
+            downsampling_method (DownsamplingMethod): Method used to downsample signal values
 
         Returns:
             Result of request as time series object
@@ -105,6 +129,8 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
             return NotFoundByIdModel(id=time_series_id, errors="Node not found.")
 
         time_series = create_stub_from_response(get_response, properties=['type', 'source'])
+        time_series['additional_properties'], time_series['statistics'] = \
+            statistics_from_properties(time_series['additional_properties'])
 
         if depth != 0:
             time_series["observable_informations"] = []
@@ -126,6 +152,28 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
         else:
             return BasicTimeSeriesOut(**time_series)
 
+    def get_time_series_statistics(self, time_series_id: Union[int, str]):
+        """
+        Send request to graph api to get statistics of signals of given time series
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Result of request as time series statistics object
+        """
+        get_response = self.graph_api_service.get_node(time_series_id)
+
+        if get_response["errors"] is not None:
+            return NotFoundByIdModel(id=time_series_id, errors=get_response["errors"])
+        if get_response["labels"][0] != "Time Series":
+            return NotFoundByIdModel(id=time_series_id, errors="Node not found.")
+
+        time_series = create_stub_from_response(get_response)
+        _, statistics = statistics_from_properties(time_series['additional_properties'])
+
+        return TimeSeriesStatisticsOut(id=time_series_id, statistics=statistics)
+
     def delete_time_series(self, time_series_id: Union[int, str]):
         """
         Send request to graph api to delete given time series
@@ -141,6 +189,7 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
+        transformation_cache.invalidate(time_series_id)
         self.graph_api_service.delete_node(time_series_id)
         return get_response
 
@@ -160,13 +209,20 @@ class TimeSeriesServiceGraphDB(TimeSeriesService):
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
+        time_series_properties = time_series
+        if get_response.statistics is not None:
+            # statistics are stored as properties of node, so they have to be recreated with other properties
+            time_series_properties = time_series.copy(update={"additional_properties": (
+                (time_series.additional_properties or []) + statistics_to_properties(get_response.statistics))})
+        transformation_cache.invalidate(time_series_id)
         self.graph_api_service.delete_node_properties(time_series_id)
-        self.graph_api_service.create_properties(time_series_id, time_series)
+        self.graph_api_service.create_properties(time_series_id, time_series_properties)
 
         time_series_result = {"id": time_series_id, "type": get_response.type,
                               'signal_values': get_response.signal_values,
                               'source': get_response.source,
-                              'additional_properties': get_response.additional_properties}
+                              'additional_properties': get_response.additional_properties,
+                              'statistics': get_response.statistics}
         time_series_result.update(time_series.dict())
 
         return BasicTimeSeriesOut(**time_series_result)
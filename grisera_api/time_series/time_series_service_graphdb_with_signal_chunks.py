@@ -0,0 +1,290 @@
+import heapq
+from typing import List, Union, Optional
+
+from graph_api_config import graph_api_page_size, graph_api_signal_chunk_size
+from time_series.time_series_model import Type, SignalIn, SignalValueNodesIn
+from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
+from time_series.time_series_service_graphdb_with_signal_values import TimeSeriesServiceGraphDBWithSignalValues
+
+
+class TimeSeriesServiceGraphDBWithSignalChunks(TimeSeriesServiceGraphDBWithSignalValues):
+    """
+    Time series service storing signals in signal chunk nodes instead of signal value nodes. Each chunk keeps
+    arrays of (start) timestamps, end timestamps and values of consecutive signals with their first and last
+    (start) timestamp and min and max value. Chunks of time series are ordered and do not overlap, so ranges
+    of signals are read only from chunks which may contain them. Signal values are returned in the same form
+    as signal value nodes, but without ids, lineage and additional properties.
+    """
+
+    def get_signal_chunks(self, time_series_id: Union[int, str], start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None, signal_min_value: Optional[float] = None,
+                          signal_max_value: Optional[float] = None, descending: bool = False):
+        """
+        Read signal chunks of time series, which may contain signals in given ranges, in pages of constant size.
+        Each following page is requested only when chunks of previous one were consumed.
+        Args:
+            time_series_id (int | str): identity of the time series
+            start_timestamp (Optional[int]): Filter chunks by last (start) timestamp not lower than given one
+            end_timestamp (Optional[int]): Filter chunks by first (start) timestamp lower than given one
+            signal_min_value (Optional[float]): Filter chunks by max value not lower than given one
+            signal_max_value (Optional[float]): Filter chunks by min value not greater than given one
+            descending (bool): Whether chunks are read from the last one
+        Returns:
+            Iterator of signal chunks
+        """
+        page_size = max(1, graph_api_page_size // graph_api_signal_chunk_size)
+        after_sequence = None
+        while True:
+            response = self.graph_api_service.get_signal_chunks(time_series_id, start_timestamp, end_timestamp,
+                                                                signal_min_value, signal_max_value,
+                                                                after_sequence, page_size, descending)
+            signal_chunks = response.get("signal_chunks") or []
+            for signal_chunk in signal_chunks:
+                yield signal_chunk
+            if len(signal_chunks) < page_size:
+                return
+            after_sequence = signal_chunks[-1]["sequence"]
+
+    def save_signal_values(self, signal_values: List[SignalIn], time_series_id: int, experiment_id: int,
+                           timestamp_type: Type, previous_signal_value_node=None, timestamp=None):
+        """
+        Merge signals into signal chunks of time series. Chunks ending after the first of signals are read and
+        written again with signals merged in, signals later than stored ones fill the last chunk and are appended
+        in new chunks. Stored signals come first among signals with the same (start) timestamp. Timestamp nodes
+        of experiment are not created.
+        """
+        if len(signal_values) == 0:
+            return None
+        timestamp_label = "timestamp" if timestamp_type == Type.timestamp else "start_timestamp"
+        signal_values = sorted(signal_values, key=lambda signal: getattr(signal, timestamp_label))
+        stored_chunks = list(self.get_signal_chunks(time_series_id,
+                                                    start_timestamp=getattr(signal_values[0], timestamp_label)))
+        if len(stored_chunks) == 0:
+            # the last chunk is filled up, when it is not full
+            last_chunk = next(self.get_signal_chunks(time_series_id, descending=True), None)
+            if last_chunk is not None and len(last_chunk["timestamps"]) < graph_api_signal_chunk_size:
+                stored_chunks = [last_chunk]
+
+        stored_samples = [sample for signal_chunk in stored_chunks for sample in chunk_samples(signal_chunk)]
+        new_samples = [(getattr(signal_value, timestamp_label), signal_value.end_timestamp,
+                        chunk_value(signal_value.signal_value.value)) for signal_value in signal_values]
+        samples = list(heapq.merge(stored_samples, new_samples, key=lambda sample: sample[0]))
+
+        signal_chunks = []
+        for index, chunk_start in enumerate(range(0, len(samples), graph_api_signal_chunk_size)):
+            signal_chunk = samples_chunk(samples[chunk_start:chunk_start + graph_api_signal_chunk_size],
+                                         timestamp_type)
+            if index < len(stored_chunks):
+                signal_chunk["id"] = stored_chunks[index]["id"]
+            signal_chunks.append(signal_chunk)
+        deleted_signal_chunk_ids = [signal_chunk["id"] for signal_chunk in stored_chunks[len(signal_chunks):]]
+        return self.graph_api_service.save_signal_chunks(time_series_id, signal_chunks,
+                                                         deleted_signal_chunk_ids)["errors"]
+
+    def replace_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
+                              signal_values: List[SignalIn]):
+        """
+        Replace values of stored signals with the same (start) timestamp as given ordered signals. Chunks
+        containing replaced signals are written again in a single request.
+        Args:
+            time_series_id (int | str): identity of the time series
+            time_series_type (str): type of the time series
+            signal_values (List[SignalIn]): Signals ordered by (start) timestamp
+        Returns:
+            Tuple of lists of signals without stored counterpart, of replaced signals and of replaced signals
+            with their previous values
+        """
+        timestamp_label = "timestamp" if time_series_type == Type.timestamp.value else "start_timestamp"
+        given_signal_values = {getattr(signal_value, timestamp_label): signal_value for signal_value in signal_values}
+        stored_timestamps = set()
+        replaced_chunks = []
+        replaced_signal_values = []
+        previous_signal_values = []
+        for signal_chunk in self.get_signal_chunks(time_series_id,
+                                                   start_timestamp=getattr(signal_values[0], timestamp_label),
+                                                   end_timestamp=getattr(signal_values[-1], timestamp_label) + 1):
+            replaced_count = len(replaced_signal_values)
+            values = []
+            for timestamp, value in zip(signal_chunk["timestamps"], signal_chunk["values"]):
+                signal_value = given_signal_values.get(timestamp)
+                if signal_value is None:
+                    values.append(value)
+                    continue
+                values.append(chunk_value(signal_value.signal_value.value))
+                stored_timestamps.add(timestamp)
+                replaced_signal_values.append(signal_value)
+                previous_signal_values.append(signal_value.copy(update={
+                    "signal_value": SignalValueNodesIn(value=value)}))
+            if len(replaced_signal_values) > replaced_count:
+                replaced_chunks.append({"id": signal_chunk["id"], "timestamps": signal_chunk["timestamps"],
+                                        "end_timestamps": signal_chunk.get("end_timestamps"), "values": values})
+        if len(replaced_chunks) > 0:
+            self.graph_api_service.save_signal_chunks(time_series_id, replaced_chunks)
+        new_signal_values = [signal_value for signal_value in signal_values
+                             if getattr(signal_value, timestamp_label) not in stored_timestamps]
+        return new_signal_values, replaced_signal_values, previous_signal_values
+
+    def get_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
+                          signal_min_value: Optional[int] = None,
+                          signal_max_value: Optional[int] = None,
+                          start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None,
+                          limit: Optional[int] = None,
+                          descending: bool = False):
+        """
+        Send requests to graph api to get signal values ordered by (start) timestamp. Only signal chunks which
+        may contain signals in given ranges are read, and no more of them than needed for limit.
+        Args:
+            time_series_id (int | str): identity of the time series
+            time_series_type (str): type of the time series
+            signal_min_value (Optional[int]): Filter signal values by min value
+            signal_max_value (Optional[int]): Filter signal values by max value
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of signal values, the first ones in order of (start) timestamp
+            descending (bool): Whether limit selects the last signal values instead of the first ones
+        Returns:
+            Array of signal value objects
+        """
+        signal_values = []
+        if limit == 0:
+            return signal_values
+        for signal_chunk in self.get_signal_chunks(time_series_id, start_timestamp, end_timestamp,
+                                                   signal_min_value, signal_max_value, descending):
+            samples = chunk_samples(signal_chunk)
+            for timestamp, end_timestamp_value, value in (reversed(samples) if descending else samples):
+                if start_timestamp is not None and timestamp < start_timestamp or \
+                        end_timestamp is not None and timestamp >= end_timestamp:
+                    continue
+                if (signal_min_value is not None or signal_max_value is not None) and \
+                        not isinstance(value, (int, float)) or \
+                        signal_min_value is not None and value < signal_min_value or \
+                        signal_max_value is not None and value > signal_max_value:
+                    continue
+                signal_value = {'signal_value': {'id': None, 'labels': ['Signal Value'],
+                                                 'properties': [{'key': 'value', 'value': value}]}}
+                if time_series_type == Type.timestamp:
+                    signal_value['timestamp'] = timestamp_node(timestamp)
+                else:
+                    signal_value['start_timestamp'] = timestamp_node(timestamp)
+                    signal_value['end_timestamp'] = timestamp_node(end_timestamp_value)
+                signal_values.append(signal_value)
+                if len(signal_values) == limit:
+                    return signal_values
+        return signal_values
+
+    def get_source_time_series(self, time_series_id: Union[int, str]):
+        """
+        Get time series with all its signal values taken directly from signal chunks
+        Args:
+            time_series_id (int | str): identity of the time series
+        Returns:
+            Result of request as time series object
+        """
+        time_series = TimeSeriesServiceGraphDB.get_time_series(self, time_series_id)
+        if time_series.errors is None:
+            time_series.signal_values = self.get_source_signal_values(time_series_id, time_series.type)
+        return time_series
+
+    def get_source_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
+                                 start_timestamp: Optional[int] = None):
+        """
+        Get signal values of time series to be transformed as timestamps and values taken directly from
+        signal chunks
+        Args:
+            time_series_id (int | str): identity of the time series
+            time_series_type (str): type of the time series
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+        Returns:
+            Array of signal value objects
+        """
+        signal_values = []
+        for signal_chunk in self.get_signal_chunks(time_series_id, start_timestamp):
+            for timestamp, end_timestamp, value in chunk_samples(signal_chunk):
+                if start_timestamp is not None and timestamp < start_timestamp:
+                    continue
+                if time_series_type == Type.timestamp:
+                    signal_values.append({'timestamp': timestamp, 'signal_value': {'id': None, 'value': value}})
+                else:
+                    signal_values.append({'start_timestamp': timestamp, 'end_timestamp': end_timestamp,
+                                          'signal_value': {'id': None, 'value': value}})
+        return signal_values
+
+    def create_lineage_relationships(self, new_signal_values: list, new_signal_values_id_mapping):
+        """
+        Signals stored in chunks have no nodes to link with basedOn relationships, so lineage is not stored
+        """
+        return None
+
+    def delete_signal_values(self, time_series_id: Union[int, str], start_timestamp: Optional[int] = None):
+        """
+        Send requests to graph api to delete signals of time series. Chunk containing signals both earlier
+        and not earlier than start timestamp is trimmed, then chunks starting from it are deleted.
+        Args:
+            time_series_id (int | str): identity of time series
+            start_timestamp (Optional[int]): Only signals with (start) timestamp not earlier are deleted
+        Returns:
+            Errors of request, None if signals were deleted
+        """
+        if start_timestamp is not None:
+            trimmed_chunks = []
+            for signal_chunk in self.get_signal_chunks(time_series_id, start_timestamp, start_timestamp + 1):
+                if signal_chunk["first_timestamp"] >= start_timestamp:
+                    continue
+                trimmed_chunk = samples_chunk([sample for sample in chunk_samples(signal_chunk)
+                                               if sample[0] < start_timestamp],
+                                              Type.timestamp if signal_chunk.get("end_timestamps") is None
+                                              else Type.epoch)
+                trimmed_chunk["id"] = signal_chunk["id"]
+                trimmed_chunks.append(trimmed_chunk)
+            if len(trimmed_chunks) > 0:
+                response = self.graph_api_service.save_signal_chunks(time_series_id, trimmed_chunks)
+                if response["errors"] is not None:
+                    return response["errors"]
+        response = self.graph_api_service.delete_signal_chunks(time_series_id, start_timestamp)
+        return response["errors"]
+
+
+def chunk_value(value: Union[str, float]):
+    """
+    Get value of signal to store in chunk. Values of requests are turned into strings by signal model, so strings
+    which are exactly the text of integer or float are stored as numbers and any other strings are kept as given.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        if str(int(value)) == value:
+            return int(value)
+    except ValueError:
+        pass
+    try:
+        if repr(float(value)) == value:
+            return float(value)
+    except ValueError:
+        pass
+    return value
+
+
+def chunk_samples(signal_chunk: dict):
+    """
+    Get list of signals of chunk as tuples of (start) timestamp, end timestamp and value
+    """
+    end_timestamps = signal_chunk.get("end_timestamps") or [None] * len(signal_chunk["timestamps"])
+    return list(zip(signal_chunk["timestamps"], end_timestamps, signal_chunk["values"]))
+
+
+def samples_chunk(samples: list, timestamp_type: Type):
+    """
+    Create signal chunk from ordered signals given as tuples of (start) timestamp, end timestamp and value
+    """
+    signal_chunk = {"timestamps": [sample[0] for sample in samples], "values": [sample[2] for sample in samples]}
+    if timestamp_type != Type.timestamp:
+        signal_chunk["end_timestamps"] = [sample[1] for sample in samples]
+    return signal_chunk
+
+
+def timestamp_node(timestamp: int):
+    """
+    Create timestamp node without id holding given timestamp
+    """
+    return {'id': None, 'labels': ['Timestamp'], 'properties': [{'key': 'timestamp', 'value': timestamp}]}
@@ -1,14 +1,28 @@
+import json
 from typing import List, Union, Optional
 
 from starlette.datastructures import QueryParams
 
+from graph_api_config import graph_api_bulk_chunk_size, graph_api_page_size
+
 from models.not_found_model import NotFoundByIdModel
-from time_series.ts_helpers import get_node_property
+from time_series.ts_alignment import signal_value_values
+from time_series.ts_helpers import get_node_property, signal_columns_to_signal_values, \
+    signal_values_to_signal_columns, get_page_start, get_next_page_cursor, time_series_in_to_out, \
+    get_relationship_property
 from time_series.time_series_model import Type, TimeSeriesIn, TimeSeriesOut, SignalIn, SignalValueNodesIn, \
     TimestampNodesIn, TimeSeriesNodesOut, BasicTimeSeriesOut, TimeSeriesTransformationIn, \
-    TimeSeriesTransformationRelationshipIn, TimeSeriesMultidimensionalOut
+    TimeSeriesTransformationRelationshipIn, TimeSeriesMultidimensionalOut, SignalFormat, DownsamplingMethod, \
+    TimeSeriesSignalsIn, TimeSeriesPropertyIn, JoinType, TimeSeriesTransformationStepIn
 from time_series.time_series_service_graphdb import TimeSeriesServiceGraphDB
-from time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+from time_series.ts_downsampling import downsample
+from time_series.ts_lineage import SignalValuesLineage
+from time_series.ts_statistics import signal_values_statistics, statistics_to_properties, \
+    statistics_from_properties, merge_statistics, signal_columns_statistics, subtract_statistics, \
+    next_statistics_version
+from time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+from time_series.transformation.TimeSeriesTransformationCache import transformation_cache, normalize_steps
+from time_series.transformation.TimeSeriesTransformationPool import transformation_pool
 from time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import \
     TimeSeriesTransformationMultidimensional
 
@@ -23,6 +37,11 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
         Returns:
             Result of request as time series object
         """
+        if time_series.signal_columns is not None:
+            time_series.signal_values += signal_columns_to_signal_values(time_series.signal_columns)
+            time_series.signal_columns = None
+        statistics_properties = statistics_to_properties(signal_values_statistics(time_series.signal_values))
+        time_series.additional_properties = (time_series.additional_properties or []) + statistics_properties
         result = super().save_time_series(time_series)
         if result.errors is not None:
             return result
@@ -38,6 +57,125 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
 
         return result
 
+    def append_signal_values(self, time_series_id: Union[int, str], signals: TimeSeriesSignalsIn):
+        """
+        Send requests to graph api to append signals to given time series. Signal values are linked after
+        the last signal value of time series and timestamp nodes are searched from its timestamp, so
+        signals later than stored ones are appended without reading the whole time series. With upsert,
+        properties of stored signal values with the same (start) timestamp are replaced.
+        Args:
+            time_series_id (int | str): identity of time series
+            signals (TimeSeriesSignalsIn): Signals to append
+        Returns:
+            Result of request as time series object without signal values
+        """
+        time_series = super().get_time_series(time_series_id)
+        if time_series.errors is not None:
+            return time_series
+
+        signal_values = signals.signal_values
+        if signals.signal_columns is not None:
+            signal_values = signal_values + signal_columns_to_signal_values(signals.signal_columns)
+        timestamp_label = "timestamp" if time_series.type == Type.timestamp.value else "start_timestamp"
+        signal_values = sorted(signal_values, key=lambda signal: getattr(signal, timestamp_label))
+        if len(signal_values) == 0:
+            return time_series
+        return self.add_signal_values(time_series_id, time_series, signal_values, signals.upsert)
+
+    def add_signal_values(self, time_series_id: Union[int, str], time_series: BasicTimeSeriesOut,
+                          signal_values: List[SignalIn], upsert: bool = False):
+        """
+        Send requests to graph api to add ordered signals to given time series, then extend time series
+        transformed from it over the changed tail.
+        Args:
+            time_series_id (int | str): identity of time series
+            time_series (BasicTimeSeriesOut): Time series without signal values
+            signal_values (List[SignalIn]): Signals ordered by (start) timestamp
+            upsert (bool): Whether properties of stored signal values with the same (start) timestamp are replaced
+        Returns:
+            Result of request as time series object without signal values
+        """
+        transformation_cache.invalidate(time_series_id)
+        timestamp_label = "timestamp" if time_series.type == Type.timestamp.value else "start_timestamp"
+        changed_timestamp = getattr(signal_values[0], timestamp_label)
+
+        replaced_signal_values, previous_signal_values = [], []
+        if upsert:
+            signal_values, replaced_signal_values, previous_signal_values = self.replace_signal_values(
+                time_series_id, time_series.type, signal_values)
+
+        if len(signal_values) > 0:
+            last_signal_values = self.get_signal_values(time_series_id, time_series.type, limit=1, descending=True)
+            last_signal_value_node, timestamp = (last_signal_values[0]["signal_value"],
+                                                 last_signal_values[0][timestamp_label]) \
+                if len(last_signal_values) > 0 else (None, None)
+            if timestamp is not None and \
+                    int(get_node_property(timestamp, "timestamp")) > getattr(signal_values[0], timestamp_label):
+                # signals earlier than the last one are placed in timestamp list searched from its beginning
+                timestamp = None
+            errors = self.save_signal_values(signal_values, time_series_id, self.get_experiment_id(time_series_id),
+                                             time_series.type, last_signal_value_node, timestamp)
+            if errors is not None:
+                time_series.errors = errors
+                return time_series
+
+        statistics = None
+        if time_series.statistics is not None and previous_signal_values is not None:
+            # previous values of replaced signals are removed from statistics, unless they reach min or max
+            statistics = subtract_statistics(time_series.statistics,
+                                             signal_values_statistics(previous_signal_values))
+        if statistics is not None:
+            statistics = merge_statistics(statistics,
+                                          signal_values_statistics(replaced_signal_values + signal_values))
+        else:
+            statistics = signal_columns_statistics(signal_values_to_signal_columns(
+                self.get_signal_values(time_series_id, time_series.type)))
+        statistics.version = next_statistics_version(time_series.statistics)
+        self.graph_api_service.create_properties(time_series_id, TimeSeriesPropertyIn(
+            type=time_series.type, additional_properties=statistics_to_properties(statistics)))
+        time_series.statistics = statistics
+        time_series.errors = self.update_derived_time_series(time_series_id, changed_timestamp)
+        return time_series
+
+    def replace_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
+                              signal_values: List[SignalIn]):
+        """
+        Replace properties of stored signal values with the same (start) timestamp as given ordered signals
+        in a single request, which keeps their index properties
+        Args:
+            time_series_id (int | str): identity of the time series
+            time_series_type (str): type of the time series
+            signal_values (List[SignalIn]): Signals ordered by (start) timestamp
+        Returns:
+            Tuple of lists of signals without stored counterpart, of replaced signals and of replaced signals
+            with their previous values, None if they are not known
+        """
+        timestamp_label = "timestamp" if time_series_type == Type.timestamp.value else "start_timestamp"
+        stored_signal_values = self.get_signal_values(time_series_id, time_series_type,
+                                                      start_timestamp=getattr(signal_values[0], timestamp_label),
+                                                      end_timestamp=getattr(signal_values[-1], timestamp_label) + 1)
+        stored_nodes = {int(get_node_property(signal_value[timestamp_label], "timestamp")):
+                        signal_value["signal_value"] for signal_value in stored_signal_values}
+        new_signal_values = []
+        replaced_signal_values = {}
+        for signal_value in signal_values:
+            stored_node = stored_nodes.get(getattr(signal_value, timestamp_label))
+            if stored_node is None:
+                new_signal_values.append(signal_value)
+            else:
+                replaced_signal_values[stored_node["id"]] = signal_value
+        if len(replaced_signal_values) == 0:
+            return new_signal_values, [], []
+
+        response = self.graph_api_service.replace_signal_value_properties(
+            time_series_id, [(signal_value_id, signal_value.signal_value)
+                             for signal_value_id, signal_value in replaced_signal_values.items()])
+        previous_signal_values = None if response["errors"] is not None else [
+            replaced_signal_values[node["id"]].copy(update={
+                "signal_value": SignalValueNodesIn(value=get_node_property(node, "value"))})
+            for node in response["signal_values"]]
+        return new_signal_values, list(replaced_signal_values.values()), previous_signal_values
+
     def transform_time_series(self, time_series_transformation: TimeSeriesTransformationIn):
         """
         Send request to graph api to create new transformed time series
@@ -48,42 +186,224 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
         Returns:
             Result of request as time series object
         """
+        steps = time_series_transformation.get_steps()
+        try:
+            TimeSeriesTransformationPipeline().validate(steps)
+        except Exception as e:
+            return TimeSeriesNodesOut(errors=str(e))
+        cache_key = None
+        if time_series_transformation.dry_run:
+            versions = self.get_time_series_versions(time_series_transformation.source_time_series_ids)
+            if not isinstance(versions, list):
+                return versions
+            cache_key = transformation_cache.key("pipeline", normalize_steps(steps),
+                                                 time_series_transformation.source_time_series_ids, versions)
+            new_time_series = transformation_cache.get(cache_key)
+            if new_time_series is not None:
+                new_time_series.measure_id = time_series_transformation.destination_measure_id
+                new_time_series.observable_information_id = \
+                    time_series_transformation.destination_observable_information_id
+                return time_series_in_to_out(new_time_series)
         source_time_series = []
         for time_series_id in time_series_transformation.source_time_series_ids:
-            time_series = self.get_time_series(time_series_id)
+            time_series = self.get_source_time_series(time_series_id)
             if time_series.errors is not None:
                 return time_series
             source_time_series.append(time_series)
         try:
-            new_time_series, new_signal_values_id_mapping = TimeSeriesTransformationFactory().get_transformation(
-                time_series_transformation.name) \
-                .transform(source_time_series, time_series_transformation.additional_properties)
+            new_time_series, new_signal_values_id_mapping = transformation_pool.transform(
+                source_time_series, steps)
         except Exception as e:
             return TimeSeriesNodesOut(errors=str(e))
+        if cache_key is not None:
+            transformation_cache.put(cache_key, new_time_series, len(new_time_series.signal_values))
         new_time_series.measure_id = time_series_transformation.destination_measure_id
         new_time_series.observable_information_id = time_series_transformation.destination_observable_information_id
+        if time_series_transformation.dry_run:
+            return time_series_in_to_out(new_time_series)
 
         result = self.save_time_series(new_time_series)
 
+        # steps are stored with sources, so derived time series can be extended when sources change
+        transformation = json.dumps([step.dict() for step in steps])
         for index, time_series_id in enumerate(time_series_transformation.source_time_series_ids):
             relationship = self.graph_api_service.create_relationships(result.id, time_series_id, "transformedFrom")
             self.graph_api_service.create_relationship_properties(relationship["id"],
                                                                   TimeSeriesTransformationRelationshipIn(
                                                                       additional_properties=[
-                                                                          {'key': 'order', 'value': index + 1}]))
-        assert len(new_signal_values_id_mapping) == len(
-            result.signal_values), "transformation signal values mapping does not have correct length"
-        for signal_value_ids, new_signal_value in zip(new_signal_values_id_mapping, result.signal_values):
-            new_signal_value_id = new_signal_value["signal_value"]["id"]
-            for index, old_signal_value_id in enumerate(signal_value_ids):
-                relationship = self.graph_api_service.create_relationships(new_signal_value_id, old_signal_value_id,
-                                                                           "basedOn")
-                self.graph_api_service.create_relationship_properties(relationship["id"],
-                                                                      TimeSeriesTransformationRelationshipIn(
-                                                                          additional_properties=[
-                                                                              {'key': 'order', 'value': index + 1}]))
+                                                                          {'key': 'order', 'value': index + 1},
+                                                                          {'key': 'transformation',
+                                                                           'value': transformation}]))
+        self.create_lineage_relationships(result.signal_values, new_signal_values_id_mapping)
         return result
 
+    def create_lineage_relationships(self, new_signal_values: list, new_signal_values_id_mapping):
+        """
+        Link saved transformed signal values with signal values they are based on
+
+        Args:
+            new_signal_values (list): Saved transformed signal values
+            new_signal_values_id_mapping (SignalValuesLineage | list): Lineage of transformed signal values
+        """
+        assert len(new_signal_values_id_mapping) == len(
+            new_signal_values), "transformation signal values mapping does not have correct length"
+        if isinstance(new_signal_values_id_mapping, SignalValuesLineage):
+            # windows of consecutive signal values are linked only with their first and last signal value
+            for (first_id, last_id, size), new_signal_value in zip(new_signal_values_id_mapping.bounds(),
+                                                                   new_signal_values):
+                signal_value_orders = [(first_id, 1), (last_id, size)] if size > 1 else [(first_id, 1)]
+                self.create_based_on_relationships(new_signal_value["signal_value"]["id"], signal_value_orders)
+            return
+        for signal_value_ids, new_signal_value in zip(new_signal_values_id_mapping, new_signal_values):
+            self.create_based_on_relationships(new_signal_value["signal_value"]["id"],
+                                               [(old_signal_value_id, index + 1)
+                                                for index, old_signal_value_id in enumerate(signal_value_ids)])
+
+    def create_based_on_relationships(self, new_signal_value_id: int, signal_value_orders: list):
+        """
+        Link new signal value with signal values it is based on
+
+        Args:
+            new_signal_value_id (int): Id of new signal value
+            signal_value_orders (list): Pairs of id of source signal value and its order
+        """
+        for old_signal_value_id, order in signal_value_orders:
+            relationship = self.graph_api_service.create_relationships(new_signal_value_id, old_signal_value_id,
+                                                                       "basedOn")
+            self.graph_api_service.create_relationship_properties(relationship["id"],
+                                                                  TimeSeriesTransformationRelationshipIn(
+                                                                      additional_properties=[
+                                                                          {'key': 'order', 'value': order}]))
+
+    def update_derived_time_series(self, time_series_id: Union[int, str], changed_timestamp: int):
+        """
+        Extend time series transformed from given time series, which transformation is stored with their
+        transformedFrom relationships, over signals affected by its signals changed from given timestamp
+        Args:
+            time_series_id (int | str): identity of changed time series
+            changed_timestamp (int): The lowest (start) timestamp of changed signals
+        Returns:
+            Errors of update of derived time series, None if all of them were updated
+        """
+        relationships = self.graph_api_service.get_node_relationships(time_series_id)["relationships"]
+        errors = []
+        for relationship in relationships:
+            if relationship["name"] != "transformedFrom" or str(relationship["end_node"]) != str(time_series_id):
+                continue
+            result = self.update_derived_time_series_tail(relationship["start_node"], changed_timestamp)
+            if result.errors is not None:
+                errors.append({"time_series_id": relationship["start_node"], "errors": result.errors})
+        return errors or None
+
+    def update_derived_time_series_tail(self, time_series_id: Union[int, str], changed_timestamp: int):
+        """
+        Transform again the tail of derived time series affected by signals of its sources changed from given
+        timestamp. If transformation declares tail window, only the tail of sources is read, otherwise whole
+        sources are transformed and the tail starts with the first transformed signal different from the stored
+        one. Stored signal values of the tail are replaced together with their lineage and statistics are updated
+        from the deleted and the new tail.
+        Args:
+            time_series_id (int | str): identity of derived time series
+            changed_timestamp (int): The lowest (start) timestamp of changed source signals
+        Returns:
+            Result of request as time series object without signal values
+        """
+        time_series = super().get_time_series(time_series_id)
+        if time_series.errors is not None:
+            return time_series
+        sources = sorted(
+            (int(get_relationship_property(relationship, "order")), relationship["end_node"],
+             get_relationship_property(relationship, "transformation"))
+            for relationship in self.graph_api_service.get_node_relationships(time_series_id)["relationships"]
+            if relationship["name"] == "transformedFrom" and str(relationship["start_node"]) == str(time_series_id))
+        if len(sources) == 0 or sources[0][2] is None:
+            # time series transformed before transformations were stored are not updated
+            return time_series
+        steps = [TimeSeriesTransformationStepIn(**step) for step in json.loads(sources[0][2])]
+
+        window = TimeSeriesTransformationPipeline().tail_window(steps)
+        source_start_timestamp = changed_timestamp - window[0] - window[1] if window is not None else None
+        source_time_series = []
+        for _, source_id, _ in sources:
+            source = super().get_time_series(source_id)
+            if source.errors is not None:
+                return source
+            source_time_series.append(TimeSeriesOut(id=source_id, type=source.type,
+                                                    signal_values=self.get_source_signal_values(
+                                                        source_id, source.type, source_start_timestamp)))
+        try:
+            new_time_series, new_signal_values_id_mapping = transformation_pool.transform(source_time_series, steps)
+        except Exception as e:
+            time_series.errors = str(e)
+            return time_series
+
+        timestamp_label = "timestamp" if time_series.type == Type.timestamp.value else "start_timestamp"
+        new_timestamps = [getattr(signal_value, timestamp_label) for signal_value in new_time_series.signal_values]
+        if window is not None:
+            tail_timestamp = changed_timestamp - window[0]
+            stored_tail = self.get_signal_values(time_series_id, time_series.type, start_timestamp=tail_timestamp)
+        else:
+            stored_signal_values = self.get_signal_values(time_series_id, time_series.type)
+            tail_timestamp = first_changed_timestamp(stored_signal_values, timestamp_label,
+                                                     new_time_series.signal_values)
+            if tail_timestamp is None:
+                return time_series
+            stored_tail = [signal_value for signal_value in stored_signal_values
+                           if int(get_node_property(signal_value[timestamp_label], "timestamp")) >= tail_timestamp]
+        tail_positions = [position for position, timestamp in enumerate(new_timestamps) if timestamp >= tail_timestamp]
+
+        errors = self.delete_signal_values(time_series_id, tail_timestamp)
+        if errors is not None:
+            time_series.errors = errors
+            return time_series
+        if len(stored_tail) > 0:
+            transformation_cache.invalidate(time_series_id)
+            time_series.statistics = self.statistics_without_tail(time_series_id, time_series, stored_tail)
+        if len(tail_positions) == 0:
+            if len(stored_tail) > 0:
+                self.graph_api_service.create_properties(time_series_id, TimeSeriesPropertyIn(
+                    type=time_series.type, additional_properties=statistics_to_properties(time_series.statistics)))
+            return time_series
+        time_series = self.add_signal_values(time_series_id, time_series, [
+            new_time_series.signal_values[position] for position in tail_positions])
+        if time_series.errors is not None:
+            return time_series
+        if isinstance(new_signal_values_id_mapping, SignalValuesLineage):
+            tail_mapping = SignalValuesLineage(new_signal_values_id_mapping.source_ids,
+                                               new_signal_values_id_mapping.starts[tail_positions],
+                                               new_signal_values_id_mapping.ends[tail_positions])
+        else:
+            tail_mapping = [new_signal_values_id_mapping[position] for position in tail_positions]
+        self.create_lineage_relationships(self.get_signal_values(time_series_id, time_series.type,
+                                                                 start_timestamp=tail_timestamp), tail_mapping)
+        return time_series
+
+    def statistics_without_tail(self, time_series_id: Union[int, str], time_series: BasicTimeSeriesOut,
+                                tail_signal_values: list):
+        """
+        Compute statistics of time series after its tail of given signal values was deleted. Statistics of the
+        tail are removed from stored ones and only the last remaining signal is read, whole time series is read
+        when the tail reaches its min or max value.
+        Args:
+            time_series_id (int | str): identity of time series
+            time_series (BasicTimeSeriesOut): Time series with statistics from before the tail was deleted
+            tail_signal_values (list): Deleted signal values read from graph
+        Returns:
+            Statistics of remaining signals
+        """
+        statistics = None
+        if time_series.statistics is not None:
+            statistics = subtract_statistics(time_series.statistics, signal_columns_statistics(
+                signal_values_to_signal_columns(tail_signal_values)))
+        if statistics is None:
+            statistics = signal_columns_statistics(signal_values_to_signal_columns(
+                self.get_signal_values(time_series_id, time_series.type)))
+        else:
+            statistics.last_timestamp = signal_columns_statistics(signal_values_to_signal_columns(
+                self.get_signal_values(time_series_id, time_series.type, limit=1, descending=True))).last_timestamp
+        statistics.version = next_statistics_version(time_series.statistics)
+        return statistics
+
     def get_experiment_id(self, time_series_id: int):
         query = {
             "nodes": [
@@ -166,9 +486,16 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
                 return get_response, relation_id
         return None, None
 
-    def get_or_create_timestamp_node(self, timestamp_value: int, timestamp):
+    def get_or_create_timestamp_node(self, timestamp_value: int, timestamp, experiment_id: Optional[int] = None):
+        """
+        Get timestamp node with given value or create it in its place in timestamp list. Timestamps of experiment
+        are found by index of graph database, timestamps without experiment are searched along the list from
+        given timestamp node.
+        """
         if timestamp_value is None:
             return {"errors": "Timestamp value is None. Please check time series type."}
+        if experiment_id is not None:
+            return self.graph_api_service.get_or_create_timestamp(experiment_id, timestamp_value)
         previous_timestamp_id = None
         previous_timestamp_timestamp_relation_id = None
         while timestamp is not None and int(get_node_property(timestamp, "timestamp")) < timestamp_value:
@@ -226,11 +553,17 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
         return signal_value_node_response
 
     def save_signal_values(self, signal_values: List[SignalIn], time_series_id: int, experiment_id: int,
-                           timestamp_type: Type):
-
-        timestamp, experiment_timestamp_relation_id = self.get_neighbour_node(experiment_id, "takes") \
-            if experiment_id is not None else (None, None)
-        signal_value_node = None
+                           timestamp_type: Type, previous_signal_value_node=None, timestamp=None):
+        """
+        Create signal value nodes linked after previous_signal_value_node (or to time series, if not given)
+        and place them in timestamp list of experiment. Timestamp nodes of experiment are found by index,
+        without experiment they are searched from given timestamp node, which must not be later than any
+        of signals.
+        """
+        if graph_api_bulk_chunk_size > 0:
+            return self.save_signal_values_in_chunks(signal_values, time_series_id, experiment_id,
+                                                     previous_signal_value_node, timestamp)
+        signal_value_node = previous_signal_value_node
 
         for signal_value in signal_values:
             current_signal_value_node = self.create_signal_value(signal_value.signal_value, signal_value_node,
@@ -240,21 +573,12 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
                 return current_signal_value_node
 
             current_timestamp = self.get_or_create_timestamp_node(
-                signal_value.timestamp if timestamp_type == Type.timestamp else signal_value.start_timestamp, timestamp)
+                signal_value.timestamp if timestamp_type == Type.timestamp else signal_value.start_timestamp, timestamp,
+                experiment_id)
 
             if current_timestamp["errors"] is not None:
                 return current_timestamp["errors"]
 
-            if signal_value_node is None and (
-                    timestamp is None or int(get_node_property(current_timestamp, "timestamp")) < int(
-                    get_node_property(timestamp, "timestamp"))):
-                if experiment_timestamp_relation_id is not None:
-                    self.graph_api_service.delete_relationship(experiment_timestamp_relation_id)
-                if experiment_id is not None:
-                    self.graph_api_service.create_relationships(start_node=experiment_id,
-                                                                end_node=current_timestamp["id"],
-                                                                name="takes")
-
             if timestamp_type == Type.timestamp:
                 self.graph_api_service.create_relationships(start_node=current_timestamp["id"],
                                                             end_node=current_signal_value_node["id"],
@@ -263,7 +587,8 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
                 self.graph_api_service.create_relationships(start_node=current_timestamp["id"],
                                                             end_node=current_signal_value_node["id"],
                                                             name="startInSec")
-                current_timestamp = self.get_or_create_timestamp_node(signal_value.end_timestamp, current_timestamp)
+                current_timestamp = self.get_or_create_timestamp_node(signal_value.end_timestamp, current_timestamp,
+                                                                      experiment_id)
 
                 if current_timestamp["errors"] is not None:
                     return current_timestamp["errors"]
@@ -274,11 +599,39 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
 
             timestamp = current_timestamp
             signal_value_node = current_signal_value_node
+        return self.graph_api_service.index_signal_values(time_series_id)["errors"]
+
+    def save_signal_values_in_chunks(self, signal_values: List[SignalIn], time_series_id: int, experiment_id: int,
+                                     previous_signal_value_node=None, timestamp=None):
+        """
+        Create signal values with requests to graph api for chunks of signals. Each chunk is created with its
+        timestamps in a single transaction, linked after the last signal value of previous chunk. Timestamps
+        without experiment are searched from the (start) timestamp of previous chunk's last signal.
+        """
+        previous_signal_value_id = previous_signal_value_node["id"] if previous_signal_value_node is not None \
+            else None
+        timestamp_id = timestamp["id"] if timestamp is not None else None
+        for chunk_start in range(0, len(signal_values), graph_api_bulk_chunk_size):
+            response = self.graph_api_service.create_signal_values(
+                time_series_id, experiment_id,
+                signal_values[chunk_start:chunk_start + graph_api_bulk_chunk_size],
+                previous_signal_value_id, timestamp_id)
+            if response["errors"] is not None:
+                return response["errors"]
+            previous_signal_value_id = response["signal_value_ids"][-1]
+            timestamp_id = response["timestamp_ids"][-1]
         return None
 
     def get_time_series(self, time_series_id: Union[int, str], depth: int = 0,
                         signal_min_value: Optional[int] = None,
-                        signal_max_value: Optional[int] = None):
+                        signal_max_value: Optional[int] = None,
+                        signal_format: SignalFormat = SignalFormat.rows,
+                        start_timestamp: Optional[int] = None,
+                        end_timestamp: Optional[int] = None,
+                        limit: Optional[int] = None,
+                        cursor: Optional[str] = None,
+                        max_points: Optional[int] = None,
+                        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb):
         """
         Send request to graph api to get given time series
         Args:
@@ -286,164 +639,190 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
             depth: (int): specifies how many related entities will be traversed to create the response
             signal_min_value (Optional[int]): Filter signal values by min value
             signal_max_value (Optional[int]): Filter signal values by max value
+            signal_format (SignalFormat): Format of returned signals
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of returned signal values
+            cursor (Optional[str]): Cursor of requested page returned with previous page
+            max_points (Optional[int]): Maximal number of returned signal values, signals are downsampled if needed
+            downsampling_method (DownsamplingMethod): Method used to downsample signal values
         Returns:
             Result of request as time series object
         """
+        try:
+            start_timestamp, skip = get_page_start(start_timestamp, cursor)
+        except ValueError as e:
+            return NotFoundByIdModel(id=time_series_id, errors=str(e))
         time_series = super().get_time_series(time_series_id, depth)
         if time_series.errors is None:
             time_series.signal_values = self.get_signal_values(time_series_id, time_series.type,
-                                                               signal_min_value, signal_max_value)
+                                                               signal_min_value, signal_max_value,
+                                                               start_timestamp, end_timestamp,
+                                                               limit + skip + 1 if limit is not None else None)
+            # signals with start timestamp of page returned with previous pages are skipped
+            time_series.signal_values = time_series.signal_values[skip:]
+            if limit is not None and len(time_series.signal_values) > limit:
+                time_series.signal_values = time_series.signal_values[:limit]
+                timestamp_label = "timestamp" if time_series.type == Type.timestamp.value else "start_timestamp"
+                time_series.next_cursor = get_next_page_cursor(
+                    [int(get_node_property(signal_value[timestamp_label], "timestamp"))
+                     for signal_value in time_series.signal_values], start_timestamp, skip)
+            if max_points is not None:
+                time_series.signal_values = self.downsample_signal_values(time_series.signal_values, time_series.type,
+                                                                          max_points, downsampling_method)
+            if signal_format == SignalFormat.columns:
+                time_series.signal_columns = signal_values_to_signal_columns(time_series.signal_values)
+                time_series.signal_values = []
         return time_series
 
-    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]]):
+    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]],
+                                         join: JoinType = JoinType.inner, tolerance: Optional[int] = None):
         """
         Send request to graph api to get given time series
         Args:
             time_series_ids (int | str): Ids of the time series
+            join (JoinType): Type of join of signal values of time series
+            tolerance (Optional[int]): Maximal distance between timestamps of joined signal values
         Returns:
             Result of request as time series object
         """
+        versions = self.get_time_series_versions(time_series_ids)
+        if not isinstance(versions, list):
+            return versions
+        cache_key = transformation_cache.key("multidimensional", (join.value, tolerance), time_series_ids, versions)
+        result = transformation_cache.get(cache_key)
+        if result is not None:
+            return result
         source_time_series = []
         for time_series_id in time_series_ids:
-            time_series = self.get_time_series(time_series_id)
+            time_series = self.get_source_time_series(time_series_id)
             if time_series.errors is not None:
                 return time_series
             source_time_series.append(time_series)
         try:
-            result = TimeSeriesTransformationMultidimensional().transform(source_time_series)
+            result = TimeSeriesTransformationMultidimensional(transformation_pool.align).transform(
+                source_time_series, join, tolerance)
             for time_series in source_time_series:
                 time_series.signal_values = []
             result.time_series = source_time_series
+            transformation_cache.put(cache_key, result, len(result.signal_values))
             return result
         except Exception as e:
             return TimeSeriesMultidimensionalOut(errors=str(e))
 
+    def downsample_signal_values(self, signal_values: list, time_series_type: str, max_points: int,
+                                 downsampling_method: DownsamplingMethod):
+        """
+        Reduce number of signal values read from graph to at most max_points. Selection methods return original
+        signal values, mean method creates signal value nodes without id, placed at timestamp nodes of the first
+        (and last for Epoch type) signal value in each bucket.
+        Args:
+            signal_values (list): Signal values returned by get_signal_values
+            time_series_type (str): type of the time series
+            max_points (int): Maximal number of returned signal values
+            downsampling_method (DownsamplingMethod): Method used to downsample signal values
+        Returns:
+            Array of signal value objects
+        """
+        if len(signal_values) <= max_points:
+            return signal_values
+        timestamp_label = "timestamp" if time_series_type == Type.timestamp.value else "start_timestamp"
+        first_indices, last_indices, values = downsample(
+            [int(get_node_property(signal_value[timestamp_label], "timestamp")) for signal_value in signal_values],
+            [get_node_property(signal_value["signal_value"], "value") for signal_value in signal_values],
+            max_points, downsampling_method)
+        if downsampling_method != DownsamplingMethod.mean:
+            return [signal_values[index] for index in first_indices]
+
+        downsampled_signal_values = []
+        for first_index, last_index, value in zip(first_indices, last_indices, values):
+            if first_index == last_index:
+                downsampled_signal_values.append(signal_values[first_index])
+                continue
+            signal_value = {'signal_value': {'id': None, 'labels': ['Signal Value'],
+                                             'properties': [{'key': 'value', 'value': str(value)}]}}
+            if time_series_type == Type.timestamp.value:
+                signal_value['timestamp'] = signal_values[first_index]['timestamp']
+            else:
+                signal_value['start_timestamp'] = signal_values[first_index]['start_timestamp']
+                signal_value['end_timestamp'] = signal_values[last_index]['end_timestamp']
+            downsampled_signal_values.append(signal_value)
+        return downsampled_signal_values
+
     def get_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
                           signal_min_value: Optional[int] = None,
-                          signal_max_value: Optional[int] = None):
+                          signal_max_value: Optional[int] = None,
+                          start_timestamp: Optional[int] = None,
+                          end_timestamp: Optional[int] = None,
+                          limit: Optional[int] = None,
+                          descending: bool = False):
         """
-        Send requests to graph api to get all signal values
+        Send requests to graph api to get signal values ordered by (start) timestamp. Signal values are found
+        by index and read in pages of constant size, each following page starts after the last signal value of
+        previous one.
         Args:
             time_series_id (int | str): identity of the time series
             time_series_type (str): type of the time series
             signal_min_value (Optional[int]): Filter signal values by min value
             signal_max_value (Optional[int]): Filter signal values by max value
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of signal values, the first ones in order of (start) timestamp
+            descending (bool): Whether limit selects the last signal values instead of the first ones
         Returns:
             Array of signal value objects
         """
-
-        parameters = []
-        if signal_min_value is not None:
-            parameters.append({
-                "key": "value",
-                "operator": "greater",
-                "value": signal_min_value
-            })
-        if signal_max_value is not None:
-            parameters.append({
-                "key": "value",
-                "operator": "less",
-                "value": signal_max_value
-            })
-        query_timestamp = {
-            "nodes": [
-                {
-                    "id": time_series_id,
-                    "label": "Time Series"
-                },
-                {
-                    "label": "Signal Value"
-                },
-                {
-                    "label": "Signal Value",
-                    "result": True,
-                    "parameters": parameters
-                },
-                {
-                    "label": "Timestamp",
-                    "result": True
-                }
-            ],
-            "relations": [
-                {
-                    "begin_node_index": 0,
-                    "end_node_index": 1,
-                    "label": "hasSignal"
-                },
-                {
-                    "begin_node_index": 1,
-                    "end_node_index": 2,
-                    "label": "next",
-                    "min_count": 0
-                },
-                {
-                    "begin_node_index": 3,
-                    "end_node_index": 2,
-                    "label": "inSec"
-                }
-            ]
-        }
-        query_epoch = {
-            "nodes": [
-                {
-                    "id": time_series_id,
-                    "label": "Time Series"
-                },
-                {
-                    "label": "Signal Value"
-                },
-                {
-                    "label": "Signal Value",
-                    "result": True,
-                    "parameters": parameters
-                },
-                {
-                    "label": "Timestamp",
-                    "result": True
-                },
-                {
-                    "label": "Timestamp",
-                    "result": True
-                }
-            ],
-            "relations": [
-                {
-                    "begin_node_index": 0,
-                    "end_node_index": 1,
-                    "label": "hasSignal"
-                },
-                {
-                    "begin_node_index": 1,
-                    "end_node_index": 2,
-                    "label": "next",
-                    "min_count": 0
-                },
-                {
-                    "begin_node_index": 3,
-                    "end_node_index": 2,
-                    "label": "startInSec"
-                },
-                {
-                    "begin_node_index": 4,
-                    "end_node_index": 2,
-                    "label": "endInSec"
-                }
-            ]
-        }
-        response = self.graph_api_service.get_nodes_by_query(
-            query_timestamp if time_series_type == Type.timestamp.value else query_epoch)
         signal_values = []
-        for row in response["rows"]:
-            if time_series_type == Type.timestamp:
-                signal_values.append({'signal_value': row[0], 'timestamp': row[1]})
-            else:
-                signal_values.append({'signal_value': row[0], 'start_timestamp': row[1], 'end_timestamp': row[2]})
+        after_timestamp, after_sequence = None, None
+        while True:
+            page_size = graph_api_page_size if limit is None else min(graph_api_page_size, limit - len(signal_values))
+            response = self.graph_api_service.get_signal_values(time_series_id, start_timestamp, end_timestamp,
+                                                                signal_min_value, signal_max_value,
+                                                                after_timestamp, after_sequence, page_size,
+                                                                descending)
+            rows = response["rows"] or []
+            for row in rows:
+                if time_series_type == Type.timestamp:
+                    signal_values.append({'signal_value': row[0], 'timestamp': row[1]})
+                else:
+                    signal_values.append({'signal_value': row[0], 'start_timestamp': row[1],
+                                          'end_timestamp': row[2] if len(row) > 2 else None})
+            if len(rows) < page_size or len(signal_values) == limit:
+                break
+            after_timestamp, after_sequence = response["last_timestamp"], response["last_sequence"]
         return signal_values
 
-    def get_time_series_nodes(self, params: QueryParams = None):
+    def get_source_time_series(self, time_series_id: Union[int, str]):
+        """
+        Get time series with all its signal values to be transformed
+        Args:
+            time_series_id (int | str): identity of the time series
+        Returns:
+            Result of request as time series object
+        """
+        return self.get_time_series(time_series_id)
+
+    def get_source_signal_values(self, time_series_id: Union[int, str], time_series_type: str,
+                                 start_timestamp: Optional[int] = None):
+        """
+        Get signal values of time series to be transformed
+        Args:
+            time_series_id (int | str): identity of the time series
+            time_series_type (str): type of the time series
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+        Returns:
+            Array of signal value objects
+        """
+        return self.get_signal_values(time_series_id, time_series_type, start_timestamp=start_timestamp)
+
+    def get_time_series_nodes(self, params: QueryParams = None, include_signal_values: bool = False):
         """
         Send request to graph api to get time series nodes
 
+        Args:
+            params (QueryParams): Get parameters
+            include_signal_values (bool): Whether signal values of each time series should be returned
+
         Returns:
             Result of request as list of time series nodes objects
         """
@@ -585,6 +964,10 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
                     properties[property["key"]] = property["value"]
                 else:
                     properties['additional_properties'].append({'key': property['key'], 'value': property['value']})
+            properties['additional_properties'], properties['statistics'] = \
+                statistics_from_properties(properties['additional_properties'])
+            if include_signal_values:
+                properties['signal_values'] = self.get_signal_values(time_series_node['id'], properties.get('type'))
             time_series = BasicTimeSeriesOut(**properties)
             time_series_nodes.append(time_series)
 
@@ -592,7 +975,7 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
 
     def delete_time_series(self, time_series_id: int):
         """
-        Send request to graph api to delete given time series
+        Send request to graph api to delete given time series with its signal values and their timestamps
 
         Args:
             time_series_id (int): Id of time series
@@ -600,37 +983,49 @@ class TimeSeriesServiceGraphDBWithSignalValues(TimeSeriesServiceGraphDB):
         Returns:
             Result of request as time series object
         """
-        get_response = super().delete_time_series(time_series_id)
+        get_response = self.get_time_series(time_series_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        timestamp_ids_to_analyze = []
-        for signal_value in get_response.signal_values:
-            self.graph_api_service.delete_node(signal_value["signal_value"]["id"])
-            if get_response.type == Type.timestamp.value:
-                timestamp_ids_to_analyze.append(signal_value["timestamp"]["id"])
-            else:
-                timestamp_ids_to_analyze.append(signal_value["start_timestamp"]["id"])
-                timestamp_ids_to_analyze.append(signal_value["end_timestamp"]["id"])
-        for timestamp_id in timestamp_ids_to_analyze:
-            neighbour_signal_a_id, _ = self.get_neighbour_node_id(timestamp_id, "inSec")
-            neighbour_signal_b_id, _ = self.get_neighbour_node_id(timestamp_id, "startInSec")
-            neighbour_signal_c_id, _ = self.get_neighbour_node_id(timestamp_id, "endInSec")
-            if neighbour_signal_a_id is None and neighbour_signal_b_id is None and neighbour_signal_c_id is None:
-                next_timestamp_id, _ = self.get_neighbour_node_id(timestamp_id, "next")
-                previous_timestamp_id, _ = self.get_neighbour_node_id(timestamp_id, "next", False)
-                previous_experiment_id, _ = self.get_neighbour_node_id(timestamp_id, "takes", False)
-
-                self.graph_api_service.delete_node(timestamp_id)
-
-                if next_timestamp_id is not None:
-                    if previous_experiment_id is not None:
-                        self.graph_api_service.create_relationships(start_node=previous_experiment_id,
-                                                                    end_node=next_timestamp_id,
-                                                                    name="takes")
-                    elif previous_timestamp_id is not None:
-                        self.graph_api_service.create_relationships(start_node=previous_timestamp_id,
-                                                                    end_node=next_timestamp_id,
-                                                                    name="next")
+        errors = self.delete_signal_values(time_series_id)
+        if errors is not None:
+            get_response.errors = errors
+            return get_response
+        transformation_cache.invalidate(time_series_id)
+        self.graph_api_service.delete_node(time_series_id)
         return get_response
+
+    def delete_signal_values(self, time_series_id: Union[int, str], start_timestamp: Optional[int] = None):
+        """
+        Send request to graph api to delete signal values of time series and their timestamps, which are not used
+        by other signal values, in a single transaction
+        Args:
+            time_series_id (int | str): identity of time series
+            start_timestamp (Optional[int]): Only signal values with (start) timestamp not earlier are deleted
+        Returns:
+            Errors of request, None if signal values were deleted
+        """
+        response = self.graph_api_service.delete_signal_values(time_series_id, start_timestamp)
+        return response["errors"]
+
+
+def first_changed_timestamp(stored_signal_values: list, timestamp_label: str, new_signal_values: List[SignalIn]):
+    """
+    Find (start) timestamp of the first signal, which differs between stored and newly transformed ordered signals
+
+    Returns:
+        Timestamp of the first different signal, None if signals are equal
+    """
+    stored_values = signal_value_values(stored_signal_values)
+    for position, (stored_signal_value, stored_value, new_signal_value) in enumerate(
+            zip(stored_signal_values, stored_values, new_signal_values)):
+        stored_timestamp = int(get_node_property(stored_signal_value[timestamp_label], "timestamp"))
+        new_timestamp = getattr(new_signal_value, timestamp_label)
+        if stored_timestamp != new_timestamp or str(stored_value) != str(new_signal_value.signal_value.value):
+            return min(stored_timestamp, new_timestamp)
+    if len(stored_signal_values) > len(new_signal_values):
+        return int(get_node_property(stored_signal_values[len(new_signal_values)][timestamp_label], "timestamp"))
+    if len(new_signal_values) > len(stored_signal_values):
+        return getattr(new_signal_values[len(stored_signal_values)], timestamp_label)
+    return None
@@ -1,6 +1,7 @@
-from typing import Union, Optional, List
+from typing import Union, Optional, List, AsyncIterator
 
 import bson
+from pydantic import ValidationError
 
 from starlette.datastructures import QueryParams
 from time_series.transformation.multidimensional.TimeSeriesTransformationMultidimensional import (
@@ -9,6 +10,7 @@ from time_series.transformation.multidimensional.TimeSeriesTransformationMultidi
 
 from mongo_service.collection_mapping import Collections
 from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongodb_api_config import mongo_ts_insert_batch_size
 from time_series.time_series_model import (
     TimeSeriesPropertyIn,
     BasicTimeSeriesOut,
@@ -19,11 +21,27 @@ from time_series.time_series_model import (
     TimeSeriesTransformationIn,
     SignalIn,
     SignalValueNodesIn,
+    SignalFormat,
+    DownsamplingMethod,
+    SignalStatistics,
+    TimeSeriesStatisticsOut,
+    TimeSeriesSignalsIn,
+    JoinType,
+    TimeSeriesMultidimensionalOut,
 )
 from models.not_found_model import NotFoundByIdModel
 from time_series.time_series_service import TimeSeriesService
-from time_series.transformation.TimeSeriesTransformationFactory import (
-    TimeSeriesTransformationFactory,
+from time_series.ts_helpers import get_page_start, signal_columns_to_signal_values, time_series_in_to_out
+from time_series.ts_statistics import merge_statistics, signal_values_statistics
+from time_series.transformation.TimeSeriesTransformationPipeline import (
+    TimeSeriesTransformationPipeline,
+)
+from time_series.transformation.TimeSeriesTransformationCache import (
+    transformation_cache,
+    normalize_steps,
+)
+from time_series.transformation.TimeSeriesTransformationPool import (
+    transformation_pool,
 )
 
 
@@ -53,29 +71,15 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
         Returns:
             Result of request as time series object
         """
-        if (
-            not time_series.observable_information_ids
-            and time_series.observable_information_id
-        ):
-            time_series.observable_information_ids = [
-                time_series.observable_information_id
-            ]
-        if (
-            time_series.observable_information_ids
-            and not self._check_related_observable_informations(
-                time_series.observable_information_ids
-            )
-        ):
-            return NotFoundByIdModel(
-                errors={"errors": "given observable information does not exist"}
-            )
-
-        related_measure = self.measure_service.get_measure(time_series.measure_id)
-        related_measure_exists = related_measure is not NotFoundByIdModel
-        if time_series.measure_id is not None and not related_measure_exists:
-            return NotFoundByIdModel(errors={"errors": "given measure does not exist"})
+        relations_error = self._check_time_series_relations(time_series)
+        if relations_error is not None:
+            return relations_error
 
-        if len(time_series.signal_values) == 0:
+        has_signal_columns = (
+            time_series.signal_columns is not None
+            and len(time_series.signal_columns.values) > 0
+        )
+        if len(time_series.signal_values) == 0 and not has_signal_columns:
             time_series.signal_values = [
                 SignalIn(signal_value=SignalValueNodesIn(value=1), timestamp=1)
             ]
@@ -84,24 +88,98 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
         )
         return self.get_time_series(created_ts_id)
 
+    async def save_time_series_stream(self, time_series_lines: AsyncIterator[str]):
+        """
+        Send request to mongo api to create new time series from newline delimited JSON stream.
+        Signal values are parsed one by one and inserted in batches, so memory usage does not
+        depend on the length of the time series.
+
+        Args:
+            time_series_lines (AsyncIterator[str]): Lines of the stream. First line contains time series, optionally
+                with signal values or signal columns, each following line contains single signal value
+
+        Returns:
+            Result of request as time series object without signal values
+        """
+        try:
+            time_series = TimeSeriesIn.parse_raw(await time_series_lines.__anext__())
+        except StopAsyncIteration:
+            return NotFoundByIdModel(errors={"errors": "time series stream is empty"})
+        except ValidationError as e:
+            return NotFoundByIdModel(errors={"errors": str(e)})
+
+        relations_error = self._check_time_series_relations(time_series)
+        if relations_error is not None:
+            return relations_error
+
+        # signals given in the first line are inserted with the first batch
+        batch = time_series.signal_values
+        if time_series.signal_columns is not None:
+            batch = batch + signal_columns_to_signal_values(time_series.signal_columns)
+        time_series.signal_values, time_series.signal_columns = [], None
+        header_signals_count = len(batch)
+        metadata = self.mongo_api_service.create_time_series_metadata(time_series)
+        inserted_signals_count = 0
+        statistics = SignalStatistics()
+        try:
+            async for line in time_series_lines:
+                batch.append(SignalIn.parse_raw(line))
+                if len(batch) >= mongo_ts_insert_batch_size:
+                    self.mongo_api_service.insert_time_series_signals(batch, metadata)
+                    statistics = merge_statistics(statistics, signal_values_statistics(batch))
+                    inserted_signals_count += len(batch)
+                    batch = []
+        except ValidationError as e:
+            self.mongo_api_service.delete_time_series(metadata["id"])
+            return NotFoundByIdModel(
+                errors={
+                    "errors": f"invalid signal value at line "
+                    f"{inserted_signals_count + len(batch) - header_signals_count + 2}: {e}"
+                }
+            )
+        if inserted_signals_count + len(batch) == 0:
+            batch = [SignalIn(signal_value=SignalValueNodesIn(value=1), timestamp=1)]
+        self.mongo_api_service.insert_time_series_signals(batch, metadata)
+        statistics = merge_statistics(statistics, signal_values_statistics(batch))
+        self.mongo_api_service.update_time_series_metadata(
+            {"statistics": statistics.dict()}, metadata["id"]
+        )
+
+        return TimeSeriesOut(**time_series.dict(), id=str(metadata["id"]), statistics=statistics)
+
     def get_multiple(
-        self, query: dict = {}, depth: int = 0, source: str = "", query_params=None
+        self,
+        query: dict = {},
+        depth: int = 0,
+        source: str = "",
+        query_params=None,
+        include_signal_values: bool = False,
     ):
-        results_dict = self.mongo_api_service.get_many_time_series(query, query_params)
+        results_dict = self.mongo_api_service.get_many_time_series(
+            query, query_params, include_signal_values
+        )
 
         for result in results_dict:
             self._add_related_documents(result, depth, source)
 
         return results_dict
 
-    def get_time_series_nodes(self, params: QueryParams = None):
+    def get_time_series_nodes(
+        self, params: QueryParams = None, include_signal_values: bool = False
+    ):
         """
         Send request to graph api to get time series nodes
 
+        Args:
+            params (QueryParams): Get parameters
+            include_signal_values (bool): Whether signal values of each time series should be returned
+
         Returns:
             Result of request as list of time series nodes objects
         """
-        time_series_dicts = self.get_multiple(query_params=params)
+        time_series_dicts = self.get_multiple(
+            query_params=params, include_signal_values=include_signal_values
+        )
         results = [BasicTimeSeriesOut(**ts_dict) for ts_dict in time_series_dicts]
         return TimeSeriesNodesOut(time_series_nodes=results)
 
@@ -111,6 +189,13 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
         depth: int = 0,
         signal_min_value: Optional[int] = None,
         signal_max_value: Optional[int] = None,
+        signal_format: SignalFormat = SignalFormat.rows,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        max_points: Optional[int] = None,
+        downsampling_method: DownsamplingMethod = DownsamplingMethod.lttb,
         source: str = "",
     ):
         """
@@ -121,6 +206,13 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
             depth: (int): specifies how many related entities will be traversed to create the response
             signal_min_value (Optional[int]): Filter signal values by min value
             signal_max_value (Optional[int]): Filter signal values by max value
+            signal_format (SignalFormat): Format of returned signals
+            start_timestamp (Optional[int]): Filter signal values by min (start) timestamp
+            end_timestamp (Optional[int]): Filter signal values by (start) timestamp lower than given one
+            limit (Optional[int]): Maximal number of returned signal values
+            cursor (Optional[str]): Cursor of requested page returned with previous page
+            max_points (Optional[int]): Maximal number of returned signal values, signals are downsampled if needed
+            downsampling_method (DownsamplingMethod): Method used to downsample signal values
 
         Returns:
             Result of request as time series object
@@ -129,36 +221,86 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
             bson.ObjectId(time_series_id)
         except bson.errors.InvalidId:
             return NotFoundByIdModel(id=time_series_id, errors="Invalid ID")
-        time_series = self.mongo_api_service.get_time_series(
+        try:
+            start_timestamp, skip = get_page_start(start_timestamp, cursor)
+        except ValueError as e:
+            return NotFoundByIdModel(id=time_series_id, errors=str(e))
+        get_time_series = (
+            self.mongo_api_service.get_time_series_columns
+            if signal_format == SignalFormat.columns
+            else self.mongo_api_service.get_time_series
+        )
+        time_series = get_time_series(
             ts_id=time_series_id,
             signal_min_value=signal_min_value,
             signal_max_value=signal_max_value,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            skip=skip,
+            max_points=max_points,
+            downsampling_method=downsampling_method,
         )
         self._add_related_documents(time_series, depth, source)
         if type(time_series) == NotFoundByIdModel:
             return time_series
         return TimeSeriesOut(**time_series)
 
-    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]]):
+    def get_time_series_statistics(self, time_series_id: Union[int, str]):
+        """
+        Send request to mongo api to get statistics of signals of given time series
+
+        Args:
+            time_series_id (int | str): identity of time series
+
+        Returns:
+            Result of request as time series statistics object
+        """
+        try:
+            bson.ObjectId(time_series_id)
+        except bson.errors.InvalidId:
+            return NotFoundByIdModel(id=time_series_id, errors="Invalid ID")
+        statistics = self.mongo_api_service.get_time_series_statistics(time_series_id)
+        if type(statistics) is NotFoundByIdModel:
+            return statistics
+        return TimeSeriesStatisticsOut(id=time_series_id, statistics=statistics)
+
+    def get_time_series_multidimensional(self, time_series_ids: List[Union[int, str]],
+                                         join: JoinType = JoinType.inner, tolerance: Optional[int] = None):
         """
         Send request to graph api to get given time series
         Args:
             time_series_ids (int | str): Ids of the time series
+            join (JoinType): Type of join of signal values of time series
+            tolerance (Optional[int]): Maximal distance between timestamps of joined signal values
         Returns:
             Result of request as time series object
         """
+        versions = self.get_time_series_versions(time_series_ids)
+        if not isinstance(versions, list):
+            return versions
+        cache_key = transformation_cache.key(
+            "multidimensional", (join.value, tolerance), time_series_ids, versions
+        )
+        result = transformation_cache.get(cache_key)
+        if result is not None:
+            return result
         source_time_series = []
         for time_series_id in time_series_ids:
             time_series = self.get_time_series(time_series_id)
             if time_series.errors is not None:
                 return time_series
             source_time_series.append(time_series)
-        result = TimeSeriesTransformationMultidimensional().transform(
-            source_time_series
-        )
+        try:
+            result = TimeSeriesTransformationMultidimensional(
+                transformation_pool.align
+            ).transform(source_time_series, join, tolerance)
+        except Exception as e:
+            return TimeSeriesMultidimensionalOut(errors=str(e))
         for time_series in source_time_series:
             time_series.signal_values = []
         result.time_series = source_time_series
+        transformation_cache.put(cache_key, result, len(result.signal_values))
         return result
 
     def delete_time_series(self, time_series_id: Union[int, str]):
@@ -172,6 +314,7 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
             Result of request as time series object
         """
         get_response = self.get_time_series(time_series_id)
+        transformation_cache.invalidate(time_series_id)
         self.mongo_api_service.delete_time_series(time_series_id)
         return get_response
 
@@ -191,9 +334,35 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
         time_series.signal_values = []
         update_dict = time_series.dict()
         update_dict.pop("signal_values")
+        update_dict.pop("signal_columns")
+        transformation_cache.invalidate(time_series_id)
         self.mongo_api_service.update_time_series_metadata(update_dict, time_series_id)
         return self.get_time_series(time_series_id)
 
+    def append_signal_values(self, time_series_id: Union[int, str], signals: TimeSeriesSignalsIn):
+        """
+        Send request to mongo api to append signals to given time series. Only appended signals
+        are written, stored statistics are updated.
+
+        Args:
+            time_series_id (int | str): identity of time series
+            signals (TimeSeriesSignalsIn): Signals to append
+
+        Returns:
+            Result of request as time series object without signal values
+        """
+        try:
+            bson.ObjectId(time_series_id)
+        except bson.errors.InvalidId:
+            return NotFoundByIdModel(id=time_series_id, errors="Invalid ID")
+        transformation_cache.invalidate(time_series_id)
+        time_series = self.mongo_api_service.append_time_series_signals(
+            time_series_id, signals.signal_values, signals.signal_columns, signals.upsert
+        )
+        if type(time_series) is NotFoundByIdModel:
+            return time_series
+        return BasicTimeSeriesOut(**time_series)
+
     def update_time_series_relationships(
         self, time_series_id: Union[int, str], time_series: TimeSeriesRelationIn
     ):
@@ -248,28 +417,49 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
         Returns:
             Result of request as time series object
         """
-        source_time_series = []
-        for time_series_id in time_series_transformation.source_time_series_ids:
-            time_series = self.get_time_series(time_series_id)
-            if time_series.errors is not None:
-                return time_series
-            source_time_series.append(time_series)
+        steps = time_series_transformation.get_steps()
         try:
-            new_time_series, new_signal_values_id_mapping = (
-                TimeSeriesTransformationFactory()
-                .get_transformation(time_series_transformation.name)
-                .transform(
-                    source_time_series, time_series_transformation.additional_properties
-                )
-            )
+            TimeSeriesTransformationPipeline().validate(steps)
         except Exception as e:
             return TimeSeriesNodesOut(errors=str(e))
+        source_ids = time_series_transformation.source_time_series_ids
+        new_time_series, cache_key = None, None
+        if time_series_transformation.dry_run:
+            versions = self.get_time_series_versions(source_ids)
+            if not isinstance(versions, list):
+                return versions
+            cache_key = transformation_cache.key(
+                "pipeline", normalize_steps(steps), source_ids, versions
+            )
+            new_time_series = transformation_cache.get(cache_key)
+        if new_time_series is None:
+            source_time_series = []
+            for time_series_id in source_ids:
+                time_series = self.get_time_series(time_series_id)
+                if time_series.errors is not None:
+                    return time_series
+                source_time_series.append(time_series)
+            try:
+                new_time_series, new_signal_values_id_mapping = (
+                    transformation_pool.transform(source_time_series, steps)
+                )
+            except Exception as e:
+                return TimeSeriesNodesOut(errors=str(e))
+            if cache_key is not None:
+                transformation_cache.put(
+                    cache_key, new_time_series, len(new_time_series.signal_values)
+                )
         new_time_series.measure_id = time_series_transformation.destination_measure_id
         new_time_series.observable_information_ids = (
-            time_series_transformation.destination_observable_information_ids
+            [time_series_transformation.destination_observable_information_id]
+            if time_series_transformation.destination_observable_information_id
+            is not None
+            else None
         )
+        if time_series_transformation.dry_run:
+            return time_series_in_to_out(new_time_series)
 
-        result = self.save_time_series(new_time_series)
+        return self.save_time_series(new_time_series)
 
     def get_time_series_for_observable_information(
         self,
@@ -310,6 +500,36 @@ class TimeSeriesServiceMongoDB(TimeSeriesService):
                 source=Collections.TIME_SERIES,
             )
 
+    def _check_time_series_relations(self, time_series: TimeSeriesIn):
+        """
+        Check whether observable informations and measure related to time series exist
+
+        Returns:
+            NotFoundByIdModel with errors if any related document does not exist, otherwise None
+        """
+        if (
+            not time_series.observable_information_ids
+            and time_series.observable_information_id
+        ):
+            time_series.observable_information_ids = [
+                time_series.observable_information_id
+            ]
+        if (
+            time_series.observable_information_ids
+            and not self._check_related_observable_informations(
+                time_series.observable_information_ids
+            )
+        ):
+            return NotFoundByIdModel(
+                errors={"errors": "given observable information does not exist"}
+            )
+
+        related_measure = self.measure_service.get_measure(time_series.measure_id)
+        related_measure_exists = related_measure is not NotFoundByIdModel
+        if time_series.measure_id is not None and not related_measure_exists:
+            return NotFoundByIdModel(errors={"errors": "given measure does not exist"})
+        return None
+
     def _check_related_observable_informations(self, observable_information_ids: List):
         existing_observable_informations = (
             self.observable_information_service.get_multiple(
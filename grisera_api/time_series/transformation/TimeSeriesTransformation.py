@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from property.property_model import PropertyIn
 from time_series.time_series_model import TimeSeriesOut
@@ -8,8 +8,13 @@ class TimeSeriesTransformation:
     """
     Abstract class to handle logic of time series transformation
 
+    Attributes:
+        source_time_series_count (Optional[int]): Number of time series transformed together, None if any number
+            is accepted
     """
 
+    source_time_series_count: Optional[int] = None
+
     def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
         """
         Transform time series data
@@ -22,3 +27,18 @@ class TimeSeriesTransformation:
             New time series object
         """
         raise Exception("transform not implemented yet")
+
+    def tail_window(self, additional_properties: Optional[List[PropertyIn]]) -> Optional[Tuple[int, int]]:
+        """
+        Get spans of timestamps needed to transform again only the tail of time series, after signals with
+        timestamps not lower than some timestamp were added to or changed in transformed time series
+
+        Args:
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            Tuple of span before that timestamp, in which new signals may change, and span before each new signal,
+            in which transformed signals affect it. None if changes are not bounded in time, then the whole time
+            series has to be transformed again.
+        """
+        return None
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Union
+
+from time_series.time_series_model import TimeSeriesTransformationStepIn
+from time_series.transformation import transformation_config
+
+
+class TimeSeriesTransformationCache:
+    """
+    Least recently used cache of transformation results. Results are stored under key composed of
+    transformation name, normalized parameters, ids of source time series and versions of their content,
+    so results of changed time series are never returned. Entries are evicted when number of entries or
+    total number of signal values in cached results exceeds limits.
+
+    Attributes:
+        max_entries (int): Maximal number of cached results, 0 disables the cache
+        max_signals (int): Maximal total number of signal values in cached results
+        entries (OrderedDict): Cached results with their sizes, from least to most recently used
+        versions (dict): Number of invalidations of time series with given id
+        signals (int): Total number of signal values in cached results
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_signals: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None \
+            else transformation_config.transformation_cache_entries
+        self.max_signals = max_signals if max_signals is not None \
+            else transformation_config.transformation_cache_signals
+        self.entries = OrderedDict()
+        self.versions = {}
+        self.signals = 0
+        self.lock = threading.Lock()
+
+    def key(self, name: str, parameters, source_ids: List[Union[int, str]], source_versions: list):
+        """
+        Get key of transformation result
+
+        Args:
+            name (str): Name of transformation
+            parameters: Hashable parameters of transformation, see normalize_steps
+            source_ids (List[int | str]): Ids of source time series
+            source_versions (list): Versions of content of source time series, stored with their statistics
+
+        Returns:
+            Hashable key of result
+        """
+        with self.lock:
+            return (name, parameters,
+                    tuple((str(source_id), self.versions.get(str(source_id), 0), repr(source_version))
+                          for source_id, source_version in zip(source_ids, source_versions)))
+
+    def get(self, key):
+        """
+        Get copy of cached result, None if there is no such result
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+        return entry[0].copy(deep=True)
+
+    def put(self, key, result, size: int):
+        """
+        Cache copy of result with given number of signal values, least recently used results are evicted
+        """
+        if self.max_entries <= 0 or size > self.max_signals:
+            return
+        result = result.copy(deep=True)
+        with self.lock:
+            if key in self.entries:
+                self.signals -= self.entries.pop(key)[1]
+            self.entries[key] = (result, size)
+            self.signals += size
+            while len(self.entries) > self.max_entries or self.signals > self.max_signals:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.signals -= evicted_size
+
+    def invalidate(self, time_series_id: Union[int, str]):
+        """
+        Drop results computed from given time series, called when it is updated or deleted
+        """
+        time_series_id = str(time_series_id)
+        with self.lock:
+            self.versions[time_series_id] = self.versions.get(time_series_id, 0) + 1
+            for key in [key for key in self.entries
+                        if any(source[0] == time_series_id for source in key[2])]:
+                self.signals -= self.entries.pop(key)[1]
+
+    def clear(self):
+        """
+        Drop all cached results
+        """
+        with self.lock:
+            self.entries.clear()
+            self.signals = 0
+
+
+def normalize_steps(steps: List[TimeSeriesTransformationStepIn]):
+    """
+    Get hashable form of pipeline steps, where properties of each step are sorted by key and values are compared
+    as strings
+    """
+    return tuple((step.name, tuple(sorted((str(parameter.key), str(parameter.value))
+                                          for parameter in step.additional_properties or [])))
+                 for step in steps)
+
+
+transformation_cache = TimeSeriesTransformationCache()
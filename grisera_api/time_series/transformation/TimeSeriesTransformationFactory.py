@@ -1,6 +1,7 @@
-from time_series.time_series_model import TransformationType
-from time_series.transformation.TimeSeriesTransformationQuadrants import TimeSeriesTransformationQuadrants
-from time_series.transformation.TimeSeriesTransformationResample import TimeSeriesTransformationResample
+from typing import List, Optional
+
+from property.property_model import PropertyIn
+from time_series.transformation.TimeSeriesTransformationRegistry import transformation_registry
 
 
 class TimeSeriesTransformationFactory:
@@ -20,9 +21,15 @@ class TimeSeriesTransformationFactory:
         Returns:
             New time series transformation class
         """
-        if transformation_name == TransformationType.RESAMPLE_NEAREST:
-            return TimeSeriesTransformationResample()
-        elif transformation_name == TransformationType.QUADRANTS:
-            return TimeSeriesTransformationQuadrants()
-        else:
-            raise Exception(f"transformation {transformation_name} is unknown")
+        return transformation_registry.get_transformation(transformation_name)
+
+    @staticmethod
+    def validate_parameters(transformation_name: str, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Check transformation parameters before any time series is loaded
+
+        Args:
+            transformation_name (str): Name of transformation
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+        """
+        transformation_registry.validate_parameters(transformation_name, additional_properties)
@@ -0,0 +1,105 @@
+from typing import List
+
+from property.property_model import PropertyIn
+from time_series.ts_lineage import compose_lineage
+from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, TimeSeriesTransformationStepIn
+from time_series.transformation.TimeSeriesTransformationFactory import TimeSeriesTransformationFactory
+
+
+class TimeSeriesTransformationPipeline:
+    """
+    Class with logic of applying several time series transformations one after another in memory
+
+    """
+
+    def transform(self, time_series: List[TimeSeriesOut], steps: List[TimeSeriesTransformationStepIn]):
+        """
+        Transform time series data with each of steps.
+
+        Each step transforms results of the previous step. Transformations of single time series are applied to each
+        of time series separately, other transformations get all of them together. Intermediate time series are
+        kept only in memory and the last step should result in one time series.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            steps (List[TimeSeriesTransformationStepIn]): Transformations with their parameters
+
+        Returns:
+            New time series object and mapping of its signal values to signal values of source time series
+        """
+        lineages = [None] * len(time_series)
+        for step_index, step in enumerate(steps):
+            transformation = TimeSeriesTransformationFactory().get_transformation(step.name)
+            if transformation.source_time_series_count == 1:
+                groups = [[series_index] for series_index in range(len(time_series))]
+            else:
+                groups = [list(range(len(time_series)))]
+            results = []
+            for group in groups:
+                # transformations append their name to parameters, so each of them gets own list
+                additional_properties = list(step.additional_properties) \
+                    if step.additional_properties is not None else None
+                new_time_series, new_signal_values_id_mapping = transformation.transform(
+                    [time_series[series_index] for series_index in group], additional_properties)
+                results.append((new_time_series, compose_lineage(new_signal_values_id_mapping, lineages)))
+            if step_index < len(steps) - 1:
+                time_series = [intermediate_time_series(new_time_series, series_index)
+                               for series_index, (new_time_series, _) in enumerate(results)]
+                lineages = [new_signal_values_id_mapping for _, new_signal_values_id_mapping in results]
+
+        assert len(results) == 1, "Transformation pipeline should result in one time series"
+        new_time_series, new_signal_values_id_mapping = results[0]
+        if len(steps) > 1:
+            new_time_series.additional_properties.append(
+                PropertyIn(key="transformation_steps", value=",".join(step.name for step in steps)))
+        return new_time_series, new_signal_values_id_mapping
+
+    def validate(self, steps: List[TimeSeriesTransformationStepIn]):
+        """
+        Check names and declared parameters of transformations of all steps, before source time series are loaded
+
+        Args:
+            steps (List[TimeSeriesTransformationStepIn]): Transformations with their parameters
+
+        Raises:
+            Exception: transformation is unknown or its parameters are invalid
+        """
+        for step in steps:
+            TimeSeriesTransformationFactory().validate_parameters(step.name, step.additional_properties)
+
+    def tail_window(self, steps: List[TimeSeriesTransformationStepIn]):
+        """
+        Get spans of timestamps needed to transform again only the tail of time series, see
+        TimeSeriesTransformation.tail_window. Spans of steps add up.
+
+        Args:
+            steps (List[TimeSeriesTransformationStepIn]): Transformations with their parameters
+
+        Returns:
+            Tuple of span of changed signals and span of signals needed to compute them, None if the whole time
+            series has to be transformed again
+        """
+        changed_span, needed_span = 0, 0
+        for step in steps:
+            window = TimeSeriesTransformationFactory().get_transformation(step.name).tail_window(
+                step.additional_properties)
+            if window is None:
+                return None
+            changed_span, needed_span = changed_span + window[0], needed_span + window[1]
+        return changed_span, needed_span
+
+
+def intermediate_time_series(time_series: TimeSeriesIn, series_index: int):
+    """
+    Convert transformed time series to the form of read time series, with signal values identified by index of
+    time series and their position
+    """
+    timestamp_keys = ["timestamp"] if time_series.type == Type.timestamp else ["start_timestamp", "end_timestamp"]
+    signal_values = [
+        {
+            **{key: getattr(signal_value, key) for key in timestamp_keys},
+            "signal_value": {"id": (series_index, position), "value": signal_value.signal_value.value}
+        }
+        for position, signal_value in enumerate(time_series.signal_values)]
+    return TimeSeriesOut.construct(type=time_series.type, signal_values=signal_values,
+                                   additional_properties=time_series.additional_properties)
@@ -0,0 +1,238 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Dict
+
+import numpy as np
+
+from time_series.ts_alignment import signal_timestamps, signal_value_values, align
+from time_series.ts_lineage import SignalValuesLineage
+from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, SignalValueNodesIn, \
+    TimeSeriesTransformationStepIn, JoinType
+from time_series.transformation import transformation_config
+from time_series.transformation.TimeSeriesTransformationPipeline import TimeSeriesTransformationPipeline
+
+
+class TimeSeriesTransformationPool:
+    """
+    Class running CPU-bound transformations in a bounded pool of processes. Signal arrays are passed to and from
+    worker processes in shared memory, small transformations and transformations of non-numeric signal values
+    are run in the calling process.
+
+    Attributes:
+        size (int): Number of worker processes, 0 disables the pool
+        queue_depth (int): Maximal number of transformations submitted to the pool at the same time
+        min_signals (int): Minimal number of source signals of transformation run in the pool
+        pending (int): Number of transformations submitted to the pool and not finished yet
+    """
+
+    def __init__(self, size: Optional[int] = None, queue_depth: Optional[int] = None,
+                 min_signals: Optional[int] = None):
+        self.size = size if size is not None else transformation_config.transformation_pool_size
+        self.queue_depth = queue_depth if queue_depth is not None else transformation_config.transformation_queue_depth
+        self.min_signals = min_signals if min_signals is not None \
+            else transformation_config.transformation_pool_min_signals
+        self.pending = 0
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def status(self):
+        """
+        Get size of pool and number of pending transformations
+        """
+        return {"size": self.size, "pending": self.pending, "queue_depth": self.queue_depth}
+
+    def transform(self, time_series: List[TimeSeriesOut], steps: List[TimeSeriesTransformationStepIn]):
+        """
+        Transform time series with pipeline of steps, see TimeSeriesTransformationPipeline
+
+        Returns:
+            New time series object and mapping of its signal values to signal values of source time series
+        """
+        columns = self._use_pool(time_series) and [time_series_columns(series) for series in time_series]
+        if not columns or any(series_columns is None for series_columns in columns):
+            return TimeSeriesTransformationPipeline().transform(time_series, steps)
+        arrays = {f"{series_index}_{key}": array for series_index, series_columns in enumerate(columns)
+                  for key, array in series_columns.items()}
+        arrays, meta = self._run(_transform_shared, arrays, [series.type for series in time_series], steps)
+
+        # signal values are identified by position in concatenated source time series
+        source_ids = [signal_value["signal_value"].get("id")
+                      for series in time_series for signal_value in series.signal_values]
+        values = meta["values"] if meta["values"] is not None else arrays["values"].tolist()
+        new_time_series = TimeSeriesIn(type=meta["type"], additional_properties=meta["additional_properties"])
+        if meta["type"] == Type.timestamp:
+            new_time_series.signal_values = [
+                SignalIn.construct(timestamp=timestamp, start_timestamp=None, end_timestamp=None,
+                                   signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+                for timestamp, value in zip(arrays["timestamps"].tolist(), values)]
+        else:
+            new_time_series.signal_values = [
+                SignalIn.construct(timestamp=None, start_timestamp=start_timestamp, end_timestamp=end_timestamp,
+                                   signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+                for start_timestamp, end_timestamp, value in
+                zip(arrays["start_timestamps"].tolist(), arrays["end_timestamps"].tolist(), values)]
+        lineage_ids = [source_ids[position] for position in arrays["lineage_positions"].tolist()]
+        if meta["compact_lineage"]:
+            return new_time_series, SignalValuesLineage(lineage_ids, arrays["lineage_starts"],
+                                                        arrays["lineage_ends"])
+        offsets = arrays["lineage_offsets"].tolist()
+        return new_time_series, [lineage_ids[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def align(self, timestamps: List[np.ndarray], join: JoinType = JoinType.inner, tolerance: Optional[int] = None,
+              end_timestamps: Optional[List[np.ndarray]] = None):
+        """
+        Align signals of time series, see ts_alignment.align
+        """
+        if self.size <= 0 or sum(len(series_timestamps) for series_timestamps in timestamps) < self.min_signals:
+            return align(timestamps, join, tolerance, end_timestamps)
+        arrays = {f"{series_index}_timestamps": series_timestamps
+                  for series_index, series_timestamps in enumerate(timestamps)}
+        if end_timestamps is not None:
+            arrays.update({f"{series_index}_end_timestamps": series_end_timestamps
+                           for series_index, series_end_timestamps in enumerate(end_timestamps)})
+        arrays, _ = self._run(_align_shared, arrays, len(timestamps), join, tolerance)
+        return arrays["indices"], arrays["sources"]
+
+    def _use_pool(self, time_series: List[TimeSeriesOut]):
+        return self.size > 0 and sum(len(series.signal_values) for series in time_series) >= self.min_signals
+
+    def _run(self, function, arrays: Dict[str, np.ndarray], *args):
+        with self.lock:
+            if self.pending >= self.queue_depth:
+                raise Exception("transformation queue is full, try again later")
+            self.pending += 1
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.size)
+        memory, layout = share_arrays(arrays)
+        try:
+            memory_name, result_layout, meta = self.executor.submit(
+                _run_shared, function, memory.name, layout, *args).result()
+        finally:
+            memory.close()
+            memory.unlink()
+            with self.lock:
+                self.pending -= 1
+        result_memory = SharedMemory(name=memory_name)
+        try:
+            result_arrays = {key: array.copy() for key, array in attach_arrays(result_memory, result_layout).items()}
+        finally:
+            result_memory.close()
+            result_memory.unlink()
+        return result_arrays, meta
+
+
+def time_series_columns(time_series: TimeSeriesOut):
+    """
+    Get timestamps and numeric values of signal values of time series as arrays, None if any value is not numeric
+    """
+    signal_values = time_series.signal_values
+    try:
+        columns = {"values": np.asarray(signal_value_values(signal_values), dtype=np.float64)}
+    except (ValueError, TypeError):
+        return None
+    if time_series.type == Type.timestamp:
+        columns["timestamps"] = signal_timestamps(signal_values, "timestamp")
+    else:
+        columns["start_timestamps"] = signal_timestamps(signal_values, "start_timestamp")
+        columns["end_timestamps"] = signal_timestamps(signal_values, "end_timestamp")
+    return columns
+
+
+def share_arrays(arrays: Dict[str, np.ndarray]):
+    """
+    Copy arrays to new block of shared memory
+
+    Returns:
+        Shared memory and layout of arrays in it, as list of (key, dtype, shape, offset)
+    """
+    layout = []
+    size = 0
+    for key, array in arrays.items():
+        layout.append((key, array.dtype.str, array.shape, size))
+        # arrays are aligned to 8 bytes
+        size += (array.nbytes + 7) // 8 * 8
+    memory = SharedMemory(create=True, size=max(size, 1))
+    for (key, _, _, offset), array in zip(layout, arrays.values()):
+        attach_arrays(memory, [(key, array.dtype.str, array.shape, offset)])[key][...] = array
+    return memory, layout
+
+
+def attach_arrays(memory: SharedMemory, layout: list):
+    """
+    Get arrays backed by shared memory with given layout
+    """
+    return {key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf, offset=offset)
+            for key, dtype, shape, offset in layout}
+
+
+def _run_shared(function, memory_name: str, layout: list, *args):
+    memory = SharedMemory(name=memory_name)
+    arrays = attach_arrays(memory, layout)
+    try:
+        result_arrays, meta = function(arrays, *args)
+    finally:
+        del arrays
+        try:
+            memory.close()
+        except BufferError:
+            # arrays referenced by traceback of exception are released together with it
+            pass
+    result_memory, result_layout = share_arrays(result_arrays)
+    result_memory.close()
+    return result_memory.name, result_layout, meta
+
+
+def _transform_shared(arrays: Dict[str, np.ndarray], types: List[Type], steps: List[TimeSeriesTransformationStepIn]):
+    time_series = []
+    position = 0
+    for series_index, series_type in enumerate(types):
+        values = arrays[f"{series_index}_values"].tolist()
+        if series_type == Type.timestamp:
+            timestamps = {"timestamp": arrays[f"{series_index}_timestamps"].tolist()}
+        else:
+            timestamps = {"start_timestamp": arrays[f"{series_index}_start_timestamps"].tolist(),
+                          "end_timestamp": arrays[f"{series_index}_end_timestamps"].tolist()}
+        signal_values = [{key: timestamps[key][index] for key in timestamps} for index in range(len(values))]
+        for index, (signal_value, value) in enumerate(zip(signal_values, values)):
+            signal_value["signal_value"] = {"id": position + index, "value": value}
+        position += len(values)
+        time_series.append(TimeSeriesOut.construct(type=series_type, signal_values=signal_values))
+
+    new_time_series, lineage = TimeSeriesTransformationPipeline().transform(time_series, steps)
+
+    signal_values = new_time_series.signal_values
+    values = [signal_value.signal_value.value for signal_value in signal_values]
+    numeric = all(isinstance(value, (int, float)) for value in values)
+    result_arrays = {"values": np.asarray(values if numeric else [], dtype=np.float64)}
+    if new_time_series.type == Type.timestamp:
+        result_arrays["timestamps"] = np.asarray([signal_value.timestamp for signal_value in signal_values],
+                                                 dtype=np.int64)
+    else:
+        result_arrays["start_timestamps"] = np.asarray(
+            [signal_value.start_timestamp for signal_value in signal_values], dtype=np.int64)
+        result_arrays["end_timestamps"] = np.asarray(
+            [signal_value.end_timestamp for signal_value in signal_values], dtype=np.int64)
+    compact_lineage = isinstance(lineage, SignalValuesLineage)
+    if compact_lineage:
+        result_arrays["lineage_positions"] = np.asarray(lineage.source_ids, dtype=np.int64)
+        result_arrays["lineage_starts"] = np.asarray(lineage.starts, dtype=np.int64)
+        result_arrays["lineage_ends"] = np.asarray(lineage.ends, dtype=np.int64)
+    else:
+        result_arrays["lineage_positions"] = np.asarray([position for positions in lineage for position in positions],
+                                                        dtype=np.int64)
+        result_arrays["lineage_offsets"] = np.cumsum([0] + [len(positions) for positions in lineage], dtype=np.int64)
+    meta = {"type": new_time_series.type, "additional_properties": new_time_series.additional_properties,
+            "values": None if numeric else values, "compact_lineage": compact_lineage}
+    return result_arrays, meta
+
+
+def _align_shared(arrays: Dict[str, np.ndarray], series_count: int, join: JoinType, tolerance: Optional[int]):
+    timestamps = [arrays[f"{series_index}_timestamps"] for series_index in range(series_count)]
+    end_timestamps = [arrays[f"{series_index}_end_timestamps"] for series_index in range(series_count)] \
+        if "0_end_timestamps" in arrays else None
+    indices, sources = align(timestamps, join, tolerance, end_timestamps)
+    return {"indices": indices, "sources": sources}, None
+
+
+transformation_pool = TimeSeriesTransformationPool()
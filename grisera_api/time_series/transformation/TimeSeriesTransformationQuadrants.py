@@ -1,9 +1,12 @@
 from typing import List, Optional
 
+import numpy as np
+
 from property.property_model import PropertyIn
-from time_series.ts_helpers import get_node_property, get_additional_parameter
+from time_series.ts_alignment import signal_timestamps, signal_value_values, align
+from time_series.ts_helpers import get_additional_parameter
 from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, SignalIn, Type, TransformationType, \
-    SignalValueNodesIn
+    SignalValueNodesIn, JoinType
 from time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
 
 
@@ -13,12 +16,16 @@ class TimeSeriesTransformationQuadrants(TimeSeriesTransformation):
 
     """
 
+    source_time_series_count = 2
+
     def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
         """
         Transform time series data.
 
         Get quadrants for (X, Y) signal values pairs matched by timestamp values.
-        This transformation will ignore all signal values which timestamps will not be equal.
+        With inner join (default) this transformation will ignore all signal values which timestamps will not be
+        equal, or not within tolerance if it is given. With as-of join each X signal value is matched with the latest
+        Y signal value not later than it (within tolerance).
 
         Args:
             time_series (List[TimeSeriesOut]): Time series to be transformed
@@ -31,55 +38,62 @@ class TimeSeriesTransformationQuadrants(TimeSeriesTransformation):
         assert time_series[0].type == time_series[1].type, "Time series types should be equal"
         origin_x = get_additional_parameter(additional_properties, "origin_x")
         origin_y = get_additional_parameter(additional_properties, "origin_y")
-        origin_x = int(origin_x) if origin_x is not None else 0
-        origin_y = int(origin_y) if origin_y is not None else 0
+        origin_x = float(origin_x) if origin_x is not None else 0
+        origin_y = float(origin_y) if origin_y is not None else 0
+        join = get_additional_parameter(additional_properties, "join")
+        join = JoinType(join) if join is not None else JoinType.inner
+        assert join != JoinType.outer, "outer join is not supported by quadrants transformation"
+        tolerance = get_additional_parameter(additional_properties, "tolerance")
+        tolerance = int(tolerance) if tolerance is not None else None
 
         if additional_properties is None:
             additional_properties = []
         additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.QUADRANTS))
 
-        new_signal_values = []
-        new_signal_values_id_mapping = []
-        current_signal_value_y_index = 0
-        timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
-        # Iterate over all X signal values
-        for current_signal_value_x in time_series[0].signal_values:
-            # For current X signal value find first Y signal value with greater or equal timestamp value
-            # If not found, return not existing index
-            while current_signal_value_y_index < len(time_series[1].signal_values) and \
-                    int(get_node_property(time_series[1].signal_values[current_signal_value_y_index]["timestamp"],
-                                          timestamp_label)) < int(
-                get_node_property(current_signal_value_x["timestamp"], timestamp_label)):
-                current_signal_value_y_index += 1
-            # Check if X and Y signal timestamps are the same
-            if current_signal_value_y_index < len(time_series[1].signal_values) and \
-                    get_node_property(current_signal_value_x["timestamp"], "timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "timestamp") and \
-                    get_node_property(current_signal_value_x["timestamp"], "start_timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "start_timestamp") and \
-                    get_node_property(current_signal_value_x["timestamp"], "end_timestamp") == get_node_property(
-                time_series[1].signal_values[current_signal_value_y_index]["timestamp"], "end_timestamp"):
-                # Determine quadrant comparing X and Y signal values with origin point
-                x_positive = 1 if int(
-                    get_node_property(current_signal_value_x["signal_value"], "value")) >= origin_x else 0
-                y_positive = 1 if int(
-                    get_node_property(time_series[1].signal_values[current_signal_value_y_index]["signal_value"],
-                                      "value")) >= origin_y else 0
-                quadrant = 1 + [(1, 1), (0, 1), (0, 0), (1, 0)].index((x_positive, y_positive))
-                new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=quadrant),
-                                                  timestamp=get_node_property(
-                                                      current_signal_value_x["timestamp"], "timestamp"),
-                                                  start_timestamp=get_node_property(
-                                                      current_signal_value_x["timestamp"], "start_timestamp"),
-                                                  end_timestamp=get_node_property(
-                                                      current_signal_value_x["timestamp"], "end_timestamp"),
-                                                  ))
-                new_signal_values_id_mapping.append([
-                    current_signal_value_x["signal_value"]["id"],
-                    time_series[1].signal_values[current_signal_value_y_index]["signal_value"]["id"]
-                ])
-
-        return TimeSeriesIn(type=time_series[0].type,
-                            additional_properties=additional_properties,
-                            signal_values=new_signal_values
-                            ), new_signal_values_id_mapping
+        x_signal_values = time_series[0].signal_values
+        y_signal_values = time_series[1].signal_values
+        is_epoch = time_series[0].type != Type.timestamp
+        timestamp_label = "start_timestamp" if is_epoch else "timestamp"
+        timestamps = [signal_timestamps(x_signal_values, timestamp_label),
+                      signal_timestamps(y_signal_values, timestamp_label)]
+        end_timestamps = [signal_timestamps(x_signal_values, "end_timestamp"),
+                          signal_timestamps(y_signal_values, "end_timestamp")] if is_epoch else None
+        (x_indices, y_indices), _ = align(timestamps, join, tolerance, end_timestamps)
+        x_indices, y_indices = x_indices.tolist(), y_indices.tolist()
+
+        x_values = np.asarray(signal_value_values([x_signal_values[index] for index in x_indices]), dtype=np.float64)
+        y_values = np.asarray(signal_value_values([y_signal_values[index] for index in y_indices]), dtype=np.float64)
+        # Determine quadrant comparing X and Y signal values with origin point
+        x_positive = x_values >= origin_x
+        y_positive = y_values >= origin_y
+        quadrants = np.where(x_positive, np.where(y_positive, 1, 4), np.where(y_positive, 2, 3))
+
+        quadrant_values = {quadrant: SignalValueNodesIn(value=quadrant) for quadrant in range(1, 5)}
+        new_timestamps = timestamps[0][x_indices].tolist()
+        new_end_timestamps = end_timestamps[0][x_indices].tolist() if is_epoch else [None] * len(x_indices)
+        new_signal_values = [
+            SignalIn.construct(timestamp=None if is_epoch else timestamp,
+                               start_timestamp=timestamp if is_epoch else None,
+                               end_timestamp=end_timestamp,
+                               signal_value=quadrant_values[quadrant])
+            for timestamp, end_timestamp, quadrant in zip(new_timestamps, new_end_timestamps, quadrants.tolist())]
+        new_signal_values_id_mapping = [
+            [x_signal_values[x_index]["signal_value"]["id"], y_signal_values[y_index]["signal_value"]["id"]]
+            for x_index, y_index in zip(x_indices, y_indices)]
+
+        new_time_series = TimeSeriesIn(type=time_series[0].type, additional_properties=additional_properties)
+        # signal values are already valid, so they are not validated again
+        new_time_series.signal_values = new_signal_values
+        return new_time_series, new_signal_values_id_mapping
+
+    def tail_window(self, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Signals matched by equal timestamps depend only on signals with the same timestamp, with tolerance also on
+        signals within tolerance. As-of join without tolerance may match arbitrarily old signals.
+        """
+        join = get_additional_parameter(additional_properties, "join")
+        tolerance = get_additional_parameter(additional_properties, "tolerance")
+        tolerance = int(tolerance) if tolerance is not None else 0
+        if join is not None and JoinType(join) == JoinType.asof:
+            return (0, tolerance) if tolerance > 0 else None
+        return tolerance, tolerance
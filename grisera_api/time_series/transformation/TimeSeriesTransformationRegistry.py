@@ -0,0 +1,205 @@
+import importlib
+import importlib.metadata
+import threading
+from enum import Enum
+from typing import List, Optional, Dict, Any
+
+from pydantic import BaseModel
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import TransformationType, RollingFunction, JoinType
+from time_series.transformation import transformation_config
+
+
+class ParameterType(str, Enum):
+    """
+    Type of value of transformation parameter
+
+    Attributes:
+        int (str): Integer value
+        float (str): Numeric value
+        str (str): Any value
+    """
+
+    int = "int"
+    float = "float"
+    str = "str"
+
+
+class TransformationParameter(BaseModel):
+    """
+    Model of declared parameter of transformation, given in additional properties of transformation
+
+    Attributes:
+        key (str): Key of additional property
+        type (ParameterType): Type of value
+        required (bool): Whether parameter has to be given
+        choices (Optional[List[str]]): Allowed values
+        minimum (Optional[float]): The lowest allowed value of numeric parameter
+    """
+
+    key: str
+    type: ParameterType = ParameterType.str
+    required: bool = False
+    choices: Optional[List[str]]
+    minimum: Optional[float]
+
+
+class TransformationSpec(BaseModel):
+    """
+    Model of transformation registered in registry. Implementation is imported only when transformation is used
+    for the first time, so specs of plugins should be defined in modules without heavy imports.
+
+    Attributes:
+        name (str): Name of transformation used in requests
+        target (str): Implementation class (or other callable returning transformation) as "module:attribute"
+        parameters (List[TransformationParameter]): Declared parameters of transformation
+        options (Dict[str, Any]): Keyword arguments passed when transformation is created
+    """
+
+    name: str
+    target: str
+    parameters: List[TransformationParameter] = []
+    options: Dict[str, Any] = {}
+
+
+_RESAMPLE_PARAMETERS = [
+    TransformationParameter(key="period", type=ParameterType.int, required=True, minimum=1),
+    TransformationParameter(key="start_timestamp", type=ParameterType.int),
+    TransformationParameter(key="end_timestamp", type=ParameterType.int),
+]
+
+BUILTIN_TRANSFORMATIONS = [
+    *[TransformationSpec(name=name,
+                         target="time_series.transformation.TimeSeriesTransformationResample:"
+                                "TimeSeriesTransformationResample",
+                         parameters=_RESAMPLE_PARAMETERS,
+                         options={"transformation_name": name})
+      for name in (TransformationType.RESAMPLE_NEAREST, TransformationType.RESAMPLE_MEAN,
+                   TransformationType.RESAMPLE_LINEAR, TransformationType.RESAMPLE_LAST)],
+    TransformationSpec(name=TransformationType.QUADRANTS,
+                       target="time_series.transformation.TimeSeriesTransformationQuadrants:"
+                              "TimeSeriesTransformationQuadrants",
+                       parameters=[
+                           TransformationParameter(key="origin_x", type=ParameterType.float),
+                           TransformationParameter(key="origin_y", type=ParameterType.float),
+                           TransformationParameter(key="join", choices=[JoinType.inner, JoinType.asof]),
+                           TransformationParameter(key="tolerance", type=ParameterType.int, minimum=0),
+                       ]),
+    TransformationSpec(name=TransformationType.ROLLING,
+                       target="time_series.transformation.TimeSeriesTransformationRolling:"
+                              "TimeSeriesTransformationRolling",
+                       parameters=[
+                           TransformationParameter(key="function", choices=[function for function in RollingFunction]),
+                           TransformationParameter(key="window", type=ParameterType.int, minimum=1),
+                           TransformationParameter(key="duration", type=ParameterType.int, minimum=1),
+                       ]),
+]
+
+
+class TimeSeriesTransformationRegistry:
+    """
+    Registry of time series transformations. Besides built-in transformations it discovers specs of transformations
+    from entry points of installed packages and from configured modules, on first use.
+
+    """
+
+    def __init__(self, specs: Optional[List[TransformationSpec]] = None):
+        self.specs = {spec.name: spec for spec in (specs if specs is not None else BUILTIN_TRANSFORMATIONS)}
+        self.implementations = {}
+        self.discovered = False
+        self.discover_lock = threading.Lock()
+
+    def register(self, spec: TransformationSpec):
+        """
+        Register transformation, replacing registered transformation with the same name
+        """
+        self.specs[spec.name] = spec
+        self.implementations.pop(spec.name, None)
+
+    def discover(self):
+        """
+        Register transformations from entry points and configured modules, only once. Concurrent first requests
+        wait until discovery finishes, and discovery which failed is tried again on next use.
+        """
+        if self.discovered:
+            return
+        with self.discover_lock:
+            if self.discovered:
+                return
+            entry_points = importlib.metadata.entry_points()
+            group = transformation_config.transformation_entry_point_group
+            entry_points = entry_points.select(group=group) if hasattr(entry_points, "select") \
+                else entry_points.get(group, [])
+            loaded = [entry_point.load() for entry_point in entry_points]
+            loaded += [importlib.import_module(module).TRANSFORMATIONS
+                       for module in transformation_config.transformation_modules]
+            for specs in loaded:
+                for spec in (specs if isinstance(specs, (list, tuple)) else [specs]):
+                    self.register(spec)
+            self.discovered = True
+
+    def get_spec(self, transformation_name: str):
+        """
+        Get spec of registered transformation
+
+        Raises:
+            Exception: transformation is unknown
+        """
+        self.discover()
+        spec = self.specs.get(transformation_name)
+        if spec is None:
+            raise Exception(f"transformation {transformation_name} is unknown")
+        return spec
+
+    def get_transformation(self, transformation_name: str):
+        """
+        Create transformation, its implementation is imported on first use
+
+        Args:
+            transformation_name (str): Name of transformation
+
+        Returns:
+            New time series transformation object
+        """
+        spec = self.get_spec(transformation_name)
+        implementation = self.implementations.get(transformation_name)
+        if implementation is None:
+            module_name, attribute_name = spec.target.split(":")
+            implementation = getattr(importlib.import_module(module_name), attribute_name)
+            self.implementations[transformation_name] = implementation
+        return implementation(**spec.options)
+
+    def validate_parameters(self, transformation_name: str, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Check additional properties against declared parameters of transformation, without importing it.
+        Properties without declared parameter are allowed.
+
+        Raises:
+            Exception: transformation is unknown or parameters are invalid
+        """
+        spec = self.get_spec(transformation_name)
+        values = {additional_property.key: additional_property.value
+                  for additional_property in additional_properties or []}
+        errors = []
+        for parameter in spec.parameters:
+            value = values.get(parameter.key)
+            if value is None:
+                if parameter.required:
+                    errors.append(f"{parameter.key} additional parameter is required")
+                continue
+            if parameter.type != ParameterType.str:
+                try:
+                    value = int(value) if parameter.type == ParameterType.int else float(value)
+                except ValueError:
+                    errors.append(f"{parameter.key} additional parameter should be {parameter.type.value}")
+                    continue
+                if parameter.minimum is not None and value < parameter.minimum:
+                    errors.append(f"{parameter.key} additional parameter should be at least {parameter.minimum:g}")
+            if parameter.choices is not None and str(value) not in parameter.choices:
+                errors.append(f"{parameter.key} additional parameter should be one of {', '.join(parameter.choices)}")
+        if len(errors) > 0:
+            raise Exception(f"invalid parameters of transformation {transformation_name}: {'; '.join(errors)}")
+
+
+transformation_registry = TimeSeriesTransformationRegistry()
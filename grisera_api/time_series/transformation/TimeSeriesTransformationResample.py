@@ -1,7 +1,12 @@
 from typing import List, Optional
 
+import numpy as np
+
 from property.property_model import PropertyIn
-from time_series.ts_helpers import get_node_property, get_additional_parameter
+from time_series.ts_alignment import signal_timestamps, signal_value_values
+from time_series.ts_downsampling import numeric_signals_order
+from time_series.ts_helpers import get_additional_parameter
+from time_series.ts_lineage import SignalValuesLineage
 from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
     SignalValueNodesIn
 from time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
@@ -9,16 +14,26 @@ from time_series.transformation.TimeSeriesTransformation import TimeSeriesTransf
 
 class TimeSeriesTransformationResample(TimeSeriesTransformation):
     """
-    Class with logic of time series resampling transformation
+    Class with logic of time series resampling transformations
 
+    Attributes:
+        transformation_name (TransformationType): One of resample transformations
     """
 
+    source_time_series_count = 1
+
+    def __init__(self, transformation_name: TransformationType = TransformationType.RESAMPLE_NEAREST):
+        self.transformation_name = transformation_name
+
     def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
         """
         Transform time series data.
 
         Get signal values with new sampling period.
-        This transformation will find the nearest signal value including values in the future.
+        resample_nearest finds the nearest signal value including values in the future. resample_mean gets mean
+        and resample_last the last of signal values in each period starting with new timestamp, periods without
+        signal values are skipped. resample_linear interpolates signal values between the nearest earlier and
+        later signal values. Only resample_nearest converts values to integers.
 
         Args:
             time_series (List[TimeSeriesOut]): Time series to be transformed
@@ -36,48 +51,150 @@ class TimeSeriesTransformationResample(TimeSeriesTransformation):
         start_timestamp = get_additional_parameter(additional_properties, "start_timestamp")
         end_timestamp = get_additional_parameter(additional_properties, "end_timestamp")
 
-        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
-        end_timestamp = int(end_timestamp) if end_timestamp is not None else (period + int(
-            get_node_property(time_series[0].signal_values[-1]["timestamp"], end_timestamp_label)))
-
         if additional_properties is None:
             additional_properties = []
-        additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.RESAMPLE_NEAREST))
-
-        new_signal_values = []
-        new_signal_values_id_mapping = []
-        current_time = start_timestamp
-        current_signal_value_index = 0
-        if len(time_series[0].signal_values) > 0:
-            while current_time < end_timestamp:
-                # For current timestamp find first signal value with greater or equal begin timestamp value
-                # If not found, return last signal value
-                while current_signal_value_index + 1 < len(time_series[0].signal_values) and \
-                        int(get_node_property(time_series[0].signal_values[current_signal_value_index]["timestamp"],
-                                              begin_timestamp_label)) < current_time:
-                    current_signal_value_index += 1
-                new_signal_value_index = current_signal_value_index
-                if current_signal_value_index > 0:
-                    # Get timestamps of found signal value (mostly greater or equal current_time)
-                    # and preceding signal value (less than current_time)
-                    after_signal_value_timestamp = int(
-                        get_node_property(time_series[0].signal_values[current_signal_value_index]["timestamp"],
-                                          begin_timestamp_label))
-                    before_signal_value_timestamp = int(
-                        get_node_property(time_series[0].signal_values[current_signal_value_index - 1]["timestamp"],
-                                          end_timestamp_label))
-                    # Determine which of two signal values is nearer
-                    if abs(current_time - before_signal_value_timestamp) <= abs(
-                            after_signal_value_timestamp - current_time):
-                        new_signal_value_index = current_signal_value_index - 1
-                new_signal_values.append(SignalIn(signal_value=SignalValueNodesIn(value=int(
-                    get_node_property(time_series[0].signal_values[new_signal_value_index]["signal_value"], "value"))),
-                    timestamp=current_time))
-                new_signal_values_id_mapping.append(
-                    [time_series[0].signal_values[new_signal_value_index]["signal_value"]["id"]])
-                current_time += period
-
-        return TimeSeriesIn(type=Type.timestamp,
-                            additional_properties=additional_properties,
-                            signal_values=new_signal_values
-                            ), new_signal_values_id_mapping
+        additional_properties.append(PropertyIn(key="transformation_name", value=self.transformation_name))
+
+        signal_values = time_series[0].signal_values
+        if len(signal_values) == 0:
+            return TimeSeriesIn(type=Type.timestamp, additional_properties=additional_properties), []
+        assert period > 0, "period additional parameter should be positive"
+
+        start_timestamp = int(start_timestamp) if start_timestamp is not None else 0
+        end_timestamp = int(end_timestamp) if end_timestamp is not None else \
+            period + int(signal_timestamps(signal_values[-1:], end_timestamp_label)[0])
+        new_timestamps = np.arange(start_timestamp, end_timestamp, period, dtype=np.int64)
+        if self.transformation_name != TransformationType.RESAMPLE_NEAREST:
+            return self.transform_numeric(signal_values, begin_timestamp_label, new_timestamps, period,
+                                          additional_properties)
+
+        begin_timestamps = signal_timestamps(signal_values, begin_timestamp_label)
+        end_timestamps = signal_timestamps(signal_values, end_timestamp_label)
+        new_signal_value_indices = nearest_signal_indices(begin_timestamps, end_timestamps, new_timestamps)
+
+        # values are parsed only for selected signal values, new signals selecting the same signal value share it
+        selected_indices = np.unique(new_signal_value_indices).tolist()
+        selected_values = signal_value_values([signal_values[index] for index in selected_indices])
+        values = {index: SignalValueNodesIn.construct(value=str(int(value)), additional_properties=None)
+                  for index, value in zip(selected_indices, selected_values)}
+        new_signal_values = [
+            SignalIn.construct(timestamp=timestamp, start_timestamp=None, end_timestamp=None,
+                               signal_value=values[index])
+            for timestamp, index in zip(new_timestamps.tolist(), new_signal_value_indices.tolist())]
+        new_signal_values_id_mapping = [[signal_values[index]["signal_value"]["id"]]
+                                        for index in new_signal_value_indices.tolist()]
+
+        new_time_series = TimeSeriesIn(type=Type.timestamp, additional_properties=additional_properties)
+        # signal values are already valid, so they are not validated again
+        new_time_series.signal_values = new_signal_values
+        return new_time_series, new_signal_values_id_mapping
+
+    def transform_numeric(self, signal_values: list, timestamp_label: str, new_timestamps: np.ndarray, period: int,
+                          additional_properties: List[PropertyIn]):
+        """
+        Resample numeric signal values with mean, last or linear method. Signal values with non-numeric values
+        are skipped.
+
+        Args:
+            signal_values (list): Signal values of time series
+            timestamp_label (str): Label of (start) timestamps of signal values
+            new_timestamps (np.ndarray): Ordered timestamps of new signals
+            period (int): Difference between new timestamps
+            additional_properties (List[PropertyIn]): Transformation parameters
+
+        Returns:
+            New time series object and lineage of its signal values
+        """
+        order, timestamps, values = numeric_signals_order(signal_timestamps(signal_values, timestamp_label),
+                                                          signal_value_values(signal_values))
+        if self.transformation_name == TransformationType.RESAMPLE_LINEAR:
+            new_timestamps, new_values, starts, ends = interpolated_signals(timestamps, values, new_timestamps)
+        else:
+            new_timestamps, starts, ends = period_signal_ranges(timestamps, new_timestamps, period)
+            if self.transformation_name == TransformationType.RESAMPLE_MEAN:
+                sums = np.concatenate([[0.0], np.cumsum(values)])
+                new_values = (sums[ends + 1] - sums[starts]) / (ends - starts + 1)
+            else:
+                new_values = values[ends]
+                starts = ends
+
+        new_signal_values = [
+            SignalIn.construct(timestamp=timestamp, start_timestamp=None, end_timestamp=None,
+                               signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+            for timestamp, value in zip(new_timestamps.tolist(), new_values.tolist())]
+        new_signal_values_lineage = SignalValuesLineage(
+            [signal_values[index]["signal_value"].get("id") for index in order.tolist()], starts, ends)
+
+        new_time_series = TimeSeriesIn(type=Type.timestamp, additional_properties=additional_properties)
+        # signal values are already valid, so they are not validated again
+        new_time_series.signal_values = new_signal_values
+        return new_time_series, new_signal_values_lineage
+
+    def tail_window(self, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Mean and last signal of period depend only on signals in period starting with its timestamp, nearest and
+        interpolated signals may depend on arbitrarily old signals
+        """
+        if self.transformation_name in (TransformationType.RESAMPLE_NEAREST, TransformationType.RESAMPLE_LINEAR):
+            return None
+        return int(get_additional_parameter(additional_properties, "period")), 0
+
+
+def period_signal_ranges(timestamps: np.ndarray, new_timestamps: np.ndarray, period: int):
+    """
+    Find ranges of ordered signals with timestamps in period starting with each of new timestamps
+
+    Returns:
+        Tuple of arrays of new timestamps with at least one signal in period and indices of the first and the last
+        signal in each of their periods
+    """
+    starts = np.searchsorted(timestamps, new_timestamps, side="left")
+    ends = np.searchsorted(timestamps, new_timestamps + period, side="left") - 1
+    non_empty = ends >= starts
+    return new_timestamps[non_empty], starts[non_empty], ends[non_empty]
+
+
+def interpolated_signals(timestamps: np.ndarray, values: np.ndarray, new_timestamps: np.ndarray):
+    """
+    Linearly interpolate ordered signals at new timestamps between the first and the last signal timestamp
+
+    Returns:
+        Tuple of arrays of new timestamps within signals, interpolated values and indices of the earlier and
+        the later signal used for interpolation
+    """
+    if len(timestamps) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0, dtype=np.float64), empty, empty
+    new_timestamps = new_timestamps[(new_timestamps >= timestamps[0]) & (new_timestamps <= timestamps[-1])]
+    ends = np.minimum(np.searchsorted(timestamps, new_timestamps, side="right"), len(timestamps) - 1)
+    starts = np.maximum(ends - 1, 0)
+    # signal with timestamp equal to new timestamp is used alone
+    exact = timestamps[starts] == new_timestamps
+    exact_ends = timestamps[ends] == new_timestamps
+    starts = np.where(exact_ends, ends, starts)
+    ends = np.where(exact & ~exact_ends, starts, ends)
+    return new_timestamps, np.interp(new_timestamps, timestamps, values), starts, ends
+
+
+def nearest_signal_indices(begin_timestamps: np.ndarray, end_timestamps: np.ndarray, timestamps: np.ndarray):
+    """
+    For each of ordered timestamps find index of the nearest signal. The first signal with begin timestamp
+    greater or equal to given timestamp is compared with the preceding signal, distance to which is measured
+    from its end timestamp, and the preceding one is chosen in case of a tie. If there is no such signal,
+    the last signal is compared with the preceding one.
+
+    Args:
+        begin_timestamps (np.ndarray): (Start) timestamps of signals
+        end_timestamps (np.ndarray): End timestamps of signals, equal to begin timestamps for Timestamp type
+        timestamps (np.ndarray): Ordered timestamps of new signals
+
+    Returns:
+        Array of indices of signals, one for each timestamp
+    """
+    # running maximum makes search equal to forward scan also for signals out of timestamp order
+    after_indices = np.searchsorted(np.maximum.accumulate(begin_timestamps), timestamps, side="left")
+    after_indices = np.minimum(after_indices, len(begin_timestamps) - 1)
+    before_indices = np.maximum(after_indices - 1, 0)
+    before_is_nearer = (after_indices > 0) & (
+        np.abs(timestamps - end_timestamps[before_indices]) <= np.abs(begin_timestamps[after_indices] - timestamps))
+    return np.where(before_is_nearer, before_indices, after_indices)
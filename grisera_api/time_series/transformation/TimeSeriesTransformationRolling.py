@@ -0,0 +1,215 @@
+import heapq
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+from property.property_model import PropertyIn
+from time_series.ts_alignment import signal_timestamps, signal_value_values
+from time_series.ts_downsampling import numeric_signals_order
+from time_series.ts_helpers import get_additional_parameter
+from time_series.ts_lineage import SignalValuesLineage
+from time_series.time_series_model import TimeSeriesOut, TimeSeriesIn, Type, SignalIn, TransformationType, \
+    SignalValueNodesIn, RollingFunction
+from time_series.transformation.TimeSeriesTransformation import TimeSeriesTransformation
+
+
+class TimeSeriesTransformationRolling(TimeSeriesTransformation):
+    """
+    Class with logic of time series rolling window aggregation transformation
+
+    """
+
+    source_time_series_count = 1
+
+    def transform(self, time_series: List[TimeSeriesOut], additional_properties: Optional[List[PropertyIn]]):
+        """
+        Transform time series data.
+
+        Get aggregated values of trailing windows of signal values. Window of each signal value ends with it and
+        contains at most window preceding signal values or signal values not older than duration.
+        Signal values with non-numeric values are skipped.
+
+        Args:
+            time_series (List[TimeSeriesOut]): Time series to be transformed
+            additional_properties (Optional[List[PropertyIn]]): Transformation parameters
+
+        Returns:
+            New time series object and lineage of its signal values
+        """
+        assert len(time_series) == 1, "Number of time series should equals 1 for rolling transformation"
+        function = get_additional_parameter(additional_properties, "function")
+        function = RollingFunction(function) if function is not None else RollingFunction.mean
+        window = get_additional_parameter(additional_properties, "window")
+        duration = get_additional_parameter(additional_properties, "duration")
+        assert (window is None) != (duration is None), \
+            "exactly one of window and duration additional parameters is required"
+        window = int(window) if window is not None else None
+        duration = int(duration) if duration is not None else None
+        assert (window or duration or 0) > 0, "window and duration additional parameters should be positive"
+
+        if additional_properties is None:
+            additional_properties = []
+        additional_properties.append(PropertyIn(key="transformation_name", value=TransformationType.ROLLING))
+
+        signal_values = time_series[0].signal_values
+        is_epoch = time_series[0].type != Type.timestamp
+        timestamp_label = "start_timestamp" if is_epoch else "timestamp"
+        order, timestamps, values = numeric_signals_order(signal_timestamps(signal_values, timestamp_label),
+                                                          signal_value_values(signal_values))
+        starts = window_starts(timestamps, window, duration)
+        aggregated_values = rolling_aggregate(values, starts, function).tolist()
+
+        end_timestamps = signal_timestamps(signal_values, "end_timestamp")[order].tolist() if is_epoch \
+            else [None] * len(order)
+        new_signal_values = [
+            SignalIn.construct(timestamp=None if is_epoch else timestamp,
+                               start_timestamp=timestamp if is_epoch else None,
+                               end_timestamp=end_timestamp,
+                               signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+            for timestamp, end_timestamp, value in zip(timestamps.tolist(), end_timestamps, aggregated_values)]
+        new_signal_values_lineage = SignalValuesLineage(
+            [signal_values[index]["signal_value"].get("id") for index in order.tolist()],
+            starts, np.arange(len(order)))
+
+        new_time_series = TimeSeriesIn(type=time_series[0].type, additional_properties=additional_properties)
+        # signal values are already valid, so they are not validated again
+        new_time_series.signal_values = new_signal_values
+        return new_time_series, new_signal_values_lineage
+
+    def tail_window(self, additional_properties: Optional[List[PropertyIn]]):
+        """
+        Windows with duration depend only on signals not older than duration, windows with number of signals may
+        reach arbitrarily old signals
+        """
+        duration = get_additional_parameter(additional_properties, "duration")
+        return (0, int(duration)) if duration is not None else None
+
+
+def window_starts(timestamps: np.ndarray, window: Optional[int] = None, duration: Optional[int] = None):
+    """
+    Get index of the first signal of trailing window of each of ordered signals. Window contains at most window
+    signals or signals with timestamp greater than timestamp of the last signal minus duration.
+
+    Returns:
+        Non-decreasing array of indices
+    """
+    if window is not None:
+        return np.maximum(np.arange(len(timestamps)) - window + 1, 0)
+    return np.searchsorted(timestamps, timestamps - duration, side="right")
+
+
+def rolling_aggregate(values: np.ndarray, starts: np.ndarray, function: RollingFunction):
+    """
+    Aggregate values in windows from starts to each index. Mean is computed from running sums, standard deviation
+    with Welford updates as signals enter and leave window, minimum and maximum with monotonic deque, all in O(n).
+    Median keeps window in two heaps with lazy removal, which costs O(log n) per signal.
+
+    Args:
+        values (np.ndarray): Values of ordered signals
+        starts (np.ndarray): Non-decreasing indices of the first signal of window of each signal
+        function (RollingFunction): Aggregation function
+
+    Returns:
+        Array of aggregated values
+    """
+    if len(values) == 0:
+        return values
+    if function == RollingFunction.mean:
+        # sums of values shifted by their mean lose less precision
+        offset = values.mean()
+        ends = np.arange(1, len(values) + 1)
+        sums = np.concatenate([[0.0], np.cumsum(values - offset)])
+        return (sums[ends] - sums[starts]) / (ends - starts) + offset
+    if function == RollingFunction.std:
+        return _rolling_std(values.tolist(), starts.tolist())
+    if function == RollingFunction.median:
+        return _rolling_median(values.tolist(), starts.tolist())
+    if function == RollingFunction.min:
+        return -_rolling_max((-values).tolist(), starts.tolist())
+    return _rolling_max(values.tolist(), starts.tolist())
+
+
+def _rolling_std(values: list, starts: list):
+    count, mean, squares = 0, 0.0, 0.0
+    first = 0
+    result = []
+    for end, (value, start) in enumerate(zip(values, starts)):
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        squares += delta * (value - mean)
+        while first < start:
+            count -= 1
+            if count == 1:
+                # single remaining signal is used as new anchor, so rounding errors do not accumulate
+                mean, squares = values[end], 0.0
+            else:
+                delta = values[first] - mean
+                mean -= delta / count
+                squares -= delta * (values[first] - mean)
+            first += 1
+        result.append(max(squares, 0.0) / count)
+    return np.sqrt(np.asarray(result, dtype=np.float64))
+
+
+def _rolling_max(values: list, starts: list):
+    window = deque()
+    result = []
+    for end, (value, start) in enumerate(zip(values, starts)):
+        # indices in deque have decreasing values, so the first one is maximum of window
+        while window and values[window[-1]] <= value:
+            window.pop()
+        window.append(end)
+        while window[0] < start:
+            window.popleft()
+        result.append(values[window[0]])
+    return np.asarray(result, dtype=np.float64)
+
+
+def _rolling_median(values: list, starts: list):
+    # lower half of window is kept in max heap and upper half in min heap, both as (value, index) pairs;
+    # signals leaving window are only counted out and dropped when they reach top of their heap
+    lower, upper = [], []
+    in_lower = [False] * len(values)
+    lower_size, upper_size = 0, 0
+    result = []
+    previous_start = 0
+
+    def prune(start):
+        while lower and lower[0][1] < start:
+            heapq.heappop(lower)
+        while upper and upper[0][1] < start:
+            heapq.heappop(upper)
+
+    for end, (value, start) in enumerate(zip(values, starts)):
+        for index in range(previous_start, start):
+            if in_lower[index]:
+                lower_size -= 1
+            else:
+                upper_size -= 1
+        previous_start = start
+        prune(start)
+        if lower and value <= -lower[0][0]:
+            heapq.heappush(lower, (-value, end))
+            in_lower[end] = True
+            lower_size += 1
+        else:
+            heapq.heappush(upper, (value, end))
+            upper_size += 1
+        while lower_size > upper_size + 1:
+            moved_value, index = heapq.heappop(lower)
+            heapq.heappush(upper, (-moved_value, index))
+            in_lower[index] = False
+            lower_size -= 1
+            upper_size += 1
+            prune(start)
+        while upper_size > lower_size:
+            moved_value, index = heapq.heappop(upper)
+            heapq.heappush(lower, (-moved_value, index))
+            in_lower[index] = True
+            upper_size -= 1
+            lower_size += 1
+            prune(start)
+        result.append(-lower[0][0] if lower_size > upper_size else (upper[0][0] - lower[0][0]) / 2)
+    return np.asarray(result, dtype=np.float64)
@@ -1,24 +1,34 @@
-from typing import List
+from typing import List, Optional, Callable
 
-from time_series.ts_helpers import get_node_property
-from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesMultidimensionalOut
+from time_series.ts_alignment import signal_timestamps, align
+from time_series.time_series_model import TimeSeriesOut, Type, TimeSeriesMultidimensionalOut, JoinType
 
 
 class TimeSeriesTransformationMultidimensional:
     """
     Class with logic of time series multidimensional transformation
 
+    Attributes:
+        aligner (Callable): Function aligning signals of time series, with the same arguments as ts_alignment.align
     """
 
-    def transform(self, time_series: List[TimeSeriesOut]):
+    def __init__(self, aligner: Callable = align):
+        self.aligner = aligner
+
+    def transform(self, time_series: List[TimeSeriesOut], join: JoinType = JoinType.inner,
+                  tolerance: Optional[int] = None):
         """
         Transform time series data.
 
         Get signal values lists grouped by timestamp values.
-        This transformation will ignore all signal values which timestamps will not be equal.
+        Inner join ignores all signal values which timestamps will not be equal (or within tolerance) in all
+        time series, as-of join groups signal values of the first time series with the latest earlier signal values
+        of other time series, outer join keeps all signal values and missing ones are null.
 
         Args:
             time_series (List[TimeSeriesOut]): Time series to be transformed
+            join (JoinType): Type of join of signal values
+            tolerance (Optional[int]): Maximal distance between timestamps of grouped signal values
 
         Returns:
             New time series object
@@ -27,41 +37,27 @@ class TimeSeriesTransformationMultidimensional:
         for i in range(1, len(time_series)):
             assert time_series[0].type == time_series[i].type, "Time series types should be equal"
 
-        new_signal_values = []
-        current_signal_value_rest_indexes = [0] * len(time_series)
-        timestamp_label = "timestamp" if time_series[0].type == Type.timestamp else "start_timestamp"
-        # Iterate over all X signal values
-        for current_signal_value_x in time_series[0].signal_values:
-            match = True
-            signal_values = [current_signal_value_x["signal_value"]]
-            for i in range(1, len(time_series)):
-                # For current X signal value find first Y, Z and other signal values with greater or equal timestamp
-                # value
-                # If not found, return not existing indexes
-                while current_signal_value_rest_indexes[i] < len(time_series[i].signal_values) and \
-                        int(get_node_property(
-                            time_series[i].signal_values[current_signal_value_rest_indexes[i]]["timestamp"],
-                            timestamp_label)) < int(
-                    get_node_property(current_signal_value_x["timestamp"], timestamp_label)):
-                    current_signal_value_rest_indexes[i] += 1
-                # Check if X, Y, Z and other signal timestamps are the same
-                if current_signal_value_rest_indexes[i] < len(time_series[1].signal_values) and \
-                        get_node_property(current_signal_value_x["timestamp"], "timestamp") == get_node_property(
-                    time_series[i].signal_values[current_signal_value_rest_indexes[i]]["timestamp"], "timestamp") and \
-                        get_node_property(current_signal_value_x["timestamp"], "start_timestamp") == get_node_property(
-                    time_series[i].signal_values[current_signal_value_rest_indexes[i]]["timestamp"],
-                    "start_timestamp") and \
-                        get_node_property(current_signal_value_x["timestamp"], "end_timestamp") == get_node_property(
-                    time_series[i].signal_values[current_signal_value_rest_indexes[i]]["timestamp"], "end_timestamp"):
-                    signal_values.append(
-                        time_series[i].signal_values[current_signal_value_rest_indexes[i]]["signal_value"])
-                else:
-                    match = False
-                    break
-            if match:
-                new_signal_values.append({
-                    "timestamp": current_signal_value_x["timestamp"],
-                    "signal_values": signal_values
-                })
+        is_epoch = time_series[0].type != Type.timestamp
+        timestamp_label = "start_timestamp" if is_epoch else "timestamp"
+        timestamps = [signal_timestamps(series.signal_values, timestamp_label) for series in time_series]
+        end_timestamps = [signal_timestamps(series.signal_values, "end_timestamp") for series in time_series] \
+            if is_epoch else None
+        indices, sources = self.aligner(timestamps, join, tolerance, end_timestamps)
+
+        signal_values = [[series.signal_values[index]["signal_value"] if index >= 0 else None
+                          for index in series_indices]
+                         for series, series_indices in zip(time_series, indices.tolist())]
+        timestamp_keys = [key for key in ("timestamp", "start_timestamp", "end_timestamp")
+                          if any(len(series.signal_values) > 0 and key in series.signal_values[0]
+                                 for series in time_series)]
+        source_signal_values = [time_series[source].signal_values[indices[source, row]]
+                                for row, source in enumerate(sources.tolist())]
+        new_signal_values = [
+            {
+                **{key: source_signal_value[key] for key in timestamp_keys},
+                "signal_values": list(row_signal_values)
+            }
+            for source_signal_value, row_signal_values in zip(source_signal_values, zip(*signal_values))
+        ]
 
         return TimeSeriesMultidimensionalOut(type=time_series[0].type, signal_values=new_signal_values)
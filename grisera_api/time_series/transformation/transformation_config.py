@@ -0,0 +1,24 @@
+# parameters of time series transformations
+import os
+
+# comma separated modules with TRANSFORMATIONS list of TransformationSpec registered in addition to built-in ones
+transformation_modules = [module.strip() for module in (os.environ.get("TRANSFORMATION_MODULES") or "").split(",")
+                          if module.strip()]
+
+# group of entry points of installed packages pointing to TransformationSpec or list of them
+transformation_entry_point_group = os.environ.get("TRANSFORMATION_ENTRY_POINT_GROUP") or "grisera.transformations"
+
+# number of processes transforming time series, 0 transforms them in the process handling request
+transformation_pool_size = int(os.environ.get("TRANSFORMATION_POOL_SIZE") or min(os.cpu_count() or 1, 4))
+
+# maximal number of transformations waiting for or running in the pool, further ones are rejected
+transformation_queue_depth = int(os.environ.get("TRANSFORMATION_QUEUE_DEPTH") or 16)
+
+# time series with less signals in total are transformed in the process handling request
+transformation_pool_min_signals = int(os.environ.get("TRANSFORMATION_POOL_MIN_SIGNALS") or 10000)
+
+# maximal number of cached transformation results, 0 disables the cache
+transformation_cache_entries = int(os.environ.get("TRANSFORMATION_CACHE_ENTRIES") or 128)
+
+# maximal total number of signal values in cached transformation results
+transformation_cache_signals = int(os.environ.get("TRANSFORMATION_CACHE_SIGNALS") or 1000000)
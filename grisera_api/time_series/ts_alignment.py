@@ -0,0 +1,236 @@
+from typing import List, Optional
+
+import numpy as np
+
+from time_series.time_series_model import JoinType
+from time_series.ts_helpers import get_node_property
+
+
+def signal_timestamps(signal_values: list, timestamp_label: str):
+    """
+    Get array of (start or end) timestamps of signal values. Signal values read from graph keep timestamp node
+    under timestamp label, signal values read from mongo keep timestamp number. Signal values with single
+    timestamp node containing both start_timestamp and end_timestamp properties are also supported.
+
+    Args:
+        signal_values (list): Signal values of time series
+        timestamp_label (str): One of timestamp, start_timestamp and end_timestamp
+
+    Returns:
+        Array of timestamps
+    """
+    if len(signal_values) == 0:
+        return np.empty(0, dtype=np.int64)
+    timestamp = signal_values[0].get(timestamp_label)
+    if timestamp is None:
+        timestamps = [get_node_property(signal_value["timestamp"], timestamp_label) for signal_value in signal_values]
+    elif isinstance(timestamp, dict):
+        timestamps = [get_node_property(signal_value[timestamp_label], "timestamp") for signal_value in signal_values]
+    else:
+        timestamps = [signal_value[timestamp_label] for signal_value in signal_values]
+    return np.asarray(timestamps, dtype=np.int64)
+
+
+def signal_value_values(signal_values: list):
+    """
+    Get list of values of signal values read from graph (signal value nodes) or from mongo (dicts with value)
+    """
+    if len(signal_values) > 0 and "properties" not in signal_values[0]["signal_value"]:
+        return [signal_value["signal_value"]["value"] for signal_value in signal_values]
+    return [get_node_property(signal_value["signal_value"], "value") for signal_value in signal_values]
+
+
+def _ordered(timestamps: np.ndarray):
+    """
+    Get order of timestamps and ordered timestamps, sorting is skipped for already ordered timestamps
+    """
+    if len(timestamps) < 2 or np.all(timestamps[1:] >= timestamps[:-1]):
+        order = np.arange(len(timestamps))
+        return order, timestamps
+    order = np.argsort(timestamps, kind="stable")
+    return order, timestamps[order]
+
+
+def _nearest_positions(ordered_timestamps: np.ndarray, timestamps: np.ndarray, tolerance: int):
+    """
+    For each of timestamps find position of the nearest of ordered timestamps, the earlier one in case of a tie
+
+    Returns:
+        Tuple of arrays of positions and of flags if the nearest timestamp is within tolerance
+    """
+    positions = np.searchsorted(ordered_timestamps, timestamps, side="left")
+    before = np.maximum(positions - 1, 0)
+    after = np.minimum(positions, len(ordered_timestamps) - 1)
+    before_distances = np.abs(timestamps - ordered_timestamps[before])
+    after_distances = np.abs(ordered_timestamps[after] - timestamps)
+    before_is_nearer = (positions > 0) & (before_distances <= after_distances)
+    positions = np.where(before_is_nearer, before, after)
+    return positions, np.where(before_is_nearer, before_distances, after_distances) <= tolerance
+
+
+def align_exact(timestamps: List[np.ndarray], end_timestamps: Optional[List[np.ndarray]] = None):
+    """
+    Align signals of K time series by equal timestamps. Each signal of the first time series, in timestamp order,
+    is matched with the first signal of each other time series with the same timestamp (and end timestamp).
+
+    Args:
+        timestamps (List[np.ndarray]): (Start) timestamps of signals of each time series
+        end_timestamps (Optional[List[np.ndarray]]): End timestamps of signals of each time series, None for
+            signals of type Timestamp
+
+    Returns:
+        Array of shape (K, signals of the first time series) with indices of matched signals, -1 where there is
+        no matching signal
+    """
+    first_order, first_timestamps = _ordered(timestamps[0])
+    indices = np.full((len(timestamps), len(first_order)), -1, dtype=np.int64)
+    indices[0] = first_order
+    for series_index in range(1, len(timestamps)):
+        if len(timestamps[series_index]) == 0:
+            continue
+        order, ordered_timestamps = _ordered(timestamps[series_index])
+        positions = np.minimum(np.searchsorted(ordered_timestamps, first_timestamps, side="left"), len(order) - 1)
+        matched = ordered_timestamps[positions] == first_timestamps
+        matched_indices = order[positions]
+        if end_timestamps is not None:
+            matched &= end_timestamps[series_index][matched_indices] == end_timestamps[0][first_order]
+        indices[series_index] = np.where(matched, matched_indices, -1)
+    return indices
+
+
+def align_nearest(timestamps: List[np.ndarray], tolerance: int):
+    """
+    Align signals of K time series by the nearest timestamps. Each signal of the first time series, in timestamp
+    order, is matched with the signal of each other time series with the nearest timestamp, if their distance does
+    not exceed tolerance. Signal of other time series may be matched with several signals of the first one.
+
+    Args:
+        timestamps (List[np.ndarray]): (Start) timestamps of signals of each time series
+        tolerance (int): Maximal distance between timestamps of matched signals
+
+    Returns:
+        Array of shape (K, signals of the first time series) with indices of matched signals, -1 where there is
+        no matching signal
+    """
+    first_order, first_timestamps = _ordered(timestamps[0])
+    indices = np.full((len(timestamps), len(first_order)), -1, dtype=np.int64)
+    indices[0] = first_order
+    for series_index in range(1, len(timestamps)):
+        if len(timestamps[series_index]) == 0:
+            continue
+        order, ordered_timestamps = _ordered(timestamps[series_index])
+        positions, matched = _nearest_positions(ordered_timestamps, first_timestamps, tolerance)
+        indices[series_index] = np.where(matched, order[positions], -1)
+    return indices
+
+
+def align_asof(timestamps: List[np.ndarray], tolerance: Optional[int] = None):
+    """
+    Align signals of K time series as of timestamps of the first time series. Each signal of the first time series,
+    in timestamp order, is matched with the latest signal of each other time series with timestamp not greater
+    than its timestamp and, if tolerance is given, not earlier than its timestamp minus tolerance.
+
+    Args:
+        timestamps (List[np.ndarray]): (Start) timestamps of signals of each time series
+        tolerance (Optional[int]): Maximal distance between timestamps of matched signals
+
+    Returns:
+        Array of shape (K, signals of the first time series) with indices of matched signals, -1 where there is
+        no matching signal
+    """
+    first_order, first_timestamps = _ordered(timestamps[0])
+    indices = np.full((len(timestamps), len(first_order)), -1, dtype=np.int64)
+    indices[0] = first_order
+    for series_index in range(1, len(timestamps)):
+        if len(timestamps[series_index]) == 0:
+            continue
+        order, ordered_timestamps = _ordered(timestamps[series_index])
+        positions = np.searchsorted(ordered_timestamps, first_timestamps, side="right") - 1
+        matched = positions >= 0
+        positions = np.maximum(positions, 0)
+        if tolerance is not None:
+            matched &= first_timestamps - ordered_timestamps[positions] <= tolerance
+        indices[series_index] = np.where(matched, order[positions], -1)
+    return indices
+
+
+def align_outer(timestamps: List[np.ndarray], tolerance: Optional[int] = None):
+    """
+    Align signals of K time series keeping every signal exactly once. Rows start with signals of the first time
+    series, then each signal of the following time series joins the row with the nearest timestamp within
+    tolerance (exactly equal without tolerance), unless the row already has a nearer signal of the same time
+    series. Remaining signals start new rows.
+
+    Args:
+        timestamps (List[np.ndarray]): (Start) timestamps of signals of each time series
+        tolerance (Optional[int]): Maximal distance between timestamps of signals in the same row
+
+    Returns:
+        Tuple of array of shape (K, rows) with indices of signals, -1 where row has no signal of time series,
+        and array of indices of time series, which signal timestamp is the timestamp of row. Rows are ordered by
+        timestamps.
+    """
+    tolerance = tolerance or 0
+    first_order, row_timestamps = _ordered(timestamps[0])
+    indices = np.full((len(timestamps), len(first_order)), -1, dtype=np.int64)
+    indices[0] = first_order
+    sources = np.zeros(len(first_order), dtype=np.int64)
+    for series_index in range(1, len(timestamps)):
+        order, ordered_timestamps = _ordered(timestamps[series_index])
+        joined = np.zeros(len(order), dtype=bool)
+        if len(row_timestamps) > 0 and len(order) > 0:
+            rows, matched = _nearest_positions(row_timestamps, ordered_timestamps, tolerance)
+            candidates = np.flatnonzero(matched)
+            distances = np.abs(ordered_timestamps[candidates] - row_timestamps[rows[candidates]])
+            # the nearest signal joins each row
+            candidates = candidates[np.lexsort((distances, rows[candidates]))]
+            _, first_candidates = np.unique(rows[candidates], return_index=True)
+            candidates = candidates[first_candidates]
+            indices[series_index, rows[candidates]] = order[candidates]
+            joined[candidates] = True
+        new_rows = np.flatnonzero(~joined)
+        new_indices = np.full((len(timestamps), len(new_rows)), -1, dtype=np.int64)
+        new_indices[series_index] = order[new_rows]
+        row_timestamps = np.concatenate([row_timestamps, ordered_timestamps[new_rows]])
+        indices = np.concatenate([indices, new_indices], axis=1)
+        sources = np.concatenate([sources, np.full(len(new_rows), series_index, dtype=np.int64)])
+        row_order = np.argsort(row_timestamps, kind="stable")
+        row_timestamps, indices, sources = row_timestamps[row_order], indices[:, row_order], sources[row_order]
+    return indices, sources
+
+
+def align(timestamps: List[np.ndarray], join: JoinType = JoinType.inner, tolerance: Optional[int] = None,
+          end_timestamps: Optional[List[np.ndarray]] = None):
+    """
+    Align signals of K time series with given join. Inner join keeps signals of the first time series matched
+    with signals of all other time series with equal timestamps, or the nearest ones within tolerance. As-of
+    join matches them with the latest signals not later than them, within tolerance. Outer join keeps all signals,
+    see align_outer. End timestamps are compared only by inner join without tolerance.
+
+    Args:
+        timestamps (List[np.ndarray]): (Start) timestamps of signals of each time series
+        join (JoinType): Type of join
+        tolerance (Optional[int]): Maximal distance between timestamps of aligned signals
+        end_timestamps (Optional[List[np.ndarray]]): End timestamps of signals of each time series, None for
+            signals of type Timestamp
+
+    Returns:
+        Tuple of array of shape (K, rows) with indices of aligned signals, -1 where row has no signal of time
+        series, and array of indices of time series, which signal timestamp is the timestamp of row
+    """
+    if join == JoinType.outer:
+        return align_outer(timestamps, tolerance)
+    if join == JoinType.asof:
+        indices = complete_rows(align_asof(timestamps, tolerance))
+    elif tolerance:
+        indices = complete_rows(align_nearest(timestamps, tolerance))
+    else:
+        indices = complete_rows(align_exact(timestamps, end_timestamps))
+    return indices, np.zeros(indices.shape[1], dtype=np.int64)
+
+
+def complete_rows(indices: np.ndarray):
+    """
+    Keep only aligned rows with signal of each time series
+    """
+    return indices[:, np.all(indices >= 0, axis=0)]
@@ -0,0 +1,122 @@
+from typing import List
+
+import numpy as np
+
+from time_series.time_series_model import DownsamplingMethod
+
+
+def numeric_signals_order(timestamps: List[int], values: list):
+    """
+    Get indices of signals with numeric values in ascending order of timestamps
+
+    Returns:
+        Tuple of indices, timestamps and values arrays, where timestamps and values are already ordered
+    """
+    try:
+        numeric_values = np.asarray(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        numeric_values = np.array([_to_float(value) for value in values], dtype=np.float64)
+    numeric_indices = np.flatnonzero(np.isfinite(numeric_values))
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    order = numeric_indices[np.argsort(timestamps[numeric_indices], kind="stable")]
+    return order, timestamps[order], numeric_values[order]
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def time_buckets(timestamps: np.ndarray, buckets_count: int):
+    """
+    Assign each of ordered timestamps to one of buckets_count buckets of equal time width
+    """
+    time_range = int(timestamps[-1] - timestamps[0]) + 1
+    return (timestamps - timestamps[0]) * buckets_count // time_range
+
+
+def bucket_boundaries(buckets: np.ndarray):
+    """
+    Get indices of first and last element of each group of equal consecutive buckets
+    """
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:] - 1, len(buckets) - 1]
+    return starts, ends
+
+
+def min_max_indices(timestamps: np.ndarray, values: np.ndarray, max_points: int):
+    """
+    Select signals with minimal and maximal value in each of max_points / 2 time buckets
+
+    Returns:
+        Ordered indices of selected signals
+    """
+    buckets = time_buckets(timestamps, max(max_points // 2, 1))
+    order = np.lexsort((values, buckets))
+    starts, ends = bucket_boundaries(buckets[order])
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+
+def lttb_indices(timestamps: np.ndarray, values: np.ndarray, max_points: int):
+    """
+    Select signals with Largest Triangle Three Buckets algorithm. The first and the last signals are always
+    selected, the remaining ones are split into max_points - 2 buckets of equal size and from each bucket the
+    signal forming the largest triangle with previously selected signal and average of the next bucket is chosen.
+
+    Returns:
+        Ordered indices of selected signals
+    """
+    signals_count = len(timestamps)
+    if signals_count <= max_points:
+        return np.arange(signals_count)
+    if max_points < 3:
+        return np.array([0, signals_count - 1][:max_points], dtype=np.int64)
+    x = timestamps.astype(np.float64)
+    y = values
+    edges = np.linspace(1, signals_count - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = signals_count - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == max_points - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def downsample(timestamps: List[int], values: list, max_points: int, method: DownsamplingMethod):
+    """
+    Reduce number of signals to at most max_points. Signals with non-numeric values are skipped.
+
+    Args:
+        timestamps (List[int]): (Start) timestamps of signals
+        values (list): Values of signals
+        max_points (int): Maximal number of output signals
+        method (DownsamplingMethod): Downsampling method
+
+    Returns:
+        Tuple of arrays (first_indices, last_indices, values). Each output signal represents input signals from
+        first to last index in timestamp order, selection methods represent a single input signal.
+    """
+    order, timestamps, values = numeric_signals_order(timestamps, values)
+    if len(order) == 0:
+        return order, order, values
+    if method == DownsamplingMethod.mean:
+        starts, ends = bucket_boundaries(time_buckets(timestamps, max_points))
+        means = np.add.reduceat(values, starts) / (ends - starts + 1)
+        return order[starts], order[ends], means
+    if method == DownsamplingMethod.min_max:
+        selected = min_max_indices(timestamps, values, max_points)
+    else:
+        selected = lttb_indices(timestamps, values, max_points)
+    return order[selected], order[selected], values[selected]
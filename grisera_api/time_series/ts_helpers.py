@@ -1,6 +1,9 @@
-from typing import Optional, List
+import base64
+import json
+from typing import Optional, List, AsyncIterator
 
 from property.property_model import PropertyIn
+from time_series.time_series_model import SignalColumnsIn, SignalIn, SignalValueNodesIn, TimeSeriesIn, TimeSeriesOut
 
 
 def get_node_property(node, property_key: str):
@@ -11,9 +14,123 @@ def get_node_property(node, property_key: str):
     return None
 
 
+def get_relationship_property(relationship: dict, property_key: str):
+    for relationship_property in relationship.get("properties") or []:
+        if relationship_property["key"] == property_key:
+            return relationship_property["value"]
+    return None
+
+
 def get_additional_parameter(additional_properties: Optional[List[PropertyIn]], key: str):
     if additional_properties is not None:
         for additional_property in additional_properties:
             if additional_property.key == key:
                 return additional_property.value
     return None
+
+
+async def iterate_lines(chunks: AsyncIterator[bytes]):
+    """
+    Split asynchronous stream of bytes chunks into decoded lines. Empty lines are skipped.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line.decode("utf-8")
+    if buffer.strip():
+        yield buffer.decode("utf-8")
+
+
+def signal_columns_to_signal_values(signal_columns: SignalColumnsIn):
+    """
+    Convert signals in columnar format to list of signals. Models are constructed without validation,
+    as columns were already validated.
+    """
+    if signal_columns.timestamps is not None:
+        return [SignalIn.construct(timestamp=timestamp,
+                                   signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+                for timestamp, value in zip(signal_columns.timestamps, signal_columns.values)]
+    return [SignalIn.construct(start_timestamp=start_timestamp, end_timestamp=end_timestamp,
+                               signal_value=SignalValueNodesIn.construct(value=value, additional_properties=None))
+            for start_timestamp, end_timestamp, value in
+            zip(signal_columns.start_timestamps, signal_columns.end_timestamps, signal_columns.values)]
+
+
+def signal_values_to_signal_columns(signal_values: list):
+    """
+    Convert signal values read from graph (dicts of signal value and timestamp nodes) to columnar format
+    """
+    columns = {"values": [get_node_property(signal_value["signal_value"], "value") for signal_value in signal_values]}
+    if len(signal_values) > 0 and "timestamp" not in signal_values[0]:
+        columns["start_timestamps"] = [get_node_property(signal_value["start_timestamp"], "timestamp")
+                                       for signal_value in signal_values]
+        columns["end_timestamps"] = [get_node_property(signal_value["end_timestamp"], "timestamp")
+                                     for signal_value in signal_values]
+    else:
+        columns["timestamps"] = [get_node_property(signal_value["timestamp"], "timestamp")
+                                 for signal_value in signal_values]
+    return SignalColumnsIn(**columns)
+
+
+def encode_signal_cursor(next_timestamp: int, skip: int = 0):
+    """
+    Create opaque cursor pointing to the first signal with (start) timestamp not less than given one, after
+    given number of signals with exactly that timestamp, which were already returned
+    """
+    return base64.urlsafe_b64encode(json.dumps({"next_timestamp": next_timestamp, "skip": skip}).encode()).decode()
+
+
+def decode_signal_cursor(cursor: str):
+    """
+    Get timestamp of the first signal and number of skipped signals from cursor created with encode_signal_cursor
+
+    Raises:
+        ValueError: cursor is invalid
+    """
+    try:
+        content = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(content["next_timestamp"]), int(content.get("skip", 0))
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def get_page_start(start_timestamp: Optional[int], cursor: Optional[str]):
+    """
+    Combine start timestamp filter with cursor into start timestamp of requested page and number of signals
+    with that timestamp to skip
+    """
+    if cursor is None:
+        return start_timestamp, 0
+    next_timestamp, skip = decode_signal_cursor(cursor)
+    if start_timestamp is not None and start_timestamp > next_timestamp:
+        return start_timestamp, 0
+    return next_timestamp, skip
+
+
+def get_next_page_cursor(timestamps: List[int], start_timestamp: Optional[int], skip: int):
+    """
+    Create cursor of the page following page of signals with given ordered (start) timestamps. Signals with
+    the same timestamp as the last one are counted, so the next page skips them instead of losing the rest.
+
+    Args:
+        timestamps (List[int]): (Start) timestamps of signals of page
+        start_timestamp (Optional[int]): Start timestamp of page
+        skip (int): Number of signals skipped at start timestamp of page
+    """
+    last_timestamp = timestamps[-1]
+    returned = sum(1 for timestamp in timestamps if timestamp == last_timestamp)
+    if start_timestamp == last_timestamp:
+        returned += skip
+    return encode_signal_cursor(last_timestamp, returned)
+
+
+def time_series_in_to_out(time_series: TimeSeriesIn):
+    """
+    Convert time series which was not saved to the model sent to client, signal values are converted to dicts
+    """
+    time_series_out = TimeSeriesOut(**time_series.dict(exclude={"signal_values"}))
+    time_series_out.signal_values = [signal_value.dict() for signal_value in time_series.signal_values]
+    return time_series_out
@@ -0,0 +1,76 @@
+from typing import List, Optional
+
+import numpy as np
+
+
+class SignalValuesLineage:
+    """
+    Compact mapping of new signal values to windows of consecutive source signal values. Instead of a list of ids
+    for each new signal value, ids of source signal values are kept once, in window order, together with bounds
+    of the window of each new signal value.
+
+    Attributes:
+        source_ids (list): Ids of source signal values in window order
+        starts (np.ndarray): Index of the first source signal value of each window
+        ends (np.ndarray): Index of the last source signal value of each window
+    """
+
+    def __init__(self, source_ids: list, starts: np.ndarray, ends: np.ndarray):
+        self.source_ids = source_ids
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> List:
+        return self.source_ids[self.starts[index]:self.ends[index] + 1]
+
+    def __iter__(self):
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield self.source_ids[start:end + 1]
+
+    def bounds(self):
+        """
+        Iterate over ids of the first and the last source signal value and size of each window
+        """
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield self.source_ids[start], self.source_ids[end], end - start + 1
+
+
+def compose_lineage(lineage, source_lineages: List[Optional["SignalValuesLineage"]]):
+    """
+    Map lineage of signal values of time series transformed from intermediate time series back to signal values
+    of saved time series. Ids of intermediate signal values are pairs of index of intermediate time series and
+    position of signal value in it, any other ids are ids of saved signal values. Lineages of consecutive windows
+    are composed without expanding them.
+
+    Args:
+        lineage (SignalValuesLineage | list): Lineage returned by transformation
+        source_lineages (List[Optional[SignalValuesLineage | list]]): Lineage of each of transformed time series,
+            None for saved time series
+
+    Returns:
+        Lineage of signal values referring only saved signal values
+    """
+    if all(source_lineage is None for source_lineage in source_lineages):
+        return lineage
+    if isinstance(lineage, SignalValuesLineage) and len(lineage.source_ids) > 0 and \
+            all(isinstance(source_id, tuple) for source_id in lineage.source_ids):
+        series_indices = {series_index for series_index, _ in lineage.source_ids}
+        source_lineage = source_lineages[next(iter(series_indices))]
+        positions = np.array([position for _, position in lineage.source_ids], dtype=np.int64)
+        if len(series_indices) == 1 and isinstance(source_lineage, SignalValuesLineage) and \
+                np.all(positions[1:] >= positions[:-1]):
+            return SignalValuesLineage(source_lineage.source_ids, source_lineage.starts[positions[lineage.starts]],
+                                       source_lineage.ends[positions[lineage.ends]])
+
+    def source_ids(signal_value_id):
+        if isinstance(signal_value_id, tuple):
+            series_index, position = signal_value_id
+            return source_lineages[series_index][position]
+        return [signal_value_id]
+
+    return [list(dict.fromkeys(source_id for signal_value_id in signal_value_ids
+                               for source_id in source_ids(signal_value_id)))
+            for signal_value_ids in lineage]
@@ -0,0 +1,162 @@
+from typing import List, Optional
+
+import numpy as np
+
+from property.property_model import PropertyIn
+from time_series.time_series_model import SignalStatistics, SignalIn, SignalColumnsIn
+
+STATISTICS_PROPERTY_PREFIX = "statistics_"
+
+
+def compute_statistics(timestamps: list, end_timestamps: Optional[list], values: list):
+    """
+    Compute statistics of signals given as columns
+
+    Args:
+        timestamps (list): (Start) timestamps of signals
+        end_timestamps (Optional[list]): End timestamps of signals, None for signals of type Timestamp
+        values (list): Values of signals
+
+    Returns:
+        SignalStatistics of given signals
+    """
+    if len(values) == 0:
+        return SignalStatistics()
+    statistics = SignalStatistics(
+        count=len(values),
+        first_timestamp=min(timestamps),
+        last_timestamp=max(end_timestamps if end_timestamps is not None else timestamps),
+    )
+    try:
+        numeric_values = np.asarray(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        return statistics
+    if not np.all(np.isfinite(numeric_values)):
+        return statistics
+    statistics.min_value = float(numeric_values.min())
+    statistics.max_value = float(numeric_values.max())
+    statistics.mean = float(numeric_values.mean())
+    statistics.std = float(numeric_values.std())
+    return statistics
+
+
+def signal_values_statistics(signal_values: List[SignalIn]):
+    """
+    Compute statistics of signals given as list of SignalIn
+    """
+    is_epoch = len(signal_values) > 0 and signal_values[0].timestamp is None
+    return compute_statistics(
+        [signal.start_timestamp if is_epoch else signal.timestamp for signal in signal_values],
+        [signal.end_timestamp for signal in signal_values] if is_epoch else None,
+        [signal.signal_value.value for signal in signal_values],
+    )
+
+
+def signal_columns_statistics(signal_columns: Optional[SignalColumnsIn]):
+    """
+    Compute statistics of signals given in columnar format
+    """
+    if signal_columns is None:
+        return SignalStatistics()
+    if signal_columns.timestamps is not None:
+        return compute_statistics(signal_columns.timestamps, None, signal_columns.values)
+    return compute_statistics(signal_columns.start_timestamps, signal_columns.end_timestamps, signal_columns.values)
+
+
+def merge_statistics(first: SignalStatistics, second: SignalStatistics):
+    """
+    Combine statistics of two disjoint sets of signals into statistics of their union. Mean and standard
+    deviation are combined with pairwise update of sums of squared deviations, so signals are not needed.
+    """
+    if first.count == 0:
+        return second.copy()
+    if second.count == 0:
+        return first.copy()
+    count = first.count + second.count
+    statistics = SignalStatistics(
+        count=count,
+        first_timestamp=min(first.first_timestamp, second.first_timestamp),
+        last_timestamp=max(first.last_timestamp, second.last_timestamp),
+    )
+    if first.mean is None or second.mean is None:
+        return statistics
+    delta = second.mean - first.mean
+    squares_sum = (first.std ** 2 * first.count + second.std ** 2 * second.count
+                   + delta ** 2 * first.count * second.count / count)
+    statistics.min_value = min(first.min_value, second.min_value)
+    statistics.max_value = max(first.max_value, second.max_value)
+    statistics.mean = first.mean + delta * second.count / count
+    statistics.std = float(np.sqrt(squares_sum / count))
+    return statistics
+
+
+def subtract_statistics(total: SignalStatistics, part: SignalStatistics):
+    """
+    Remove statistics of a subset of signals from statistics of all of them, reversing merge_statistics.
+    First and last timestamps of all signals are kept.
+
+    Returns:
+        SignalStatistics of remaining signals, or None if they cannot be derived without signals, because
+        removed signals reach min or max value or are not numeric
+    """
+    if part.count == 0:
+        return total.copy()
+    if part.count >= total.count or total.mean is None or part.mean is None or \
+            part.min_value <= total.min_value or part.max_value >= total.max_value:
+        return None
+    count = total.count - part.count
+    statistics = SignalStatistics(
+        count=count,
+        first_timestamp=total.first_timestamp,
+        last_timestamp=total.last_timestamp,
+        min_value=total.min_value,
+        max_value=total.max_value,
+        mean=(total.mean * total.count - part.mean * part.count) / count,
+    )
+    delta = part.mean - statistics.mean
+    squares_sum = (total.std ** 2 * total.count - part.std ** 2 * part.count
+                   - delta ** 2 * count * part.count / total.count)
+    statistics.std = float(np.sqrt(max(squares_sum, 0) / count))
+    return statistics
+
+
+def next_statistics_version(statistics: Optional[SignalStatistics]):
+    """
+    Get version of signals changed after they had given statistics, 0 is the version of signals without them
+    """
+    return statistics.version + 1 if statistics is not None else 1
+
+
+def statistics_to_properties(statistics: SignalStatistics):
+    """
+    Convert statistics to properties of time series node
+
+    Returns:
+        List of PropertyIn with keys prefixed with STATISTICS_PROPERTY_PREFIX
+    """
+    return [
+        PropertyIn(key=STATISTICS_PROPERTY_PREFIX + key, value=str(value))
+        for key, value in statistics.dict().items()
+        if value is not None
+    ]
+
+
+def statistics_from_properties(additional_properties: Optional[list]):
+    """
+    Separate statistics properties from other additional properties of time series node
+
+    Returns:
+        Tuple of remaining additional properties and SignalStatistics, or None if node has no statistics
+    """
+    if additional_properties is None:
+        return additional_properties, None
+    remaining_properties = []
+    statistics = {}
+    for property in additional_properties:
+        key = property["key"] if isinstance(property, dict) else property.key
+        value = property["value"] if isinstance(property, dict) else property.value
+        if key.startswith(STATISTICS_PROPERTY_PREFIX):
+            statistics[key[len(STATISTICS_PROPERTY_PREFIX):]] = value
+        else:
+            remaining_properties.append(property)
+    return remaining_properties, SignalStatistics(**statistics) if statistics else None